@@ -0,0 +1,85 @@
+"""
+Serviço de classificação ABC (Pareto) do catálogo
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.repositories.abc_repository import DEFAULT_CLASS, AbcRepository
+
+# Ordem de prioridade para alertas e inventário cíclico
+CLASS_PRIORITY = {"A": 0, "B": 1, "C": 2, None: 3}
+
+
+class AbcService:
+    """Calcula e persiste a curva ABC por receita e por margem"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = AbcRepository(db)
+
+    def analyze(self, days: Optional[int] = None) -> Dict[str, Any]:
+        """Curva ABC da janela (sem gravar)"""
+        days = days or settings.ABC_WINDOW_DAYS
+        end = datetime.now()
+        start = end - timedelta(days=days)
+        items = self.repo.get_classification(
+            start, end, settings.ABC_A_SHARE, settings.ABC_B_SHARE
+        )
+        summary = {}
+        for abc_class in ("A", "B", "C"):
+            members = [item for item in items if item["abc_class"] == abc_class]
+            summary[abc_class] = {
+                "products": len(members),
+                "revenue": round(sum(item["revenue"] for item in members), 2),
+                "revenue_share": round(
+                    sum(item["revenue_share"] for item in members), 4
+                ),
+            }
+        return {
+            "period_start": start,
+            "period_end": end,
+            "window_days": days,
+            "thresholds": {"A": settings.ABC_A_SHARE, "B": settings.ABC_B_SHARE},
+            "summary": summary,
+            "items": items,
+        }
+
+    def refresh(self, days: Optional[int] = None) -> Dict[str, Any]:
+        """Recalcula e grava apenas as classes que mudaram"""
+        analysis = self.analyze(days)
+        computed = {
+            item["product_id"]: (item["abc_class"], item["abc_margin_class"])
+            for item in analysis["items"]
+        }
+        current = self.repo.get_current_classes()
+
+        changes = []
+        for product_id, stored in current.items():
+            abc_class, abc_margin_class = computed.get(
+                product_id, (DEFAULT_CLASS, DEFAULT_CLASS)
+            )
+            if stored != (abc_class, abc_margin_class):
+                changes.append(
+                    {
+                        "id": product_id,
+                        "abc_class": abc_class,
+                        "abc_margin_class": abc_margin_class,
+                    }
+                )
+        updated = self.repo.update_classes(changes)
+
+        distribution = Counter(
+            computed.get(product_id, (DEFAULT_CLASS,))[0] for product_id in current
+        )
+        return {
+            "window_days": analysis["window_days"],
+            "products_evaluated": len(current),
+            "products_updated": updated,
+            "distribution": {key: distribution.get(key, 0) for key in "ABC"},
+            "refreshed_at": datetime.now(),
+        }
@@ -0,0 +1,217 @@
+"""
+Serviço de afinidade entre produtos ("comprados juntos")
+"""
+
+import logging
+import time
+from concurrent.futures import as_completed
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.analytics.basket_pairs import PairCounter, basket_pair_keys
+from app.infrastructure.jobs.executor import get_process_pool, worker_session
+from app.infrastructure.repositories.affinity_repository import AffinityRepository
+
+logger = logging.getLogger(__name__)
+
+
+def count_pairs_shard(
+    database_url: str,
+    start: datetime,
+    end: datetime,
+    frequent_ids: np.ndarray,
+    max_basket_size: int,
+    max_pairs: int,
+    batch_size: int,
+) -> Dict[str, Any]:
+    """Conta os pares de produtos das vendas de um intervalo de tempo (worker)"""
+    n_items = len(frequent_ids)
+    counter = PairCounter(n_items, max_pairs)
+    with worker_session(database_url) as db:
+        batches = AffinityRepository(db).iter_basket_items(start, end, batch_size)
+        for sale_ids, product_ids in batches:
+            positions = np.minimum(
+                np.searchsorted(frequent_ids, product_ids), n_items - 1
+            )
+            item_index = np.where(frequent_ids[positions] == product_ids, positions, -1)
+            counter.add(
+                basket_pair_keys(sale_ids, item_index, n_items, max_basket_size)
+            )
+
+    keys, counts = counter.result()
+    return {"keys": keys, "counts": counts, "floor": counter.floor}
+
+
+class AffinityService:
+    """Minera pares frequentes nas vendas e consulta recomendações"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = AffinityRepository(db)
+
+    def mine(
+        self,
+        window_days: Optional[int] = None,
+        shards: Optional[int] = None,
+        parallel: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Recalcula a tabela de afinidades
+
+        1. Contagem por produto (SQL) define os produtos frequentes.
+        2. A janela é dividida em faixas de tempo; cada faixa conta os pares
+           das suas vendas em um worker, lendo em lotes.
+        3. As contagens são somadas e viram suporte, confiança e lift; cada
+           produto mantém seus AFFINITY_TOP_N pares mais fortes.
+        """
+        started = time.perf_counter()
+        days = window_days or settings.AFFINITY_WINDOW_DAYS
+        min_count = settings.AFFINITY_MIN_PAIR_COUNT
+        end = datetime.now()
+        start = end - timedelta(days=days)
+
+        total_baskets, item_counts = self.repo.get_item_basket_counts(start, end)
+        frequent_ids = np.array(
+            sorted(pid for pid, count in item_counts.items() if count >= min_count),
+            dtype=np.int64,
+        )
+        n_items = len(frequent_ids)
+        counter = PairCounter(max(n_items, 1), settings.AFFINITY_MAX_PAIRS)
+
+        shard_count = shards or settings.AFFINITY_SHARDS
+        step = (end - start) / shard_count
+        args = [
+            (
+                settings.DATABASE_URL,
+                start + step * index,
+                end if index == shard_count - 1 else start + step * (index + 1),
+                frequent_ids,
+                settings.AFFINITY_MAX_BASKET_SIZE,
+                settings.AFFINITY_MAX_PAIRS,
+                settings.EXPORT_BATCH_SIZE,
+            )
+            for index in range(shard_count)
+        ]
+        if n_items < 2:
+            args = []
+        if parallel and len(args) > 1:
+            pool = get_process_pool()
+            futures = [pool.submit(count_pairs_shard, *shard) for shard in args]
+            shard_results = (future.result() for future in as_completed(futures))
+        else:
+            shard_results = (count_pairs_shard(*shard) for shard in args)
+
+        shard_floor = 0
+        for shard in shard_results:
+            counter.add(shard["keys"], shard["counts"])
+            shard_floor += shard["floor"]
+        keys, counts = counter.result()
+
+        rows = self._build_rows(
+            keys, counts, counter, frequent_ids, item_counts, total_baskets
+        )
+        written = self.repo.replace_affinities(rows)
+
+        elapsed = round(time.perf_counter() - started, 2)
+        logger.info(
+            "Afinidade de produtos: %s vendas, %s pares, %s linhas em %ss",
+            total_baskets,
+            len(keys),
+            written,
+            elapsed,
+        )
+        return {
+            "window_days": days,
+            "baskets": total_baskets,
+            "frequent_products": n_items,
+            "pairs_counted": int(len(keys)),
+            "rows": written,
+            "shards": len(args),
+            "count_error_bound": shard_floor + counter.floor,
+            "elapsed_seconds": elapsed,
+        }
+
+    def _build_rows(
+        self,
+        keys: np.ndarray,
+        counts: np.ndarray,
+        counter: PairCounter,
+        frequent_ids: np.ndarray,
+        item_counts: Dict[int, int],
+        total_baskets: int,
+    ) -> List[dict]:
+        keep = counts >= settings.AFFINITY_MIN_PAIR_COUNT
+        keys, counts = keys[keep], counts[keep]
+        if len(keys) == 0:
+            return []
+
+        first, second = counter.split(keys)
+        item_totals = np.array(
+            [item_counts[int(pid)] for pid in frequent_ids], dtype=np.float64
+        )
+        lift = counts * total_baskets / (item_totals[first] * item_totals[second])
+        keep = lift >= settings.AFFINITY_MIN_LIFT
+        first, second, counts, lift = (
+            first[keep],
+            second[keep],
+            counts[keep],
+            lift[keep],
+        )
+
+        # Uma linha por direção: A -> B e B -> A
+        products = np.concatenate([first, second])
+        related = np.concatenate([second, first])
+        pair_counts = np.concatenate([counts, counts])
+        lifts = np.concatenate([lift, lift])
+        confidence = pair_counts / item_totals[products]
+
+        # Posição de cada par no ranking do produto (maior confiança primeiro)
+        order = np.lexsort((-lifts, -confidence, products))
+        rank = np.empty(len(order), dtype=np.int64)
+        sorted_products = products[order]
+        group_start = np.searchsorted(sorted_products, sorted_products)
+        rank[order] = np.arange(len(order)) - group_start
+
+        # O par fica se estiver no top-N de qualquer um dos dois produtos,
+        # mantendo as duas direções na tabela
+        n_pairs = len(counts)
+        in_top = rank < settings.AFFINITY_TOP_N
+        pair_kept = np.tile(in_top[:n_pairs] | in_top[n_pairs:], 2)
+
+        generated_at = datetime.now()
+        product_ids = frequent_ids[products[pair_kept]].tolist()
+        related_ids = frequent_ids[related[pair_kept]].tolist()
+        kept_counts = pair_counts[pair_kept].tolist()
+        kept_confidence = confidence[pair_kept].tolist()
+        kept_lift = lifts[pair_kept].tolist()
+        return [
+            {
+                "product_id": product_ids[index],
+                "related_product_id": related_ids[index],
+                "pair_count": kept_counts[index],
+                "support": round(kept_counts[index] / total_baskets, 6),
+                "confidence": round(kept_confidence[index], 6),
+                "lift": round(kept_lift[index], 4),
+                "generated_at": generated_at,
+                "created_at": generated_at,
+                "updated_at": generated_at,
+            }
+            for index in range(len(product_ids))
+        ]
+
+    def get_recommendations(
+        self, product_ids: Sequence[int], limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Produtos comprados junto com os informados (fora da lista)"""
+        product_ids = list(dict.fromkeys(product_ids))
+        return self.repo.get_related(product_ids, product_ids, limit)
+
+    def get_top_pairs(
+        self, min_lift: float = 1.2, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Pares mais frequentes, candidatos a promoções combinadas"""
+        return self.repo.get_top_pairs(min_lift, limit)
@@ -0,0 +1,53 @@
+"""
+Serviço de análises ad-hoc de vendas
+"""
+
+import time
+from datetime import datetime
+from typing import Optional
+
+from app.infrastructure.analytics.sales_store import SalesColumnStore, sales_store
+from app.presentation.schemas.analytics import (
+    AnalyticsFilters,
+    AnalyticsResponse,
+    AnalyticsStoreStats,
+)
+
+
+class AnalyticsService:
+    """Consultas vetorizadas sobre o armazenamento colunar de vendas"""
+
+    def __init__(self, store: Optional[SalesColumnStore] = None):
+        self.store = store or sales_store
+
+    def query_sales(self, filters: AnalyticsFilters) -> AnalyticsResponse:
+        """Agrega itens de venda conforme filtros e agrupamentos"""
+        started = time.perf_counter()
+        rows = self.store.query(
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+            product_ids=filters.product_ids,
+            category_ids=filters.category_ids,
+            user_ids=filters.cashier_ids,
+            payment_methods=filters.payment_methods,
+            statuses=filters.statuses,
+            group_by=filters.group_by,
+            metrics=filters.metrics,
+            order_by=filters.order_by,
+            descending=filters.descending,
+            limit=filters.limit,
+        )
+        return AnalyticsResponse(
+            group_by=filters.group_by,
+            metrics=filters.metrics,
+            rows=rows,
+            total_rows=len(rows),
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+            generated_at=datetime.now(),
+            store=AnalyticsStoreStats(**self.store.stats()),
+        )
+
+    def refresh(self) -> AnalyticsStoreStats:
+        """Força a atualização incremental do armazenamento"""
+        self.store.refresh(force=True)
+        return AnalyticsStoreStats(**self.store.stats())
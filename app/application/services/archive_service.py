@@ -0,0 +1,60 @@
+"""
+Serviço de arquivamento mensal (rolagem das "partições")
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.infrastructure.repositories.archive_repository import (
+    ArchiveRepository,
+    add_months,
+    archive_cutoff,
+    month_start,
+)
+
+
+class ArchiveService:
+    """Arquiva os meses anteriores ao corte, um mês por transação"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = ArchiveRepository(db)
+
+    def pending_months(self, today: Optional[date] = None) -> List[date]:
+        """Meses fechados ainda nas tabelas vivas, do mais antigo ao corte"""
+        cutoff = archive_cutoff(today)
+        month = self.repo.get_oldest_live_month()
+        months = []
+        while month is not None and month < cutoff:
+            months.append(month)
+            month = add_months(month, 1)
+        return months
+
+    def roll(
+        self, dry_run: bool = False, today: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """Move para o arquivo todos os meses pendentes"""
+        months = []
+        for month in self.pending_months(today):
+            counts = (
+                self.repo.count_month(month)
+                if dry_run
+                else self.repo.archive_month(month)
+            )
+            if any(counts.values()):
+                months.append({"month": month.strftime("%Y-%m"), **counts})
+        return {
+            "cutoff": archive_cutoff(today),
+            "dry_run": dry_run,
+            "months": months,
+        }
+
+    def restore(self, month: date) -> Dict[str, Any]:
+        """Devolve um mês às tabelas vivas (volta ao arquivo na próxima rolagem)"""
+        counts = self.repo.restore_month(month_start(month))
+        return {"month": month.strftime("%Y-%m"), **counts}
+
+    def archived_months(self) -> List[Dict[str, Any]]:
+        return self.repo.get_archived_months()
@@ -0,0 +1,98 @@
+"""
+Serviço de diagnóstico em produção (perfis, memória, traces e SQL lento)
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.application.services.sale_service import SaleService
+from app.infrastructure.analytics.live_kpis import live_kpis
+from app.infrastructure.analytics.sales_store import sales_store
+from app.infrastructure.analytics.trending import trending_tracker
+from app.infrastructure.events.broker import event_broker
+from app.infrastructure.metrics.instruments import registry
+from app.infrastructure.profiling.memory import MemoryTracker, memory_tracker
+from app.infrastructure.profiling.slow_queries import SlowQueryLog, slow_query_log
+from app.infrastructure.profiling.store import ProfileStore, profile_store
+from app.infrastructure.tracing.exporters import TraceRing, to_otlp, trace_ring
+
+
+class DiagnosticsService:
+    """Perfis gravados pelo ProfilingMiddleware, memória e traces deste worker"""
+
+    def __init__(
+        self,
+        store: ProfileStore = profile_store,
+        tracker: MemoryTracker = memory_tracker,
+        traces: TraceRing = trace_ring,
+        slow_queries: SlowQueryLog = slow_query_log,
+    ):
+        self.store = store
+        self.tracker = tracker
+        self.traces = traces
+        self.slow_queries = slow_queries
+
+    def list_profiles(self, limit: int = 50) -> List[Dict[str, Any]]:
+        profiles = self.store.list(limit)
+        for profile in profiles:
+            profile["download_url"] = f"/api/v1/admin/profiles/{profile['id']}"
+        return profiles
+
+    def profile_path(self, profile_id: str) -> Path:
+        """Arquivo "folded" do perfil; LookupError se não existe"""
+        path = self.store.folded_path(profile_id)
+        if path is None:
+            raise LookupError("Perfil não encontrado")
+        return path
+
+    # ==================== MEMÓRIA ====================
+
+    def memory_status(self) -> Dict[str, Any]:
+        """tracemalloc + tamanho das estruturas mantidas em memória"""
+        status = self.tracker.status()
+        status["structures"] = {
+            "user_carts": SaleService.cart_stats(),
+            "analytics_store": sales_store.stats(),
+            "trending": trending_tracker.stats(),
+            "live_kpis": live_kpis.stats(),
+            "event_broker": event_broker.stats(),
+            "metrics": registry.stats(),
+        }
+        return status
+
+    def start_tracing(self, frames: int) -> Dict[str, Any]:
+        return self.tracker.start(frames)
+
+    def stop_tracing(self) -> Dict[str, Any]:
+        return self.tracker.stop()
+
+    def take_snapshot(self, group_by: str, limit: int) -> Dict[str, Any]:
+        snapshot = self.tracker.take_snapshot()
+        snapshot["group_by"] = group_by
+        snapshot["top"] = self.tracker.top(snapshot["id"], group_by, limit)
+        return snapshot
+
+    def diff_snapshots(
+        self, base_id: int, target_id: Optional[int], group_by: str, limit: int
+    ) -> Dict[str, Any]:
+        return self.tracker.diff(base_id, target_id, group_by, limit)
+
+    # ==================== TRACES ====================
+
+    def list_traces(self, limit: int, min_duration_ms: float) -> List[Dict[str, Any]]:
+        return self.traces.list(limit, min_duration_ms)
+
+    def get_trace(self, trace_id: str, otlp: bool = False) -> Dict[str, Any]:
+        """Spans do trace; LookupError se já saiu do buffer"""
+        trace = self.traces.get(trace_id)
+        if trace is None:
+            raise LookupError("Trace não encontrado")
+        return to_otlp(trace["spans"]) if otlp else trace
+
+    # ==================== CONSULTAS LENTAS ====================
+
+    def list_slow_queries(self, order_by: str, limit: int) -> List[Dict[str, Any]]:
+        return self.slow_queries.list(order_by, limit)
+
+    def clear_slow_queries(self) -> int:
+        return self.slow_queries.clear()
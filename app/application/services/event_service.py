@@ -0,0 +1,66 @@
+"""
+Serviço de eventos em tempo real (vendas, KPIs e estoque baixo)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.infrastructure.analytics.live_kpis import LiveKpiCounters, live_kpis
+from app.infrastructure.database.models.product import Product
+from app.infrastructure.events.broker import EventBroker, event_broker
+
+EVENT_TYPES = ("sale", "kpis", "low_stock")
+
+
+class EventService:
+    """Traduz mudanças do domínio em eventos do broker"""
+
+    def __init__(
+        self,
+        broker: Optional[EventBroker] = None,
+        kpis: Optional[LiveKpiCounters] = None,
+    ):
+        self.broker = broker or event_broker
+        self.kpis = kpis or live_kpis
+
+    def sale_changed(self, sale, status: str, items: int) -> None:
+        """Venda concluída ou cancelada + KPIs do dia (calculados uma vez)"""
+        self.broker.publish(
+            "sale",
+            {
+                "sale_id": sale.id,
+                "status": status,
+                "final_amount": sale.final_amount,
+                "items": items,
+                "created_at": sale.created_at,
+            },
+        )
+        self.broker.publish("kpis", self.kpis.today_kpis())
+
+    def stock_changed(self, product: Product, previous_quantity: float) -> None:
+        """Publica quando o estoque cruza o mínimo para baixo"""
+        min_level = product.min_stock_level or 0
+        if previous_quantity > min_level >= product.stock_quantity:
+            self.broker.publish(
+                "low_stock",
+                {
+                    "product_id": product.id,
+                    "product_name": product.name,
+                    "previous_quantity": previous_quantity,
+                    "current_quantity": product.stock_quantity,
+                    "min_stock": min_level,
+                    "alert_level": (
+                        "critical" if product.stock_quantity <= 0 else "warning"
+                    ),
+                    "detected_at": datetime.now(),
+                },
+            )
+
+    def initial_state(self, event_types: Optional[frozenset]) -> List[Tuple[str, Any]]:
+        """Estado enviado na conexão (KPIs atuais)"""
+        if event_types is None or "kpis" in event_types:
+            return [("kpis", self.kpis.today_kpis())]
+        return []
+
+    def stats(self) -> Dict[str, int]:
+        return self.broker.stats()
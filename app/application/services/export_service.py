@@ -0,0 +1,69 @@
+"""
+Serviço de exportação de relatórios (CSV, XLSX e PDF) em fluxo
+"""
+
+from datetime import datetime
+from typing import Callable, Iterator, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.database.connection import SessionLocal
+from app.infrastructure.exports.writers import (
+    MEDIA_TYPES,
+    stream_csv,
+    stream_pdf,
+    stream_xlsx,
+)
+from app.infrastructure.repositories.export_repository import ExportRepository
+
+DATASETS = {
+    "sales": ("stream_sales", "Vendas"),
+    "sale-items": ("stream_sale_items", "Itens de venda"),
+    "stock-movements": ("stream_stock_movements", "Movimentações de estoque"),
+    "stock-report": ("stream_stock_report", "Relatório de estoque"),
+}
+
+
+class ExportService:
+    """Exporta conjuntos de dados sem carregá-los inteiros em memória"""
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        # Sessão própria: o fluxo continua após o fim da requisição
+        self.session_factory = session_factory
+
+    def export(
+        self, dataset: str, file_format: str, **filters
+    ) -> Tuple[str, str, Iterator[bytes]]:
+        """Retorna nome do arquivo, media type e gerador de bytes"""
+        if dataset not in DATASETS:
+            raise ValueError(f"Conjunto de dados inválido: {dataset}")
+        if file_format not in MEDIA_TYPES:
+            raise ValueError(f"Formato inválido: {file_format}")
+
+        filename = (
+            f"{dataset.replace('-', '_')}_{datetime.now():%Y%m%d_%H%M%S}.{file_format}"
+        )
+        return (
+            filename,
+            MEDIA_TYPES[file_format],
+            self._generate(dataset, file_format, filters),
+        )
+
+    def _generate(self, dataset: str, file_format: str, filters: dict):
+        """Abre a sessão, percorre o cursor e serializa no formato pedido"""
+        method, title = DATASETS[dataset]
+        db = self.session_factory()
+        try:
+            repository = ExportRepository(db, batch_size=settings.EXPORT_BATCH_SIZE)
+            columns, rows = getattr(repository, method)(**filters)
+            if file_format == "csv":
+                yield from stream_csv(columns, rows)
+            elif file_format == "xlsx":
+                yield from stream_xlsx(columns, rows, title)
+            else:
+                yield from stream_pdf(
+                    columns, rows, title, max_rows=settings.EXPORT_PDF_MAX_ROWS
+                )
+        finally:
+            db.close()
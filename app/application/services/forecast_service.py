@@ -0,0 +1,128 @@
+"""
+Serviço de previsão de demanda (lote noturno sobre todo o catálogo)
+"""
+
+import logging
+import time
+from concurrent.futures import as_completed
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.forecasting.holt_winters import MODEL_NAME, forecast
+from app.infrastructure.jobs.executor import get_process_pool, worker_session
+from app.infrastructure.repositories.forecast_repository import ForecastRepository
+
+logger = logging.getLogger(__name__)
+
+
+def forecast_shard(
+    database_url: str,
+    first_id: int,
+    last_id: int,
+    start_date: date,
+    end_date: date,
+    horizon: int,
+) -> Dict[str, Any]:
+    """Carrega o histórico da faixa de produtos e calcula a previsão (worker)"""
+    with worker_session(database_url) as db:
+        product_ids, history = ForecastRepository(db).get_daily_demand(
+            first_id, last_id, start_date, end_date
+        )
+
+    result = forecast(history, horizon)
+    return {
+        "product_ids": product_ids,
+        "mean": result.mean.astype(np.float32),
+        "lower": result.lower.astype(np.float32),
+        "upper": result.upper.astype(np.float32),
+    }
+
+
+class ForecastService:
+    """Gera e consulta previsões diárias de demanda por produto"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = ForecastRepository(db)
+
+    def run_forecast(
+        self,
+        horizon_days: Optional[int] = None,
+        history_days: Optional[int] = None,
+        shards: Optional[int] = None,
+        parallel: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Prevê a demanda de todos os produtos ativos
+
+        O catálogo é dividido em faixas de id; cada faixa vira uma matriz
+        (produtos x dias) processada em um worker do pool. As faixas são
+        gravadas à medida que ficam prontas.
+        """
+        started = time.perf_counter()
+        horizon = horizon_days or settings.FORECAST_HORIZON_DAYS
+        history = history_days or settings.FORECAST_HISTORY_DAYS
+        # Histórico até ontem: o dia corrente ainda está incompleto
+        end_date = date.today() - timedelta(days=1)
+        start_date = end_date - timedelta(days=history - 1)
+        bounds = self.repo.get_product_id_bounds(shards or settings.FORECAST_SHARDS)
+
+        args = [
+            (settings.DATABASE_URL, first, last, start_date, end_date, horizon)
+            for first, last in bounds
+        ]
+        if parallel and len(args) > 1:
+            pool = get_process_pool()
+            futures = [pool.submit(forecast_shard, *shard) for shard in args]
+            shard_results = (future.result() for future in as_completed(futures))
+        else:
+            shard_results = (forecast_shard(*shard) for shard in args)
+
+        products = 0
+        rows = 0
+        for shard in shard_results:
+            rows += self.repo.replace_forecasts(
+                shard["product_ids"],
+                date.today(),
+                shard["mean"],
+                shard["lower"],
+                shard["upper"],
+                MODEL_NAME,
+            )
+            products += len(shard["product_ids"])
+
+        elapsed = round(time.perf_counter() - started, 2)
+        logger.info(
+            "Previsão de demanda: %s produtos, %s linhas em %ss",
+            products,
+            rows,
+            elapsed,
+        )
+        return {
+            "model": MODEL_NAME,
+            "products": products,
+            "shards": len(args),
+            "rows": rows,
+            "history_start": start_date,
+            "history_end": end_date,
+            "horizon_days": horizon,
+            "elapsed_seconds": elapsed,
+        }
+
+    def get_product_forecast(self, product_id: int) -> List[Dict[str, Any]]:
+        """Previsões futuras de um produto"""
+        return [
+            {
+                "forecast_date": item.forecast_date,
+                "predicted_quantity": item.predicted_quantity,
+                "lower_bound": item.lower_bound,
+                "upper_bound": item.upper_bound,
+                "model": item.model,
+                "generated_at": item.generated_at,
+            }
+            for item in self.repo.get_product_forecast(product_id)
+        ]
@@ -0,0 +1,135 @@
+"""
+Serviço de verificações de saúde (liveness, readiness e relatório detalhado)
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.infrastructure.database.connection import SessionLocal, engine
+from app.infrastructure.metrics.instruments import cache_hit
+from app.infrastructure.repositories.health_repository import HealthRepository
+
+_STARTED_AT = time.monotonic()
+
+FEATURES = {
+    "authentication": "✅ Enabled",
+    "products": "✅ Enabled",
+    "categories": "✅ Enabled",
+    "pdv": "✅ Enabled",
+    "sales": "✅ Enabled",
+    "barcode_reader": "✅ Simulation",
+    "scale": "✅ Simulation",
+    "thermal_printer": "✅ Simulation",
+    "bulk_promotions": "✅ Enabled",
+    "stock_control": "✅ Enabled",
+}
+
+# Relatório detalhado em cache: (calculado em, relatório)
+_details_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_details_lock = threading.Lock()
+
+
+class HealthService:
+    """Probes baratas para o orquestrador e relatório completo em cache"""
+
+    def __init__(self, db_engine: Optional[Engine] = None):
+        self.engine = db_engine or engine
+
+    def liveness(self) -> Dict[str, Any]:
+        """Processo respondendo (sem banco)"""
+        return {
+            "status": "alive",
+            "uptime_seconds": round(time.monotonic() - _STARTED_AT, 1),
+        }
+
+    def pool_status(self) -> Dict[str, Any]:
+        pool = self.engine.pool
+        status = {"class": type(pool).__name__}
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                status[name] = method()
+        max_overflow = getattr(pool, "_max_overflow", None)
+        if "size" in status and max_overflow is not None and max_overflow >= 0:
+            status["capacity"] = status["size"] + max_overflow
+        return status
+
+    def readiness(self) -> Tuple[bool, Dict[str, Any]]:
+        """SELECT 1 + pool com conexão disponível"""
+        pool = self.pool_status()
+        if "capacity" in pool and pool.get("checkedout", 0) >= pool["capacity"]:
+            return False, {
+                "status": "not_ready",
+                "reason": "pool_exhausted",
+                "pool": pool,
+            }
+        try:
+            HealthRepository.ping(self.engine)
+        except SQLAlchemyError as e:
+            return False, {
+                "status": "not_ready",
+                "reason": "database_unavailable",
+                "error": str(e),
+                "pool": pool,
+            }
+        return True, {"status": "ready", "pool": pool}
+
+    def details(self) -> Dict[str, Any]:
+        """
+        Relatório completo, recalculado no máximo uma vez a cada
+        HEALTH_DETAILS_TTL_SECONDS (chamadas concorrentes esperam o mesmo
+        cálculo em vez de repetir as consultas)
+        """
+        global _details_cache
+        cached = _details_cache
+        if (
+            cached
+            and time.monotonic() - cached[0] < settings.HEALTH_DETAILS_TTL_SECONDS
+        ):
+            cache_hit("health_details", True)
+            return cached[1]
+        with _details_lock:
+            cached = _details_cache
+            if cached and (
+                time.monotonic() - cached[0] < settings.HEALTH_DETAILS_TTL_SECONDS
+            ):
+                cache_hit("health_details", True)
+                return cached[1]
+            cache_hit("health_details", False)
+            report = self._build_details()
+            _details_cache = (time.monotonic(), report)
+            return report
+
+    def _build_details(self) -> Dict[str, Any]:
+        db = SessionLocal()
+        try:
+            repo = HealthRepository(db)
+            counts = repo.get_counts()
+            low_stock_details = repo.get_low_stock_details()
+        except SQLAlchemyError as e:
+            return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
+        finally:
+            db.close()
+        counts["low_stock_products"] = len(low_stock_details)
+        return {
+            "status": "healthy",
+            "database": "connected",
+            "features": FEATURES,
+            "counts": counts,
+            "alerts": {
+                "low_stock": len(low_stock_details) > 0,
+                "low_stock_details": low_stock_details,
+            },
+            "pdv_status": {
+                "barcode_reader": "ready",
+                "scale": "ready",
+                "printer": "ready",
+            },
+            "pool": self.pool_status(),
+            "generated_at": time.time(),
+        }
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from app.infrastructure.repositories.category_repository import CategoryRepository
+from app.infrastructure.repositories.pagination import Page
 from app.infrastructure.repositories.product_repository import ProductRepository
 from app.presentation.schemas.product import (
     BulkPriceUpdate,
@@ -182,7 +183,8 @@ class ProductService:
         low_stock_only: bool = False,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[ProductSummary]:
+        cursor: Optional[str] = None,
+    ) -> Page:
         """Busca produtos"""
         products = self.product_repo.search(
             query=query,
@@ -191,6 +193,7 @@ class ProductService:
             low_stock_only=low_stock_only,
             skip=skip,
             limit=limit,
+            cursor=cursor,
         )
 
         result = []
@@ -209,13 +212,19 @@ class ProductService:
             )
             result.append(summary)
 
-        return result
+        return Page(result, products.next_cursor)
 
     def list_products(
-        self, skip: int = 0, limit: int = 100, active_only: bool = True
-    ) -> List[ProductSummary]:
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True,
+        cursor: Optional[str] = None,
+    ) -> Page:
         """Lista produtos"""
-        return self.search_products(skip=skip, limit=limit, active_only=active_only)
+        return self.search_products(
+            skip=skip, limit=limit, active_only=active_only, cursor=cursor
+        )
 
     def update_product(
         self, product_id: int, product_data: ProductUpdate
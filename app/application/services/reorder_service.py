@@ -0,0 +1,113 @@
+"""
+Motor de reposição automática (sugestões e pedidos de compra em rascunho)
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.repositories.reorder_repository import ReorderRepository
+from app.infrastructure.repositories.velocity_repository import VelocityRepository
+
+
+class ReorderService:
+    """Avalia o catálogo inteiro de uma vez e agrupa a compra por fornecedor"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = ReorderRepository(db)
+
+    def compute_suggestions(
+        self, supplier_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Produtos que precisam de reposição e quantidade a pedir
+
+        posição = estoque + pedidos abertos
+        gatilho = max(ponto de reposição, demanda no prazo de entrega)
+        alvo    = max_stock, ou gatilho + demanda na cobertura se não houver
+        """
+        catalog = self.repo.get_catalog_position()
+        if supplier_id is not None:
+            keep = catalog["supplier_id"] == supplier_id
+            catalog = {name: column[keep] for name, column in catalog.items()}
+        product_ids = catalog["product_id"]
+        if len(product_ids) == 0:
+            return []
+
+        velocity = VelocityRepository(self.db).get_daily_velocity(product_ids.tolist())
+        position = catalog["stock"] + catalog["open_quantity"]
+
+        reorder_point = np.where(
+            catalog["reorder_point"] >= 0,
+            catalog["reorder_point"],
+            catalog["min_stock"],
+        )
+        trigger = np.maximum(reorder_point, velocity * settings.REORDER_LEAD_TIME_DAYS)
+        fallback_target = trigger + velocity * settings.REORDER_COVERAGE_DAYS
+        target = np.where(
+            catalog["max_stock"] > 0, catalog["max_stock"], fallback_target
+        )
+        quantity = np.ceil(np.maximum(target - position, 0))
+
+        needed = (position <= trigger) & (quantity > 0)
+        if not needed.any():
+            return []
+
+        # Mais urgentes primeiro: menos dias de cobertura
+        coverage = np.where(
+            velocity > 0, position / np.where(velocity > 0, velocity, 1), np.inf
+        )
+        selected = np.flatnonzero(needed)
+        selected = selected[np.argsort(coverage[selected], kind="stable")]
+
+        names = self.repo.get_product_names(product_ids[selected].tolist())
+        return [
+            {
+                "product_id": int(product_ids[i]),
+                "product_name": names.get(int(product_ids[i])),
+                "supplier_id": int(catalog["supplier_id"][i]),
+                "current_stock": float(catalog["stock"][i]),
+                "open_order_quantity": float(catalog["open_quantity"][i]),
+                "reorder_point": float(reorder_point[i]),
+                "target_stock": float(target[i]),
+                "daily_velocity": round(float(velocity[i]), 4),
+                "days_of_coverage": (
+                    round(float(coverage[i]), 1) if np.isfinite(coverage[i]) else None
+                ),
+                "quantity_to_order": int(quantity[i]),
+                "unit_cost": float(catalog["cost_price"][i]),
+                "estimated_cost": round(
+                    float(quantity[i] * catalog["cost_price"][i]), 2
+                ),
+            }
+            for i in selected
+        ]
+
+    def create_draft_orders(
+        self, user_id: int, supplier_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Gera um pedido de compra 'draft' por fornecedor com as sugestões"""
+        suggestions = self.compute_suggestions(supplier_id)
+        by_supplier: Dict[int, List[dict]] = defaultdict(list)
+        for suggestion in suggestions:
+            by_supplier[suggestion["supplier_id"]].append(
+                {
+                    "product_id": suggestion["product_id"],
+                    "quantity_ordered": suggestion["quantity_to_order"],
+                    "unit_cost": suggestion["unit_cost"],
+                }
+            )
+
+        orders = (
+            self.repo.create_draft_orders(by_supplier, user_id) if by_supplier else []
+        )
+        return {
+            "orders_created": len(orders),
+            "items_created": len(suggestions),
+            "total_amount": round(sum(order["total_amount"] for order in orders), 2),
+            "orders": orders,
+        }
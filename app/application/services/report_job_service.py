@@ -0,0 +1,226 @@
+"""
+Serviço de jobs de relatórios executados em pool de processos
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.application.services.abc_service import AbcService
+from app.application.services.affinity_service import AffinityService
+from app.application.services.forecast_service import ForecastService
+from app.application.services.report_service import ReportService
+from app.application.services.stock_service import StockService
+from app.core.config import settings
+from app.infrastructure.jobs import job_store as jobs
+from app.infrastructure.jobs.executor import (
+    get_process_pool,
+    shutdown_process_pool,
+    worker_session,
+)
+from app.infrastructure.jobs.job_store import JobStore
+from app.presentation.schemas.report import (
+    AbcRunRequest,
+    AffinityRunRequest,
+    SalesReportFilters,
+)
+from app.presentation.schemas.report_job import ReportJobCreate, ReportJobResponse
+from app.presentation.schemas.stock import ForecastRunRequest
+
+logger = logging.getLogger(__name__)
+
+RESULT_FILE = "result.json"
+
+
+# ==================== TIPOS DE JOB (executam no worker) ====================
+
+
+def _sales_report(db: Session, params: Dict[str, Any]):
+    return ReportService(db).get_sales_report(SalesReportFilters(**params))
+
+
+def _stock_report(db: Session, params: Dict[str, Any]):
+    return StockService(db).get_stock_report()
+
+
+def _abc_classification(db: Session, params: Dict[str, Any]):
+    return AbcService(db).refresh(params.get("days"))
+
+
+def _basket_affinity(db: Session, params: Dict[str, Any]):
+    # Já roda dentro de um worker: processa as faixas sequencialmente
+    return AffinityService(db).mine(parallel=False, **params)
+
+
+def _demand_forecast(db: Session, params: Dict[str, Any]):
+    # Já roda dentro de um worker: processa as faixas sequencialmente
+    return ForecastService(db).run_forecast(parallel=False, **params)
+
+
+# tipo -> (função, schema de validação dos parâmetros)
+JOB_TYPES: Dict[str, tuple] = {
+    "sales_report": (_sales_report, SalesReportFilters),
+    "stock_report": (_stock_report, None),
+    "demand_forecast": (_demand_forecast, ForecastRunRequest),
+    "abc_classification": (_abc_classification, AbcRunRequest),
+    "basket_affinity": (_basket_affinity, AffinityRunRequest),
+}
+
+
+def run_report_job(
+    job_id: str, job_type: str, params: Dict[str, Any], database_url: str, root: str
+) -> None:
+    """Ponto de entrada no processo worker (conexão própria com o banco)"""
+    store = JobStore(root)
+    store.update(
+        job_id,
+        status=jobs.RUNNING,
+        progress=0.1,
+        message="Consultando banco de dados",
+        started_at=datetime.now().isoformat(),
+        worker_pid=os.getpid(),
+    )
+    try:
+        with worker_session(database_url) as db:
+            run, _ = JOB_TYPES[job_type]
+            result = run(db, params)
+
+            store.update(job_id, progress=0.8, message="Gravando resultado")
+            with open(
+                store.result_path(job_id, RESULT_FILE), "w", encoding="utf-8"
+            ) as f:
+                json.dump(jsonable_encoder(result), f, ensure_ascii=False)
+
+            store.update(
+                job_id,
+                status=jobs.COMPLETED,
+                progress=1.0,
+                message=None,
+                result_file=RESULT_FILE,
+                finished_at=datetime.now().isoformat(),
+            )
+    except Exception as e:
+        store.update(
+            job_id,
+            status=jobs.FAILED,
+            error=str(e),
+            finished_at=datetime.now().isoformat(),
+        )
+
+
+# ==================== SERVIÇO (processo da API) ====================
+
+
+class ReportJobService:
+    """Enfileira, consulta e entrega resultados de jobs de relatório"""
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        submit: Optional[Callable[..., Future]] = None,
+    ):
+        self.store = store or JobStore()
+        self._submit = submit
+
+    def submit(self, request: ReportJobCreate) -> ReportJobResponse:
+        """Valida os parâmetros e envia o job ao pool"""
+        if request.job_type not in JOB_TYPES:
+            raise ValueError(
+                f"Tipo de job inválido: {request.job_type}. "
+                f"Disponíveis: {', '.join(JOB_TYPES)}"
+            )
+        _, schema = JOB_TYPES[request.job_type]
+        params = request.params or {}
+        if schema is not None:
+            try:
+                params = jsonable_encoder(schema(**params))
+            except ValidationError as e:
+                raise ValueError(f"Parâmetros inválidos: {e}")
+
+        self.store.purge_expired()
+        meta = self.store.create(request.job_type, params)
+        args = (
+            meta["id"],
+            request.job_type,
+            params,
+            settings.DATABASE_URL,
+            str(self.store.root),
+        )
+        try:
+            future = self._submit_to_pool(args)
+        except Exception as e:
+            meta = self.store.update(meta["id"], status=jobs.FAILED, error=str(e))
+            return self._to_response(meta)
+        future.add_done_callback(lambda f, job_id=meta["id"]: self._on_done(job_id, f))
+        return self._to_response(meta)
+
+    def _submit_to_pool(self, args: tuple) -> Future:
+        if self._submit is not None:
+            return self._submit(run_report_job, *args)
+        try:
+            return get_process_pool().submit(run_report_job, *args)
+        except BrokenProcessPool:
+            # Worker morreu (ex.: OOM): recria o pool uma vez
+            logger.warning("Pool de processos quebrado, recriando")
+            shutdown_process_pool()
+            return get_process_pool().submit(run_report_job, *args)
+
+    def _on_done(self, job_id: str, future: Future) -> None:
+        """Falhas fora do job (worker encerrado, cancelamento) viram 'failed'"""
+        if future.cancelled():
+            error = "Job cancelado"
+        elif future.exception() is not None:
+            error = f"Falha no worker: {future.exception()!r}"
+        else:
+            return
+        try:
+            self.store.update(
+                job_id,
+                status=jobs.FAILED,
+                error=error,
+                finished_at=datetime.now().isoformat(),
+            )
+        except OSError:
+            logger.exception("Não foi possível registrar falha do job %s", job_id)
+
+    def get(self, job_id: str) -> Optional[ReportJobResponse]:
+        meta = self.store.get(job_id)
+        return self._to_response(meta) if meta else None
+
+    def result_path(self, job_id: str) -> Path:
+        """Arquivo de resultado de um job concluído"""
+        meta = self.store.get(job_id)
+        if meta is None:
+            raise LookupError("Job não encontrado ou expirado")
+        if meta["status"] != jobs.COMPLETED:
+            raise ValueError(f"Job ainda não concluído (status: {meta['status']})")
+        return self.store.result_path(job_id, meta["result_file"])
+
+    @staticmethod
+    def _to_response(meta: Dict[str, Any]) -> ReportJobResponse:
+        download_url = None
+        if meta["status"] == jobs.COMPLETED:
+            download_url = f"{settings.API_V1_STR}/reports/jobs/{meta['id']}/download"
+        return ReportJobResponse(
+            id=meta["id"],
+            job_type=meta["job_type"],
+            params=meta["params"],
+            status=meta["status"],
+            progress=meta["progress"],
+            message=meta["message"],
+            error=meta["error"],
+            created_at=meta["created_at"],
+            started_at=meta["started_at"],
+            finished_at=meta["finished_at"],
+            expires_at=meta["expires_at"],
+            download_url=download_url,
+        )
@@ -1,7 +1,11 @@
 from datetime import date, datetime
 from typing import Optional
 
+import structlog
+
+from app.infrastructure.analytics.live_kpis import live_kpis
 from app.infrastructure.repositories.report_repository import ReportRepository
+from app.infrastructure.tracing.tracer import traced_class
 from app.presentation.schemas.report import (
     CategoryPerformance,
     DailySales,
@@ -16,7 +20,10 @@ from app.presentation.schemas.report import (
     TopProduct,
 )
 
+logger = structlog.get_logger(__name__)
+
 
+@traced_class
 class ReportService:
     """Serviço de relatórios e dashboard"""
 
@@ -24,47 +31,40 @@ class ReportService:
         self.db = db
         self.repo = ReportRepository(db)
 
+    @staticmethod
+    def _is_today(target_date: Optional[date]) -> bool:
+        """Dia corrente é respondido pelos contadores em memória"""
+        return target_date is None or target_date == datetime.utcnow().date()
+
     def get_dashboard_data(
         self, target_date: Optional[date] = None
     ) -> DashboardResponse:
         try:
-            print(
-                f"📊 ReportService: Iniciando geração do dashboard para data: {target_date}"
-            )
-
             # KPIs do dia
-            print("🔄 Buscando KPIs do dia...")
-            kpis_dict = self.repo.get_today_kpis(target_date)
-            print(f"✅ KPIs obtidos: {kpis_dict}")
+            if self._is_today(target_date):
+                kpis_dict = live_kpis.today_kpis()
+            else:
+                kpis_dict = self.repo.get_today_kpis(target_date)
             kpis = DashboardKPIs(**kpis_dict)
 
             # Tendências (mock ou real)
-            print("🔄 Calculando tendências...")
             trends = self.repo.get_period_comparison(target_date or date.today())
-            print(f"✅ Tendências calculadas: {trends}")
             for key, value in trends.items():
                 setattr(kpis, key, value)
 
             # Top produtos
-            print("🔄 Buscando top produtos...")
             top_products_data = self.repo.get_top_products()
-            print(f"✅ Top produtos obtidos: {len(top_products_data)} produtos")
             top_products = [TopProduct(**p) for p in top_products_data]
 
             # Vendas diárias
-            print("🔄 Buscando vendas diárias...")
             daily_sales_data = self.repo.get_daily_sales()
-            print(f"✅ Vendas diárias obtidas: {len(daily_sales_data)} registros")
             daily_sales = [DailySales(**d) for d in daily_sales_data]
 
             # Alertas de estoque
-            print("🔄 Buscando alertas de estoque...")
             stock_alerts_data = self.repo.get_stock_alerts()
-            print(f"✅ Alertas de estoque obtidos: {len(stock_alerts_data)} alertas")
             stock_alerts = [StockAlert(**a) for a in stock_alerts_data]
 
             # Metas de vendas (mock)
-            print("🔄 Gerando metas de vendas...")
             sales_goals = [
                 SalesGoal(
                     period="monthly",
@@ -76,22 +76,24 @@ class ReportService:
             ]
 
             # Performance por categoria
-            print("🔄 Buscando performance por categoria...")
             category_performance_data = self.repo.get_category_performance()
-            print(
-                f"✅ Performance por categoria obtida: {len(category_performance_data)} categorias"
-            )
             category_performance = [
                 CategoryPerformance(**c) for c in category_performance_data
             ]
 
             # Análise por hora
-            print("🔄 Buscando análise por hora...")
-            hourly_analysis_data = self.repo.get_hourly_analysis(target_date)
-            print(f"✅ Análise por hora obtida: {len(hourly_analysis_data)} registros")
+            if self._is_today(target_date):
+                hourly_analysis_data = live_kpis.hourly()
+            else:
+                hourly_analysis_data = self.repo.get_hourly_analysis(target_date)
             hourly_analysis = [HourlyAnalysis(**h) for h in hourly_analysis_data]
 
-            print("✅ Dashboard completo gerado com sucesso!")
+            logger.debug(
+                "dashboard_data_built",
+                target_date=str(target_date),
+                top_products=len(top_products),
+                stock_alerts=len(stock_alerts),
+            )
 
             # Definir período
             target_date_val = target_date or date.today()
@@ -109,13 +111,8 @@ class ReportService:
                 period_end=target_date_val,
             )
 
-        except Exception as e:
-            print(
-                f"❌ Erro no ReportService.get_dashboard_data: {type(e).__name__}: {str(e)}"
-            )
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("dashboard_data_failed", target_date=str(target_date))
             raise
 
     def get_sales_report(self, filters: SalesReportFilters) -> SalesReportResponse:
@@ -3,12 +3,22 @@ Serviço de vendas e PDV
 """
 
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
+import structlog
 from sqlalchemy.orm import Session
 
+from app.application.services.event_service import EventService
+from app.infrastructure.analytics.live_kpis import live_kpis
+from app.infrastructure.analytics.trending import trending_tracker
+from app.infrastructure.metrics.instruments import (
+    checkout_cart_items,
+    checkout_phase_duration_seconds,
+)
+from app.infrastructure.repositories.pagination import Page
 from app.infrastructure.repositories.product_repository import ProductRepository
 from app.infrastructure.repositories.sale_repository import SaleRepository
+from app.infrastructure.tracing.tracer import traced_class
 from app.presentation.schemas.product import ProductResponse
 from app.presentation.schemas.sale import (
     BarcodeInput,
@@ -22,7 +32,10 @@ from app.presentation.schemas.sale import (
     SaleSummary,
 )
 
+logger = structlog.get_logger(__name__)
+
 
+@traced_class
 class SaleService:
     """Serviço de vendas"""
 
@@ -33,6 +46,7 @@ class SaleService:
         self.db = db
         self.product_repo = ProductRepository(db)
         self.sale_repo = SaleRepository(db)
+        self.events = EventService()
         self.user_id = user_id
         if user_id is not None:
             if user_id not in self._user_carts:
@@ -41,6 +55,16 @@ class SaleService:
         else:
             self._current_cart = Cart()
 
+    @classmethod
+    def cart_stats(cls) -> Dict[str, int]:
+        """Carrinhos em memória (inclusive vazios ou abandonados)"""
+        carts = list(cls._user_carts.values())
+        return {
+            "carts": len(carts),
+            "non_empty_carts": sum(1 for cart in carts if cart.items),
+            "items": sum(len(cart.items) for cart in carts),
+        }
+
     def _calculate_item_total(
         self, product: ProductResponse, quantity: float, weight: Optional[float] = None
     ) -> Tuple[float, float, float]:
@@ -93,56 +117,67 @@ class SaleService:
         return cart
 
     def add_product_by_barcode(self, barcode_input: BarcodeInput) -> Dict[str, Any]:
-        product = self.product_repo.get_by_barcode(barcode_input.barcode)
-        if not product:
-            raise ValueError(
-                f"Produto com código {barcode_input.barcode} não encontrado"
-            )
-        if not product.is_active:
-            raise ValueError("Produto inativo")
-        required_quantity = (
-            barcode_input.weight
-            if product.requires_weighing
-            else barcode_input.quantity
-        )
-        if product.stock_quantity < required_quantity:
-            raise ValueError(
-                f"Estoque insuficiente. Disponível: {product.stock_quantity}"
-            )
         from app.application.services.product_service import ProductService
 
-        product_service = ProductService(self.db)
-        product_response = product_service.get_product(product.id)
-        existing_item = None
-        for item in self._current_cart.items:
-            if item.product_id == product.id:
-                existing_item = item
-                break
-        if existing_item:
-            new_quantity = existing_item.quantity + barcode_input.quantity
-            new_weight = None
-            if product_response.requires_weighing:
-                new_weight = (existing_item.weight or 0) + (barcode_input.weight or 0)
-            original_total, bulk_discount, final_total = self._calculate_item_total(
-                product_response, new_quantity, new_weight
-            )
-            existing_item.quantity = new_quantity
-            existing_item.weight = new_weight
-            existing_item.original_total = original_total
-            existing_item.bulk_discount_applied = bulk_discount
-            existing_item.final_total = final_total
-            existing_item.has_promotion = bulk_discount > 0
-            if bulk_discount > 0:
-                existing_item.promotion_description = f"{product_response.bulk_min_quantity}+ unidades = {product_response.bulk_discount_percentage}% OFF"
-        else:
-            cart_item = self._create_cart_item(
-                product_response, barcode_input.quantity, barcode_input.weight
+        # Uma observação de "lookup" por leitura: código de barras + produto
+        with checkout_phase_duration_seconds.time(phase="lookup"):
+            product = self.product_repo.get_by_barcode(barcode_input.barcode)
+            if not product:
+                raise ValueError(
+                    f"Produto com código {barcode_input.barcode} não encontrado"
+                )
+            if not product.is_active:
+                raise ValueError("Produto inativo")
+            required_quantity = (
+                barcode_input.weight
+                if product.requires_weighing
+                else barcode_input.quantity
             )
-            self._current_cart.items.append(cart_item)
-        self._current_cart = self._recalculate_cart(self._current_cart)
+            if product.stock_quantity < required_quantity:
+                raise ValueError(
+                    f"Estoque insuficiente. Disponível: {product.stock_quantity}"
+                )
+            product_response = ProductService(self.db).get_product(product.id)
+        with checkout_phase_duration_seconds.time(phase="pricing"):
+            existing_item = None
+            for item in self._current_cart.items:
+                if item.product_id == product.id:
+                    existing_item = item
+                    break
+            if existing_item:
+                new_quantity = existing_item.quantity + barcode_input.quantity
+                new_weight = None
+                if product_response.requires_weighing:
+                    new_weight = (existing_item.weight or 0) + (
+                        barcode_input.weight or 0
+                    )
+                original_total, bulk_discount, final_total = self._calculate_item_total(
+                    product_response, new_quantity, new_weight
+                )
+                existing_item.quantity = new_quantity
+                existing_item.weight = new_weight
+                existing_item.original_total = original_total
+                existing_item.bulk_discount_applied = bulk_discount
+                existing_item.final_total = final_total
+                existing_item.has_promotion = bulk_discount > 0
+                if bulk_discount > 0:
+                    existing_item.promotion_description = f"{product_response.bulk_min_quantity}+ unidades = {product_response.bulk_discount_percentage}% OFF"
+            else:
+                cart_item = self._create_cart_item(
+                    product_response, barcode_input.quantity, barcode_input.weight
+                )
+                self._current_cart.items.append(cart_item)
+            self._current_cart = self._recalculate_cart(self._current_cart)
         # Atualiza o carrinho global do usuário, se aplicável
         if self.user_id is not None:
             self._user_carts[self.user_id] = self._current_cart
+        # Alto volume: amostrado conforme LOG_SAMPLING
+        logger.info(
+            "pdv_item_added",
+            user_id=self.user_id,
+            product_id=product.id,
+            cart_items=len(self._current_cart.items),
+        )
         return {
             "success": True,
             "message": f"Produto {product_response.name} adicionado",
@@ -207,6 +242,7 @@ class SaleService:
             raise ValueError("Carrinho vazio")
         if payment_request.amount_received < self._current_cart.final_total:
             raise ValueError("Valor recebido insuficiente")
+        checkout_cart_items.observe(len(self._current_cart.items))
         sale_items = []
         for cart_item in self._current_cart.items:
             sale_items.append(
@@ -232,39 +268,63 @@ class SaleService:
             "items": sale_items,
         }
         # Salva a venda no banco e retorna o objeto sale
-        sale = self.sale_repo.create_sale(sale_data)
-        for cart_item in self._current_cart.items:
-            product = self.product_repo.get_by_id(cart_item.product_id)
-            if product:
-                quantity_to_remove = (
-                    cart_item.weight
-                    if cart_item.requires_weighing
-                    else cart_item.quantity
-                )
-                product.stock_quantity -= quantity_to_remove
-                self.db.commit()
-        change_amount = payment_request.amount_received - self._current_cart.final_total
-        receipt_data = {
-            "sale_id": sale.id,
-            "date": sale.created_at.strftime("%d/%m/%Y %H:%M:%S"),
-            "items": [
-                {
-                    "name": item.product_name,
-                    "quantity": item.quantity,
-                    "weight": item.weight,
-                    "unit_price": item.unit_price,
-                    "total": item.final_total,
-                    "discount": item.bulk_discount_applied,
-                }
-                for item in self._current_cart.items
-            ],
-            "subtotal": self._current_cart.subtotal,
-            "total_discount": self._current_cart.bulk_discount,
-            "final_total": self._current_cart.final_total,
-            "payment_method": payment_request.payment_method.value,
-            "amount_received": payment_request.amount_received,
-            "change": change_amount,
-        }
+        with checkout_phase_duration_seconds.time(phase="persist"):
+            sale = self.sale_repo.create_sale(sale_data)
+        with checkout_phase_duration_seconds.time(phase="stock"):
+            for cart_item in self._current_cart.items:
+                product = self.product_repo.get_by_id(cart_item.product_id)
+                if product:
+                    quantity_to_remove = (
+                        cart_item.weight
+                        if cart_item.requires_weighing
+                        else cart_item.quantity
+                    )
+                    previous_quantity = product.stock_quantity
+                    product.stock_quantity -= quantity_to_remove
+                    self.db.commit()
+                    self.events.stock_changed(product, previous_quantity)
+        live_kpis.record_sale(
+            sale.created_at,
+            sale.final_amount,
+            sum(item.quantity for item in self._current_cart.items),
+        )
+        trending_tracker.record_sale(
+            sale.created_at,
+            [(item.product_id, item.quantity) for item in self._current_cart.items],
+        )
+        self.events.sale_changed(sale, "completed", len(self._current_cart.items))
+        logger.info(
+            "sale_completed",
+            sale_id=sale.id,
+            user_id=user_id,
+            amount=sale.final_amount,
+            items=len(self._current_cart.items),
+        )
+        with checkout_phase_duration_seconds.time(phase="receipt"):
+            change_amount = (
+                payment_request.amount_received - self._current_cart.final_total
+            )
+            receipt_data = {
+                "sale_id": sale.id,
+                "date": sale.created_at.strftime("%d/%m/%Y %H:%M:%S"),
+                "items": [
+                    {
+                        "name": item.product_name,
+                        "quantity": item.quantity,
+                        "weight": item.weight,
+                        "unit_price": item.unit_price,
+                        "total": item.final_total,
+                        "discount": item.bulk_discount_applied,
+                    }
+                    for item in self._current_cart.items
+                ],
+                "subtotal": self._current_cart.subtotal,
+                "total_discount": self._current_cart.bulk_discount,
+                "final_total": self._current_cart.final_total,
+                "payment_method": payment_request.payment_method.value,
+                "amount_received": payment_request.amount_received,
+                "change": change_amount,
+            }
         self._current_cart = Cart()
         if self.user_id is not None:
             self._user_carts[self.user_id] = self._current_cart
@@ -291,7 +351,8 @@ class SaleService:
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[SaleSummary]:
+        cursor: Optional[str] = None,
+    ) -> Page:
         sales = self.sale_repo.get_sales_by_filters(
             start_date=start_date,
             end_date=end_date,
@@ -299,6 +360,7 @@ class SaleService:
             status=status,
             skip=skip,
             limit=limit,
+            cursor=cursor,
         )
         result = []
         for sale in sales:
@@ -312,10 +374,23 @@ class SaleService:
                 cashier_name=sale.user.full_name,
             )
             result.append(summary)
-        return result
+        return Page(result, sales.next_cursor)
 
     def cancel_sale(self, sale_id: int, user_id: int) -> bool:
-        return self.sale_repo.cancel_sale(sale_id, user_id)
+        cancelled = self.sale_repo.cancel_sale(sale_id, user_id)
+        if cancelled:
+            sale = self.sale_repo.get_by_id(sale_id)
+            live_kpis.cancel_sale(
+                sale.created_at,
+                sale.final_amount,
+                sum(item.quantity for item in sale.items),
+            )
+            trending_tracker.cancel_sale(
+                sale.created_at,
+                [(item.product_id, item.quantity) for item in sale.items],
+            )
+            self.events.sale_changed(sale, "cancelled", len(sale.items))
+        return cancelled
 
     def _convert_to_sale_response(self, sale) -> SaleResponse:
         items = []
@@ -2,17 +2,23 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 
+from app.application.services.abc_service import CLASS_PRIORITY
+from app.application.services.event_service import EventService
 from app.infrastructure.database.models.product import Product
 from app.infrastructure.database.models.stock import (
     MovementType,
     StockMovement,
     Supplier,
 )
+from app.infrastructure.repositories.pagination import Page, keyset_page
+from app.infrastructure.repositories.velocity_repository import VelocityRepository
+from app.infrastructure.tracing.tracer import traced_class
 
 
+@traced_class
 class StockService:
     def __init__(self, db: Session):
         self.db = db
@@ -90,6 +96,7 @@ class StockService:
         self.db.add(movement)
         self.db.commit()
         self.db.refresh(movement)
+        EventService().stock_changed(product, previous_quantity)
 
         return movement
 
@@ -101,8 +108,9 @@ class StockService:
         end_date: Optional[datetime] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[StockMovement]:
-        """Buscar movimentações de estoque"""
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Buscar movimentações de estoque (mais recentes primeiro)"""
 
         query = self.db.query(StockMovement)
 
@@ -118,11 +126,12 @@ class StockService:
         if end_date:
             query = query.filter(StockMovement.created_at <= end_date)
 
-        return (
-            query.order_by(desc(StockMovement.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return keyset_page(
+            query,
+            (StockMovement.created_at, StockMovement.id),
+            cursor,
+            limit,
+            skip=skip,
         )
 
     # ==================== ALERTAS DE ESTOQUE ====================
@@ -140,6 +149,12 @@ class StockService:
             .all()
         )
 
+        # Dias até ruptura de todos os produtos em uma única consulta
+        days_to_stockout = VelocityRepository(self.db).get_days_to_stockout_map(
+            [product.id for product in products],
+            [product.stock_quantity for product in products],
+        )
+
         alerts = []
         for product in products:
             alert_level = "critical" if product.stock_quantity == 0 else "warning"
@@ -154,43 +169,20 @@ class StockService:
                     "min_stock": product.min_stock_level,
                     "reorder_point": product.reorder_point,
                     "alert_level": alert_level,
-                    "days_without_stock": self._calculate_days_without_stock(product),
+                    "days_without_stock": days_to_stockout[product.id],
+                    "abc_class": product.abc_class,
                 }
             )
 
-        return sorted(alerts, key=lambda x: x["current_quantity"])
-
-    def _calculate_days_without_stock(self, product: Product) -> Optional[int]:
-        """Calcular quantos dias até ficar sem estoque"""
-        if product.stock_quantity == 0:
-            return 0
-
-        # Calcular média de vendas dos últimos 30 dias
-        thirty_days_ago = datetime.now() - timedelta(days=30)
-
-        movements = (
-            self.db.query(StockMovement)
-            .filter(
-                and_(
-                    StockMovement.product_id == product.id,
-                    StockMovement.movement_type == MovementType.SAIDA,
-                    StockMovement.created_at >= thirty_days_ago,
-                )
-            )
-            .all()
+        # Itens classe A primeiro
+        return sorted(
+            alerts,
+            key=lambda x: (
+                CLASS_PRIORITY.get(x["abc_class"], 3),
+                x["current_quantity"],
+            ),
         )
 
-        if not movements:
-            return None
-
-        total_sold = sum(m.quantity for m in movements)
-        avg_daily_sales = total_sold / 30
-
-        if avg_daily_sales == 0:
-            return None
-
-        return int(product.stock_quantity / avg_daily_sales)
-
     # ==================== RELATÓRIOS DE ESTOQUE ====================
 
     def get_stock_report(self) -> Dict[str, Any]:
@@ -205,7 +197,15 @@ class StockService:
             .count()
         )
 
-        low_stock_count = len(self.get_low_stock_alerts())
+        low_stock_count = (
+            self.db.query(Product)
+            .filter(
+                and_(
+                    Product.is_active, Product.stock_quantity <= Product.min_stock_level
+                )
+            )
+            .count()
+        )
 
         # Valor total do estoque
         total_stock_value = (
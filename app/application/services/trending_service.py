@@ -0,0 +1,57 @@
+"""
+Serviço de produtos em alta (top-k em tempo real)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.analytics.trending import TrendingTracker, trending_tracker
+from app.infrastructure.database.models.product import Product
+
+
+class TrendingService:
+    """Lê o top-k das janelas em memória e completa com dados do produto"""
+
+    def __init__(self, db: Session, tracker: Optional[TrendingTracker] = None):
+        self.db = db
+        self.tracker = tracker or trending_tracker
+
+    def get_trending(self, window: str = "1h", limit: int = 10) -> Dict[str, Any]:
+        """Produtos mais vendidos na janela (uma consulta para os k produtos)"""
+        items = self.tracker.top(window, limit)
+        product_ids = [item["product_id"] for item in items]
+        products = {}
+        if product_ids:
+            rows = self.db.execute(
+                select(Product.id, Product.name, Product.price).where(
+                    Product.id.in_(product_ids)
+                )
+            )
+            products = {row[0]: (row[1], row[2]) for row in rows}
+        return {
+            "window": window,
+            "generated_at": datetime.now(),
+            "items": [
+                {
+                    **item,
+                    "product_name": products.get(item["product_id"], ("", 0))[0],
+                    "price": float(products.get(item["product_id"], ("", 0))[1] or 0),
+                }
+                for item in items
+            ],
+        }
+
+    def get_top_today(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Top do dia no formato do dashboard"""
+        return [
+            {
+                "name": item["product_name"],
+                "price": item["price"],
+                "quantity_sold": int(item["quantity"]),
+                "times_sold": item["times_sold"],
+            }
+            for item in self.get_trending("today", limit)["items"]
+        ]
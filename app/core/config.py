@@ -20,6 +20,8 @@ class Settings(BaseSettings):
     # API
     API_V1_STR: str = "/api/v1"
     DEBUG: bool = True
+    # Workers do uvicorn/gunicorn (a mesma variável que eles leem)
+    WEB_CONCURRENCY: int = 1
 
     # Segurança
     SECRET_KEY: str = "sua-chave-secreta-super-segura-mude-em-producao"
@@ -29,6 +31,8 @@ class Settings(BaseSettings):
     # Banco de dados
     DATABASE_URL: str = "sqlite:///./supermarket.db"
     DATABASE_URL_DEV: str = "sqlite:///./supermarket_dev.db"
+    # SQLite em WAL: leituras (relatórios, backup) não bloqueiam o caixa
+    SQLITE_WAL: bool = True
 
     # CORS
     CORS_ORIGINS: List[str] = [
@@ -49,12 +53,135 @@ class Settings(BaseSettings):
 
     # Logs
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "console"  # console | json
+    # Níveis por módulo, ex.: "sqlalchemy.engine=INFO,app.infrastructure=DEBUG"
+    LOG_LEVELS: str = "sqlalchemy.engine=WARNING"
+    # Fração mantida de eventos de alto volume (nome do evento ou do logger)
+    LOG_SAMPLING: str = "pdv_item_added=0.1"
+
+    # Analytics em memória
+    ANALYTICS_REFRESH_SECONDS: int = 30
+
+    # Produtos em alta (contadores Space-Saving por balde de tempo)
+    TRENDING_CAPACITY: int = 200
+
+    # KPIs do dia em memória (só com um worker; com mais, lidos do banco)
+    LIVE_KPIS_SNAPSHOT_PATH: str = "./data/live_kpis.npz"
+    LIVE_KPIS_PERSIST_SECONDS: int = 60
+
+    # Eventos em tempo real (SSE; fan-out em memória, só com um worker)
+    EVENTS_QUEUE_SIZE: int = 100
+    EVENTS_HISTORY_SIZE: int = 200
+    EVENTS_HEARTBEAT_SECONDS: int = 15
+    EVENTS_RETRY_MS: int = 5000
+
+    # Health check
+    HEALTH_DETAILS_TTL_SECONDS: int = 10
+
+    # Métricas (/metrics); com vários workers, um diretório compartilhado
+    METRICS_DIR: str = ""
+    METRICS_FLUSH_SECONDS: int = 5
+
+    # Perfilamento sob demanda (X-Profile: 1 com token de admin)
+    PROFILING_ENABLED: bool = True
+    PROFILES_DIR: str = "./data/profiles"
+    PROFILES_MAX: int = 50
+    PROFILE_SAMPLE_INTERVAL_MS: int = 5
+    PROFILE_MAX_SECONDS: int = 60
+    MEMORY_SNAPSHOTS_MAX: int = 5
+
+    # Log de consultas lentas (com EXPLAIN)
+    SLOW_QUERY_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN: bool = True
+    SLOW_QUERY_MAX_ENTRIES: int = 200
+    SLOW_QUERY_MAX_STATEMENT_LENGTH: int = 4000
+
+    # Tracing local (spans em memória e, opcionalmente, em arquivo)
+    TRACING_ENABLED: bool = True
+    TRACING_SAMPLE_RATE: float = 0.1
+    TRACING_RING_SIZE: int = 200
+    TRACING_MAX_SPANS: int = 1000
+    TRACING_MAX_STATEMENT_LENGTH: int = 500
+    TRACING_FILE: str = ""  # ex.: ./data/traces.jsonl
+    TRACING_FILE_FORMAT: str = "otlp"  # otlp | native
+    TRACING_SERVICE_NAME: str = "supermarket-api"
+
+    # Captura de tráfego para replay (scripts/replay_traffic.py)
+    CAPTURE_ENABLED: bool = False
+    CAPTURE_DIR: str = "./data/capture"
+    CAPTURE_MAX_BYTES: int = 50 * 1024 * 1024
+    CAPTURE_MAX_FILES: int = 20
+    CAPTURE_SAMPLE_RATE: float = 1.0  # Por usuário: sessões inteiras
+    CAPTURE_MAX_BODY_BYTES: int = 64 * 1024
+    CAPTURE_EXCLUDE_PATHS: str = (
+        "/metrics,/health,/docs,/openapi.json,/api/v1/events,/api/v1/admin"
+    )
+    # Redigidos em qualquer corpo ou query
+    CAPTURE_REDACT_FIELDS: str = (
+        "password,current_password,new_password,access_token,token,"
+        "cpf,email,phone,address"
+    )
+    # "<prefixo da rota>:<campo>": nomes e documentos de pessoas, não os do
+    # catálogo (produtos, categorias e fornecedores continuam no replay)
+    CAPTURE_REDACT_ROUTE_FIELDS: str = (
+        "/api/v1/auth:username,/api/v1/auth:full_name,"
+        "/api/v1/customers:name,/api/v1/customers:document"
+    )
+
+    # Exportações
+    EXPORT_BATCH_SIZE: int = 2000
+    EXPORT_PDF_MAX_ROWS: int = 20000
+
+    # Estoque
+    STOCK_VELOCITY_WINDOW_DAYS: int = 30
+
+    # Curva ABC
+    ABC_WINDOW_DAYS: int = 90
+    ABC_A_SHARE: float = 0.8
+    ABC_B_SHARE: float = 0.95
+
+    # Afinidade de produtos (comprados juntos)
+    AFFINITY_WINDOW_DAYS: int = 180
+    AFFINITY_SHARDS: int = 8
+    AFFINITY_MIN_PAIR_COUNT: int = 5
+    AFFINITY_MIN_LIFT: float = 1.0
+    AFFINITY_TOP_N: int = 10
+    AFFINITY_MAX_BASKET_SIZE: int = 50
+    AFFINITY_MAX_PAIRS: int = 5_000_000
+
+    # Reposição automática
+    REORDER_LEAD_TIME_DAYS: int = 3
+    REORDER_COVERAGE_DAYS: int = 14
+
+    # Previsão de demanda
+    FORECAST_HORIZON_DAYS: int = 14
+    FORECAST_HISTORY_DAYS: int = 730
+    FORECAST_SHARDS: int = 8
+
+    # Arquivo mensal de vendas e movimentações (scripts/roll_partitions.py).
+    # Acima de FORECAST_HISTORY_DAYS para a previsão ler só as tabelas vivas
+    ARCHIVE_AFTER_MONTHS: int = 25
+
+    # Backup online (scripts/backup.py, agendado pela API quando habilitado).
+    # Desligado por padrão: servidores de desenvolvimento e de medição não
+    # devem disparar cópias; produção liga no .env / docker-compose
+    BACKUP_ENABLED: bool = False
+    BACKUP_INTERVAL_HOURS: int = 24
+    BACKUP_DIR: str = "./data/backups"
+    BACKUP_KEEP: int = 7
+    BACKUP_STEP_PAGES: int = 256  # SQLite: páginas copiadas por passo
+    BACKUP_MAX_MB_PER_SECOND: float = 10.0  # Limite de leitura do banco
+    BACKUP_PG_DUMP_COMMAND: str = "pg_dump"
+
+    # Jobs de relatórios
+    REPORT_JOBS_DIR: str = "./data/report_jobs"
+    REPORT_JOBS_WORKERS: int = 2
+    REPORT_JOBS_TTL_HOURS: int = 24
 
     # Campos extras do .env
     PAYMENT_TERMINAL_ENABLED: bool = False
     ENVIRONMENT: str = "development"
-    BACKUP_ENABLED: bool = True
-    BACKUP_INTERVAL_HOURS: int = 24
 
     @validator("CORS_ORIGINS", pre=True)
     def assemble_cors_origins(cls, v):
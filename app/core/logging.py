@@ -0,0 +1,136 @@
+"""
+Configuração de logs estruturados (structlog sobre o logging padrão)
+
+Os handlers da aplicação só enfileiram o registro; formatação e escrita em
+stderr acontecem numa thread do QueueListener, fora da thread da requisição.
+Eventos de alto volume podem ser amostrados (LOG_SAMPLING) antes de entrar
+na fila; WARNING e acima nunca são descartados.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from typing import Dict, Optional
+
+import structlog
+
+from app.core.config import settings
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _parse_pairs(value: str) -> Dict[str, str]:
+    """'a=1,b=2' -> {'a': '1', 'b': '2'}"""
+    pairs = {}
+    for item in value.split(","):
+        if "=" in item:
+            key, _, val = item.partition("=")
+            pairs[key.strip()] = val.strip()
+    return pairs
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Mantém só uma fração dos registros de eventos de alto volume
+
+    A taxa é procurada pelo nome do evento (structlog) e depois pelo nome do
+    logger, ex.: ``LOG_SAMPLING="pdv_item_added=0.1,uvicorn.access=0.05"``.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not self.rates or record.levelno >= logging.WARNING:
+            return True
+        event = record.msg.get("event") if isinstance(record.msg, dict) else None
+        rate = self.rates.get(event, self.rates.get(record.name))
+        return rate is None or random.random() < rate
+
+
+def _capture_exc_info(logger, method_name, event_dict):
+    """Resolve ``exc_info=True`` ainda na thread que registrou o evento"""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enfileira o registro sem formatá-lo (o listener formata)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging() -> None:
+    """Configura structlog + logging padrão com fila (idempotente)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    shared_processors = [
+        structlog.contextvars.merge_contextvars,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+    ]
+    structlog.configure(
+        processors=shared_processors
+        + [_capture_exc_info, structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
+    renderer = (
+        structlog.processors.JSONRenderer()
+        if settings.LOG_FORMAT == "json"
+        else structlog.dev.ConsoleRenderer(colors=False)
+    )
+    output = logging.StreamHandler()
+    output.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=shared_processors,
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.format_exc_info,
+                renderer,
+            ],
+        )
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    rates = {
+        key: float(value) for key, value in _parse_pairs(settings.LOG_SAMPLING).items()
+    }
+    queue_handler.addFilter(SamplingFilter(rates))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(settings.LOG_LEVEL.upper())
+    for name, level in _parse_pairs(settings.LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level.upper())
+    # uvicorn configura handlers próprios (escrita síncrona); passa pela fila
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, output, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Esvazia a fila e para o listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
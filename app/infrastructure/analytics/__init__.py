@@ -0,0 +1,3 @@
+"""
+Estruturas analíticas em memória
+"""
@@ -0,0 +1,115 @@
+"""
+Contagem de pares de produtos na mesma venda (itemsets frequentes de tamanho 2)
+
+Apriori em dois níveis: só entram produtos que já são frequentes sozinhos
+(um par não pode ser mais frequente que seus itens). Cada produto frequente
+recebe um índice denso e o par (a, b), com a < b, vira uma chave int64
+``a * n + b``. Os pares são gerados em lote com NumPy, comparando cada item
+com o item ``k`` posições adiante dentro da mesma venda.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+class PairCounter:
+    """
+    Acumulador de contagens de pares com memória limitada
+
+    As chaves novas ficam em buffer e são consolidadas (np.unique) quando o
+    buffer enche. Se o número de pares distintos passar de ``max_pairs``, os
+    pares com menor contagem são descartados e ``floor`` registra o maior
+    valor descartado (erro máximo por par, como em lossy counting).
+    """
+
+    def __init__(self, n_items: int, max_pairs: int, buffer_size: int = 2_000_000):
+        self.n_items = n_items
+        self.max_pairs = max_pairs
+        self.buffer_size = buffer_size
+        self.floor = 0
+        self._keys = np.empty(0, dtype=np.int64)
+        self._counts = np.empty(0, dtype=np.int64)
+        self._buffer = []
+        self._buffered = 0
+
+    def add(self, keys: np.ndarray, counts: np.ndarray = None) -> None:
+        if len(keys) == 0:
+            return
+        if counts is None:
+            counts = np.ones(len(keys), dtype=np.int64)
+        self._buffer.append((keys, counts))
+        self._buffered += len(keys)
+        if self._buffered >= self.buffer_size:
+            self._compact()
+
+    def _compact(self) -> None:
+        if not self._buffer:
+            return
+        keys = np.concatenate([self._keys] + [chunk[0] for chunk in self._buffer])
+        counts = np.concatenate([self._counts] + [chunk[1] for chunk in self._buffer])
+        self._buffer = []
+        self._buffered = 0
+
+        self._keys, inverse = np.unique(keys, return_inverse=True)
+        self._counts = np.bincount(inverse, weights=counts).astype(np.int64)
+
+        while len(self._keys) > self.max_pairs:
+            self.floor += 1
+            keep = self._counts > self.floor
+            self._keys, self._counts = self._keys[keep], self._counts[keep]
+
+    def result(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Chaves ordenadas e contagens"""
+        self._compact()
+        return self._keys, self._counts
+
+    def split(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Índices densos (a, b) de cada chave"""
+        return keys // self.n_items, keys % self.n_items
+
+
+def basket_pair_keys(
+    sale_ids: np.ndarray,
+    item_index: np.ndarray,
+    n_items: int,
+    max_basket_size: int,
+) -> np.ndarray:
+    """
+    Chaves de todos os pares distintos dentro de cada venda
+
+    ``item_index`` já deve estar mapeado para índices densos (-1 = produto
+    não frequente). Vendas com mais de ``max_basket_size`` produtos
+    distintos são ignoradas: geram O(n²) pares e quase sempre são compras
+    atípicas (atacado, inventário).
+    """
+    keep = item_index >= 0
+    sale_ids, item_index = sale_ids[keep], item_index[keep]
+    if len(sale_ids) < 2:
+        return np.empty(0, dtype=np.int64)
+
+    order = np.lexsort((item_index, sale_ids))
+    sale_ids, item_index = sale_ids[order], item_index[order]
+    # Mesmo produto repetido na venda conta uma vez
+    distinct = np.ones(len(sale_ids), dtype=bool)
+    distinct[1:] = (sale_ids[1:] != sale_ids[:-1]) | (item_index[1:] != item_index[:-1])
+    sale_ids, item_index = sale_ids[distinct], item_index[distinct]
+
+    _, sizes = np.unique(sale_ids, return_counts=True)
+    oversized = sizes > max_basket_size
+    if oversized.any():
+        keep = np.repeat(~oversized, sizes)
+        sale_ids, item_index = sale_ids[keep], item_index[keep]
+        sizes = sizes[~oversized]
+    if len(sizes) == 0 or sizes.max() < 2:
+        return np.empty(0, dtype=np.int64)
+
+    chunks = []
+    for offset in range(1, int(sizes.max())):
+        same = sale_ids[offset:] == sale_ids[:-offset]
+        if not same.any():
+            break
+        first = item_index[:-offset][same].astype(np.int64)
+        second = item_index[offset:][same].astype(np.int64)
+        chunks.append(first * n_items + second)
+    return np.concatenate(chunks)
@@ -0,0 +1,315 @@
+"""
+KPIs do dia em memória (séries por minuto em buffer circular)
+
+Um buffer de 1440 posições (24 h) guarda, por minuto, receita, número de
+vendas e itens vendidos. Cada posição leva o minuto absoluto a que se
+refere; posições de outro dia são ignoradas na leitura e sobrescritas na
+escrita, então não há "virada do dia" explícita.
+
+Checkout e cancelamento atualizam o minuto da venda. O estado é salvo em
+disco periodicamente e, na inicialização, carregado e conciliado com o
+banco (o banco prevalece).
+
+O buffer é do processo: com vários workers (``WEB_CONCURRENCY > 1``) cada
+um só veria as próprias vendas, então os contadores ficam desligados e as
+leituras do dia vão ao banco (``ReportRepository``).
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import structlog
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.database.connection import SessionLocal
+from app.infrastructure.database.models.sale import Sale, SaleItem, SaleStatus
+from app.infrastructure.repositories.report_repository import ReportRepository
+
+logger = structlog.get_logger(__name__)
+
+MINUTES_PER_DAY = 24 * 60
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _minute(at: datetime) -> int:
+    """Minuto absoluto (UTC ingênuo, como Sale.created_at)"""
+    return int((at - _EPOCH).total_seconds() // 60)
+
+
+class LiveKpiCounters:
+    """Receita, vendas e itens por minuto das últimas 24 horas"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        snapshot_path: Optional[str] = None,
+        persist_interval: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self._session_factory = session_factory
+        self.enabled = settings.WEB_CONCURRENCY <= 1 if enabled is None else enabled
+        self.snapshot_path = Path(snapshot_path or settings.LIVE_KPIS_SNAPSHOT_PATH)
+        self.persist_interval = (
+            settings.LIVE_KPIS_PERSIST_SECONDS
+            if persist_interval is None
+            else persist_interval
+        )
+        self._lock = threading.Lock()
+        self._stamp = np.full(MINUTES_PER_DAY, -1, dtype=np.int64)
+        self._revenue = np.zeros(MINUTES_PER_DAY)
+        self._transactions = np.zeros(MINUTES_PER_DAY, dtype=np.int64)
+        self._items = np.zeros(MINUTES_PER_DAY)
+        self._persisted_at = time.monotonic()
+        self._loaded = False
+
+    # ==================== ESCRITA ====================
+
+    def _add(
+        self, at: datetime, revenue: float, transactions: int, items: float
+    ) -> None:
+        minute = _minute(at)
+        if minute <= _minute(datetime.utcnow()) - MINUTES_PER_DAY:
+            return  # Fora do buffer (ex.: cancelamento de venda antiga)
+        slot = minute % MINUTES_PER_DAY
+        if self._stamp[slot] != minute:
+            self._stamp[slot] = minute
+            self._revenue[slot] = 0.0
+            self._transactions[slot] = 0
+            self._items[slot] = 0.0
+        self._revenue[slot] += revenue
+        self._transactions[slot] += transactions
+        self._items[slot] += items
+
+    def record_sale(self, at: datetime, amount: float, items: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._add(at, amount, 1, items)
+        self._maybe_persist()
+
+    def cancel_sale(self, at: datetime, amount: float, items: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._add(at, -amount, -1, -items)
+        self._maybe_persist()
+
+    # ==================== LEITURA ====================
+
+    def _today_mask(self, now: datetime) -> np.ndarray:
+        start = _minute(datetime.combine(now.date(), datetime.min.time()))
+        return (self._stamp >= start) & (self._stamp <= _minute(now))
+
+    def _from_database(self, read: Callable[[ReportRepository], object]):
+        db = self._session_factory()
+        try:
+            return read(ReportRepository(db))
+        finally:
+            db.close()
+
+    def today_kpis(self) -> Dict[str, float]:
+        """Mesmo formato de ReportRepository.get_today_kpis"""
+        if not self.enabled:
+            today = datetime.utcnow().date()
+            return self._from_database(lambda repo: repo.get_today_kpis(today))
+        self._ensure_loaded()
+        with self._lock:
+            mask = self._today_mask(datetime.utcnow())
+            revenue = float(self._revenue[mask].sum())
+            transactions = int(self._transactions[mask].sum())
+            items = float(self._items[mask].sum())
+        return {
+            "today_sales": round(revenue, 2),
+            "today_transactions": transactions,
+            "products_sold": int(items),
+            "customers_served": transactions,
+            "average_ticket": round(revenue / transactions, 2) if transactions else 0.0,
+        }
+
+    def hourly(self) -> List[Dict[str, float]]:
+        """Mesmo formato de ReportRepository.get_hourly_analysis (dia corrente)"""
+        if not self.enabled:
+            today = datetime.utcnow().date()
+            return self._from_database(lambda repo: repo.get_hourly_analysis(today))
+        self._ensure_loaded()
+        with self._lock:
+            mask = self._today_mask(datetime.utcnow())
+            hours = (self._stamp[mask] % MINUTES_PER_DAY) // 60
+            revenue = np.bincount(hours, weights=self._revenue[mask], minlength=24)
+            transactions = np.bincount(
+                hours, weights=self._transactions[mask], minlength=24
+            ).astype(np.int64)
+        return [
+            {
+                "hour": hour,
+                "sales_amount": round(float(revenue[hour]), 2),
+                "transactions_count": int(transactions[hour]),
+                "average_ticket": round(
+                    float(revenue[hour]) / int(transactions[hour]), 2
+                ),
+            }
+            for hour in range(24)
+            if transactions[hour] > 0
+        ]
+
+    def series(self, minutes: int = 60) -> List[Dict[str, float]]:
+        """Últimos ``minutes`` minutos (inclusive os sem venda; zerados se desligado)"""
+        self._ensure_loaded()
+        now = _minute(datetime.utcnow())
+        absolute = np.arange(now - minutes + 1, now + 1)
+        slots = absolute % MINUTES_PER_DAY
+        with self._lock:
+            valid = self._stamp[slots] == absolute
+            revenue = np.where(valid, self._revenue[slots], 0.0)
+            transactions = np.where(valid, self._transactions[slots], 0)
+        return [
+            {
+                "minute": _EPOCH + timedelta(minutes=int(value)),
+                "revenue": round(float(revenue[index]), 2),
+                "transactions": int(transactions[index]),
+            }
+            for index, value in enumerate(absolute)
+        ]
+
+    # ==================== PERSISTÊNCIA / CONCILIAÇÃO ====================
+
+    def persist(self) -> None:
+        """Grava o buffer em disco (troca atômica do arquivo)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            stamp, revenue = self._stamp.copy(), self._revenue.copy()
+            transactions, items = self._transactions.copy(), self._items.copy()
+            self._persisted_at = time.monotonic()
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.snapshot_path.with_suffix(".tmp.npz")
+        np.savez(
+            temp_path,
+            stamp=stamp,
+            revenue=revenue,
+            transactions=transactions,
+            items=items,
+        )
+        os.replace(temp_path, self.snapshot_path)
+
+    def _maybe_persist(self) -> None:
+        if time.monotonic() - self._persisted_at < self.persist_interval:
+            return
+        try:
+            self.persist()
+        except OSError:
+            logger.exception("live_kpis_persist_failed", path=str(self.snapshot_path))
+
+    def _load_snapshot(self) -> bool:
+        if not self.snapshot_path.exists():
+            return False
+        try:
+            with np.load(self.snapshot_path) as snapshot:
+                self._stamp = snapshot["stamp"]
+                self._revenue = snapshot["revenue"]
+                self._transactions = snapshot["transactions"]
+                self._items = snapshot["items"]
+        except (OSError, KeyError, ValueError):
+            logger.warning("live_kpis_snapshot_invalid", path=str(self.snapshot_path))
+            return False
+        return True
+
+    def reconcile(self) -> int:
+        """
+        Carrega o snapshot e corrige pelo banco os minutos das últimas 24 h
+
+        Uma consulta das vendas das últimas 24 h, agregada por minuto com
+        NumPy; devolve quantos minutos divergiam do snapshot.
+        """
+        if not self.enabled:
+            return 0
+        now = datetime.utcnow()
+        since = now - timedelta(minutes=MINUTES_PER_DAY - 1)
+        since = since.replace(second=0, microsecond=0)
+        items = (
+            select(SaleItem.sale_id, func.sum(SaleItem.quantity).label("quantity"))
+            .group_by(SaleItem.sale_id)
+            .subquery()
+        )
+        with self._lock:
+            self._load_snapshot()
+            db = self._session_factory()
+            try:
+                rows = db.execute(
+                    select(
+                        Sale.created_at,
+                        Sale.final_amount,
+                        func.coalesce(items.c.quantity, 0),
+                    )
+                    .outerjoin(items, items.c.sale_id == Sale.id)
+                    .where(
+                        Sale.status == SaleStatus.COMPLETED, Sale.created_at >= since
+                    )
+                ).all()
+            except SQLAlchemyError:
+                # Sem banco: segue com o snapshot até a próxima conciliação
+                logger.exception("live_kpis_reconcile_failed")
+                self._loaded = True
+                return 0
+            finally:
+                db.close()
+
+            stamp = np.full(MINUTES_PER_DAY, -1, dtype=np.int64)
+            revenue = np.zeros(MINUTES_PER_DAY)
+            transactions = np.zeros(MINUTES_PER_DAY, dtype=np.int64)
+            quantity = np.zeros(MINUTES_PER_DAY)
+            # Minutos sem venda também valem (zerados)
+            absolute = np.arange(_minute(since), _minute(now) + 1)
+            stamp[absolute % MINUTES_PER_DAY] = absolute
+            if rows:
+                minutes = np.array([_minute(row[0]) for row in rows], dtype=np.int64)
+                slots = minutes % MINUTES_PER_DAY
+                np.add.at(revenue, slots, [row[1] or 0.0 for row in rows])
+                np.add.at(transactions, slots, 1)
+                np.add.at(quantity, slots, [row[2] or 0.0 for row in rows])
+
+            previous_valid = self._stamp == stamp
+            previous_revenue = np.where(previous_valid, self._revenue, 0.0)
+            previous_transactions = np.where(previous_valid, self._transactions, 0)
+            differs = ~np.isclose(previous_revenue, revenue) | (
+                previous_transactions != transactions
+            )
+            previous_total = int(previous_transactions.sum())
+            self._stamp, self._revenue = stamp, revenue
+            self._transactions, self._items = transactions, quantity
+            self._loaded = True
+
+        changed = int(differs.sum())
+        logger.info(
+            "live_kpis_reconciled",
+            database_sales=len(rows),
+            snapshot_sales=previous_total,
+            corrected_minutes=changed,
+        )
+        return changed
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.reconcile()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "enabled": int(self.enabled),
+                "slots": MINUTES_PER_DAY,
+                "memory_bytes": self._stamp.nbytes
+                + self._revenue.nbytes
+                + self._transactions.nbytes
+                + self._items.nbytes,
+            }
+
+
+live_kpis = LiveKpiCounters()
@@ -0,0 +1,587 @@
+"""
+Armazenamento colunar em memória de vendas para análises ad-hoc
+
+Os itens de venda são mantidos em arrays NumPy (um por coluna) e
+atualizados incrementalmente por ``id > último visto``. As consultas
+(filtro, agrupamento e top-k) são vetorizadas, sem objetos ORM.
+"""
+
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.database.connection import SessionLocal
+from app.infrastructure.database.models.product import Category, Product
+from app.infrastructure.database.models.sale import (
+    PaymentMethod,
+    Sale,
+    SaleItem,
+    SaleStatus,
+)
+from app.infrastructure.metrics.instruments import cache_hit
+
+logger = logging.getLogger(__name__)
+
+# Códigos compactos (int8) para colunas categóricas
+PAYMENT_CODES = {method: code for code, method in enumerate(PaymentMethod)}
+STATUS_CODES = {status: code for code, status in enumerate(SaleStatus)}
+PAYMENT_LABELS = np.array([method.value for method in PaymentMethod], dtype=object)
+STATUS_LABELS = np.array([status.value for status in SaleStatus], dtype=object)
+
+GROUP_KEYS = (
+    "day",
+    "week",
+    "month",
+    "hour",
+    "weekday",
+    "product",
+    "category",
+    "cashier",
+    "payment_method",
+    "status",
+)
+METRICS = (
+    "revenue",
+    "quantity",
+    "profit",
+    "discount",
+    "items",
+    "transactions",
+    "average_ticket",
+)
+TIME_KEYS = ("day", "week", "month", "hour", "weekday")
+_KEY_COLUMNS = {
+    "product": "product_id",
+    "cashier": "user_id",
+    "payment_method": "payment",
+    "status": "status",
+}
+_MAX_COMBINED_KEY = 2**62
+
+_NS_PER_HOUR = 3_600 * 1_000_000_000
+_NS_PER_DAY = 24 * _NS_PER_HOUR
+
+_ITEM_COLUMNS = {
+    "item_id": np.int64,
+    "sale_id": np.int64,
+    "product_id": np.int32,
+    "user_id": np.int32,
+    "created_at": np.int64,  # nanosegundos desde epoch
+    "quantity": np.float64,
+    "revenue": np.float64,
+    "discount": np.float64,
+    "payment": np.int8,
+    "status": np.int8,
+}
+
+
+class _ColumnBuffer:
+    """Arrays por coluna com crescimento amortizado (dobra a capacidade)"""
+
+    def __init__(self, dtypes: Dict[str, type], capacity: int = 1024):
+        self.dtypes = dtypes
+        self.size = 0
+        self._data = {
+            name: np.empty(capacity, dtype=dtype) for name, dtype in dtypes.items()
+        }
+
+    @property
+    def capacity(self) -> int:
+        return len(next(iter(self._data.values())))
+
+    def append(self, columns: Dict[str, np.ndarray]) -> None:
+        count = len(next(iter(columns.values())))
+        if count == 0:
+            return
+        required = self.size + count
+        if required > self.capacity:
+            new_capacity = max(required, self.capacity * 2)
+            for name, array in self._data.items():
+                grown = np.empty(new_capacity, dtype=array.dtype)
+                grown[: self.size] = array[: self.size]
+                self._data[name] = grown
+        for name, values in columns.items():
+            self._data[name][self.size : required] = values
+        self.size = required
+
+    def column(self, name: str) -> np.ndarray:
+        """View (sem cópia) da parte preenchida da coluna"""
+        return self._data[name][: self.size]
+
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self._data.values())
+
+
+class SalesColumnStore:
+    """Fatos de venda (itens) + dimensões de produto/categoria em memória"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        refresh_interval: Optional[float] = None,
+        chunk_size: int = 50_000,
+        overlap: int = 1_000,
+    ):
+        self._session_factory = session_factory
+        self.refresh_interval = (
+            settings.ANALYTICS_REFRESH_SECONDS
+            if refresh_interval is None
+            else refresh_interval
+        )
+        self.chunk_size = chunk_size
+        # Reler os últimos ids protege contra commits fora de ordem
+        self.overlap = overlap
+        self._lock = threading.RLock()
+        self._items = _ColumnBuffer(_ITEM_COLUMNS)
+        self._last_item_id = 0
+        self._last_sale_id = 0
+        self._sales_updated_since: Optional[datetime] = None
+        self._products_updated_since: Optional[datetime] = None
+        self._product_category = np.full(1, -1, dtype=np.int32)
+        self._product_cost = np.zeros(1, dtype=np.float64)
+        self._product_names: Dict[int, str] = {}
+        self._category_names: Dict[int, str] = {}
+        self._refreshed_at: Optional[float] = None
+
+    # ==================== CARGA / ATUALIZAÇÃO ====================
+
+    def refresh(self, force: bool = False) -> bool:
+        """Carrega apenas o que mudou desde a última atualização"""
+        with self._lock:
+            if (
+                not force
+                and self._refreshed_at is not None
+                and time.monotonic() - self._refreshed_at < self.refresh_interval
+            ):
+                cache_hit("analytics_store", True)
+                return False
+            cache_hit("analytics_store", False)
+            started = time.perf_counter()
+            db = self._session_factory()
+            try:
+                self._load_dimensions(db)
+                loaded = self._load_items(db)
+                self._sync_sale_status(db)
+            finally:
+                db.close()
+            self._refreshed_at = time.monotonic()
+            logger.debug(
+                "analytics store refreshed: %s new items, %s total, %.1f ms",
+                loaded,
+                self._items.size,
+                (time.perf_counter() - started) * 1000,
+            )
+            return True
+
+    def _load_dimensions(self, db: Session) -> None:
+        """Atualiza lookups de produto (incremental por updated_at)"""
+        self._category_names = dict(
+            db.execute(select(Category.id, Category.name)).all()
+        )
+
+        query = select(
+            Product.id,
+            Product.name,
+            Product.category_id,
+            Product.cost_price,
+            Product.updated_at,
+        )
+        if self._products_updated_since is not None:
+            query = query.where(Product.updated_at >= self._products_updated_since)
+        rows = db.execute(query).all()
+        if not rows:
+            return
+
+        ids = np.fromiter((row.id for row in rows), dtype=np.int64, count=len(rows))
+        max_id = int(ids.max())
+        if max_id >= len(self._product_category):
+            size = max(max_id + 1, len(self._product_category) * 2)
+            category = np.full(size, -1, dtype=np.int32)
+            category[: len(self._product_category)] = self._product_category
+            cost = np.zeros(size, dtype=np.float64)
+            cost[: len(self._product_cost)] = self._product_cost
+            self._product_category, self._product_cost = category, cost
+
+        self._product_category[ids] = [row.category_id for row in rows]
+        self._product_cost[ids] = [row.cost_price or 0.0 for row in rows]
+        for row in rows:
+            self._product_names[row.id] = row.name
+        self._products_updated_since = max(row.updated_at for row in rows)
+
+    def _load_items(self, db: Session) -> int:
+        """Acrescenta itens com id > último visto em blocos"""
+        if self._sales_updated_since is None:
+            self._sales_updated_since = db.execute(
+                select(func.max(Sale.updated_at))
+            ).scalar()
+
+        lower = max(0, self._last_item_id - self.overlap)
+        query = (
+            select(
+                SaleItem.id,
+                SaleItem.sale_id,
+                SaleItem.product_id,
+                Sale.user_id,
+                Sale.created_at,
+                SaleItem.quantity,
+                SaleItem.final_total_price,
+                SaleItem.discount_applied + SaleItem.bulk_discount_applied,
+                Sale.payment_method,
+                Sale.status,
+            )
+            .join(Sale, SaleItem.sale_id == Sale.id)
+            .where(SaleItem.id > lower)
+            .order_by(SaleItem.id)
+            .execution_options(yield_per=self.chunk_size)
+        )
+
+        loaded = 0
+        for rows in db.execute(query).partitions():
+            columns = self._rows_to_columns(rows)
+            if lower < self._last_item_id:
+                tail_start = max(0, self._items.size - 4 * self.overlap)
+                known = self._items.column("item_id")[tail_start:]
+                keep = ~np.isin(columns["item_id"], known)
+                columns = {name: values[keep] for name, values in columns.items()}
+            self._items.append(columns)
+            count = len(columns["item_id"])
+            if count:
+                self._last_item_id = max(
+                    self._last_item_id, int(columns["item_id"].max())
+                )
+                self._last_sale_id = max(
+                    self._last_sale_id, int(columns["sale_id"].max())
+                )
+            loaded += count
+        return loaded
+
+    @staticmethod
+    def _rows_to_columns(rows: Sequence) -> Dict[str, np.ndarray]:
+        (
+            item_ids,
+            sale_ids,
+            product_ids,
+            user_ids,
+            created_at,
+            quantity,
+            revenue,
+            discount,
+            payment,
+            status,
+        ) = zip(*rows)
+        count = len(rows)
+        return {
+            "item_id": np.fromiter(item_ids, dtype=np.int64, count=count),
+            "sale_id": np.fromiter(sale_ids, dtype=np.int64, count=count),
+            "product_id": np.fromiter(product_ids, dtype=np.int32, count=count),
+            "user_id": np.fromiter(user_ids, dtype=np.int32, count=count),
+            "created_at": np.array(created_at, dtype="datetime64[ns]").view(np.int64),
+            "quantity": np.array(quantity, dtype=np.float64),
+            "revenue": np.array(revenue, dtype=np.float64),
+            "discount": np.array(discount, dtype=np.float64),
+            "payment": np.fromiter(
+                (PAYMENT_CODES[PaymentMethod(p)] for p in payment),
+                dtype=np.int8,
+                count=count,
+            ),
+            "status": np.fromiter(
+                (STATUS_CODES[SaleStatus(s)] for s in status),
+                dtype=np.int8,
+                count=count,
+            ),
+        }
+
+    def _sync_sale_status(self, db: Session) -> None:
+        """Propaga mudanças de status (ex.: cancelamentos) de vendas já carregadas"""
+        if self._sales_updated_since is None or self._items.size == 0:
+            return
+        # Margem cobre transações que commitaram com updated_at antigo
+        since = self._sales_updated_since - timedelta(minutes=5)
+        rows = db.execute(
+            select(Sale.id, Sale.status, Sale.updated_at).where(
+                Sale.updated_at > since, Sale.id <= self._last_sale_id
+            )
+        ).all()
+        if not rows:
+            return
+        changed = pd.Series(
+            [STATUS_CODES[SaleStatus(row.status)] for row in rows],
+            index=[row.id for row in rows],
+            dtype=np.int8,
+        )
+        sale_ids = self._items.column("sale_id")
+        mask = np.isin(sale_ids, changed.index.to_numpy())
+        if mask.any():
+            self._items.column("status")[mask] = changed.reindex(
+                sale_ids[mask]
+            ).to_numpy()
+        self._sales_updated_since = max(row.updated_at for row in rows)
+
+    # ==================== CONSULTAS ====================
+
+    def query(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        product_ids: Optional[Iterable[int]] = None,
+        category_ids: Optional[Iterable[int]] = None,
+        user_ids: Optional[Iterable[int]] = None,
+        payment_methods: Optional[Iterable[PaymentMethod]] = None,
+        statuses: Iterable[SaleStatus] = (SaleStatus.COMPLETED,),
+        group_by: Sequence[str] = ("day",),
+        metrics: Sequence[str] = ("revenue", "quantity", "transactions"),
+        order_by: Optional[str] = None,
+        descending: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """Filtra, agrupa e ordena os itens de venda de forma vetorizada"""
+        unknown = set(group_by) - set(GROUP_KEYS)
+        if unknown:
+            raise ValueError(f"Agrupamento inválido: {sorted(unknown)}")
+        unknown = set(metrics) - set(METRICS)
+        if unknown:
+            raise ValueError(f"Métrica inválida: {sorted(unknown)}")
+        if order_by is not None and order_by not in metrics:
+            raise ValueError("order_by deve ser uma das métricas solicitadas")
+
+        self.refresh()
+        with self._lock:
+            items = self._items
+            product_id = items.column("product_id")
+            created_at = items.column("created_at")
+
+            mask = np.isin(
+                items.column("status"),
+                [STATUS_CODES[SaleStatus(s)] for s in statuses],
+            )
+            if start_date:
+                mask &= created_at >= _to_ns(start_date)
+            if end_date:
+                mask &= created_at < _to_ns(end_date + timedelta(days=1))
+            if product_ids:
+                mask &= np.isin(product_id, list(product_ids))
+            if user_ids:
+                mask &= np.isin(items.column("user_id"), list(user_ids))
+            if payment_methods:
+                mask &= np.isin(
+                    items.column("payment"),
+                    [PAYMENT_CODES[PaymentMethod(p)] for p in payment_methods],
+                )
+            category = None
+            if category_ids or "category" in group_by:
+                category = self._lookup(self._product_category, product_id, -1)
+            if category_ids:
+                mask &= np.isin(category, list(category_ids))
+
+            values = {
+                "revenue": items.column("revenue")[mask],
+                "quantity": items.column("quantity")[mask],
+                "discount": items.column("discount")[mask],
+            }
+            values["cost"] = values["quantity"] * self._lookup(
+                self._product_cost, product_id[mask], 0.0
+            )
+            sale_ids = None
+            if "transactions" in metrics or "average_ticket" in metrics:
+                sale_ids = items.column("sale_id")[mask]
+            keys = self._group_keys(group_by, mask, category)
+            product_names = self._product_names
+            category_names = self._category_names
+
+        return self._aggregate(
+            keys,
+            values,
+            sale_ids,
+            list(group_by),
+            list(metrics),
+            order_by,
+            descending,
+            limit,
+            product_names,
+            category_names,
+        )
+
+    def _group_keys(
+        self, group_by: Sequence[str], mask: np.ndarray, category: Optional[np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """Chaves de agrupamento (int64) das linhas selecionadas"""
+        items = self._items
+        keys = {}
+        if any(key in TIME_KEYS for key in group_by):
+            created_at = items.column("created_at")[mask]
+            days = created_at // _NS_PER_DAY
+        for key in group_by:
+            if key == "day":
+                keys[key] = days
+            elif key == "week":
+                # 1970-01-01 foi quinta-feira: semana começa na segunda
+                keys[key] = days - (days + 3) % 7
+            elif key == "month":
+                keys[key] = (
+                    days.astype("datetime64[D]").astype("datetime64[M]").view(np.int64)
+                )
+            elif key == "hour":
+                keys[key] = (created_at // _NS_PER_HOUR) % 24
+            elif key == "weekday":
+                keys[key] = (days + 3) % 7
+            elif key == "category":
+                keys[key] = category[mask]
+            else:
+                keys[key] = items.column(_KEY_COLUMNS[key])[mask]
+        return keys
+
+    @staticmethod
+    def _lookup(table: np.ndarray, ids: np.ndarray, default) -> np.ndarray:
+        """Mapeia ids para valores de um array denso indexado por id"""
+        inside = ids < len(table)
+        if inside.all():
+            return table[ids]
+        values = np.full(len(ids), default, dtype=table.dtype)
+        values[inside] = table[ids[inside]]
+        return values
+
+    @staticmethod
+    def _aggregate(
+        keys: Dict[str, np.ndarray],
+        values: Dict[str, np.ndarray],
+        sale_ids: Optional[np.ndarray],
+        group_by: List[str],
+        metrics: List[str],
+        order_by: Optional[str],
+        descending: bool,
+        limit: Optional[int],
+        product_names: Dict[int, str],
+        category_names: Dict[int, str],
+    ) -> List[dict]:
+        """Agrupa por hash (factorize) e soma com bincount"""
+        size = len(values["revenue"])
+        group = np.zeros(size, dtype=np.int64)
+        groups = 1
+        labels: Dict[str, np.ndarray] = {}
+        if group_by:
+            cardinality = 1
+            for key in group_by:
+                codes, uniques = pd.factorize(keys[key])
+                width = max(len(uniques), 1)
+                if cardinality * width >= _MAX_COMBINED_KEY:
+                    group, compacted = pd.factorize(group)
+                    cardinality = max(len(compacted), 1)
+                group = group * width + codes
+                cardinality *= width
+            group, uniques = pd.factorize(group)
+            groups = len(uniques)
+            # Rótulos a partir da primeira linha de cada grupo
+            first = np.zeros(groups, dtype=np.int64)
+            first[group[::-1]] = np.arange(size - 1, -1, -1)
+            labels = {key: keys[key][first] for key in group_by}
+
+        result = {
+            name: np.bincount(group, weights=values[name], minlength=groups)
+            for name in ("revenue", "quantity", "discount", "cost")
+        }
+        result["items"] = np.bincount(group, minlength=groups)
+        result["profit"] = result["revenue"] - result["cost"]
+        if sale_ids is not None:
+            result["transactions"] = _count_distinct(group, sale_ids, groups)
+            result["average_ticket"] = np.divide(
+                result["revenue"],
+                result["transactions"],
+                out=np.zeros(groups),
+                where=result["transactions"] > 0,
+            )
+
+        if order_by:
+            ranking = result[order_by] if descending else -result[order_by]
+            if limit and limit < groups:
+                order = np.argpartition(-ranking, limit - 1)[:limit]
+                order = order[np.argsort(-ranking[order], kind="stable")]
+            else:
+                order = np.argsort(-ranking, kind="stable")
+        else:
+            time_keys = [key for key in group_by if key in TIME_KEYS]
+            if time_keys:
+                order = np.lexsort([labels[key] for key in reversed(time_keys)])
+            else:
+                order = np.arange(groups)
+            if limit:
+                order = order[:limit]
+
+        columns = {}
+        for key in group_by:
+            column = labels[key][order]
+            if key in ("day", "week"):
+                columns[key] = column.astype("datetime64[D]").astype(str).tolist()
+            elif key == "month":
+                columns[key] = column.astype("datetime64[M]").astype(str).tolist()
+            elif key == "payment_method":
+                columns[key] = PAYMENT_LABELS[column].tolist()
+            elif key == "status":
+                columns[key] = STATUS_LABELS[column].tolist()
+            else:
+                columns[key] = column.tolist()
+        if "product" in group_by:
+            columns["product_name"] = [
+                product_names.get(product_id) for product_id in columns["product"]
+            ]
+        if "category" in group_by:
+            columns["category_name"] = [
+                category_names.get(category_id) for category_id in columns["category"]
+            ]
+        for metric in metrics:
+            column = result[metric][order]
+            columns[metric] = (
+                column.astype(np.int64).tolist()
+                if metric in ("items", "transactions")
+                else column.astype(np.float64).round(4).tolist()
+            )
+
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+    # ==================== ESTADO ====================
+
+    def stats(self) -> dict:
+        """Resumo do conteúdo carregado"""
+        with self._lock:
+            return {
+                "items": self._items.size,
+                "capacity": self._items.capacity,
+                "memory_bytes": self._items.nbytes()
+                + self._product_category.nbytes
+                + self._product_cost.nbytes,
+                "last_item_id": self._last_item_id,
+                "last_sale_id": self._last_sale_id,
+                "products": len(self._product_names),
+                "seconds_since_refresh": None
+                if self._refreshed_at is None
+                else round(time.monotonic() - self._refreshed_at, 1),
+            }
+
+
+def _count_distinct(group: np.ndarray, sale_ids: np.ndarray, groups: int) -> np.ndarray:
+    """Quantidade de vendas distintas por grupo"""
+    if len(sale_ids) == 0:
+        return np.zeros(groups, dtype=np.int64)
+    offset = int(sale_ids.min())
+    span = int(sale_ids.max()) - offset + 1
+    if groups * span < _MAX_COMBINED_KEY:
+        distinct = pd.unique(group * span + (sale_ids - offset))
+        return np.bincount(distinct // span, minlength=groups)
+    pairs = pd.DataFrame({"group": group, "sale": sale_ids}).drop_duplicates()
+    return np.bincount(pairs["group"].to_numpy(), minlength=groups)
+
+
+def _to_ns(value: date) -> int:
+    return int(np.datetime64(value, "ns").view(np.int64))
+
+
+# Instância compartilhada pelo processo
+sales_store = SalesColumnStore()
@@ -0,0 +1,211 @@
+"""
+Produtos em alta em tempo real (heavy hitters em janelas deslizantes)
+
+Cada janela é dividida em baldes de tempo e cada balde guarda um resumo
+Space-Saving com no máximo ``capacity`` contadores por produto. Uma venda
+atualiza só o balde corrente (no pior caso O(capacity), quando um produto
+novo entra num resumo cheio); a leitura soma os resumos dos baldes vivos e
+guarda o resultado até a próxima venda ou rotação.
+
+Space-Saving garante que todo produto com participação acima de
+1/capacity do balde está no resumo, e cada contagem superestima o valor
+real em no máximo ``error``.
+"""
+
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.database.connection import SessionLocal
+from app.infrastructure.database.models.sale import Sale, SaleItem, SaleStatus
+from app.infrastructure.metrics.instruments import cache_hit
+
+logger = logging.getLogger(__name__)
+
+# Nome -> (tamanho do balde em segundos, número de baldes); None = dia corrente
+WINDOWS: Dict[str, Optional[Tuple[int, int]]] = {
+    "15m": (60, 15),
+    "1h": (300, 12),
+    "today": None,
+}
+
+
+class SpaceSaving:
+    """Resumo Space-Saving: produto -> [quantidade, erro, vendas]"""
+
+    __slots__ = ("capacity", "counters")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counters: Dict[int, List[float]] = {}
+
+    def add(self, product_id: int, quantity: float) -> None:
+        counter = self.counters.get(product_id)
+        if counter is not None:
+            counter[0] += quantity
+            counter[2] += 1
+            return
+        if len(self.counters) < self.capacity:
+            self.counters[product_id] = [quantity, 0.0, 1]
+            return
+        # Substitui o menor contador e herda sua contagem como erro
+        victim = min(self.counters, key=lambda key: self.counters[key][0])
+        floor = self.counters.pop(victim)[0]
+        self.counters[product_id] = [floor + quantity, floor, 1]
+
+    def remove(self, product_id: int, quantity: float) -> None:
+        """Estorno (cancelamento); produtos fora do resumo são ignorados"""
+        counter = self.counters.get(product_id)
+        if counter is not None:
+            counter[0] = max(counter[0] - quantity, 0.0)
+            counter[2] = max(counter[2] - 1, 0)
+
+
+class TrendingTracker:
+    """Top-k de produtos por janela (15 min, 1 h e dia corrente)"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        capacity: Optional[int] = None,
+    ):
+        self._session_factory = session_factory
+        self.capacity = capacity or settings.TRENDING_CAPACITY
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Dict[int, SpaceSaving]] = {}
+        self._cache: Dict[str, List[dict]] = {}
+        self._loaded = False
+
+    @staticmethod
+    def _bucket_key(window: str, at: datetime) -> int:
+        spec = WINDOWS[window]
+        if spec is None:
+            return at.toordinal()
+        return int(at.timestamp()) // spec[0]
+
+    def _live_keys(self, window: str, now: datetime) -> range:
+        current = self._bucket_key(window, now)
+        spec = WINDOWS[window]
+        return range(current - (spec[1] - 1 if spec else 0), current + 1)
+
+    def _expire(self, now: datetime) -> None:
+        for window in WINDOWS:
+            live = self._live_keys(window, now)
+            buckets = self._buckets.setdefault(window, {})
+            for key in [key for key in buckets if key not in live]:
+                del buckets[key]
+                self._cache.pop(window, None)
+
+    def _apply(
+        self, at: datetime, items: Iterable[Tuple[int, float]], sign: int
+    ) -> None:
+        now = datetime.utcnow()
+        self._expire(now)
+        items = list(items)
+        for window in WINDOWS:
+            key = self._bucket_key(window, at)
+            if key not in self._live_keys(window, now):
+                continue
+            buckets = self._buckets[window]
+            if sign < 0 and key not in buckets:
+                continue
+            bucket = buckets.setdefault(key, SpaceSaving(self.capacity))
+            for product_id, quantity in items:
+                if sign > 0:
+                    bucket.add(product_id, quantity)
+                else:
+                    bucket.remove(product_id, quantity)
+            self._cache.pop(window, None)
+
+    def record_sale(self, at: datetime, items: Iterable[Tuple[int, float]]) -> None:
+        """Venda concluída: (product_id, quantidade) de cada item"""
+        with self._lock:
+            self._apply(at, items, 1)
+
+    def cancel_sale(self, at: datetime, items: Iterable[Tuple[int, float]]) -> None:
+        """Venda cancelada: desconta dos baldes que ainda estão vivos"""
+        with self._lock:
+            self._apply(at, items, -1)
+
+    def rebuild(self) -> int:
+        """Recarrega os baldes a partir das vendas concluídas do banco"""
+        now = datetime.utcnow()
+        since = min(
+            datetime.combine(now.date(), datetime.min.time()),
+            now - timedelta(hours=1),
+        )
+        # Sob o lock: vendas registradas durante a carga não se perdem
+        with self._lock:
+            db = self._session_factory()
+            try:
+                rows = db.execute(
+                    select(Sale.created_at, SaleItem.product_id, SaleItem.quantity)
+                    .join(Sale, Sale.id == SaleItem.sale_id)
+                    .where(
+                        Sale.status == SaleStatus.COMPLETED, Sale.created_at >= since
+                    )
+                ).all()
+            finally:
+                db.close()
+
+            self._buckets = {}
+            self._cache = {}
+            self._expire(now)
+            for row in rows:
+                self._apply(row[0], ((row[1], row[2] or 0.0),), 1)
+            self._loaded = True
+        logger.info("Produtos em alta recarregados: %s itens de venda", len(rows))
+        return len(rows)
+
+    def top(self, window: str, limit: int = 10) -> List[dict]:
+        """Produtos mais vendidos na janela (quantidade, erro máximo, vendas)"""
+        if not self._loaded:
+            self.rebuild()
+        with self._lock:
+            self._expire(datetime.utcnow())
+            merged = self._cache.get(window)
+            cache_hit("trending", merged is not None)
+            if merged is None:
+                totals: Dict[int, List[float]] = {}
+                for bucket in self._buckets[window].values():
+                    for product_id, (quantity, error, hits) in bucket.counters.items():
+                        total = totals.setdefault(product_id, [0.0, 0.0, 0])
+                        total[0] += quantity
+                        total[1] += error
+                        total[2] += hits
+                ranked = heapq.nlargest(
+                    self.capacity, totals.items(), key=lambda entry: entry[1][0]
+                )
+                merged = [
+                    {
+                        "product_id": product_id,
+                        "quantity": round(quantity, 3),
+                        "max_error": round(error, 3),
+                        "times_sold": int(hits),
+                    }
+                    for product_id, (quantity, error, hits) in ranked
+                    if quantity > 0
+                ]
+                self._cache[window] = merged
+            return merged[:limit]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "buckets": sum(len(buckets) for buckets in self._buckets.values()),
+                "counters": sum(
+                    len(bucket.counters)
+                    for buckets in self._buckets.values()
+                    for bucket in buckets.values()
+                ),
+                "cached_windows": len(self._cache),
+            }
+
+
+trending_tracker = TrendingTracker()
@@ -0,0 +1,3 @@
+"""
+Backup online do banco (snapshots comprimidos, com checksum e rotação)
+"""
@@ -0,0 +1,116 @@
+"""
+Agendador de backups dentro da API
+
+Uma thread verifica a cada CHECK_SECONDS se o snapshot mais recente em
+BACKUP_DIR passou de BACKUP_INTERVAL_HOURS. Se sim, roda
+``scripts/backup.py`` em outro processo, com prioridade mínima de CPU e de
+disco: compressão e checksum não disputam o GIL nem o processador com as
+requisições do caixa. Um lock de arquivo garante um backup por vez entre
+os workers; quem não pega o lock só espera a próxima verificação.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+from app.core.config import settings
+from app.infrastructure.backup.snapshot import BackupManager
+
+try:
+    import fcntl
+except ImportError:  # Windows: um worker só, sem lock entre processos
+    fcntl = None
+
+logger = structlog.get_logger(__name__)
+
+CHECK_SECONDS = 300
+SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "backup.py"
+
+
+class BackupScheduler:
+    """Thread que dispara ``scripts/backup.py`` quando o backup vence"""
+
+    def __init__(self, interval_hours: Optional[int] = None):
+        self.interval = timedelta(
+            hours=interval_hours or settings.BACKUP_INTERVAL_HOURS
+        )
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._process: Optional[subprocess.Popen] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="backup-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Para a thread; um backup em andamento termina sozinho"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        # A primeira verificação espera a API aquecer
+        while not self._stop.wait(CHECK_SECONDS):
+            try:
+                self.run_if_due()
+            except Exception:  # o agendador nunca derruba a thread
+                logger.exception("backup_schedule_failed")
+
+    def is_due(self) -> bool:
+        latest = BackupManager().latest_at()
+        return latest is None or datetime.utcnow() - latest >= self.interval
+
+    def run_if_due(self) -> bool:
+        """Roda o backup se venceu e nenhum outro worker está rodando"""
+        if not self.is_due():
+            return False
+        directory = Path(settings.BACKUP_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        with (directory / ".lock").open("w") as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return False
+            # Outro worker pode ter terminado entre a checagem e o lock
+            if not self.is_due():
+                return False
+            return self._spawn()
+
+    def _spawn(self) -> bool:
+        command = [sys.executable, str(SCRIPT)]
+        # Prioridade pelos utilitários, não por preexec_fn: fork de uma thread
+        # que não é a principal, num servidor com várias threads, não é seguro
+        if shutil.which("nice"):
+            command = ["nice", "-n", "19"] + command
+        if shutil.which("ionice"):
+            command = ["ionice", "-c", "3"] + command  # Disco só quando ocioso
+        options = (
+            {"creationflags": subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+            if os.name == "nt"
+            else {}
+        )
+        logger.info("backup_started", command=command)
+        self._process = subprocess.Popen(
+            command, cwd=SCRIPT.parents[1], stdout=subprocess.DEVNULL, **options
+        )
+        code = self._process.wait()
+        self._process = None
+        if code != 0:
+            logger.error("backup_failed", exit_code=code)
+        return code == 0
+
+
+backup_scheduler = BackupScheduler()
@@ -0,0 +1,297 @@
+"""
+Cópias do banco sem travar o caixa
+
+SQLite: API de backup online em passos de BACKUP_STEP_PAGES páginas, com
+pausa entre os passos para respeitar BACKUP_MAX_MB_PER_SECOND. Em WAL
+(SQLITE_WAL) a cópia lê de uma transação de leitura aberta: é consistente
+e as gravações do caixa não esperam por ela. Sem WAL, cada passo segura o
+lock de leitura só enquanto copia suas páginas, mas qualquer gravação faz o
+SQLite recomeçar a cópia; a tentativa é então refeita com passos duas vezes
+maiores (no limite, um passo só). A cópia crua é depois comprimida com
+gzip.
+
+Postgres: ``pg_dump --format=custom`` (já comprimido), que lê de um
+snapshot MVCC sem bloquear gravações; a saída é lida no mesmo ritmo
+limitado, o que segura o próprio pg_dump.
+
+Cada arquivo ganha um ``.sha256`` no formato do ``sha256sum`` e só aparece
+com o nome final depois de completo (``.partial`` durante a escrita).
+"""
+
+import gzip
+import hashlib
+import os
+import shlex
+import sqlite3
+import subprocess
+import tempfile
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import structlog
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+# Tentativas com passos crescentes antes de copiar tudo em um passo
+MAX_SQLITE_ATTEMPTS = 6
+SNAPSHOT_PATTERNS = ("backup-*.db.gz", "backup-*.dump")
+
+
+class _Restarted(Exception):
+    """O SQLite recomeçou a cópia porque o banco foi alterado"""
+
+
+class Throttle:
+    """Segura o chamador para não passar de ``bytes_per_second``"""
+
+    def __init__(self, bytes_per_second: float):
+        self.bytes_per_second = bytes_per_second
+        self.started = time.monotonic()
+        self.done = 0
+
+    def consume(self, size: int) -> None:
+        self.done += size
+        if self.bytes_per_second <= 0:
+            return
+        ahead = self.done / self.bytes_per_second - (time.monotonic() - self.started)
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+class BackupManager:
+    """Gera, verifica e rotaciona os snapshots em BACKUP_DIR"""
+
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        directory: Optional[str] = None,
+        keep: Optional[int] = None,
+        step_pages: Optional[int] = None,
+        max_mb_per_second: Optional[float] = None,
+    ):
+        self.url = make_url(database_url or settings.DATABASE_URL)
+        self.directory = Path(directory or settings.BACKUP_DIR)
+        self.keep = keep or settings.BACKUP_KEEP
+        self.step_pages = step_pages or settings.BACKUP_STEP_PAGES
+        mb_per_second = (
+            settings.BACKUP_MAX_MB_PER_SECOND
+            if max_mb_per_second is None
+            else max_mb_per_second
+        )
+        self.bytes_per_second = mb_per_second * 1024 * 1024
+
+    # ==================== SNAPSHOT ====================
+
+    def create(self) -> Dict[str, Any]:
+        """Gera um snapshot, grava o checksum e apaga os excedentes"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        started = time.monotonic()
+        backend = self.url.get_backend_name()
+        if backend == "sqlite":
+            path, details = self._sqlite_snapshot(f"backup-{stamp}.db.gz")
+        elif backend == "postgresql":
+            path, details = self._pg_snapshot(f"backup-{stamp}.dump")
+        else:
+            raise ValueError(f"Backup não suportado para {backend}")
+        removed = self.rotate()
+        summary = {
+            "file": str(path),
+            "size_bytes": path.stat().st_size,
+            "sha256": _read_checksum(path),
+            "elapsed_seconds": round(time.monotonic() - started, 2),
+            "removed": removed,
+            **details,
+        }
+        logger.info("backup_created", **summary)
+        return summary
+
+    def _sqlite_snapshot(self, name: str):
+        database = self.url.database
+        if not database or database == ":memory:":
+            raise ValueError("Banco SQLite em memória não tem backup")
+        raw = self.directory / f"{name}.raw.partial"
+        try:
+            details = self._sqlite_copy(Path(database), raw)
+            with raw.open("rb") as source:
+                path = self._write(
+                    name, _gzip_chunks(source, Throttle(self.bytes_per_second))
+                )
+        finally:
+            raw.unlink(missing_ok=True)
+        return path, details
+
+    def _sqlite_copy(self, database: Path, target: Path) -> Dict[str, Any]:
+        source = sqlite3.connect(
+            f"file:{database}?mode=ro", uri=True, timeout=30, isolation_level=None
+        )
+        try:
+            page_size = source.execute("PRAGMA page_size").fetchone()[0]
+            wal = source.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            if wal:
+                # Transação de leitura fixa o snapshot: gravações seguem no WAL
+                # e a cópia nunca recomeça
+                source.execute("BEGIN")
+                source.execute("SELECT count(*) FROM sqlite_master").fetchone()
+            pages = self.step_pages
+            for attempt in range(1, MAX_SQLITE_ATTEMPTS + 1):
+                if attempt == MAX_SQLITE_ATTEMPTS:
+                    pages = -1  # Um passo: lock de leitura durante a cópia toda
+                    logger.warning("backup_single_step", hint="use SQLITE_WAL")
+                target.unlink(missing_ok=True)
+                destination = sqlite3.connect(target)
+                throttle = Throttle(self.bytes_per_second)
+                last_remaining = [None]
+
+                def progress(status, remaining, total):
+                    if last_remaining[0] is not None and remaining > last_remaining[0]:
+                        raise _Restarted()
+                    last_remaining[0] = remaining
+                    throttle.consume(max(pages, 0) * page_size)
+
+                try:
+                    source.backup(destination, pages=pages, progress=progress)
+                    return {"attempts": attempt, "step_pages": pages, "wal": wal}
+                except _Restarted:
+                    logger.info("backup_restarted", attempt=attempt, step_pages=pages)
+                    pages *= 2
+                finally:
+                    destination.close()
+        finally:
+            source.close()
+
+    def _pg_snapshot(self, name: str):
+        command = shlex.split(settings.BACKUP_PG_DUMP_COMMAND) + [
+            "--format=custom",
+            "--compress=6",
+            "--no-owner",
+            "--no-password",
+        ]
+        for option, value in (
+            ("--host", self.url.host),
+            ("--port", self.url.port),
+            ("--username", self.url.username),
+            ("--dbname", self.url.database),
+        ):
+            if value:
+                command.append(f"{option}={value}")
+        env = dict(os.environ)
+        if self.url.password:
+            env["PGPASSWORD"] = self.url.password  # Fora da linha de comando
+        # stderr em arquivo: um pipe cheio travaria o pg_dump
+        stderr = tempfile.TemporaryFile()
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=stderr, env=env
+        )
+        throttle = Throttle(self.bytes_per_second)
+
+        def chunks():
+            while True:
+                chunk = process.stdout.read(CHUNK_SIZE)
+                if not chunk:
+                    return
+                throttle.consume(len(chunk))
+                yield chunk
+
+        try:
+            path = self._write(name, chunks(), check=lambda: process.wait() == 0)
+        except RuntimeError:
+            stderr.seek(0)
+            message = stderr.read().decode(errors="replace").strip()
+            raise RuntimeError(f"pg_dump falhou: {message}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            stderr.close()
+        return path, {"command": command[0]}
+
+    def _write(self, name: str, chunks, check=None) -> Path:
+        """Grava os blocos em ``.partial``; renomeia após o checksum"""
+        path = self.directory / name
+        partial = self.directory / f"{name}.partial"
+        digest = hashlib.sha256()
+        try:
+            with partial.open("wb") as output:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    output.write(chunk)
+                output.flush()
+                os.fsync(output.fileno())
+            if check is not None and not check():
+                raise RuntimeError(name)
+            _checksum_path(path).write_text(f"{digest.hexdigest()}  {name}\n")
+            partial.replace(path)
+        finally:
+            partial.unlink(missing_ok=True)
+        return path
+
+    # ==================== MANUTENÇÃO ====================
+
+    def list(self) -> List[Path]:
+        """Snapshots completos, do mais novo ao mais antigo"""
+        files = {
+            path
+            for pattern in SNAPSHOT_PATTERNS
+            for path in self.directory.glob(pattern)
+        }
+        return sorted(files, key=lambda path: path.name, reverse=True)
+
+    def latest_at(self) -> Optional[datetime]:
+        """Quando o snapshot mais recente foi gravado"""
+        snapshots = self.list()
+        if not snapshots:
+            return None
+        return datetime.utcfromtimestamp(snapshots[0].stat().st_mtime)
+
+    def rotate(self) -> List[str]:
+        removed = []
+        for path in self.list()[self.keep :]:
+            path.unlink(missing_ok=True)
+            _checksum_path(path).unlink(missing_ok=True)
+            removed.append(path.name)
+        return removed
+
+    def verify(self, path: Path) -> bool:
+        """Confere o checksum (e, no SQLite, a integridade do gzip)"""
+        expected = _read_checksum(path)
+        digest = hashlib.sha256()
+        with path.open("rb") as source:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        if expected != digest.hexdigest():
+            return False
+        if path.name.endswith(".gz"):
+            with gzip.open(path, "rb") as source:
+                while source.read(CHUNK_SIZE):
+                    pass
+        return True
+
+
+def _gzip_chunks(source, throttle: Throttle):
+    """Comprime ``source`` em blocos, sem carregar o arquivo na memória"""
+    deflate = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: cabeçalho gzip
+    for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+        throttle.consume(len(chunk))  # CPU da compressão também é limitada
+        data = deflate.compress(chunk)
+        if data:
+            yield data
+    yield deflate.flush()
+
+
+def _checksum_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.sha256")
+
+
+def _read_checksum(path: Path) -> Optional[str]:
+    checksum = _checksum_path(path)
+    if not checksum.exists():
+        return None
+    return checksum.read_text().split()[0]
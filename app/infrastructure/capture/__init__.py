@@ -0,0 +1,3 @@
+"""
+Captura de tráfego (opcional) para replay de regressão de desempenho
+"""
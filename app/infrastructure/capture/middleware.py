@@ -0,0 +1,93 @@
+"""
+Middleware ASGI que grava as requisições para replay
+
+Guarda método, rota (template), caminho, query, corpo JSON (até
+CAPTURE_MAX_BODY_BYTES), status, duração e o token (só para resolver o
+perfil na thread de escrita; nunca é gravado). Caminhos em
+CAPTURE_EXCLUDE_PATHS (métricas, saúde, streams) ficam de fora.
+"""
+
+import time
+
+from app.core.config import settings
+from app.infrastructure.capture.recorder import traffic_recorder
+
+
+class CaptureMiddleware:
+    def __init__(self, app):
+        self.app = app
+        self.max_body = settings.CAPTURE_MAX_BODY_BYTES
+        self.excluded = tuple(
+            path.strip()
+            for path in settings.CAPTURE_EXCLUDE_PATHS.split(",")
+            if path.strip()
+        )
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or scope["path"].startswith(self.excluded)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request_body = bytearray()
+        request_truncated = False
+        response_body = bytearray()
+        response_json = False
+        response_truncated = False
+        status_code = 500
+
+        async def receive_wrapper():
+            nonlocal request_truncated
+            message = await receive()
+            if message["type"] == "http.request" and not request_truncated:
+                request_body.extend(message.get("body", b""))
+                if len(request_body) > self.max_body:
+                    request_truncated = True
+                    request_body.clear()
+            return message
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_json, response_truncated
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                for name, value in message.get("headers", []):
+                    if name.lower() == b"content-type":
+                        response_json = value.startswith(b"application/json")
+            elif message["type"] == "http.response.body" and response_json:
+                if not response_truncated:
+                    response_body.extend(message.get("body", b""))
+                    if len(response_body) > self.max_body:
+                        response_truncated = True
+                        response_body.clear()
+            await send(message)
+
+        started_at = time.time()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            token = None
+            for name, value in scope.get("headers", []):
+                if name == b"authorization" and value[:7].lower() == b"bearer ":
+                    token = value[7:].decode("latin-1")
+            route = scope.get("route")
+            traffic_recorder.record(
+                {
+                    "ts": round(started_at, 6),
+                    "method": scope["method"],
+                    "route": getattr(route, "path", None),
+                    "path": scope["path"],
+                    "query": scope.get("query_string", b"").decode("latin-1"),
+                    "body": bytes(request_body),
+                    "body_truncated": request_truncated,
+                    "status": status_code,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                    "token": token,
+                    "response_body": bytes(response_body)
+                    if response_json and not response_truncated
+                    else None,
+                }
+            )
@@ -0,0 +1,269 @@
+"""
+Gravação do tráfego em arquivos JSON lines com rotação
+
+A requisição só enfileira o registro bruto; uma thread própria decodifica o
+token, resolve o perfil do usuário (com cache), redige os campos sensíveis,
+aplica a amostragem e escreve. Cada processo grava os próprios arquivos
+(``capture-<início>-<pid>.jsonl``), trocados ao passar de
+CAPTURE_MAX_BYTES; os mais antigos acima de CAPTURE_MAX_FILES são apagados.
+
+O usuário vira um pseudônimo estável (hash com a SECRET_KEY): o replay
+mantém as sessões separadas sem saber quem era quem.
+"""
+
+import hashlib
+import json
+import os
+import queue
+import random
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+import structlog
+
+from app.core.config import settings
+from app.core.security import verify_token
+
+logger = structlog.get_logger(__name__)
+
+REDACTED = "***"
+# Só estes campos da resposta são guardados (o replay remapeia os IDs)
+_ID_FIELDS = ("id", "sale_id", "job_id")
+
+
+def _redact(value: Any, fields: frozenset) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key.lower() in fields else _redact(item, fields)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item, fields) for item in value]
+    return value
+
+
+def _route_fields(spec: str) -> Tuple[Tuple[str, frozenset], ...]:
+    """``/api/v1/auth:username,...`` -> ((prefixo, campos), ...)"""
+    routes: Dict[str, set] = {}
+    for entry in spec.split(","):
+        prefix, _, field = entry.strip().rpartition(":")
+        if prefix and field:
+            routes.setdefault(prefix, set()).add(field.lower())
+    return tuple((prefix, frozenset(fields)) for prefix, fields in routes.items())
+
+
+def shape(value: Any, depth: int = 3) -> Any:
+    """Estrutura do JSON (chaves e tipos), sem valores nem tamanhos"""
+    if isinstance(value, dict):
+        if depth == 0:
+            return "object"
+        return {key: shape(value[key], depth - 1) for key in sorted(value)}
+    if isinstance(value, list):
+        if depth == 0 or not value:
+            return ["list"]
+        return [shape(value[0], depth - 1)]
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    return "null" if value is None else "string"
+
+
+def summarize_response(body: bytes) -> Dict[str, Any]:
+    """Impressão da resposta para comparação no replay"""
+    summary: Dict[str, Any] = {
+        "size": len(body),
+        "sha1": hashlib.sha1(body).hexdigest(),
+    }
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return summary
+    summary["shape"] = shape(data)
+    if isinstance(data, list):
+        summary["length"] = len(data)
+    elif isinstance(data, dict):
+        ids = {
+            key: data[key]
+            for key in _ID_FIELDS
+            if isinstance(data.get(key), int) and not isinstance(data[key], bool)
+        }
+        if ids:
+            summary["ids"] = ids
+    return summary
+
+
+class TrafficRecorder:
+    """Fila + thread de escrita dos registros de tráfego"""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_files: Optional[int] = None,
+        sample_rate: Optional[float] = None,
+    ):
+        self.directory = Path(directory or settings.CAPTURE_DIR)
+        self.max_bytes = max_bytes or settings.CAPTURE_MAX_BYTES
+        self.max_files = max_files or settings.CAPTURE_MAX_FILES
+        self.sample_rate = (
+            settings.CAPTURE_SAMPLE_RATE if sample_rate is None else sample_rate
+        )
+        self.redact_fields = frozenset(
+            field.strip().lower()
+            for field in settings.CAPTURE_REDACT_FIELDS.split(",")
+            if field.strip()
+        )
+        self.route_redact_fields = _route_fields(settings.CAPTURE_REDACT_ROUTE_FIELDS)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._roles: Dict[str, Optional[str]] = {}
+        self._output = None
+        self._path: Optional[Path] = None
+        self.written = 0
+        self.dropped = 0
+
+    def record(self, raw: Dict[str, Any]) -> None:
+        """Chamado pelo middleware ao fim da resposta (só enfileira)"""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="traffic-recorder", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put(raw)
+
+    # ==================== THREAD DE ESCRITA ====================
+
+    def _run(self) -> None:
+        while True:
+            raw = self._queue.get()
+            if raw is None:
+                break
+            try:
+                entry = self._build(raw)
+                if entry is None:
+                    self.dropped += 1
+                    continue
+                self._write(json.dumps(entry, default=str, ensure_ascii=False))
+            except Exception:  # gravação nunca derruba a thread
+                logger.exception("traffic_capture_failed", path=raw.get("path"))
+            if self._queue.empty() and self._output is not None:
+                self._output.flush()
+        if self._output is not None:
+            self._output.close()
+            self._output = None
+
+    def _user(self, token: Optional[str]):
+        """(pseudônimo, perfil) do portador do token"""
+        payload = verify_token(token) if token else None
+        username = payload.get("sub") if payload else None
+        if not username:
+            return None, None
+        if username not in self._roles:
+            self._roles[username] = self._lookup_role(username)
+        pseudonym = hashlib.sha256(
+            f"{settings.SECRET_KEY}:{username}".encode()
+        ).hexdigest()[:12]
+        return pseudonym, self._roles[username]
+
+    @staticmethod
+    def _lookup_role(username: str) -> Optional[str]:
+        from app.infrastructure.database.connection import SessionLocal
+        from app.infrastructure.database.models.user import User
+
+        db = SessionLocal()
+        try:
+            role = db.query(User.role).filter(User.username == username).scalar()
+        finally:
+            db.close()
+        return role.value if role is not None else None
+
+    def _keep(self, user: Optional[str]) -> bool:
+        """Amostra por usuário (sessões inteiras) ou por requisição"""
+        if self.sample_rate >= 1:
+            return True
+        if user is None:
+            return random.random() < self.sample_rate
+        return int(user, 16) / 16 ** len(user) < self.sample_rate
+
+    def _build(self, raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        user, role = self._user(raw.pop("token", None))
+        if not self._keep(user):
+            return None
+
+        fields = self.redact_fields.union(
+            *(
+                scoped
+                for prefix, scoped in self.route_redact_fields
+                if raw["path"].startswith(prefix)
+            )
+        )
+        body = None
+        body_bytes = raw.pop("body")
+        if body_bytes and not raw["body_truncated"]:
+            try:
+                body = _redact(json.loads(body_bytes), fields)
+            except ValueError:
+                body = None  # Só JSON é reproduzido
+        query = raw.pop("query")
+        if query:
+            query = urlencode(
+                [
+                    (key, REDACTED if key.lower() in fields else value)
+                    for key, value in parse_qsl(query, keep_blank_values=True)
+                ]
+            )
+        response_body = raw.pop("response_body")
+        return {
+            **raw,
+            "query": query or None,
+            "body": body,
+            "user": user,
+            "role": role,
+            "response": summarize_response(response_body)
+            if response_body is not None
+            else None,
+        }
+
+    def _write(self, line: str) -> None:
+        if self._output is None or self._output.tell() >= self.max_bytes:
+            self._rotate()
+        self._output.write(line + "\n")
+        self.written += 1
+
+    def _rotate(self) -> None:
+        if self._output is not None:
+            self._output.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        self._path = self.directory / f"capture-{stamp}-{os.getpid()}.jsonl"
+        self._output = self._path.open("a", encoding="utf-8")
+        files = sorted(self.directory.glob("capture-*.jsonl"))
+        for old in files[: max(len(files) - self.max_files, 0)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "current_file": str(self._path) if self._path else None,
+            "cached_roles": len(self._roles),
+        }
+
+
+traffic_recorder = TrafficRecorder()
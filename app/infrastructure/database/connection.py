@@ -2,7 +2,7 @@
 Configuração da conexão com banco de dados
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -14,9 +14,20 @@ engine = create_engine(
     connect_args={"check_same_thread": False}
     if "sqlite" in settings.DATABASE_URL
     else {},
-    echo=settings.DEBUG,  # Log SQL queries em desenvolvimento
+    # SQL no log: LOG_LEVELS="sqlalchemy.engine=INFO" (passa pela fila de logs)
+    echo=False,
 )
 
+if engine.dialect.name == "sqlite" and settings.SQLITE_WAL:
+
+    @event.listens_for(engine, "connect")
+    def _enable_wal(dbapi_connection, connection_record):
+        # Persiste no arquivo; em memória o SQLite mantém "memory"
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
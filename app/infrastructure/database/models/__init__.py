@@ -2,8 +2,11 @@
 Database models
 """
 
+from .affinity import ProductAffinity
+from .archive import ArchivedSale, ArchivedSaleItem, ArchivedStockMovement
 from .base import Base
 from .customer import Customer
+from .forecast import ProductForecast
 from .product import Category, Product
 from .sale import Sale, SaleItem
 from .stock import PurchaseOrder, PurchaseOrderItem, StockMovement, Supplier
@@ -21,4 +24,9 @@ __all__ = [
     "StockMovement",
     "PurchaseOrder",
     "PurchaseOrderItem",
+    "ProductForecast",
+    "ProductAffinity",
+    "ArchivedSale",
+    "ArchivedSaleItem",
+    "ArchivedStockMovement",
 ]
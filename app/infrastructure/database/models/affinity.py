@@ -0,0 +1,28 @@
+"""
+Modelo de afinidade entre produtos (comprados juntos)
+"""
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, UniqueConstraint
+
+from .base import BaseModel
+
+
+class ProductAffinity(BaseModel):
+    """Par de produtos frequentes na mesma venda (uma linha por direção)"""
+
+    __tablename__ = "product_affinities"
+    __table_args__ = (
+        UniqueConstraint(
+            "product_id", "related_product_id", name="uq_product_affinities_pair"
+        ),
+    )
+
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
+    related_product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+
+    pair_count = Column(Integer, nullable=False)  # Vendas com os dois produtos
+    support = Column(Float, nullable=False)  # pair_count / total de vendas
+    confidence = Column(Float, nullable=False)  # P(related | product)
+    lift = Column(Float, nullable=False)
+
+    generated_at = Column(DateTime, nullable=False)
@@ -0,0 +1,109 @@
+"""
+Arquivo mensal de vendas, itens e movimentações de estoque
+
+Mesmas colunas das tabelas vivas, sem chaves estrangeiras (produtos e
+usuários podem ser removidos depois) e com índice em ``created_at``. Os
+meses fechados são movidos para cá por ``scripts/roll_partitions.py``; as
+consultas incluem o arquivo só quando o período começa antes do corte
+(``archive_cutoff``).
+"""
+
+from sqlalchemy import Column, DateTime
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import Float, Index, Integer, Numeric, String, Text
+from sqlalchemy.orm import foreign, relationship
+
+from .base import Base
+from .sale import PaymentMethod, SaleStatus
+from .stock import MovementType
+
+
+class ArchivedSale(Base):
+    """Venda de um mês arquivado (mesmos atributos de Sale)"""
+
+    __tablename__ = "sales_archive"
+    # A listagem continua aqui pelo mesmo cursor (created_at, id)
+    __table_args__ = (Index("ix_sales_archive_created_at_id", "created_at", "id"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    customer_id = Column(Integer, nullable=True)
+    user_id = Column(Integer, nullable=False)
+
+    subtotal_amount = Column(Float, default=0, nullable=False)
+    discount_amount = Column(Float, default=0, nullable=False)
+    bulk_discount_amount = Column(Float, default=0, nullable=False)
+    final_amount = Column(Float, default=0, nullable=False)
+
+    payment_method = Column(SQLEnum(PaymentMethod), nullable=False)
+    status = Column(SQLEnum(SaleStatus), nullable=False)
+
+    # Relacionamentos (só leitura, sem chave estrangeira)
+    user = relationship(
+        "User",
+        primaryjoin="foreign(ArchivedSale.user_id) == User.id",
+        viewonly=True,
+    )
+    customer = relationship(
+        "Customer",
+        primaryjoin="foreign(ArchivedSale.customer_id) == Customer.id",
+        viewonly=True,
+    )
+    items = relationship(
+        "ArchivedSaleItem",
+        primaryjoin=lambda: ArchivedSale.id == foreign(ArchivedSaleItem.sale_id),
+        viewonly=True,
+        order_by=lambda: ArchivedSaleItem.id,
+    )
+
+
+class ArchivedSaleItem(Base):
+    """Item de venda arquivada"""
+
+    __tablename__ = "sale_items_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    sale_id = Column(Integer, nullable=False, index=True)
+    product_id = Column(Integer, nullable=False)
+
+    quantity = Column(Float, nullable=False)
+    weight = Column(Float, nullable=True)
+
+    unit_price = Column(Float, nullable=False)
+    original_total_price = Column(Float, nullable=False)
+    discount_applied = Column(Float, default=0, nullable=False)
+    bulk_discount_applied = Column(Float, default=0, nullable=False)
+    final_total_price = Column(Float, nullable=False)
+
+    product = relationship(
+        "Product",
+        primaryjoin="foreign(ArchivedSaleItem.product_id) == Product.id",
+        viewonly=True,
+    )
+
+
+class ArchivedStockMovement(Base):
+    """Movimentação de estoque de um mês arquivado"""
+
+    __tablename__ = "stock_movements_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    product_id = Column(Integer, nullable=False)
+    movement_type = Column(SQLEnum(MovementType), nullable=False)
+    quantity = Column(Integer, nullable=False)
+    previous_quantity = Column(Integer, nullable=False)
+    new_quantity = Column(Integer, nullable=False)
+    unit_cost = Column(Numeric(10, 2), nullable=True)
+    total_cost = Column(Numeric(10, 2), nullable=True)
+    reason = Column(String(255), nullable=True)
+    notes = Column(Text, nullable=True)
+    user_id = Column(Integer, nullable=False)
+    sale_id = Column(Integer, nullable=True)
+    supplier_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime(timezone=True), index=True)
+    updated_at = Column(DateTime, nullable=False)
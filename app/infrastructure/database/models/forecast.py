@@ -0,0 +1,37 @@
+"""
+Modelo de previsões de demanda por produto
+"""
+
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+
+from .base import BaseModel
+
+
+class ProductForecast(BaseModel):
+    """Previsão diária de demanda (com intervalo de predição)"""
+
+    __tablename__ = "product_forecasts"
+    __table_args__ = (
+        UniqueConstraint(
+            "product_id", "forecast_date", name="uq_product_forecasts_product_date"
+        ),
+    )
+
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
+    forecast_date = Column(Date, nullable=False, index=True)
+
+    predicted_quantity = Column(Float, nullable=False)
+    lower_bound = Column(Float, nullable=False)
+    upper_bound = Column(Float, nullable=False)
+
+    model = Column(String(50), nullable=False)  # Ex.: "holt_winters_weekly"
+    generated_at = Column(DateTime, nullable=False)
@@ -73,6 +73,11 @@ class Product(BaseModel):
     last_purchase_date = Column(DateTime(timezone=True), nullable=True)
     last_sale_date = Column(DateTime(timezone=True), nullable=True)
 
+    # Classificação ABC (por receita e por margem)
+    abc_class = Column(String(1), nullable=True, index=True)
+    abc_margin_class = Column(String(1), nullable=True)
+    abc_updated_at = Column(DateTime, nullable=True)
+
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
 
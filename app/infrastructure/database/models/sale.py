@@ -5,7 +5,16 @@ Modelos de venda
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -32,6 +41,8 @@ class Sale(BaseModel):
     """Venda"""
 
     __tablename__ = "sales"
+    # Ordem das listagens paginadas por cursor
+    __table_args__ = (Index("ix_sales_created_at_id", "created_at", "id"),)
 
     # Cliente (opcional)
     customer_id = Column(Integer, ForeignKey("customers.id"), nullable=True)
@@ -6,7 +6,7 @@ from enum import Enum
 
 from sqlalchemy import Boolean, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -53,6 +53,7 @@ class StockMovement(BaseModel):
     """Movimentações de estoque"""
 
     __tablename__ = "stock_movements"
+    __table_args__ = (Index("ix_stock_movements_created_at_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
@@ -79,13 +80,14 @@ class PurchaseOrder(BaseModel):
     """Pedidos de compra"""
 
     __tablename__ = "purchase_orders"
+    __table_args__ = (Index("ix_purchase_orders_created_at_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False)
     order_number = Column(String(50), unique=True, nullable=False)
     status = Column(
         String(20), default="pending"
-    )  # pending, confirmed, delivered, cancelled
+    )  # draft, pending, confirmed, delivered, cancelled
     total_amount = Column(Numeric(10, 2), nullable=False, default=0)
     notes = Column(Text, nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
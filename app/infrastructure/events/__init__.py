@@ -0,0 +1,3 @@
+"""
+Eventos em tempo real (Server-Sent Events)
+"""
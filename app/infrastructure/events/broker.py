@@ -0,0 +1,148 @@
+"""
+Broker de eventos em memória com fan-out para assinantes SSE
+
+Cada evento é serializado uma única vez no formato SSE e a mesma mensagem
+é entregue à fila de todos os assinantes interessados. ``publish`` pode ser
+chamado de qualquer thread (endpoints síncronos rodam no threadpool); a
+entrega acontece no event loop do assinante.
+
+As últimas mensagens ficam num histórico curto para que clientes que
+reconectam com ``Last-Event-ID`` recebam o que perderam.
+
+O fan-out é do processo: com vários workers (``WEB_CONCURRENCY > 1``) um
+cliente conectado ao worker A não recebe os eventos das vendas atendidas
+pelo worker B. Telas em tempo real exigem um único worker.
+"""
+
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, FrozenSet, List, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+
+
+class Subscription:
+    """Fila de um cliente conectado"""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        event_types: Optional[FrozenSet[str]],
+        size: int,
+    ):
+        self.loop = loop
+        self.event_types = event_types
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.dropped = 0
+
+    def wants(self, event_type: str) -> bool:
+        return self.event_types is None or event_type in self.event_types
+
+    def deliver(self, message: str) -> None:
+        """Roda no loop do assinante; cliente lento perde as mais antigas"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+
+class EventBroker:
+    """Publica eventos para as telas conectadas a este processo"""
+
+    def __init__(self, history_size: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._subscribers: List[Subscription] = []
+        self._history: Deque[Tuple[int, str, str]] = deque(
+            maxlen=history_size or settings.EVENTS_HISTORY_SIZE
+        )
+        self._last_id = 0
+
+    @staticmethod
+    def format(event_id: Optional[int], event_type: str, data: Any) -> str:
+        payload = json.dumps(jsonable_encoder(data), ensure_ascii=False)
+        id_line = f"id: {event_id}\n" if event_id is not None else ""
+        return f"{id_line}event: {event_type}\ndata: {payload}\n\n"
+
+    def publish(self, event_type: str, data: Any) -> int:
+        """Serializa uma vez e distribui para os assinantes"""
+        with self._lock:
+            self._last_id += 1
+            event_id = self._last_id
+            message = self.format(event_id, event_type, data)
+            self._history.append((event_id, event_type, message))
+            targets = [sub for sub in self._subscribers if sub.wants(event_type)]
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+            except RuntimeError:
+                # Loop encerrado: o assinante sai no próximo unsubscribe
+                pass
+        return event_id
+
+    def subscribe(
+        self,
+        event_types: Optional[FrozenSet[str]] = None,
+        last_event_id: Optional[int] = None,
+    ) -> Subscription:
+        """Registra um assinante (chamar dentro do event loop)"""
+        subscription = Subscription(
+            asyncio.get_running_loop(), event_types, settings.EVENTS_QUEUE_SIZE
+        )
+        with self._lock:
+            if last_event_id is not None:
+                for event_id, event_type, message in self._history:
+                    if event_id > last_event_id and subscription.wants(event_type):
+                        subscription.deliver(message)
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    async def stream(
+        self,
+        event_types: Optional[FrozenSet[str]] = None,
+        last_event_id: Optional[int] = None,
+        initial: Optional[List[Tuple[str, Any]]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Mensagens SSE de um novo assinante, com keep-alive periódico
+
+        A inscrição acontece no primeiro ``next``: se o cliente cair antes de
+        a resposta começar, nada fica registrado.
+        """
+        subscription = self.subscribe(event_types, last_event_id)
+        try:
+            yield f"retry: {settings.EVENTS_RETRY_MS}\n\n"
+            # Estado atual sem id: não altera o ponto de retomada do cliente
+            for event_type, data in initial or []:
+                yield self.format(None, event_type, data)
+            while True:
+                try:
+                    yield await asyncio.wait_for(
+                        subscription.queue.get(),
+                        timeout=settings.EVENTS_HEARTBEAT_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "last_event_id": self._last_id,
+                "dropped": sum(sub.dropped for sub in self._subscribers),
+                "queued": sum(sub.queue.qsize() for sub in self._subscribers),
+                "history": len(self._history),
+            }
+
+
+event_broker = EventBroker()
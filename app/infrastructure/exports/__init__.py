@@ -0,0 +1,3 @@
+"""
+Exportação de relatórios em fluxo
+"""
@@ -0,0 +1,151 @@
+"""
+Escritores em fluxo (CSV, XLSX e PDF) para exportação de relatórios
+"""
+
+import csv
+import io
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Iterable, Iterator, List, Sequence
+
+from openpyxl import Workbook
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.pdfgen import canvas
+
+CHUNK_SIZE = 64 * 1024
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "pdf": "application/pdf",
+}
+
+
+def _cell(value):
+    """Normaliza valores do banco para as planilhas"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        # openpyxl não aceita datetime com fuso
+        return value.replace(tzinfo=None)
+    return value
+
+
+def _text(value) -> str:
+    """Representação textual de uma célula"""
+    value = _cell(value)
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def stream_csv(columns: List[str], rows: Iterable[Sequence]) -> Iterator[bytes]:
+    """Gera o CSV em blocos de ~64KB"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM para o Excel reconhecer acentuação
+    buffer.write("\ufeff")
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow([_text(value) for value in row])
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+def stream_xlsx(
+    columns: List[str], rows: Iterable[Sequence], title: str
+) -> Iterator[bytes]:
+    """Gera o XLSX em modo write-only (linhas vão direto para disco)"""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title[:31])
+    sheet.append(columns)
+    for row in rows:
+        sheet.append([_cell(value) for value in row])
+
+    with tempfile.TemporaryFile(suffix=".xlsx") as output:
+        workbook.save(output)
+        output.seek(0)
+        while True:
+            chunk = output.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+def stream_pdf(
+    columns: List[str], rows: Iterable[Sequence], title: str, max_rows: int
+) -> Iterator[bytes]:
+    """Gera o PDF página a página, limitado a max_rows linhas"""
+    output = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    width, height = landscape(A4)
+    pdf = canvas.Canvas(output, pagesize=(width, height), pageCompression=1)
+    margin = 28
+    line_height = 11
+    column_width = (width - 2 * margin) / max(len(columns), 1)
+    max_chars = max(int(column_width / 4.2), 4)
+    page = 0
+
+    def start_page() -> float:
+        nonlocal page
+        page += 1
+        pdf.setFont("Helvetica-Bold", 11)
+        pdf.drawString(margin, height - margin, title)
+        pdf.setFont("Helvetica", 7)
+        pdf.drawRightString(
+            width - margin,
+            height - margin,
+            f"Gerado em {datetime.now():%d/%m/%Y %H:%M} - página {page}",
+        )
+        draw_row(columns, height - margin - 2 * line_height, bold=True)
+        return height - margin - 3 * line_height
+
+    def draw_row(values: Sequence, y: float, bold: bool = False) -> None:
+        pdf.setFont("Helvetica-Bold" if bold else "Helvetica", 7)
+        for index, value in enumerate(values):
+            text = _text(value)
+            if len(text) > max_chars:
+                text = text[: max_chars - 1] + "…"
+            pdf.drawString(margin + index * column_width, y, text)
+
+    y = start_page()
+    written = 0
+    for row in rows:
+        if y < margin:
+            pdf.showPage()
+            y = start_page()
+        if written >= max_rows:
+            pdf.setFont("Helvetica-Oblique", 8)
+            pdf.drawString(
+                margin,
+                y,
+                f"Relatório truncado em {max_rows} linhas - "
+                "utilize CSV ou XLSX para o conjunto completo",
+            )
+            break
+        draw_row(row, y)
+        y -= line_height
+        written += 1
+
+    pdf.save()
+    output.seek(0)
+    try:
+        while True:
+            chunk = output.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        output.close()
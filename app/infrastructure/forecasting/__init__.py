@@ -0,0 +1,3 @@
+"""
+Previsão de demanda
+"""
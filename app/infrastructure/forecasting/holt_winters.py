@@ -0,0 +1,135 @@
+"""
+Holt-Winters aditivo com sazonalidade semanal, vetorizado por produto
+
+Cada linha da matriz é a série diária de um produto; o laço percorre apenas
+os dias e todas as operações são feitas sobre o vetor de produtos.
+"""
+
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+
+SEASON_LENGTH = 7
+MODEL_NAME = "holt_winters_weekly"
+
+# Grade de parâmetros avaliada para cada produto (escolhe o menor erro)
+DEFAULT_GRID: Tuple[Tuple[float, float, float], ...] = tuple(
+    (alpha, beta, gamma)
+    for alpha in (0.05, 0.15, 0.35)
+    for beta in (0.0, 0.02)
+    for gamma in (0.05, 0.25)
+)
+
+
+@dataclass
+class ForecastResult:
+    """Previsões (produtos x horizonte) e parâmetros escolhidos"""
+
+    mean: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    alpha: np.ndarray
+    beta: np.ndarray
+    gamma: np.ndarray
+
+
+def _smooth(
+    y: np.ndarray,
+    first: np.ndarray,
+    alpha: float,
+    beta: float,
+    gamma: float,
+    phi: float,
+):
+    """Executa a suavização; retorna estado final e soma dos erros quadráticos"""
+    products, days = y.shape
+    active_days = np.maximum(days - first, 1)
+    # Nível inicial: média do histórico ativo (evita o viés de zeros antes do lançamento)
+    level = y.sum(axis=1) / active_days
+    trend = np.zeros(products)
+    season = np.zeros((products, SEASON_LENGTH))
+    sse = np.zeros(products)
+    rows = np.arange(products)
+
+    for t in range(days):
+        active = t >= first
+        slot = t % SEASON_LENGTH
+        observed = y[:, t]
+        seasonal = season[rows, slot]
+        damped_trend = phi * trend
+
+        error = observed - (level + damped_trend + seasonal)
+        sse += np.where(active, error * error, 0.0)
+
+        new_level = alpha * (observed - seasonal) + (1 - alpha) * (level + damped_trend)
+        new_trend = beta * (new_level - level) + (1 - beta) * damped_trend
+        new_season = gamma * (observed - new_level) + (1 - gamma) * seasonal
+
+        trend = np.where(active, new_trend, trend)
+        season[:, slot] = np.where(active, new_season, seasonal)
+        level = np.where(active, new_level, level)
+
+    return level, trend, season, sse / active_days
+
+
+def forecast(
+    y: np.ndarray,
+    horizon: int,
+    grid: Sequence[Tuple[float, float, float]] = DEFAULT_GRID,
+    phi: float = 0.98,
+    z: float = 1.96,
+) -> ForecastResult:
+    """
+    Ajusta e projeta `horizon` dias para cada linha de `y`
+
+    Intervalos de predição pela variância analítica do modelo aditivo
+    (z=1.96 -> ~95%). Valores negativos são truncados em zero.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    products, days = y.shape
+    # Primeiro dia com venda de cada produto (sem vendas: série inteira)
+    has_sales = y > 0
+    first = np.where(has_sales.any(axis=1), has_sales.argmax(axis=1), 0)
+
+    best_mse = np.full(products, np.inf)
+    level = np.zeros(products)
+    trend = np.zeros(products)
+    season = np.zeros((products, SEASON_LENGTH))
+    params = np.zeros((products, 3))
+
+    for alpha, beta, gamma in grid:
+        fit_level, fit_trend, fit_season, mse = _smooth(
+            y, first, alpha, beta, gamma, phi
+        )
+        better = mse < best_mse
+        best_mse = np.where(better, mse, best_mse)
+        level = np.where(better, fit_level, level)
+        trend = np.where(better, fit_trend, trend)
+        season = np.where(better[:, None], fit_season, season)
+        params[better] = (alpha, beta, gamma)
+
+    steps = np.arange(1, horizon + 1)
+    # Tendência amortecida acumulada: sum(phi^i, i=1..h)
+    damping = np.cumsum(phi**steps)
+    slots = (days + steps - 1) % SEASON_LENGTH
+    mean = level[:, None] + damping[None, :] * trend[:, None] + season[:, slots]
+
+    # Var(h) = sigma^2 * (1 + sum_{j<h} c_j^2), c_j = alpha(1 + j*beta) + gamma*[j % m == 0]
+    alpha, beta, gamma = params[:, 0:1], params[:, 1:2], params[:, 2:3]
+    j = np.arange(1, horizon)[None, :]
+    c = alpha * (1 + j * beta) + gamma * (j % SEASON_LENGTH == 0)
+    variance_factor = np.concatenate(
+        [np.ones((products, 1)), 1 + np.cumsum(c * c, axis=1)], axis=1
+    )
+    width = z * np.sqrt(best_mse[:, None] * variance_factor)
+
+    mean = np.maximum(mean, 0.0)
+    return ForecastResult(
+        mean=mean,
+        lower=np.maximum(mean - width, 0.0),
+        upper=mean + width,
+        alpha=params[:, 0],
+        beta=params[:, 1],
+        gamma=params[:, 2],
+    )
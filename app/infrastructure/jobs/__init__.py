@@ -0,0 +1,3 @@
+"""
+Execução de jobs em segundo plano
+"""
@@ -0,0 +1,55 @@
+"""
+Pool de processos compartilhado para tarefas pesadas
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+
+_pool: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Cria o pool sob demanda (spawn: workers não herdam conexões do pai)"""
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.REPORT_JOBS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_process_pool(wait: bool = False) -> None:
+    """Encerra o pool (shutdown da aplicação ou pool quebrado)"""
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait, cancel_futures=True)
+            _pool = None
+
+
+@contextmanager
+def worker_session(database_url: str) -> Iterator[Session]:
+    """Sessão própria do processo worker (sem pool; engine descartado ao sair)"""
+    engine = create_engine(
+        database_url,
+        poolclass=NullPool,
+        connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
+    )
+    db = sessionmaker(bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
@@ -0,0 +1,140 @@
+"""
+Armazenamento em disco de jobs em segundo plano (metadados + resultado)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+PENDING_STATUSES = (QUEUED, RUNNING)
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    """Verifica se o processo dono do job ainda existe"""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobStore:
+    """Um diretório por job com meta.json e o arquivo de resultado"""
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        ttl: timedelta = timedelta(hours=settings.REPORT_JOBS_TTL_HOURS),
+    ):
+        self.root = Path(root or settings.REPORT_JOBS_DIR)
+        self.ttl = ttl
+
+    # ==================== METADADOS ====================
+
+    def _job_dir(self, job_id: str) -> Path:
+        # job_id vem da URL: aceitar apenas o formato gerado aqui
+        return self.root / uuid.UUID(job_id).hex
+
+    def create(self, job_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Registra um job novo como 'queued'"""
+        job_id = uuid.uuid4().hex
+        now = datetime.now()
+        meta = {
+            "id": job_id,
+            "job_type": job_type,
+            "params": params,
+            "status": QUEUED,
+            "progress": 0.0,
+            "message": None,
+            "error": None,
+            "result_file": None,
+            "owner_pid": os.getpid(),
+            "created_at": now.isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "expires_at": (now + self.ttl).isoformat(),
+        }
+        self._job_dir(job_id).mkdir(parents=True, exist_ok=True)
+        self._write(job_id, meta)
+        return meta
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Lê os metadados (None se não existe ou expirou)"""
+        try:
+            path = self._job_dir(job_id) / "meta.json"
+        except ValueError:
+            return None
+        if not path.exists():
+            return None
+        with open(path, encoding="utf-8") as f:
+            meta = json.load(f)
+
+        if datetime.fromisoformat(meta["expires_at"]) <= datetime.now():
+            self.delete(job_id)
+            return None
+        if meta["status"] in PENDING_STATUSES and not _pid_alive(meta["owner_pid"]):
+            # API reiniciada com o job na fila: o pool que o executaria não existe
+            meta = self.update(
+                job_id, status=FAILED, error="Job interrompido (processo finalizado)"
+            )
+        return meta
+
+    def update(self, job_id: str, **changes) -> Dict[str, Any]:
+        """Atualiza campos dos metadados"""
+        path = self._job_dir(job_id) / "meta.json"
+        with open(path, encoding="utf-8") as f:
+            meta = json.load(f)
+        meta.update(changes)
+        self._write(job_id, meta)
+        return meta
+
+    def _write(self, job_id: str, meta: Dict[str, Any]) -> None:
+        """Escrita atômica (arquivo temporário + rename)"""
+        job_dir = self._job_dir(job_id)
+        fd, tmp_path = tempfile.mkstemp(dir=job_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, job_dir / "meta.json")
+
+    # ==================== RESULTADOS ====================
+
+    def result_path(self, job_id: str, filename: str) -> Path:
+        """Caminho onde o worker grava o resultado"""
+        return self._job_dir(job_id) / filename
+
+    def delete(self, job_id: str) -> None:
+        shutil.rmtree(self._job_dir(job_id), ignore_errors=True)
+
+    def purge_expired(self) -> int:
+        """Remove jobs expirados; retorna quantos foram removidos"""
+        if not self.root.exists():
+            return 0
+        removed = 0
+        now = datetime.now()
+        for job_dir in self.root.iterdir():
+            meta_path = job_dir / "meta.json"
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    expires_at = datetime.fromisoformat(json.load(f)["expires_at"])
+            except (OSError, ValueError, KeyError):
+                continue
+            if expires_at <= now:
+                shutil.rmtree(job_dir, ignore_errors=True)
+                removed += 1
+        return removed
@@ -0,0 +1,3 @@
+"""
+Métricas no formato de exposição do Prometheus
+"""
@@ -0,0 +1,134 @@
+"""
+Métricas da aplicação (HTTP, banco, checkout e caches)
+"""
+
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.infrastructure.metrics.registry import Registry
+
+registry = Registry(settings.METRICS_DIR or None, settings.METRICS_FLUSH_SECONDS)
+
+# ==================== HTTP ====================
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "Requisições HTTP atendidas",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP por rota",
+    ("method", "route"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "Requisições HTTP em andamento",
+)
+
+# ==================== BANCO ====================
+
+db_queries_total = registry.counter(
+    "db_queries_total",
+    "Comandos SQL executados",
+    ("operation",),
+)
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds",
+    "Duração dos comandos SQL",
+    ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+db_lock_errors_total = registry.counter(
+    "db_lock_errors_total",
+    "Comandos que falharam esperando bloqueio do banco",
+    ("reason",),
+)
+db_pool_connections = registry.gauge(
+    "db_pool_connections",
+    "Conexões do pool por estado",
+    ("state",),
+)
+
+# ==================== PDV ====================
+
+checkout_cart_items = registry.histogram(
+    "checkout_cart_items",
+    "Itens distintos no carrinho ao finalizar a venda",
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100),
+)
+checkout_phase_duration_seconds = registry.histogram(
+    "checkout_phase_duration_seconds",
+    "Duração das fases do PDV (lookup, pricing, persist, stock, receipt)",
+    ("phase",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
+# ==================== CACHES ====================
+
+cache_requests_total = registry.counter(
+    "cache_requests_total",
+    "Consultas aos caches em memória",
+    ("cache", "result"),
+)
+
+
+def cache_hit(cache: str, hit: bool) -> None:
+    cache_requests_total.inc(cache=cache, result="hit" if hit else "miss")
+
+
+# SQLite: mensagem do OperationalError; PostgreSQL: SQLSTATE
+_LOCK_MESSAGES = ("database is locked", "database table is locked")
+_LOCK_SQLSTATES = {"40P01": "deadlock", "55P03": "lock_not_available"}
+
+
+def _lock_reason(error: BaseException) -> Optional[str]:
+    """Motivo do erro se ele for de bloqueio/espera, senão None"""
+    sqlstate = getattr(error, "pgcode", None)
+    if sqlstate in _LOCK_SQLSTATES:
+        return _LOCK_SQLSTATES[sqlstate]
+    message = str(error).lower()
+    if any(text in message for text in _LOCK_MESSAGES):
+        return "busy_timeout"
+    return None
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Conta e cronometra os comandos SQL e expõe o estado do pool"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["metrics_started"].pop()
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+        db_queries_total.inc(operation=operation)
+        db_query_duration_seconds.observe(
+            time.perf_counter() - started, operation=operation
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        connection = context.connection
+        if connection is not None and connection.info.get("metrics_started"):
+            connection.info["metrics_started"].pop()
+        reason = _lock_reason(context.original_exception)
+        if reason:
+            db_lock_errors_total.inc(reason=reason)
+
+    def pool_state() -> Dict[tuple, float]:
+        pool = engine.pool
+        state = {}
+        for name in ("checkedout", "checkedin", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                state[(name,)] = float(method())
+        return state
+
+    db_pool_connections.set_collector(pool_state)
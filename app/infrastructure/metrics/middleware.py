@@ -0,0 +1,47 @@
+"""
+Middleware ASGI de métricas HTTP
+
+A rota é rotulada pelo template (``/api/v1/products/{product_id}``), não
+pela URL, para manter a cardinalidade baixa.
+"""
+
+import time
+
+from app.infrastructure.metrics.instruments import (
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+    registry,
+)
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec()
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            http_requests_total.inc(method=method, route=path, status=str(status_code))
+            http_request_duration_seconds.observe(elapsed, method=method, route=path)
+            registry.maybe_flush()
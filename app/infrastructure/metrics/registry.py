@@ -0,0 +1,293 @@
+"""
+Registro de métricas em processo (contadores, gauges e histogramas)
+
+Atualizar uma métrica custa um lock e uma soma num dicionário. Com vários
+workers (uvicorn/gunicorn), cada processo grava periodicamente seu estado em
+``METRICS_DIR/metrics-<pid>.json`` e quem atende ``/metrics`` soma os
+arquivos: contadores e histogramas de todos os processos (inclusive os que
+já terminaram, para não "voltar" a contagem) e gauges só dos vivos.
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[LabelValues, object] = {}
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "|".join(key): self._copy(value) for key, value in self._values.items()
+            }
+
+    @staticmethod
+    def _copy(value):
+        return list(value) if isinstance(value, list) else value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        # Valores lidos na hora da coleta (ex.: estado do pool)
+        self._collect = collect
+
+    def set_collector(self, collect: Callable[[], Dict[LabelValues, float]]) -> None:
+        self._collect = collect
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def snapshot(self) -> Dict[str, object]:
+        if self._collect is not None:
+            values = self._collect()
+            with self._lock:
+                self._values = dict(values)
+        return super().snapshot()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Contagem por balde (não acumulada) + +Inf, soma, total
+                state = [0] * (len(self.buckets) + 1) + [0.0, 0]
+                self._values[key] = state
+            state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def time(self, **labels: str) -> "_Timer":
+        return _Timer(self, labels)
+
+
+class _Timer:
+    """Context manager que observa a duração do bloco"""
+
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+
+class Registry:
+    """Conjunto de métricas + agregação entre processos"""
+
+    def __init__(self, directory: Optional[str] = None, flush_interval: float = 5.0):
+        self._metrics: Dict[str, _Metric] = {}
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        self._flushed_at = 0.0
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames=(), collect=None
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, collect))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "metrics": len(self._metrics),
+            "series": sum(len(metric._values) for metric in self._metrics.values()),
+        }
+
+    # ==================== VÁRIOS PROCESSOS ====================
+
+    def _snapshot(self) -> Dict[str, Dict[str, object]]:
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def flush(self) -> None:
+        """Grava o estado deste processo (troca atômica do arquivo)"""
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"metrics-{os.getpid()}.json"
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(self._snapshot()))
+        os.replace(temp_path, path)
+        self._flushed_at = time.monotonic()
+
+    def maybe_flush(self) -> None:
+        if (
+            self.directory is not None
+            and time.monotonic() - self._flushed_at >= self.flush_interval
+        ):
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def _collect_all(self) -> Dict[str, Dict[str, object]]:
+        own = self._snapshot()
+        if self.directory is None or not self.directory.exists():
+            return own
+        merged = {name: dict(values) for name, values in own.items()}
+        for path in self.directory.glob("metrics-*.json"):
+            pid = int(path.stem.split("-", 1)[1])
+            if pid == os.getpid():
+                continue
+            try:
+                other = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            alive = _pid_alive(pid)
+            for name, values in other.items():
+                metric = self._metrics.get(name)
+                if metric is None or (metric.kind == "gauge" and not alive):
+                    continue
+                target = merged.setdefault(name, {})
+                for key, value in values.items():
+                    current = target.get(key)
+                    if current is None:
+                        target[key] = value
+                    elif isinstance(value, list):
+                        target[key] = [a + b for a, b in zip(current, value)]
+                    else:
+                        target[key] = current + value
+        return merged
+
+    # ==================== EXPOSIÇÃO ====================
+
+    def render(self) -> str:
+        """Formato texto do Prometheus (0.0.4)"""
+        lines: List[str] = []
+        collected = self._collect_all()
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for key, value in sorted(collected.get(name, {}).items()):
+                labels = list(zip(metric.labelnames, key.split("|"))) if key else []
+                if metric.kind == "histogram":
+                    lines.extend(_histogram_lines(name, metric, labels, value))
+                else:
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _labels(pairs: Iterable[Tuple[str, str]]) -> str:
+    pairs = list(pairs)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _histogram_lines(name: str, metric: Histogram, labels, state) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(metric.buckets + (float("inf"),), state[:-2]):
+        cumulative += count
+        le = "+Inf" if bound == float("inf") else repr(bound)
+        lines.append(f"{name}_bucket{_labels(labels + [('le', le)])} {cumulative}")
+    lines.append(f"{name}_sum{_labels(labels)} {_number(state[-2])}")
+    lines.append(f"{name}_count{_labels(labels)} {int(state[-1])}")
+    return lines
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
@@ -0,0 +1,3 @@
+"""
+Perfilamento sob demanda de requisições (amostragem de pilhas)
+"""
@@ -0,0 +1,164 @@
+"""
+Rastreamento de memória com tracemalloc (snapshots e diferenças)
+
+Cada worker tem seu próprio tracemalloc: as respostas trazem o pid de quem
+atendeu. Os snapshots ficam em memória, no máximo MEMORY_SNAPSHOTS_MAX.
+"""
+
+import os
+import resource
+import threading
+import tracemalloc
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Alocações do próprio rastreamento não interessam
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _rss_bytes() -> Optional[int]:
+    """RSS atual (Linux) ou pico (demais sistemas)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak * 1024 if peak else None
+
+
+class MemoryTracker:
+    """Liga/desliga o tracemalloc e compara snapshots"""
+
+    def __init__(self, max_snapshots: Optional[int] = None):
+        self.max_snapshots = max_snapshots or settings.MEMORY_SNAPSHOTS_MAX
+        self._lock = threading.Lock()
+        self._snapshots: "OrderedDict[int, Tuple[datetime, tracemalloc.Snapshot]]" = (
+            OrderedDict()
+        )
+        self._next_id = 1
+
+    def status(self) -> Dict[str, Any]:
+        tracing = tracemalloc.is_tracing()
+        current, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+        with self._lock:
+            snapshots = [
+                {"id": snapshot_id, "taken_at": taken_at}
+                for snapshot_id, (taken_at, _) in self._snapshots.items()
+            ]
+        return {
+            "pid": os.getpid(),
+            "rss_bytes": _rss_bytes(),
+            "tracing": tracing,
+            "traceback_frames": tracemalloc.get_traceback_limit() if tracing else None,
+            "traced_bytes": current,
+            "traced_peak_bytes": peak,
+            "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+            "snapshots": snapshots,
+        }
+
+    def start(self, frames: int = 1) -> Dict[str, Any]:
+        """Só alocações feitas depois daqui são rastreadas"""
+        if tracemalloc.is_tracing():
+            raise ValueError("tracemalloc já está ativo")
+        tracemalloc.start(frames)
+        return self.status()
+
+    def stop(self) -> Dict[str, Any]:
+        """Para o rastreamento e descarta os snapshots"""
+        if not tracemalloc.is_tracing():
+            raise ValueError("tracemalloc não está ativo")
+        tracemalloc.stop()
+        with self._lock:
+            self._snapshots.clear()
+        return self.status()
+
+    def take_snapshot(self) -> Dict[str, Any]:
+        if not tracemalloc.is_tracing():
+            raise ValueError("tracemalloc não está ativo")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        taken_at = datetime.utcnow()
+        with self._lock:
+            snapshot_id = self._next_id
+            self._next_id += 1
+            self._snapshots[snapshot_id] = (taken_at, snapshot)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return {
+            "id": snapshot_id,
+            "taken_at": taken_at,
+            "traced_bytes": sum(stat.size for stat in snapshot.statistics("filename")),
+        }
+
+    def _get(self, snapshot_id: int) -> tracemalloc.Snapshot:
+        with self._lock:
+            entry = self._snapshots.get(snapshot_id)
+        if entry is None:
+            raise LookupError(f"Snapshot {snapshot_id} não encontrado")
+        return entry[1]
+
+    def top(
+        self, snapshot_id: int, group_by: str = "lineno", limit: int = 25
+    ) -> List[Dict[str, Any]]:
+        """Maiores alocações vivas de um snapshot"""
+        stats = self._get(snapshot_id).statistics(group_by)
+        return [
+            {
+                "location": _location(stat.traceback, group_by),
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in stats[:limit]
+        ]
+
+    def diff(
+        self,
+        base_id: int,
+        target_id: Optional[int] = None,
+        group_by: str = "lineno",
+        limit: int = 25,
+    ) -> Dict[str, Any]:
+        """
+        Crescimento entre dois snapshots (sem ``target_id``, tira um agora)
+
+        Ordenado pela diferença de tamanho: o que mais cresceu primeiro.
+        """
+        base = self._get(base_id)
+        if target_id is None:
+            target_id = self.take_snapshot()["id"]
+        stats = self._get(target_id).compare_to(base, group_by)
+        return {
+            "base_id": base_id,
+            "target_id": target_id,
+            "group_by": group_by,
+            "size_diff_bytes": sum(stat.size_diff for stat in stats),
+            "top": [
+                {
+                    "location": _location(stat.traceback, group_by),
+                    "size_bytes": stat.size,
+                    "size_diff_bytes": stat.size_diff,
+                    "count": stat.count,
+                    "count_diff": stat.count_diff,
+                }
+                for stat in stats[:limit]
+            ],
+        }
+
+
+def _location(traceback: tracemalloc.Traceback, group_by: str) -> str:
+    if group_by == "filename":
+        return traceback[0].filename
+    # Local da alocação primeiro, seguido de quem o chamou
+    return " <- ".join(
+        f"{frame.filename}:{frame.lineno}" for frame in reversed(traceback)
+    )
+
+
+memory_tracker = MemoryTracker()
@@ -0,0 +1,123 @@
+"""
+Middleware ASGI de perfilamento sob demanda
+
+Uma requisição é perfilada quando traz ``X-Profile: 1`` (ou ``?profile=1``)
+e um token de administrador. As demais só pagam a checagem do cabeçalho.
+O id do perfil volta no cabeçalho ``X-Profile-Id``.
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+import structlog
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.infrastructure.database.connection import SessionLocal
+from app.infrastructure.profiling.sampler import StackSampler
+from app.infrastructure.profiling.store import profile_store
+from app.presentation.api.dependencies import get_current_active_user, require_admin
+
+logger = structlog.get_logger(__name__)
+
+_FLAG_VALUES = (b"1", b"true", b"yes")
+
+
+def _flagged(scope) -> bool:
+    for name, value in scope["headers"]:
+        if name == b"x-profile":
+            return value.lower() in _FLAG_VALUES
+    query = scope.get("query_string", b"")
+    if b"profile=" not in query:
+        return False
+    params = query.lower().split(b"&")
+    return any(b"profile=" + value in params for value in _FLAG_VALUES)
+
+
+def _admin_username(authorization: Optional[bytes]) -> Optional[str]:
+    """Mesma validação de require_admin; None se não for administrador"""
+    if not authorization:
+        return None
+    scheme, _, token = authorization.decode("latin-1").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    db = SessionLocal()
+    try:
+        credentials = HTTPAuthorizationCredentials(scheme=scheme, credentials=token)
+        return require_admin(get_current_active_user(credentials, db)).username
+    except HTTPException:
+        return None
+    finally:
+        db.close()
+
+
+class ProfilingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _flagged(scope):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        username = await run_in_threadpool(
+            _admin_username, headers.get(b"authorization")
+        )
+        if username is None:
+            logger.warning("profile_denied", path=scope["path"])
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = profile_store.new_id()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (b"x-profile-id", profile_id.encode())
+                ]
+            await send(message)
+
+        def endpoint_code():
+            route = scope.get("route")
+            endpoint = getattr(route, "endpoint", None)
+            return getattr(endpoint, "__code__", None)
+
+        sampler = StackSampler(
+            threading.get_ident(),
+            sys._getframe(),
+            endpoint_code,
+            settings.PROFILE_SAMPLE_INTERVAL_MS / 1000,
+            settings.PROFILE_MAX_SECONDS,
+        )
+        started_at = datetime.utcnow()
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stacks = sampler.stop()
+            route = scope.get("route")
+            meta = {
+                "id": profile_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path", None),
+                "status_code": status_code,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                "samples": sampler.samples,
+                "interval_ms": settings.PROFILE_SAMPLE_INTERVAL_MS,
+                "username": username,
+                "created_at": started_at.isoformat(),
+            }
+            await run_in_threadpool(profile_store.save, meta, stacks)
+            logger.info("request_profiled", **meta)
@@ -0,0 +1,100 @@
+"""
+Profiler por amostragem das pilhas de uma requisição
+
+Uma thread lê ``sys._current_frames()`` a cada intervalo e guarda as pilhas
+que pertencem à requisição perfilada:
+
+- na thread do event loop, as que passam pelo frame do middleware desta
+  requisição (código async: rota, dependências, middlewares internos);
+- nas threads do threadpool, as que passam pelo endpoint da rota (endpoints
+  ``def``). Requisições simultâneas ao mesmo endpoint síncrono também
+  entram nessas amostras.
+
+O resultado é o formato "folded" (``a;b;c 12``), aceito por flamegraph.pl,
+speedscope e inferno.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Callable, Dict, List, Optional
+
+_labels: Dict[CodeType, str] = {}
+
+
+def _label(code: CodeType) -> str:
+    label = _labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        if filename.startswith(os.getcwd()):
+            filename = os.path.relpath(filename)
+        name = getattr(code, "co_qualname", code.co_name)
+        label = f"{name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+        _labels[code] = label
+    return label
+
+
+class StackSampler:
+    """Coleta pilhas da requisição até ``stop()`` ou ``max_seconds``"""
+
+    def __init__(
+        self,
+        loop_thread_id: int,
+        request_frame: FrameType,
+        endpoint_code: Callable[[], Optional[CodeType]],
+        interval: float,
+        max_seconds: float,
+    ):
+        self.loop_thread_id = loop_thread_id
+        self.request_frame = request_frame
+        # A rota só é conhecida depois do roteamento: lida a cada amostra
+        self.endpoint_code = endpoint_code
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + self.max_seconds
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval) and time.monotonic() < deadline:
+            endpoint = self.endpoint_code()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = self._request_stack(thread_id, frame, endpoint)
+                if stack:
+                    self.stacks[";".join(stack)] += 1
+                    self.samples += 1
+
+    def _request_stack(
+        self, thread_id: int, frame: FrameType, endpoint: Optional[CodeType]
+    ) -> Optional[List[str]]:
+        """Pilha (raiz -> folha) a partir do frame da requisição, se houver"""
+        chain = []
+        while frame is not None:
+            chain.append(frame)
+            if thread_id == self.loop_thread_id:
+                if frame is self.request_frame:
+                    break
+            elif frame.f_code is endpoint:
+                break
+            frame = frame.f_back
+        if frame is None:
+            return None
+        return [_label(item.f_code) for item in reversed(chain)]
@@ -0,0 +1,228 @@
+"""
+Log de consultas lentas com plano de execução
+
+Comandos acima de SLOW_QUERY_THRESHOLD_MS são agrupados pela "impressão
+digital" (literais e listas IN normalizados). Cada grupo guarda contagem,
+tempos, parâmetros redigidos (só tipos), o trecho da aplicação que disparou
+a consulta e o plano (``EXPLAIN QUERY PLAN`` no SQLite, ``EXPLAIN`` no
+PostgreSQL), capturado uma vez por grupo na mesma conexão e transação (no PostgreSQL,
+dentro de um SAVEPOINT).
+"""
+
+import hashlib
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__))) + os.sep
+_ROOT_DIR = os.path.dirname(_APP_DIR[:-1]) + os.sep
+# Instrumentação (este módulo, wrappers de tracing) não é "quem chamou"
+_SKIP_DIRS = (
+    os.path.dirname(__file__) + os.sep,
+    os.path.join(_APP_DIR, "infrastructure", "tracing") + os.sep,
+)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_PARAM = re.compile(r"%\(\w+\)s|:\w+|\$\d+|%s")
+_SPACES = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """SQL com literais e parâmetros trocados por ``?``"""
+    normalized = _STRING.sub("?", statement)
+    normalized = _PARAM.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    return _SPACES.sub(" ", normalized).strip()
+
+
+def _redact(parameters: Any, executemany: bool) -> Any:
+    """Só os tipos dos parâmetros (valores podem conter dados pessoais)"""
+    if executemany:
+        return {"batches": len(parameters)}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return None
+
+
+def _caller(depth: int = 3) -> List[str]:
+    """Frames da aplicação mais próximos da consulta (mais interno primeiro)"""
+    frames = []
+    frame = sys._getframe(2)
+    while frame is not None and len(frames) < depth:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_APP_DIR) and not filename.startswith(_SKIP_DIRS):
+            path = filename[len(_ROOT_DIR) :]
+            frames.append(f"{path}:{frame.f_lineno} in {frame.f_code.co_name}")
+        frame = frame.f_back
+    return frames
+
+
+def _explain(conn, statement: str, parameters: Any) -> Optional[List[str]]:
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        sql = f"EXPLAIN QUERY PLAN {statement}"
+    elif dialect == "postgresql":
+        sql = f"EXPLAIN {statement}"
+    else:
+        return None
+    # Cursor novo na mesma conexão DBAPI: não interfere no resultado atual.
+    # No PostgreSQL um EXPLAIN que falha aborta a transação inteira; o
+    # SAVEPOINT isola a falha e a requisição segue normalmente.
+    savepoint = dialect == "postgresql" and conn.in_transaction()
+    cursor = conn.connection.cursor()
+    try:
+        if savepoint:
+            cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(sql, parameters)
+            rows = cursor.fetchall()
+        except Exception:
+            if savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            raise
+        finally:
+            if savepoint:
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+    finally:
+        cursor.close()
+    if dialect == "sqlite":
+        # (id, parent, notused, detail): indenta pela hierarquia
+        depth = {0: -1}
+        lines = []
+        for node_id, parent, _, detail in rows:
+            depth[node_id] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[node_id] + detail)
+        return lines
+    return [row[0] for row in rows]
+
+
+class SlowQueryLog:
+    """Consultas lentas por impressão digital (LRU limitado)"""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or settings.SLOW_QUERY_MAX_ENTRIES
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def record(
+        self,
+        conn,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        elapsed_ms: float,
+    ) -> None:
+        normalized = fingerprint(statement)
+        key = hashlib.sha1(normalized.encode()).hexdigest()[:16]
+        caller = _caller()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                entry = {
+                    "id": key,
+                    "fingerprint": normalized,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "plan": None,
+                    "plan_error": None,
+                    "first_seen": datetime.utcnow(),
+                }
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["last_ms"] = elapsed_ms
+            entry["last_seen"] = datetime.utcnow()
+            entry["statement"] = statement[: settings.SLOW_QUERY_MAX_STATEMENT_LENGTH]
+            entry["parameters"] = _redact(parameters, executemany)
+            entry["caller"] = caller
+            needs_plan = entry["plan"] is None and entry["plan_error"] is None
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        if (
+            needs_plan
+            and settings.SLOW_QUERY_EXPLAIN
+            and not executemany
+            and normalized.split(" ", 1)[0].upper() in ("SELECT", "WITH")
+        ):
+            try:
+                plan = _explain(conn, statement, parameters)
+                error = None
+            except Exception as e:  # plano é opcional: nunca quebra a consulta
+                plan, error = None, f"{type(e).__name__}: {e}"
+                logger.warning(
+                    "slow_query_explain_failed", fingerprint_id=key, error=error
+                )
+            with self._lock:
+                entry["plan"], entry["plan_error"] = plan, error
+
+        logger.warning(
+            "slow_query",
+            fingerprint_id=key,
+            elapsed_ms=round(elapsed_ms, 1),
+            caller=caller[0] if caller else None,
+        )
+
+    def list(self, order_by: str = "total_ms", limit: int = 50) -> List[Dict]:
+        with self._lock:
+            entries = [dict(entry) for entry in self._entries.values()]
+        for entry in entries:
+            entry["avg_ms"] = round(entry["total_ms"] / entry["count"], 2)
+            entry["total_ms"] = round(entry["total_ms"], 2)
+            entry["max_ms"] = round(entry["max_ms"], 2)
+            entry["last_ms"] = round(entry["last_ms"], 2)
+        entries.sort(key=lambda entry: entry[order_by], reverse=True)
+        return entries[:limit]
+
+    def clear(self) -> int:
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+        return removed
+
+
+slow_query_log = SlowQueryLog()
+
+
+def watch_engine(engine: Engine, threshold_ms: Optional[float] = None) -> None:
+    """Registra no log os comandos acima do limite"""
+    threshold = (
+        settings.SLOW_QUERY_THRESHOLD_MS if threshold_ms is None else threshold_ms
+    )
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (
+            time.perf_counter() - conn.info["slow_query_started"].pop()
+        ) * 1000
+        if elapsed_ms >= threshold:
+            slow_query_log.record(conn, statement, parameters, executemany, elapsed_ms)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        connection = context.connection
+        if connection is not None and connection.info.get("slow_query_started"):
+            connection.info["slow_query_started"].pop()
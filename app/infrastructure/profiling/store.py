@@ -0,0 +1,72 @@
+"""
+Armazenamento limitado de perfis em disco (metadados + pilhas "folded")
+"""
+
+import json
+import os
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+
+class ProfileStore:
+    """``<id>.json`` + ``<id>.folded`` por perfil; os mais antigos saem"""
+
+    def __init__(self, root: Optional[str] = None, max_profiles: Optional[int] = None):
+        self.root = Path(root or settings.PROFILES_DIR)
+        self.max_profiles = max_profiles or settings.PROFILES_MAX
+
+    @staticmethod
+    def new_id() -> str:
+        return uuid.uuid4().hex
+
+    def _path(self, profile_id: str, suffix: str) -> Path:
+        # profile_id vem da URL: aceitar apenas o formato gerado aqui
+        return self.root / f"{uuid.UUID(profile_id).hex}{suffix}"
+
+    def save(self, meta: Dict[str, Any], stacks: Counter) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        folded = self._path(meta["id"], ".folded")
+        folded.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        )
+        temp_path = self._path(meta["id"], ".json.tmp")
+        temp_path.write_text(json.dumps(meta))
+        os.replace(temp_path, self._path(meta["id"], ".json"))
+        self._prune()
+
+    def _prune(self) -> None:
+        metas = sorted(self.root.glob("*.json"), key=lambda path: path.stat().st_mtime)
+        for path in metas[: max(len(metas) - self.max_profiles, 0)]:
+            path.unlink(missing_ok=True)
+            path.with_suffix(".folded").unlink(missing_ok=True)
+
+    def list(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Perfis mais recentes primeiro"""
+        if not self.root.exists():
+            return []
+        paths = sorted(
+            self.root.glob("*.json"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        profiles = []
+        for path in paths[:limit]:
+            try:
+                profiles.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+        return profiles
+
+    def folded_path(self, profile_id: str) -> Optional[Path]:
+        try:
+            path = self._path(profile_id, ".folded")
+        except ValueError:
+            return None
+        return path if path.exists() else None
+
+
+profile_store = ProfileStore()
@@ -0,0 +1,120 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models.product import Product
+from app.infrastructure.database.models.sale import Sale, SaleItem, SaleStatus
+
+# Produtos sem venda na janela
+DEFAULT_CLASS = "C"
+
+
+class AbcRepository:
+    """Repository da curva ABC (Pareto) do catálogo"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_classification(
+        self,
+        start: datetime,
+        end: datetime,
+        a_share: float,
+        b_share: float,
+    ) -> List[dict]:
+        """
+        Receita, margem e classes ABC de cada produto vendido na janela
+
+        Uma consulta: agregação por produto + somas acumuladas via window
+        functions. A classe usa a participação acumulada *antes* do produto,
+        então o item que cruza o limite ainda entra na classe superior.
+        """
+        contributions = (
+            select(
+                SaleItem.product_id.label("product_id"),
+                func.sum(SaleItem.final_total_price).label("revenue"),
+                func.sum(
+                    SaleItem.final_total_price
+                    - SaleItem.quantity * func.coalesce(Product.cost_price, 0)
+                ).label("margin"),
+            )
+            .join(Sale, Sale.id == SaleItem.sale_id)
+            .join(Product, Product.id == SaleItem.product_id)
+            .where(
+                Sale.status == SaleStatus.COMPLETED,
+                Sale.created_at >= start,
+                Sale.created_at < end,
+            )
+            .group_by(SaleItem.product_id)
+            .subquery()
+        )
+        revenue = contributions.c.revenue
+        # Margem negativa não contribui para a curva
+        margin = case((contributions.c.margin > 0, contributions.c.margin), else_=0)
+
+        def classify(value, total):
+            previous = func.coalesce(
+                func.sum(value).over(
+                    order_by=(value.desc(), contributions.c.product_id),
+                    rows=(None, -1),
+                ),
+                0,
+            )
+            share = previous / func.nullif(total, 0)
+            return case(
+                (share.is_(None), DEFAULT_CLASS),
+                (share < a_share, "A"),
+                (share < b_share, "B"),
+                else_="C",
+            )
+
+        total_revenue = func.sum(revenue).over()
+        total_margin = func.sum(margin).over()
+        rows = self.db.execute(
+            select(
+                contributions.c.product_id,
+                Product.name,
+                revenue,
+                contributions.c.margin,
+                (revenue / func.nullif(total_revenue, 0)).label("revenue_share"),
+                classify(revenue, total_revenue).label("abc_class"),
+                classify(margin, total_margin).label("abc_margin_class"),
+            )
+            .join(Product, Product.id == contributions.c.product_id)
+            .order_by(revenue.desc(), contributions.c.product_id)
+        )
+        return [
+            {
+                "product_id": row[0],
+                "product_name": row[1],
+                "revenue": float(row[2] or 0),
+                "margin": float(row[3] or 0),
+                "revenue_share": float(row[4] or 0),
+                "abc_class": row[5],
+                "abc_margin_class": row[6],
+            }
+            for row in rows
+        ]
+
+    def get_current_classes(self) -> Dict[int, Tuple[Optional[str], Optional[str]]]:
+        """Classes gravadas atualmente nos produtos ativos"""
+        rows = self.db.execute(
+            select(Product.id, Product.abc_class, Product.abc_margin_class).where(
+                Product.is_active
+            )
+        )
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def update_classes(self, changes: List[dict]) -> int:
+        """UPDATE em lote por chave primária (apenas produtos que mudaram)"""
+        if not changes:
+            return 0
+        now = datetime.utcnow()
+        self.db.execute(
+            update(Product),
+            [{**change, "abc_updated_at": now} for change in changes],
+        )
+        self.db.commit()
+        return len(changes)
@@ -0,0 +1,155 @@
+from datetime import datetime
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session, aliased
+
+from app.infrastructure.database.models.affinity import ProductAffinity
+from app.infrastructure.database.models.product import Product
+from app.infrastructure.database.models.sale import Sale, SaleItem, SaleStatus
+
+
+class AffinityRepository:
+    """Repository de cestas de venda e afinidade entre produtos"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_item_basket_counts(
+        self, start: datetime, end: datetime
+    ) -> Tuple[int, Dict[int, int]]:
+        """Total de vendas concluídas e vendas que contêm cada produto"""
+        period = (
+            Sale.status == SaleStatus.COMPLETED,
+            Sale.created_at >= start,
+            Sale.created_at < end,
+        )
+        total = self.db.execute(select(func.count(Sale.id)).where(*period)).scalar()
+        rows = self.db.execute(
+            select(SaleItem.product_id, func.count(func.distinct(SaleItem.sale_id)))
+            .join(Sale, Sale.id == SaleItem.sale_id)
+            .where(*period)
+            .group_by(SaleItem.product_id)
+        )
+        return total or 0, dict(rows.all())
+
+    def iter_basket_items(
+        self, start: datetime, end: datetime, batch_size: int
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        (sale_id, product_id) das vendas concluídas do período, em lotes
+
+        Ordenado por venda; uma venda nunca é dividida entre dois lotes.
+        """
+        result = self.db.execute(
+            select(SaleItem.sale_id, SaleItem.product_id)
+            .join(Sale, Sale.id == SaleItem.sale_id)
+            .where(
+                Sale.status == SaleStatus.COMPLETED,
+                Sale.created_at >= start,
+                Sale.created_at < end,
+            )
+            .order_by(SaleItem.sale_id)
+            .execution_options(yield_per=batch_size)
+        )
+        carry_sales = np.empty(0, dtype=np.int64)
+        carry_products = np.empty(0, dtype=np.int64)
+        for rows in result.partitions():
+            sales = np.fromiter((row[0] for row in rows), np.int64, len(rows))
+            products = np.fromiter((row[1] for row in rows), np.int64, len(rows))
+            sales = np.concatenate([carry_sales, sales])
+            products = np.concatenate([carry_products, products])
+            # A última venda do lote pode continuar no próximo
+            tail = np.searchsorted(sales, sales[-1])
+            carry_sales, carry_products = sales[tail:], products[tail:]
+            if tail:
+                yield sales[:tail], products[:tail]
+        if len(carry_sales):
+            yield carry_sales, carry_products
+
+    def replace_affinities(self, rows: List[dict], batch_size: int = 5000) -> int:
+        """Substitui todas as afinidades (inserção em lote)"""
+        self.db.execute(delete(ProductAffinity))
+        for offset in range(0, len(rows), batch_size):
+            self.db.execute(insert(ProductAffinity), rows[offset : offset + batch_size])
+        self.db.commit()
+        return len(rows)
+
+    def get_related(
+        self, product_ids: Sequence[int], exclude_ids: Sequence[int], limit: int
+    ) -> List[dict]:
+        """Produtos ativos e com estoque mais associados aos informados"""
+        if not product_ids:
+            return []
+        confidence = func.max(ProductAffinity.confidence).label("confidence")
+        rows = self.db.execute(
+            select(
+                Product.id,
+                Product.name,
+                Product.barcode,
+                Product.price,
+                confidence,
+                func.max(ProductAffinity.lift),
+                func.max(ProductAffinity.pair_count),
+            )
+            .join(Product, Product.id == ProductAffinity.related_product_id)
+            .where(
+                ProductAffinity.product_id.in_(product_ids),
+                ProductAffinity.related_product_id.notin_(exclude_ids),
+                Product.is_active,
+                Product.stock_quantity > 0,
+            )
+            .group_by(Product.id, Product.name, Product.barcode, Product.price)
+            .order_by(confidence.desc(), Product.id)
+            .limit(limit)
+        )
+        return [
+            {
+                "product_id": row[0],
+                "product_name": row[1],
+                "barcode": row[2],
+                "price": float(row[3] or 0),
+                "confidence": round(float(row[4]), 4),
+                "lift": round(float(row[5]), 4),
+                "pair_count": row[6],
+            }
+            for row in rows
+        ]
+
+    def get_top_pairs(self, min_lift: float, limit: int) -> List[dict]:
+        """Pares com maior afinidade (cada par uma vez), para promoções"""
+        related = aliased(Product)
+        rows = self.db.execute(
+            select(
+                ProductAffinity.product_id,
+                Product.name,
+                ProductAffinity.related_product_id,
+                related.name,
+                ProductAffinity.pair_count,
+                ProductAffinity.support,
+                ProductAffinity.confidence,
+                ProductAffinity.lift,
+            )
+            .join(Product, Product.id == ProductAffinity.product_id)
+            .join(related, related.id == ProductAffinity.related_product_id)
+            .where(
+                ProductAffinity.product_id < ProductAffinity.related_product_id,
+                ProductAffinity.lift >= min_lift,
+            )
+            .order_by(ProductAffinity.pair_count.desc(), ProductAffinity.lift.desc())
+            .limit(limit)
+        )
+        return [
+            {
+                "product_id": row[0],
+                "product_name": row[1],
+                "related_product_id": row[2],
+                "related_product_name": row[3],
+                "pair_count": row[4],
+                "support": row[5],
+                "confidence": row[6],
+                "lift": row[7],
+            }
+            for row in rows
+        ]
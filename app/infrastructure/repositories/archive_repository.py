@@ -0,0 +1,254 @@
+"""
+Repositório do arquivo mensal de vendas e movimentações
+
+Regra que as consultas usam: todo mês anterior a ``archive_cutoff()`` pode
+estar (total ou parcialmente) no arquivo; a partir dele, tudo está nas
+tabelas vivas. Como os meses são arquivados do mais antigo para o mais
+novo, toda venda arquivada é mais antiga que qualquer venda viva.
+"""
+
+from datetime import date, datetime, time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, or_, select, union_all
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.infrastructure.database.models.archive import (
+    ArchivedSale,
+    ArchivedSaleItem,
+    ArchivedStockMovement,
+)
+from app.infrastructure.database.models.sale import Sale, SaleItem
+from app.infrastructure.database.models.stock import StockMovement
+from app.infrastructure.tracing.tracer import traced_class
+
+# Tabela viva -> tabela de arquivo, na ordem de cópia
+ARCHIVE_TABLES = (
+    (Sale.__table__, ArchivedSale.__table__),
+    (SaleItem.__table__, ArchivedSaleItem.__table__),
+    (StockMovement.__table__, ArchivedStockMovement.__table__),
+)
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(value: date, months: int) -> date:
+    """Primeiro dia do mês ``months`` meses depois (ou antes) de ``value``"""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def archive_cutoff(today: Optional[date] = None) -> date:
+    """Primeiro dia do mês mais antigo que permanece nas tabelas vivas"""
+    return add_months(today or datetime.utcnow().date(), -settings.ARCHIVE_AFTER_MONTHS)
+
+
+def needs_archive(start: Optional[date]) -> bool:
+    """Período que começa antes do corte (ou sem início) pode ter dados arquivados"""
+    if start is None:
+        return True
+    if isinstance(start, datetime):
+        start = start.date()
+    return start < archive_cutoff()
+
+
+def _union(live, archive, name: str):
+    columns = [column.name for column in live.columns]
+    return union_all(
+        select(*(live.c[column] for column in columns)),
+        select(*(archive.c[column] for column in columns)),
+    ).subquery(name)
+
+
+def sale_sources(start: Optional[date]) -> Tuple[type, type]:
+    """
+    (Sale, SaleItem) para agregações a partir de ``start``
+
+    Dentro do período vivo devolve os próprios modelos; antes do corte,
+    aliases sobre ``UNION ALL`` das tabelas vivas e arquivadas (só colunas,
+    sem relacionamentos: as junções precisam ser explícitas).
+    """
+    if not needs_archive(start):
+        return Sale, SaleItem
+    return (
+        aliased(Sale, _union(Sale.__table__, ArchivedSale.__table__, "sales_all")),
+        aliased(
+            SaleItem,
+            _union(SaleItem.__table__, ArchivedSaleItem.__table__, "sale_items_all"),
+        ),
+    )
+
+
+@traced_class
+class ArchiveRepository:
+    """Move meses fechados entre as tabelas vivas e o arquivo"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def _bounds(month: date) -> Tuple[datetime, datetime]:
+        start = month_start(month)
+        return (
+            datetime.combine(start, time.min),
+            datetime.combine(add_months(start, 1), time.min),
+        )
+
+    def get_oldest_live_month(self) -> Optional[date]:
+        """Mês mais antigo com vendas ou movimentações nas tabelas vivas"""
+        oldest = [
+            self.db.execute(select(func.min(model.created_at))).scalar()
+            for model in (Sale, StockMovement)
+        ]
+        oldest = [_as_datetime(value) for value in oldest if value is not None]
+        return month_start(min(oldest).date()) if oldest else None
+
+    def get_archived_months(self) -> List[Dict]:
+        """Vendas e movimentações arquivadas por mês (contagem por intervalo)"""
+        bounds = [
+            self.db.execute(
+                select(func.min(model.created_at), func.max(model.created_at))
+            ).one()
+            for model in (ArchivedSale, ArchivedStockMovement)
+        ]
+        values = [_as_datetime(value) for row in bounds for value in row if value]
+        if not values:
+            return []
+        months = []
+        month, last = month_start(min(values).date()), month_start(max(values).date())
+        while month <= last:
+            start, end = self._bounds(month)
+            counts = {
+                key: self.db.execute(
+                    select(func.count(model.id)).where(
+                        model.created_at >= start, model.created_at < end
+                    )
+                ).scalar()
+                for model, key in (
+                    (ArchivedSale, "sales"),
+                    (ArchivedStockMovement, "movements"),
+                )
+            }
+            if any(counts.values()):
+                months.append({"month": month.strftime("%Y-%m"), **counts})
+            month = add_months(month, 1)
+        return months
+
+    def count_month(self, month: date) -> Dict[str, int]:
+        """Linhas vivas que ``archive_month`` moveria"""
+        start, end = self._bounds(month)
+        sale_ids = select(Sale.id).where(
+            Sale.created_at >= start, Sale.created_at < end
+        )
+        return {
+            "sales": self.db.execute(
+                select(func.count()).select_from(sale_ids.subquery())
+            ).scalar(),
+            "sale_items": self.db.execute(
+                select(func.count(SaleItem.id)).where(SaleItem.sale_id.in_(sale_ids))
+            ).scalar(),
+            "stock_movements": self.db.execute(
+                select(func.count(StockMovement.id)).where(
+                    self._movements_filter(StockMovement, sale_ids, start, end)
+                )
+            ).scalar(),
+        }
+
+    @staticmethod
+    def _movements_filter(model, sale_ids, start: datetime, end: datetime):
+        # Movimentações de uma venda acompanham a venda (chave estrangeira)
+        return or_(
+            (model.created_at >= start) & (model.created_at < end),
+            model.sale_id.in_(sale_ids),
+        )
+
+    def _move(self, source, target, condition) -> int:
+        columns = [column.name for column in source.columns]
+        self.db.execute(
+            insert(target).from_select(
+                columns,
+                select(*(source.c[column] for column in columns)).where(condition),
+            )
+        )
+        return self.db.execute(delete(source).where(condition)).rowcount
+
+    def archive_month(self, month: date) -> Dict[str, int]:
+        """Move as vendas, itens e movimentações do mês em uma transação"""
+        start, end = self._bounds(month)
+        sales, items, movements = (live for live, _ in ARCHIVE_TABLES)
+        sale_ids = select(sales.c.id).where(
+            sales.c.created_at >= start, sales.c.created_at < end
+        )
+        try:
+            # Filhos antes dos pais: as chaves estrangeiras apontam para sales
+            moved = {
+                "stock_movements": self._move(
+                    movements,
+                    ArchivedStockMovement.__table__,
+                    self._movements_filter(movements.c, sale_ids, start, end),
+                ),
+                "sale_items": self._move(
+                    items, ArchivedSaleItem.__table__, items.c.sale_id.in_(sale_ids)
+                ),
+                "sales": self._move(
+                    sales,
+                    ArchivedSale.__table__,
+                    (sales.c.created_at >= start) & (sales.c.created_at < end),
+                ),
+            }
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return moved
+
+    def restore_month(self, month: date) -> Dict[str, int]:
+        """Devolve um mês arquivado às tabelas vivas (pais antes dos filhos)"""
+        start, end = self._bounds(month)
+        sales, items, movements = (archive for _, archive in ARCHIVE_TABLES)
+        sale_ids = select(sales.c.id).where(
+            sales.c.created_at >= start, sales.c.created_at < end
+        )
+        try:
+            restored = {
+                "sales": self._move(
+                    sales,
+                    Sale.__table__,
+                    (sales.c.created_at >= start) & (sales.c.created_at < end),
+                ),
+            }
+            # As vendas já saíram do arquivo: os filtros usam as tabelas vivas
+            live_ids = select(Sale.id).where(
+                Sale.created_at >= start, Sale.created_at < end
+            )
+            restored["sale_items"] = self._move(
+                items, SaleItem.__table__, items.c.sale_id.in_(live_ids)
+            )
+            # Movimentação de venda que continua arquivada fica no arquivo
+            restored["stock_movements"] = self._move(
+                movements,
+                StockMovement.__table__,
+                self._movements_filter(movements.c, live_ids, start, end)
+                & or_(
+                    movements.c.sale_id.is_(None),
+                    movements.c.sale_id.in_(select(Sale.id)),
+                ),
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return restored
+
+    def get_archived_sale(self, sale_id: int) -> Optional[ArchivedSale]:
+        return self.db.get(ArchivedSale, sale_id)
+
+
+def _as_datetime(value) -> datetime:
+    # SQLite devolve o texto de colunas com fuso (server_default)
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
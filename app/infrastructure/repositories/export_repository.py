@@ -0,0 +1,257 @@
+from datetime import date, datetime, time, timedelta
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import case, select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models.product import Category, Product
+from app.infrastructure.database.models.sale import (
+    PaymentMethod,
+    Sale,
+    SaleItem,
+    SaleStatus,
+)
+from app.infrastructure.database.models.stock import (
+    MovementType,
+    StockMovement,
+    Supplier,
+)
+from app.infrastructure.database.models.user import User
+
+ExportRows = Tuple[List[str], Iterator[Sequence]]
+
+
+class ExportRepository:
+    """Repository de leitura em fluxo (cursor no servidor) para exportações"""
+
+    def __init__(self, db: Session, batch_size: int = 2000):
+        self.db = db
+        self.batch_size = batch_size
+
+    def _stream(self, statement) -> Iterator[Sequence]:
+        """Executa a consulta buscando em lotes de batch_size linhas"""
+        result = self.db.execute(statement.execution_options(yield_per=self.batch_size))
+        try:
+            for row in result:
+                yield tuple(row)
+        finally:
+            result.close()
+
+    @staticmethod
+    def _date_range(column, start_date: Optional[date], end_date: Optional[date]):
+        """Predicados de intervalo (usam índice, ao contrário de func.date)"""
+        conditions = []
+        if start_date:
+            conditions.append(column >= datetime.combine(start_date, time.min))
+        if end_date:
+            conditions.append(
+                column < datetime.combine(end_date + timedelta(days=1), time.min)
+            )
+        return conditions
+
+    def stream_sales(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        status: Optional[SaleStatus] = None,
+        payment_method: Optional[PaymentMethod] = None,
+        user_id: Optional[int] = None,
+    ) -> ExportRows:
+        """Vendas (cabeçalho)"""
+        columns = [
+            "venda_id",
+            "data",
+            "operador",
+            "cliente_id",
+            "pagamento",
+            "status",
+            "subtotal",
+            "desconto",
+            "desconto_atacado",
+            "total",
+        ]
+        statement = (
+            select(
+                Sale.id,
+                Sale.created_at,
+                User.username,
+                Sale.customer_id,
+                Sale.payment_method,
+                Sale.status,
+                Sale.subtotal_amount,
+                Sale.discount_amount,
+                Sale.bulk_discount_amount,
+                Sale.final_amount,
+            )
+            .outerjoin(User, User.id == Sale.user_id)
+            .where(*self._date_range(Sale.created_at, start_date, end_date))
+            .order_by(Sale.id)
+        )
+        if status:
+            statement = statement.where(Sale.status == status)
+        if payment_method:
+            statement = statement.where(Sale.payment_method == payment_method)
+        if user_id:
+            statement = statement.where(Sale.user_id == user_id)
+        return columns, self._stream(statement)
+
+    def stream_sale_items(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        status: Optional[SaleStatus] = None,
+        product_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+    ) -> ExportRows:
+        """Itens de venda com produto e categoria"""
+        columns = [
+            "item_id",
+            "venda_id",
+            "data",
+            "status",
+            "produto_id",
+            "codigo_barras",
+            "produto",
+            "categoria",
+            "quantidade",
+            "preco_unitario",
+            "total_bruto",
+            "desconto",
+            "desconto_atacado",
+            "total",
+        ]
+        statement = (
+            select(
+                SaleItem.id,
+                SaleItem.sale_id,
+                Sale.created_at,
+                Sale.status,
+                SaleItem.product_id,
+                Product.barcode,
+                Product.name,
+                Category.name,
+                SaleItem.quantity,
+                SaleItem.unit_price,
+                SaleItem.original_total_price,
+                SaleItem.discount_applied,
+                SaleItem.bulk_discount_applied,
+                SaleItem.final_total_price,
+            )
+            .join(Sale, Sale.id == SaleItem.sale_id)
+            .outerjoin(Product, Product.id == SaleItem.product_id)
+            .outerjoin(Category, Category.id == Product.category_id)
+            .where(*self._date_range(Sale.created_at, start_date, end_date))
+            .order_by(SaleItem.id)
+        )
+        if status:
+            statement = statement.where(Sale.status == status)
+        if product_id:
+            statement = statement.where(SaleItem.product_id == product_id)
+        if category_id:
+            statement = statement.where(Product.category_id == category_id)
+        return columns, self._stream(statement)
+
+    def stream_stock_movements(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        product_id: Optional[int] = None,
+        movement_type: Optional[MovementType] = None,
+    ) -> ExportRows:
+        """Movimentações de estoque"""
+        columns = [
+            "movimentacao_id",
+            "data",
+            "produto_id",
+            "produto",
+            "tipo",
+            "quantidade",
+            "quantidade_anterior",
+            "quantidade_nova",
+            "custo_unitario",
+            "custo_total",
+            "motivo",
+            "usuario",
+            "venda_id",
+            "fornecedor",
+        ]
+        statement = (
+            select(
+                StockMovement.id,
+                StockMovement.created_at,
+                StockMovement.product_id,
+                Product.name,
+                StockMovement.movement_type,
+                StockMovement.quantity,
+                StockMovement.previous_quantity,
+                StockMovement.new_quantity,
+                StockMovement.unit_cost,
+                StockMovement.total_cost,
+                StockMovement.reason,
+                User.username,
+                StockMovement.sale_id,
+                Supplier.name,
+            )
+            .outerjoin(Product, Product.id == StockMovement.product_id)
+            .outerjoin(User, User.id == StockMovement.user_id)
+            .outerjoin(Supplier, Supplier.id == StockMovement.supplier_id)
+            .where(*self._date_range(StockMovement.created_at, start_date, end_date))
+            .order_by(StockMovement.id)
+        )
+        if product_id:
+            statement = statement.where(StockMovement.product_id == product_id)
+        if movement_type:
+            statement = statement.where(StockMovement.movement_type == movement_type)
+        return columns, self._stream(statement)
+
+    def stream_stock_report(self, category_id: Optional[int] = None) -> ExportRows:
+        """Posição atual de estoque dos produtos ativos"""
+        columns = [
+            "produto_id",
+            "produto",
+            "codigo_barras",
+            "categoria",
+            "fornecedor",
+            "estoque_atual",
+            "estoque_minimo",
+            "estoque_maximo",
+            "preco_custo",
+            "preco_venda",
+            "valor_estoque",
+            "localizacao",
+            "status",
+        ]
+        stock_status = case(
+            (Product.stock_quantity <= 0, "out_of_stock"),
+            (Product.stock_quantity <= Product.min_stock_level, "low_stock"),
+            (
+                Product.max_stock.isnot(None)
+                & (Product.stock_quantity >= Product.max_stock),
+                "overstock",
+            ),
+            else_="ok",
+        )
+        statement = (
+            select(
+                Product.id,
+                Product.name,
+                Product.barcode,
+                Category.name,
+                Supplier.name,
+                Product.stock_quantity,
+                Product.min_stock_level,
+                Product.max_stock,
+                Product.cost_price,
+                Product.price,
+                Product.stock_quantity * Product.cost_price,
+                Product.location,
+                stock_status,
+            )
+            .outerjoin(Category, Category.id == Product.category_id)
+            .outerjoin(Supplier, Supplier.id == Product.supplier_id)
+            .where(Product.is_active)
+            .order_by(Product.id)
+        )
+        if category_id:
+            statement = statement.where(Product.category_id == category_id)
+        return columns, self._stream(statement)
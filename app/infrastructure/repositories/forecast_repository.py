@@ -0,0 +1,169 @@
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models.forecast import ProductForecast
+from app.infrastructure.database.models.product import Product
+from app.infrastructure.database.models.sale import Sale, SaleItem, SaleStatus
+
+
+class ForecastRepository:
+    """Repository de histórico diário de demanda e previsões"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_product_id_bounds(self, shards: int) -> List[Tuple[int, int]]:
+        """Divide os produtos ativos em faixas contíguas de id com tamanhos parecidos"""
+        ids = np.fromiter(
+            self.db.execute(
+                select(Product.id).where(Product.is_active).order_by(Product.id)
+            ).scalars(),
+            dtype=np.int64,
+        )
+        if len(ids) == 0:
+            return []
+        chunks = np.array_split(ids, min(shards, len(ids)))
+        return [(int(chunk[0]), int(chunk[-1])) for chunk in chunks if len(chunk)]
+
+    def get_daily_demand(
+        self, first_id: int, last_id: int, start_date: date, end_date: date
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Matriz (produtos x dias) de quantidade vendida para a faixa de ids
+
+        Dias sem venda ficam com zero; produtos ativos sem venda no período
+        também entram (linha zerada).
+        """
+        product_ids = np.fromiter(
+            self.db.execute(
+                select(Product.id)
+                .where(Product.is_active, Product.id.between(first_id, last_id))
+                .order_by(Product.id)
+            ).scalars(),
+            dtype=np.int64,
+        )
+        days = (end_date - start_date).days + 1
+        matrix = np.zeros((len(product_ids), days))
+        if len(product_ids) == 0:
+            return product_ids, matrix
+
+        sale_day = func.date(Sale.created_at)
+        rows = self.db.execute(
+            select(SaleItem.product_id, sale_day, func.sum(SaleItem.quantity))
+            .join(Sale, Sale.id == SaleItem.sale_id)
+            .where(
+                Sale.status == SaleStatus.COMPLETED,
+                Sale.created_at >= datetime.combine(start_date, time.min),
+                Sale.created_at
+                < datetime.combine(end_date + timedelta(days=1), time.min),
+                SaleItem.product_id.between(first_id, last_id),
+            )
+            .group_by(SaleItem.product_id, sale_day)
+        ).all()
+        if not rows:
+            return product_ids, matrix
+
+        item_products = np.fromiter((row[0] for row in rows), np.int64, len(rows))
+        # func.date devolve str no SQLite e date no PostgreSQL
+        item_days = np.array([str(row[1]) for row in rows], dtype="datetime64[D]")
+        quantities = np.fromiter((row[2] or 0 for row in rows), np.float64, len(rows))
+
+        positions = np.searchsorted(product_ids, item_products)
+        positions = np.minimum(positions, len(product_ids) - 1)
+        known = product_ids[positions] == item_products
+        offsets = (item_days - np.datetime64(start_date, "D")).astype(np.int64)
+        np.add.at(matrix, (positions[known], offsets[known]), quantities[known])
+        return product_ids, matrix
+
+    def replace_forecasts(
+        self,
+        product_ids: np.ndarray,
+        start_date: date,
+        mean: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        model: str,
+        batch_size: int = 5000,
+    ) -> int:
+        """Substitui as previsões dos produtos informados (inserção em lote)"""
+        generated_at = datetime.now()
+        horizon = mean.shape[1]
+        dates = [start_date + timedelta(days=offset) for offset in range(horizon)]
+
+        ids = product_ids.tolist()
+        if ids:
+            # Faixa inteira: remove também previsões de produtos desativados
+            self.db.execute(
+                delete(ProductForecast).where(
+                    ProductForecast.product_id.between(min(ids), max(ids))
+                )
+            )
+
+        rows = []
+        written = 0
+        means, lowers, uppers = mean.tolist(), lower.tolist(), upper.tolist()
+        for index, product_id in enumerate(ids):
+            for step, forecast_date in enumerate(dates):
+                rows.append(
+                    {
+                        "product_id": product_id,
+                        "forecast_date": forecast_date,
+                        "predicted_quantity": round(means[index][step], 4),
+                        "lower_bound": round(lowers[index][step], 4),
+                        "upper_bound": round(uppers[index][step], 4),
+                        "model": model,
+                        "generated_at": generated_at,
+                        "created_at": generated_at,
+                        "updated_at": generated_at,
+                    }
+                )
+            if len(rows) >= batch_size:
+                self.db.execute(insert(ProductForecast), rows)
+                written += len(rows)
+                rows = []
+        if rows:
+            self.db.execute(insert(ProductForecast), rows)
+            written += len(rows)
+        self.db.commit()
+        return written
+
+    def get_product_forecast(self, product_id: int) -> List[ProductForecast]:
+        """Previsões de um produto a partir de hoje"""
+        return (
+            self.db.query(ProductForecast)
+            .filter(
+                ProductForecast.product_id == product_id,
+                ProductForecast.forecast_date >= date.today(),
+            )
+            .order_by(ProductForecast.forecast_date)
+            .all()
+        )
+
+    def get_expected_daily_demand(
+        self, product_ids: Sequence[int], days: int = 7
+    ) -> Dict[int, float]:
+        """Demanda média prevista para os próximos `days` dias"""
+        if len(product_ids) == 0:
+            return {}
+        today = date.today()
+        statement = (
+            select(
+                ProductForecast.product_id,
+                func.avg(ProductForecast.predicted_quantity),
+            )
+            .where(
+                ProductForecast.forecast_date >= today,
+                ProductForecast.forecast_date < today + timedelta(days=days),
+            )
+            .group_by(ProductForecast.product_id)
+        )
+        if len(product_ids) <= 1000:
+            statement = statement.where(ProductForecast.product_id.in_(product_ids))
+        return {
+            product_id: float(value or 0)
+            for product_id, value in self.db.execute(statement)
+        }
@@ -0,0 +1,71 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models.product import Category, Product
+from app.infrastructure.database.models.sale import Sale
+from app.infrastructure.database.models.user import User
+from app.infrastructure.repositories.velocity_repository import VelocityRepository
+
+
+class HealthRepository:
+    """Consultas das verificações de saúde"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def ping(engine: Engine) -> None:
+        """SELECT 1 numa conexão do pool (propaga o erro)"""
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    def get_counts(self) -> Dict[str, int]:
+        """Todas as contagens numa única consulta"""
+        row = self.db.execute(
+            select(
+                select(func.count(User.id)).scalar_subquery(),
+                select(func.count(Product.id))
+                .where(Product.is_active)
+                .scalar_subquery(),
+                select(func.count(Category.id))
+                .where(Category.is_active)
+                .scalar_subquery(),
+                select(func.count(Sale.id)).scalar_subquery(),
+            )
+        ).one()
+        return {
+            "users": row[0],
+            "products": row[1],
+            "categories": row[2],
+            "sales": row[3],
+        }
+
+    def get_low_stock_details(self) -> List[Dict[str, Any]]:
+        """Produtos ativos no estoque mínimo ou abaixo (só as colunas usadas)"""
+        rows = self.db.execute(
+            select(
+                Product.id,
+                Product.name,
+                Product.stock_quantity,
+                Product.min_stock_level,
+            ).where(
+                Product.is_active, Product.stock_quantity <= Product.min_stock_level
+            )
+        ).all()
+        days_to_stockout = VelocityRepository(self.db).get_days_to_stockout_map(
+            [row[0] for row in rows], [row[2] for row in rows]
+        )
+        return [
+            {
+                "name": row[1],
+                "current_stock": float(row[2]),
+                "min_level": float(row[3]),
+                "difference": float(row[3] - row[2]),
+                "urgency": "critical" if row[2] <= 0 else "warning",
+                "days_to_stockout": days_to_stockout[row[0]],
+            }
+            for row in rows
+        ]
@@ -0,0 +1,115 @@
+"""
+Paginação por cursor (keyset)
+
+O cursor é opaco para o cliente: base64 da chave de ordenação e do id do
+último item entregue. A próxima página filtra "depois desta chave" em vez
+de pular linhas com OFFSET, então a página 10.000 custa o mesmo que a
+primeira (desde que exista índice na coluna de ordenação).
+
+Datas entram no cursor como o texto gravado no banco e são comparadas como
+texto: no SQLite ``CURRENT_TIMESTAMP`` (sem microssegundos) e datas do
+Python (com) convivem na mesma coluna, e um ``datetime`` convertido de volta
+não seria igual ao valor gravado.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Iterable, List, Optional, Sequence
+
+from sqlalchemy import DateTime, String, and_, cast, or_, type_coerce
+from sqlalchemy.orm import Query
+
+
+class Page(list):
+    """Itens da página + cursor da próxima (``None`` na última)"""
+
+    def __init__(
+        self,
+        items: Iterable = (),
+        next_cursor: Optional[str] = None,
+        last_cursor: Optional[str] = None,
+    ):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+        # Cursor do último item, mesmo sem próxima página (para emendar fontes)
+        self.last_cursor = last_cursor
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    data = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Cursor inválido")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Cursor inválido")
+    return values
+
+
+def _key(column):
+    """Expressão comparada e gravada no cursor (datas como texto)"""
+    if isinstance(column.type, DateTime):
+        return type_coerce(column, String)
+    return column
+
+
+def _after(columns: Sequence, values: Sequence, descending: bool):
+    """Linhas depois de ``values`` na ordem (c0, c1)
+
+    ``c0 <= v0 AND (c0 < v0 OR c1 < v1)``: o primeiro termo é um intervalo
+    simples na coluna indexada; o resto só desempata.
+    """
+    keys = [_key(column) for column in columns]
+    if descending:
+        before = [key < value for key, value in zip(keys, values)]
+        bound = keys[0] <= values[0]
+    else:
+        before = [key > value for key, value in zip(keys, values)]
+        bound = keys[0] >= values[0]
+    if len(keys) == 1:
+        return before[0]
+    return and_(bound, or_(*before))
+
+
+def keyset_page(
+    query: Query,
+    columns: Sequence,
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = True,
+    skip: int = 0,
+) -> Page:
+    """
+    Página de ``query`` ordenada por ``columns`` (chave, ..., id)
+
+    Sem cursor, ``skip`` ainda funciona (OFFSET) para clientes antigos.
+    Busca ``limit + 1`` linhas para saber se há próxima página.
+    """
+    if cursor:
+        query = query.filter(
+            _after(columns, decode_cursor(cursor, len(columns)), descending)
+        )
+    order = [column.desc() if descending else column.asc() for column in columns]
+    labels = [
+        (cast(column, String) if isinstance(column.type, DateTime) else column).label(
+            f"cursor_{index}"
+        )
+        for index, column in enumerate(columns)
+    ]
+    query = query.add_columns(*labels).order_by(*order)
+    if skip and not cursor:
+        query = query.offset(skip)
+    rows = query.limit(limit + 1).all()
+    items = [row[0] for row in rows[:limit]]
+    last_cursor = encode_cursor(rows[len(items) - 1][1:]) if items else None
+    return Page(
+        items,
+        next_cursor=last_cursor if len(rows) > limit else None,
+        last_cursor=last_cursor,
+    )
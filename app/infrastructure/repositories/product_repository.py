@@ -9,6 +9,8 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from app.infrastructure.database.models.product import Category, Product
+from app.infrastructure.repositories.pagination import Page, keyset_page
+from app.infrastructure.tracing.tracer import traced_class
 from app.presentation.schemas.product import (
     ProductCreate,
     ProductUpdate,
@@ -16,6 +18,7 @@ from app.presentation.schemas.product import (
 )
 
 
+@traced_class
 class ProductRepository:
     """Repositório para operações com produtos"""
 
@@ -48,8 +51,9 @@ class ProductRepository:
         low_stock_only: bool = False,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[Product]:
-        """Busca produtos com filtros"""
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Busca produtos com filtros (ordem de id; ``cursor`` ou ``skip``)"""
         db_query = self.db.query(Product).options(joinedload(Product.category))
 
         # Filtro por status
@@ -75,18 +79,26 @@ class ProductRepository:
             )
             db_query = db_query.filter(search_filter)
 
-        return db_query.offset(skip).limit(limit).all()
+        return keyset_page(
+            db_query, (Product.id,), cursor, limit, descending=False, skip=skip
+        )
 
     def get_all(
-        self, skip: int = 0, limit: int = 100, active_only: bool = True
-    ) -> List[Product]:
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True,
+        cursor: Optional[str] = None,
+    ) -> Page:
         """Lista todos os produtos"""
         query = self.db.query(Product).options(joinedload(Product.category))
 
         if active_only:
             query = query.filter(Product.is_active)
 
-        return query.offset(skip).limit(limit).all()
+        return keyset_page(
+            query, (Product.id,), cursor, limit, descending=False, skip=skip
+        )
 
     def create(self, product_data: ProductCreate) -> Product:
         """Cria novo produto"""
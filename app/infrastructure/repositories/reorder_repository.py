@@ -0,0 +1,140 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models.product import Product
+from app.infrastructure.database.models.stock import PurchaseOrder, PurchaseOrderItem
+
+# Pedidos que ainda vão abastecer o estoque
+OPEN_ORDER_STATUSES = ("draft", "pending", "confirmed")
+
+
+class ReorderRepository:
+    """Repository do motor de reposição (leitura em colunas e escrita em lote)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_catalog_position(self) -> Dict[str, np.ndarray]:
+        """
+        Posição de estoque de todos os produtos ativos com fornecedor
+
+        Uma única consulta: produto + quantidade em pedidos abertos
+        (pedida - recebida), devolvida em colunas numpy.
+        """
+        open_orders = (
+            select(
+                PurchaseOrderItem.product_id.label("product_id"),
+                func.sum(
+                    PurchaseOrderItem.quantity_ordered
+                    - func.coalesce(PurchaseOrderItem.quantity_received, 0)
+                ).label("open_quantity"),
+            )
+            .join(
+                PurchaseOrder, PurchaseOrder.id == PurchaseOrderItem.purchase_order_id
+            )
+            .where(PurchaseOrder.status.in_(OPEN_ORDER_STATUSES))
+            .group_by(PurchaseOrderItem.product_id)
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(
+                Product.id,
+                Product.supplier_id,
+                Product.stock_quantity,
+                Product.min_stock_level,
+                func.coalesce(Product.reorder_point, -1),
+                func.coalesce(Product.max_stock, -1),
+                Product.cost_price,
+                func.coalesce(open_orders.c.open_quantity, 0),
+            )
+            .outerjoin(open_orders, open_orders.c.product_id == Product.id)
+            .where(Product.is_active, Product.supplier_id.isnot(None))
+            .order_by(Product.id)
+        ).all()
+
+        columns = list(zip(*rows)) if rows else [()] * 8
+        return {
+            "product_id": np.array(columns[0], dtype=np.int64),
+            "supplier_id": np.array(columns[1], dtype=np.int64),
+            "stock": np.array(columns[2], dtype=np.float64),
+            "min_stock": np.array(columns[3], dtype=np.float64),
+            # -1 = não configurado
+            "reorder_point": np.array(columns[4], dtype=np.float64),
+            "max_stock": np.array(columns[5], dtype=np.float64),
+            "cost_price": np.array(columns[6], dtype=np.float64),
+            "open_quantity": np.array(columns[7], dtype=np.float64),
+        }
+
+    def get_product_names(self, product_ids: List[int]) -> Dict[int, str]:
+        if not product_ids:
+            return {}
+        rows = self.db.execute(
+            select(Product.id, Product.name).where(Product.id.in_(product_ids))
+        )
+        return dict(rows.all())
+
+    def create_draft_orders(
+        self, orders: Dict[int, List[dict]], user_id: int
+    ) -> List[dict]:
+        """Um pedido 'draft' por fornecedor; itens inseridos em lote"""
+        # Sufixo aleatório: duas gerações no mesmo segundo (clique duplo, job
+        # agendado junto com uma chamada manual) não colidem no número único
+        stamp = f"{datetime.now():%Y%m%d%H%M%S}-{uuid4().hex[:6].upper()}"
+        purchase_orders = []
+        for supplier_id, items in orders.items():
+            total = sum(
+                Decimal(str(item["unit_cost"])) * item["quantity_ordered"]
+                for item in items
+            )
+            purchase_orders.append(
+                PurchaseOrder(
+                    supplier_id=supplier_id,
+                    order_number=f"AUTO-{stamp}-{supplier_id}",
+                    status="draft",
+                    total_amount=total,
+                    notes="Gerado automaticamente pelo motor de reposição",
+                    user_id=user_id,
+                )
+            )
+        self.db.add_all(purchase_orders)
+        self.db.flush()  # Para obter os IDs
+
+        now = datetime.now()
+        item_rows = []
+        for order in purchase_orders:
+            for item in orders[order.supplier_id]:
+                unit_cost = Decimal(str(item["unit_cost"]))
+                item_rows.append(
+                    {
+                        "purchase_order_id": order.id,
+                        "product_id": item["product_id"],
+                        "quantity_ordered": item["quantity_ordered"],
+                        "quantity_received": 0,
+                        "unit_cost": unit_cost,
+                        "total_cost": unit_cost * item["quantity_ordered"],
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+        if item_rows:
+            self.db.execute(insert(PurchaseOrderItem), item_rows)
+
+        # Resumo antes do commit (evita recarregar cada pedido expirado)
+        created = [
+            {
+                "id": order.id,
+                "order_number": order.order_number,
+                "supplier_id": order.supplier_id,
+                "items": len(orders[order.supplier_id]),
+                "total_amount": float(order.total_amount),
+            }
+            for order in purchase_orders
+        ]
+        self.db.commit()
+        return created
@@ -1,49 +1,53 @@
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import List, Optional, Tuple
 
-from sqlalchemy import and_, desc, func, text
+from sqlalchemy import and_, case, desc, func, text
 from sqlalchemy.orm import Session
 
 from app.infrastructure.database.models.product import Category, Product
-from app.infrastructure.database.models.sale import Sale, SaleItem
 from app.infrastructure.database.models.user import User
+from app.infrastructure.repositories.archive_repository import sale_sources
+from app.infrastructure.repositories.velocity_repository import VelocityRepository
+from app.infrastructure.tracing.tracer import traced_class
 
 
+@traced_class
 class ReportRepository:
     """Repository para relatórios e dashboard"""
 
     def __init__(self, db: Session):
         self.db = db
 
+    @staticmethod
+    def _day_bounds(target_date: date) -> Tuple[datetime, datetime]:
+        """Intervalo [início, fim) do dia (usa índice, ao contrário de func.date)"""
+        start = datetime.combine(target_date, time.min)
+        return start, start + timedelta(days=1)
+
     def get_today_kpis(self, target_date: date = None) -> dict:
         """KPIs do dia atual"""
         if not target_date:
             target_date = date.today()
+        start, end = self._day_bounds(target_date)
+        sale, item = sale_sources(target_date)
+        in_day = (
+            sale.created_at >= start,
+            sale.created_at < end,
+            sale.status == "completed",
+        )
         # Vendas de hoje
         today_sales = (
-            self.db.query(func.sum(Sale.final_amount))
-            .filter(
-                func.date(Sale.created_at) == target_date, Sale.status == "completed"
-            )
-            .scalar()
-            or 0
+            self.db.query(func.sum(sale.final_amount)).filter(*in_day).scalar() or 0
         )
         # Transações de hoje
         today_transactions = (
-            self.db.query(func.count(Sale.id))
-            .filter(
-                func.date(Sale.created_at) == target_date, Sale.status == "completed"
-            )
-            .scalar()
-            or 0
+            self.db.query(func.count(sale.id)).filter(*in_day).scalar() or 0
         )
         # Produtos vendidos hoje
         products_sold = (
-            self.db.query(func.sum(SaleItem.quantity))
-            .join(Sale)
-            .filter(
-                func.date(Sale.created_at) == target_date, Sale.status == "completed"
-            )
+            self.db.query(func.sum(item.quantity))
+            .join(sale, item.sale_id == sale.id)
+            .filter(*in_day)
             .scalar()
             or 0
         )
@@ -69,24 +73,25 @@ class ReportRepository:
         # Período anterior
         start_previous = start_current - timedelta(days=days_back)
         end_previous = start_current
+        sale, _ = sale_sources(start_previous)
         # Vendas período atual
         current_sales = (
-            self.db.query(func.sum(Sale.final_amount))
+            self.db.query(func.sum(sale.final_amount))
             .filter(
-                Sale.created_at >= start_current,
-                Sale.created_at <= end_current,
-                Sale.status == "completed",
+                sale.created_at >= start_current,
+                sale.created_at <= end_current,
+                sale.status == "completed",
             )
             .scalar()
             or 0
         )
         # Vendas período anterior
         previous_sales = (
-            self.db.query(func.sum(Sale.final_amount))
+            self.db.query(func.sum(sale.final_amount))
             .filter(
-                Sale.created_at >= start_previous,
-                Sale.created_at < end_previous,
-                Sale.status == "completed",
+                sale.created_at >= start_previous,
+                sale.created_at < end_previous,
+                sale.status == "completed",
             )
             .scalar()
             or 0
@@ -108,22 +113,22 @@ class ReportRepository:
     def get_top_products(self, limit: int = 10, days_back: int = 30) -> List[dict]:
         """Produtos mais vendidos"""
         start_date = date.today() - timedelta(days=days_back)
+        sale, item = sale_sources(start_date)
         query = (
             self.db.query(
                 Product.id,
                 Product.name,
                 Category.name.label("category_name"),
-                func.sum(SaleItem.quantity).label("quantity_sold"),
-                func.sum(SaleItem.final_total_price).label("revenue"),
+                func.sum(item.quantity).label("quantity_sold"),
+                func.sum(item.final_total_price).label("revenue"),
                 func.sum(
-                    SaleItem.final_total_price
-                    - (SaleItem.quantity * Product.cost_price)
+                    item.final_total_price - (item.quantity * Product.cost_price)
                 ).label("profit"),
             )
-            .join(SaleItem, Product.id == SaleItem.product_id)
-            .join(Sale, SaleItem.sale_id == Sale.id)
+            .join(item, Product.id == item.product_id)
+            .join(sale, item.sale_id == sale.id)
             .join(Category, Product.category_id == Category.id)
-            .filter(Sale.created_at >= start_date, Sale.status == "completed")
+            .filter(sale.created_at >= start_date, sale.status == "completed")
             .group_by(Product.id, Product.name, Category.name)
             .order_by(desc("quantity_sold"))
             .limit(limit)
@@ -143,16 +148,18 @@ class ReportRepository:
     def get_daily_sales(self, days_back: int = 30) -> List[dict]:
         """Vendas diárias"""
         start_date = date.today() - timedelta(days=days_back)
+        sale, item = sale_sources(start_date)
         query = (
             self.db.query(
-                func.date(Sale.created_at).label("sale_date"),
-                func.sum(Sale.final_amount).label("total_sales"),
-                func.count(Sale.id).label("total_transactions"),
-                func.sum(func.coalesce(SaleItem.quantity, 0)).label("total_products"),
+                func.date(sale.created_at).label("sale_date"),
+                func.sum(sale.final_amount).label("total_sales"),
+                func.count(sale.id).label("total_transactions"),
+                func.sum(func.coalesce(item.quantity, 0)).label("total_products"),
             )
-            .outerjoin(SaleItem, Sale.id == SaleItem.sale_id)
-            .filter(Sale.created_at >= start_date, Sale.status == "completed")
-            .group_by(func.date(Sale.created_at))
+            .select_from(sale)
+            .outerjoin(item, sale.id == item.sale_id)
+            .filter(sale.created_at >= start_date, sale.status == "completed")
+            .group_by(func.date(sale.created_at))
             .order_by("sale_date")
         )
         results = []
@@ -182,17 +189,31 @@ class ReportRepository:
                 Category.name.label("category_name"),
                 Product.stock_quantity,
                 Product.min_stock_level,
+                Product.abc_class,
             )
             .join(Category, Product.category_id == Category.id)
             .filter(
                 Product.stock_quantity <= Product.min_stock_level,
                 Product.is_active == True,
             )
-            .order_by((Product.stock_quantity / Product.min_stock_level))
+            # Classe A primeiro, depois os mais próximos de zerar
+            .order_by(
+                case(
+                    (Product.abc_class == "A", 0),
+                    (Product.abc_class == "B", 1),
+                    (Product.abc_class == "C", 2),
+                    else_=3,
+                ),
+                (Product.stock_quantity / Product.min_stock_level),
+            )
             .limit(limit)
         )
+        rows = query.all()
+        days_to_stockout = VelocityRepository(self.db).get_days_to_stockout_map(
+            [row.id for row in rows], [row.stock_quantity for row in rows]
+        )
         results = []
-        for row in query.all():
+        for row in rows:
             # Calcular status
             ratio = (
                 row.stock_quantity / row.min_stock_level
@@ -213,7 +234,8 @@ class ReportRepository:
                     "current_stock": float(row.stock_quantity),
                     "min_stock": float(row.min_stock_level),
                     "stock_status": status,
-                    "days_to_stockout": None,  # Implementar cálculo baseado em vendas médias
+                    "days_to_stockout": days_to_stockout[row.id],
+                    "abc_class": row.abc_class,
                 }
             )
         return results
@@ -221,25 +243,23 @@ class ReportRepository:
     def get_category_performance(self, days_back: int = 30) -> List[dict]:
         """Performance por categoria"""
         start_date = date.today() - timedelta(days=days_back)
+        sale, item = sale_sources(start_date)
         query = (
             self.db.query(
                 Category.id,
                 Category.name,
-                func.sum(SaleItem.final_total_price).label("total_sales"),
-                func.sum(SaleItem.quantity).label("total_products"),
+                func.sum(item.final_total_price).label("total_sales"),
+                func.sum(item.quantity).label("total_products"),
                 func.avg(
-                    (
-                        SaleItem.final_total_price
-                        - (SaleItem.quantity * Product.cost_price)
-                    )
-                    / SaleItem.final_total_price
+                    (item.final_total_price - (item.quantity * Product.cost_price))
+                    / item.final_total_price
                     * 100
                 ).label("profit_margin"),
             )
             .join(Product, Category.id == Product.category_id)
-            .join(SaleItem, Product.id == SaleItem.product_id)
-            .join(Sale, SaleItem.sale_id == Sale.id)
-            .filter(Sale.created_at >= start_date, Sale.status == "completed")
+            .join(item, Product.id == item.product_id)
+            .join(sale, item.sale_id == sale.id)
+            .filter(sale.created_at >= start_date, sale.status == "completed")
             .group_by(Category.id, Category.name)
             .order_by(desc("total_sales"))
         )
@@ -259,16 +279,20 @@ class ReportRepository:
         """Análise por hora do dia"""
         if not target_date:
             target_date = date.today()
+        start, end = self._day_bounds(target_date)
+        sale, _ = sale_sources(target_date)
         query = (
             self.db.query(
-                func.extract("hour", Sale.created_at).label("hour"),
-                func.sum(Sale.final_amount).label("sales_amount"),
-                func.count(Sale.id).label("transactions_count"),
+                func.extract("hour", sale.created_at).label("hour"),
+                func.sum(sale.final_amount).label("sales_amount"),
+                func.count(sale.id).label("transactions_count"),
             )
             .filter(
-                func.date(Sale.created_at) == target_date, Sale.status == "completed"
+                sale.created_at >= start,
+                sale.created_at < end,
+                sale.status == "completed",
             )
-            .group_by(func.extract("hour", Sale.created_at))
+            .group_by(func.extract("hour", sale.created_at))
             .order_by("hour")
         )
         results = []
@@ -2,17 +2,22 @@
 Repositório de vendas
 """
 
-from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Optional, Union
 
-from sqlalchemy import and_, desc, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from app.infrastructure.database.models.archive import ArchivedSale, ArchivedSaleItem
 from app.infrastructure.database.models.product import Product
 from app.infrastructure.database.models.sale import Sale, SaleItem, SaleStatus
 from app.infrastructure.database.models.user import User
+from app.infrastructure.repositories.archive_repository import needs_archive
+from app.infrastructure.repositories.pagination import Page, keyset_page
+from app.infrastructure.tracing.tracer import traced_class
 
 
+@traced_class
 class SaleRepository:
     """Repositório para operações com vendas"""
 
@@ -33,8 +38,10 @@ class SaleRepository:
         self.db.refresh(db_sale)
         return db_sale
 
-    def get_by_id(self, sale_id: int) -> Optional[Sale]:
-        return (
+    def get_by_id(
+        self, sale_id: int, include_archive: bool = True
+    ) -> Optional[Union[Sale, ArchivedSale]]:
+        sale = (
             self.db.query(Sale)
             .options(
                 joinedload(Sale.items).joinedload(SaleItem.product),
@@ -44,6 +51,53 @@ class SaleRepository:
             .filter(Sale.id == sale_id)
             .first()
         )
+        if sale is None and include_archive:
+            # Vendas de meses arquivados: somente leitura
+            sale = (
+                self.db.query(ArchivedSale)
+                .options(
+                    joinedload(ArchivedSale.items).joinedload(ArchivedSaleItem.product),
+                    joinedload(ArchivedSale.user),
+                    joinedload(ArchivedSale.customer),
+                )
+                .filter(ArchivedSale.id == sale_id)
+                .first()
+            )
+        return sale
+
+    def _filtered(
+        self,
+        model,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        user_id: Optional[int],
+        status: Optional[str],
+    ):
+        query = self.db.query(model)
+        if start_date:
+            query = query.filter(
+                model.created_at >= datetime.combine(start_date, time.min)
+            )
+        if end_date:
+            query = query.filter(
+                model.created_at
+                < datetime.combine(end_date + timedelta(days=1), time.min)
+            )
+        if user_id:
+            query = query.filter(model.user_id == user_id)
+        if status:
+            query = query.filter(model.status == status)
+        return query
+
+    def _page(
+        self, model, filters: tuple, cursor: Optional[str], skip: int, limit: int
+    ) -> Page:
+        query = self._filtered(model, *filters).options(
+            joinedload(model.user), joinedload(model.items)
+        )
+        return keyset_page(
+            query, (model.created_at, model.id), cursor, limit, skip=skip
+        )
 
     def get_sales_by_filters(
         self,
@@ -53,22 +107,41 @@ class SaleRepository:
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[Sale]:
-        query = self.db.query(Sale).options(
-            joinedload(Sale.user), joinedload(Sale.items)
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Mais recentes primeiro; ``cursor`` (keyset) ou ``skip`` (legado)"""
+        filters = (start_date, end_date, user_id, status)
+        sales = self._page(Sale, filters, cursor, skip, limit)
+        if sales.next_cursor or not needs_archive(start_date):
+            return sales
+        # Toda venda arquivada é mais antiga que as vivas: o arquivo continua
+        # a página onde as tabelas vivas acabaram
+        archive_skip = 0
+        if skip and not cursor:
+            live_total = (
+                skip + len(sales) if sales else self._filtered(Sale, *filters).count()
+            )
+            archive_skip = max(skip - live_total, 0)
+        remaining = limit - len(sales)
+        archived = self._page(
+            ArchivedSale,
+            filters,
+            sales.last_cursor or cursor,
+            archive_skip,
+            max(remaining, 1),  # Página viva cheia: só confere se há mais
+        )
+        if remaining == 0:
+            return Page(
+                sales, sales.last_cursor if archived else None, sales.last_cursor
+            )
+        return Page(
+            sales + archived,
+            archived.next_cursor,
+            archived.last_cursor or sales.last_cursor,
         )
-        if start_date:
-            query = query.filter(func.date(Sale.created_at) >= start_date)
-        if end_date:
-            query = query.filter(func.date(Sale.created_at) <= end_date)
-        if user_id:
-            query = query.filter(Sale.user_id == user_id)
-        if status:
-            query = query.filter(Sale.status == status)
-        return query.order_by(desc(Sale.created_at)).offset(skip).limit(limit).all()
 
     def cancel_sale(self, sale_id: int, user_id: int) -> bool:
-        sale = self.get_by_id(sale_id)
+        sale = self.get_by_id(sale_id, include_archive=False)
         if not sale:
             return False
         if sale.status == SaleStatus.CANCELLED:
@@ -85,17 +158,22 @@ class SaleRepository:
         return True
 
     def get_sales_summary(self, start_date: date, end_date: date) -> Dict[str, Any]:
-        sales = (
-            self.db.query(Sale)
-            .filter(
-                and_(
-                    func.date(Sale.created_at) >= start_date,
-                    func.date(Sale.created_at) <= end_date,
-                    Sale.status == SaleStatus.COMPLETED,
+        sales = []
+        models = (Sale, ArchivedSale) if needs_archive(start_date) else (Sale,)
+        for model in models:
+            sales.extend(
+                self.db.query(model)
+                .options(selectinload(model.items))
+                .filter(
+                    and_(
+                        model.created_at >= datetime.combine(start_date, time.min),
+                        model.created_at
+                        < datetime.combine(end_date + timedelta(days=1), time.min),
+                        model.status == SaleStatus.COMPLETED,
+                    )
                 )
+                .all()
             )
-            .all()
-        )
         total_sales = len(sales)
         total_revenue = sum(sale.final_amount for sale in sales)
         total_items = sum(len(sale.items) for sale in sales)
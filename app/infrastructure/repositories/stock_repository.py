@@ -6,7 +6,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import and_, asc, desc, func
+from sqlalchemy import and_, asc, func
 from sqlalchemy.orm import Session, joinedload
 
 from app.infrastructure.database.models.product import Category, Product
@@ -18,6 +18,8 @@ from app.infrastructure.database.models.stock import (
     Supplier,
 )
 from app.infrastructure.database.models.user import User
+from app.infrastructure.repositories.pagination import Page, keyset_page
+from app.infrastructure.tracing.tracer import traced_class
 from app.presentation.schemas.stock import (
     PurchaseOrderCreate,
     PurchaseOrderUpdate,
@@ -29,6 +31,7 @@ from app.presentation.schemas.stock import (
 )
 
 
+@traced_class
 class StockRepository:
     """Repositório para operações de estoque"""
 
@@ -96,8 +99,9 @@ class StockRepository:
         movement_type: Optional[MovementType] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> List[StockMovement]:
-        """Buscar movimentações de estoque"""
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Buscar movimentações de estoque (mais recentes primeiro)"""
         query = self.db.query(StockMovement).options(
             joinedload(StockMovement.product),
             joinedload(StockMovement.user),
@@ -116,11 +120,12 @@ class StockRepository:
         if end_date:
             query = query.filter(func.date(StockMovement.created_at) <= end_date)
 
-        return (
-            query.order_by(desc(StockMovement.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return keyset_page(
+            query,
+            (StockMovement.created_at, StockMovement.id),
+            cursor,
+            limit,
+            skip=skip,
         )
 
     def create_stock_movement(
@@ -203,8 +208,9 @@ class StockRepository:
         limit: int = 100,
         status: Optional[str] = None,
         supplier_id: Optional[int] = None,
-    ) -> List[PurchaseOrder]:
-        """Buscar pedidos de compra"""
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Buscar pedidos de compra (mais recentes primeiro)"""
         query = self.db.query(PurchaseOrder).options(
             joinedload(PurchaseOrder.supplier),
             joinedload(PurchaseOrder.user),
@@ -217,11 +223,12 @@ class StockRepository:
         if supplier_id:
             query = query.filter(PurchaseOrder.supplier_id == supplier_id)
 
-        return (
-            query.order_by(desc(PurchaseOrder.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return keyset_page(
+            query,
+            (PurchaseOrder.created_at, PurchaseOrder.id),
+            cursor,
+            limit,
+            skip=skip,
         )
 
     def get_purchase_order_by_id(self, order_id: int) -> Optional[PurchaseOrder]:
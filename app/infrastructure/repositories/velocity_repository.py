@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import func, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.database.models.sale import Sale, SaleItem, SaleStatus
+from app.infrastructure.database.models.stock import MovementType, StockMovement
+from app.infrastructure.repositories.forecast_repository import ForecastRepository
+from app.infrastructure.tracing.tracer import traced_class
+
+# Acima disso é mais barato agregar o catálogo todo do que montar um IN enorme
+MAX_FILTER_IDS = 1000
+
+
+@traced_class
+class VelocityRepository:
+    """Repository de velocidade de vendas e dias até ruptura"""
+
+    def __init__(self, db: Session, window_days: Optional[int] = None):
+        self.db = db
+        self.window_days = window_days or settings.STOCK_VELOCITY_WINDOW_DAYS
+
+    def get_units_out(
+        self, product_ids: Optional[Sequence[int]] = None
+    ) -> Dict[int, float]:
+        """Unidades que saíram na janela, por produto, em uma única consulta"""
+        since = datetime.now() - timedelta(days=self.window_days)
+
+        # Vendas concluídas baixam o estoque sem gerar StockMovement; saídas
+        # manuais (sem sale_id) completam o consumo
+        sold = (
+            select(
+                SaleItem.product_id.label("product_id"),
+                SaleItem.quantity.label("quantity"),
+            )
+            .join(Sale, Sale.id == SaleItem.sale_id)
+            .where(Sale.status == SaleStatus.COMPLETED, Sale.created_at >= since)
+        )
+        moved = select(
+            StockMovement.product_id.label("product_id"),
+            StockMovement.quantity.label("quantity"),
+        ).where(
+            StockMovement.movement_type == MovementType.SAIDA,
+            StockMovement.sale_id.is_(None),
+            StockMovement.created_at >= since,
+        )
+        if product_ids is not None and len(product_ids) <= MAX_FILTER_IDS:
+            sold = sold.where(SaleItem.product_id.in_(product_ids))
+            moved = moved.where(StockMovement.product_id.in_(product_ids))
+
+        outflow = union_all(sold, moved).subquery()
+        rows = self.db.execute(
+            select(outflow.c.product_id, func.sum(outflow.c.quantity)).group_by(
+                outflow.c.product_id
+            )
+        )
+        return {product_id: float(total or 0) for product_id, total in rows}
+
+    def get_daily_velocity(self, product_ids: Sequence[int]) -> np.ndarray:
+        """
+        Demanda diária alinhada com product_ids
+
+        Usa a previsão da próxima semana quando existe (product_forecasts) e
+        a média histórica da janela para os demais produtos.
+        """
+        units = self.get_units_out(product_ids)
+        velocity = np.fromiter(
+            (units.get(product_id, 0.0) for product_id in product_ids),
+            dtype=np.float64,
+            count=len(product_ids),
+        )
+        velocity /= self.window_days
+
+        forecasts = ForecastRepository(self.db).get_expected_daily_demand(product_ids)
+        if forecasts:
+            predicted = np.fromiter(
+                (forecasts.get(product_id, np.nan) for product_id in product_ids),
+                dtype=np.float64,
+                count=len(product_ids),
+            )
+            velocity = np.where(np.isnan(predicted), velocity, predicted)
+        return velocity
+
+    def get_days_to_stockout(
+        self, product_ids: Sequence[int], stock: Sequence[float]
+    ) -> List[Optional[int]]:
+        """Dias até zerar o estoque (0 se já zerado, None sem consumo)"""
+        if len(product_ids) == 0:
+            return []
+        velocity = self.get_daily_velocity(product_ids)
+        return days_to_stockout(np.asarray(stock, dtype=np.float64), velocity)
+
+    def get_days_to_stockout_map(
+        self, product_ids: Sequence[int], stock: Sequence[float]
+    ) -> Dict[int, Optional[int]]:
+        return dict(zip(product_ids, self.get_days_to_stockout(product_ids, stock)))
+
+
+def days_to_stockout(stock: np.ndarray, velocity: np.ndarray) -> List[Optional[int]]:
+    """Cálculo vetorizado: floor(estoque / velocidade)"""
+    days = np.zeros(len(stock))
+    moving = velocity > 0
+    np.floor_divide(stock, velocity, out=days, where=moving)
+    days = np.maximum(days, 0)
+    empty = stock <= 0
+    return [
+        0 if is_empty else (int(value) if is_moving else None)
+        for value, is_moving, is_empty in zip(
+            days.tolist(), moving.tolist(), empty.tolist()
+        )
+    ]
@@ -0,0 +1,3 @@
+"""
+Tracing local (spans por requisição, sem coletor externo)
+"""
@@ -0,0 +1,44 @@
+"""
+Spans dos comandos SQL (eventos do engine do SQLAlchemy)
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.infrastructure.tracing.tracer import CLIENT, start_span
+
+
+def trace_engine(engine: Engine) -> None:
+    """Um span ``db.<operação>`` por comando dentro de um trace"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+        span = start_span(
+            f"db.{operation.lower()}",
+            CLIENT,
+            **{
+                "db.system": engine.dialect.name,
+                "db.operation": operation,
+                "db.statement": statement[: settings.TRACING_MAX_STATEMENT_LENGTH],
+            },
+        )
+        conn.info.setdefault("trace_spans", []).append(span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        span = conn.info["trace_spans"].pop()
+        if span is not None:
+            if cursor.rowcount is not None and cursor.rowcount >= 0:
+                span.set_attribute("db.rowcount", cursor.rowcount)
+            span.finish()
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        connection = context.connection
+        spans = connection.info.get("trace_spans") if connection is not None else None
+        if spans:
+            span = spans.pop()
+            if span is not None:
+                span.finish(context.original_exception)
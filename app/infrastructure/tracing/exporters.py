@@ -0,0 +1,175 @@
+"""
+Destino dos traces: buffer circular em memória e arquivo JSON lines
+
+O arquivo é escrito por uma thread própria (a requisição só enfileira), no
+formato nativo ou OTLP/JSON (``ExportTraceServiceRequest``), que pode ser
+enviado depois a qualquer coletor OpenTelemetry.
+"""
+
+import json
+import queue
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.infrastructure.tracing.tracer import CLIENT, SERVER, Span
+
+# SpanKind do OTLP
+_OTLP_KINDS = {"internal": 1, SERVER: 2, CLIENT: 3}
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Spans (formato nativo) -> ExportTraceServiceRequest em JSON"""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {
+                            "key": "service.name",
+                            "value": {"stringValue": settings.TRACING_SERVICE_NAME},
+                        }
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "app.infrastructure.tracing"},
+                        "spans": [
+                            {
+                                "traceId": span["trace_id"],
+                                "spanId": span["span_id"],
+                                "parentSpanId": span["parent_id"] or "",
+                                "name": span["name"],
+                                "kind": _OTLP_KINDS.get(span["kind"], 1),
+                                "startTimeUnixNano": str(span["start_ns"]),
+                                "endTimeUnixNano": str(span["end_ns"]),
+                                "attributes": [
+                                    {"key": key, "value": _otlp_value(value)}
+                                    for key, value in span["attributes"].items()
+                                ],
+                                "status": (
+                                    {"code": 2, "message": span["error"]}
+                                    if span["error"]
+                                    else {"code": 0}
+                                ),
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class TraceRing:
+    """Últimos TRACING_RING_SIZE traces deste worker"""
+
+    def __init__(self, size: Optional[int] = None):
+        self.size = size or settings.TRACING_RING_SIZE
+        self._lock = threading.Lock()
+        self._traces: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def add(self, trace: Dict[str, Any]) -> None:
+        with self._lock:
+            self._traces[trace["trace_id"]] = trace
+            while len(self._traces) > self.size:
+                self._traces.popitem(last=False)
+
+    def list(self, limit: int, min_duration_ms: float = 0.0) -> List[Dict[str, Any]]:
+        """Resumo dos traces mais recentes primeiro"""
+        with self._lock:
+            traces = list(reversed(self._traces.values()))
+        summaries = []
+        for trace in traces:
+            if trace["duration_ms"] < min_duration_ms:
+                continue
+            summaries.append({k: v for k, v in trace.items() if k != "spans"})
+            if len(summaries) >= limit:
+                break
+        return summaries
+
+    def get(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._traces.get(trace_id)
+
+
+class FileExporter:
+    """Acrescenta um trace por linha em TRACING_FILE (thread de escrita)"""
+
+    def __init__(self, path: str, otlp: bool):
+        self.path = Path(path)
+        self.otlp = otlp
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, trace: Dict[str, Any]) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="trace-file-exporter", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put(trace)
+
+    def _run(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as output:
+            while True:
+                trace = self._queue.get()
+                if trace is None:
+                    return
+                record = to_otlp(trace["spans"]) if self.otlp else trace
+                output.write(json.dumps(record, default=str) + "\n")
+                if self._queue.empty():
+                    output.flush()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+trace_ring = TraceRing()
+file_exporter = (
+    FileExporter(settings.TRACING_FILE, settings.TRACING_FILE_FORMAT == "otlp")
+    if settings.TRACING_FILE
+    else None
+)
+
+
+def export_trace(root: Span) -> None:
+    """Chamado quando o span raiz termina"""
+    trace = root.trace
+    spans = sorted(
+        (span.to_dict() for span in trace.spans), key=lambda s: s["start_ns"]
+    )
+    record = {
+        "trace_id": trace.trace_id,
+        "name": root.name,
+        "started_at_ns": root.start_ns,
+        "duration_ms": round((root.end_ns - root.start_ns) / 1e6, 3),
+        "status_code": root.attributes.get("http.status_code"),
+        "error": root.error,
+        "span_count": len(spans),
+        "dropped_spans": trace.dropped,
+        "spans": spans,
+    }
+    trace_ring.add(record)
+    if file_exporter is not None:
+        file_exporter.export(record)
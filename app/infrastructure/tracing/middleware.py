@@ -0,0 +1,46 @@
+"""
+Middleware ASGI que abre o span raiz de cada requisição amostrada
+
+O span recebe o nome da rota (template) ao final; o id do trace volta no
+cabeçalho ``X-Trace-Id``.
+"""
+
+from app.infrastructure.tracing.exporters import export_trace
+from app.infrastructure.tracing.tracer import start_trace
+
+
+class TracingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with start_trace(
+            f"{scope['method']} {scope['path']}",
+            export_trace,
+            **{"http.method": scope["method"], "http.target": scope["path"]},
+        ) as root:
+            if root is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    root.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        root.error = f"HTTP {message['status']}"
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-trace-id", root.trace.trace_id.encode())
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if getattr(route, "path", None):
+                    root.name = f"{scope['method']} {route.path}"
+                    root.set_attribute("http.route", route.path)
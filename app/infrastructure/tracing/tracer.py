@@ -0,0 +1,194 @@
+"""
+Spans de tracing com contextvars
+
+O middleware abre o span raiz de uma requisição amostrada
+(TRACING_SAMPLE_RATE); serviços, repositórios e SQL abrem spans filhos do
+span corrente. Sem trace ativo, ``span()`` devolve um escopo vazio: o custo
+é uma leitura de ContextVar. O contexto é copiado para o threadpool, então
+endpoints ``def`` continuam no mesmo trace.
+"""
+
+import functools
+import inspect
+import os
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+
+INTERNAL = "internal"
+SERVER = "server"
+CLIENT = "client"
+
+
+class Trace:
+    """Spans de uma requisição; exportado quando o span raiz termina"""
+
+    __slots__ = ("trace_id", "spans", "dropped")
+
+    def __init__(self):
+        self.trace_id = os.urandom(16).hex()
+        self.spans: List["Span"] = []
+        self.dropped = 0
+
+
+class Span:
+    __slots__ = (
+        "trace",
+        "span_id",
+        "parent_id",
+        "name",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(
+        self,
+        trace: Trace,
+        name: str,
+        kind: str,
+        parent: Optional["Span"],
+        attributes: Dict[str, Any],
+    ):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.end_ns = time.time_ns()
+        if error is not None and self.error is None:
+            self.error = f"{type(error).__name__}: {error}"
+        trace = self.trace
+        if len(trace.spans) < settings.TRACING_MAX_SPANS:
+            trace.spans.append(self)
+        else:
+            trace.dropped += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+class _SpanScope:
+    """Context manager que abre um span e o torna o corrente"""
+
+    __slots__ = ("span", "token", "on_finish")
+
+    def __init__(self, span: Span, on_finish: Optional[Callable[[Span], None]]):
+        self.span = span
+        self.on_finish = on_finish
+
+    def __enter__(self) -> Span:
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current_span.reset(self.token)
+        self.span.finish(exc)
+        if self.on_finish is not None:
+            self.on_finish(self.span)
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NOOP = _NoopScope()
+
+
+def start_trace(
+    name: str,
+    on_finish: Callable[[Span], None],
+    kind: str = SERVER,
+    sample_rate: Optional[float] = None,
+    **attributes: Any,
+):
+    """Span raiz (amostrado); ``on_finish`` recebe o span ao terminar"""
+    rate = settings.TRACING_SAMPLE_RATE if sample_rate is None else sample_rate
+    if rate <= 0 or (rate < 1 and random.random() >= rate):
+        return _NOOP
+    return _SpanScope(Span(Trace(), name, kind, None, attributes), on_finish)
+
+
+def span(name: str, kind: str = INTERNAL, **attributes: Any):
+    """Span filho do corrente (no-op fora de um trace)"""
+    parent = _current_span.get()
+    if parent is None:
+        return _NOOP
+    return _SpanScope(Span(parent.trace, name, kind, parent, attributes), None)
+
+
+def start_span(name: str, kind: str = INTERNAL, **attributes: Any) -> Optional[Span]:
+    """Span filho sem torná-lo corrente (ex.: SQL); termine com ``finish()``"""
+    parent = _current_span.get()
+    if parent is None:
+        return None
+    return Span(parent.trace, name, kind, parent, attributes)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator: um span por chamada da função"""
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def traced_class(cls):
+    """Decorator de classe: um span por chamada de cada método público"""
+    for attr, value in list(vars(cls).items()):
+        if (
+            attr.startswith("_")
+            or not inspect.isfunction(value)
+            or inspect.iscoroutinefunction(value)
+        ):
+            continue
+        setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(value))
+    return cls
@@ -1,11 +1,18 @@
 import traceback
 
-from fastapi import Depends, FastAPI, Request
+import structlog
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
 
-from app.infrastructure.database.connection import get_db
+from app.core.config import settings
+from app.core.logging import configure_logging, shutdown_logging
+from app.infrastructure.analytics.live_kpis import live_kpis
+from app.infrastructure.analytics.trending import trending_tracker
+from app.infrastructure.backup.scheduler import backup_scheduler
+from app.infrastructure.capture.middleware import CaptureMiddleware
+from app.infrastructure.capture.recorder import traffic_recorder
+from app.infrastructure.database.connection import engine
 from app.infrastructure.database.models import (  # noqa: F401
     Category,
     Product,
@@ -16,8 +23,21 @@ from app.infrastructure.database.models import (  # noqa: F401
     Supplier,
     User,
 )
+from app.infrastructure.jobs.executor import shutdown_process_pool
+from app.infrastructure.metrics.instruments import instrument_engine, registry
+from app.infrastructure.metrics.middleware import MetricsMiddleware
+from app.infrastructure.profiling.middleware import ProfilingMiddleware
+from app.infrastructure.profiling.slow_queries import watch_engine
+from app.infrastructure.tracing.database import trace_engine
+from app.infrastructure.tracing.exporters import file_exporter
+from app.infrastructure.tracing.middleware import TracingMiddleware
+from app.presentation.api.health import router as health_router
+from app.presentation.api.metrics import router as metrics_router
 from app.presentation.api.v1 import api_router
 
+configure_logging()
+logger = structlog.get_logger(__name__)
+
 app = FastAPI(
     title="Sistema de Supermercado",
     description="API para gerenciamento de supermercado com autenticação e produtos",
@@ -35,7 +55,12 @@ async def global_exception_handler(request: Request, exc: Exception):
         "type": type(exc).__name__,
         "traceback": traceback.format_exc(),
     }
-    print(f"❌ Erro não tratado: {error_detail}")
+    logger.error(
+        "unhandled_exception",
+        method=request.method,
+        path=request.url.path,
+        exc_info=exc,
+    )
     return JSONResponse(status_code=500, content=error_detail)
 
 
@@ -49,82 +74,54 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],  # 👈 INCLUIR OPTIONS!
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Paginação por cursor
 )
+app.add_middleware(MetricsMiddleware)
+if settings.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+    trace_engine(engine)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+if settings.CAPTURE_ENABLED:
+    app.add_middleware(CaptureMiddleware)
+instrument_engine(engine)
+if settings.SLOW_QUERY_ENABLED:
+    watch_engine(engine)
 
 # Incluir apenas o router central da v1
 app.include_router(api_router, prefix="/api/v1")
+app.include_router(health_router)
+app.include_router(metrics_router)
+
+
+@app.on_event("startup")
+def load_live_counters():
+    """Reconstrói os contadores em memória (KPIs do dia e produtos em alta)"""
+    live_kpis.reconcile()
+    trending_tracker.rebuild()
+
+
+@app.on_event("startup")
+def start_backup_scheduler():
+    """Backups periódicos em processo separado (BACKUP_ENABLED)"""
+    if settings.BACKUP_ENABLED:
+        backup_scheduler.start()
+
+
+@app.on_event("shutdown")
+def shutdown_background_workers():
+    """Encerra o pool de processos dos jobs, salva KPIs do dia e métricas e
+    esvazia as filas de traces, de tráfego capturado e de logs"""
+    shutdown_process_pool()
+    backup_scheduler.stop()
+    live_kpis.persist()
+    registry.flush()
+    if file_exporter is not None:
+        file_exporter.close()
+    traffic_recorder.close()
+    shutdown_logging()
 
 
 @app.get("/")
 def read_root():
     return {"message": "API do Supermercado funcionando!"}
-
-
-@app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
-    """Health check completo com PDV"""
-    try:
-        from app.infrastructure.database.models import Category, Product, Sale, User
-
-        users_count = db.query(User).count()
-        products_count = db.query(Product).filter(Product.is_active).count()
-        categories_count = db.query(Category).filter(Category.is_active).count()
-        sales_count = db.query(Sale).count()
-
-        # 🔍 MELHORAR: Buscar produtos com estoque baixo e seus detalhes
-        low_stock_products = (
-            db.query(Product)
-            .filter(
-                Product.is_active, Product.stock_quantity <= Product.min_stock_level
-            )
-            .all()
-        )
-
-        # 📋 Criar lista detalhada dos produtos com estoque baixo
-        low_stock_details = []
-        for product in low_stock_products:
-            low_stock_details.append(
-                {
-                    "name": product.name,
-                    "current_stock": float(product.stock_quantity),
-                    "min_level": float(product.min_stock_level),
-                    "difference": float(
-                        product.min_stock_level - product.stock_quantity
-                    ),
-                    "urgency": "critical" if product.stock_quantity <= 0 else "warning",
-                }
-            )
-        return {
-            "status": "healthy",
-            "database": "connected",
-            "features": {
-                "authentication": "✅ Enabled",
-                "products": "✅ Enabled",
-                "categories": "✅ Enabled",
-                "pdv": "✅ Enabled",
-                "sales": "✅ Enabled",
-                "barcode_reader": "✅ Simulation",
-                "scale": "✅ Simulation",
-                "thermal_printer": "✅ Simulation",
-                "bulk_promotions": "✅ Enabled",
-                "stock_control": "✅ Enabled",
-            },
-            "counts": {
-                "users": users_count,
-                "products": products_count,
-                "categories": categories_count,
-                "sales": sales_count,
-                "low_stock_products": len(low_stock_products),
-            },
-            "alerts": {
-                "low_stock": len(low_stock_products) > 0,
-                "low_stock_details": low_stock_details,  # 👈 NOVO: Detalhes dos produtos
-            },
-            "pdv_status": {
-                "barcode_reader": "ready",
-                "scale": "ready",
-                "printer": "ready",
-            },
-        }
-    except Exception as e:
-        return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.application.services.auth_service import AuthService
 from app.core.security import ALGORITHM, SECRET_KEY
-from app.infrastructure.database.connection import get_db
+from app.infrastructure.database.connection import SessionLocal, get_db
 from app.infrastructure.database.models.user import User
 from app.infrastructure.repositories.user_repository import UserRepository
 
@@ -42,6 +42,24 @@ def get_current_active_user(
     token: str = Depends(security), db: Session = Depends(get_database_session)
 ):
     """Dependência para obter usuário atual via JWT token"""
+    return _authenticate(token, db)
+
+
+def get_streaming_user(token: str = Depends(security)):
+    """
+    Usuário atual para respostas em fluxo (SSE, exportações)
+
+    Dependências com ``yield`` só saem quando a resposta termina: a sessão
+    ficaria presa ao fluxo inteiro. Aqui ela fecha antes da resposta.
+    """
+    db = SessionLocal()
+    try:
+        return _authenticate(token, db)
+    finally:
+        db.close()
+
+
+def _authenticate(token, db: Session) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -76,6 +94,15 @@ def require_admin(current_user: User = Depends(get_current_active_user)):
 
 def require_supervisor(current_user: User = Depends(get_current_active_user)):
     """Dependência para verificar se o usuário atual é supervisor ou admin"""
+    return _check_supervisor(current_user)
+
+
+def require_streaming_supervisor(current_user: User = Depends(get_streaming_user)):
+    """``require_supervisor`` sem sessão presa ao fluxo da resposta"""
+    return _check_supervisor(current_user)
+
+
+def _check_supervisor(current_user: User) -> User:
     from app.infrastructure.database.models.user import UserRole
 
     if current_user.role not in [UserRole.ADMIN, UserRole.SUPERVISOR]:
@@ -0,0 +1,43 @@
+"""
+Endpoints de saúde da aplicação (probes do orquestrador e relatório)
+"""
+
+from fastapi import APIRouter, Depends, Response, status
+
+from app.application.services.health_service import HealthService
+from app.core.config import settings
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+def get_health_service() -> HealthService:
+    return HealthService()
+
+
+@router.get("/live")
+def liveness(health_service: HealthService = Depends(get_health_service)):
+    """Liveness: não toca no banco"""
+    return health_service.liveness()
+
+
+@router.get("/ready")
+def readiness(
+    response: Response,
+    health_service: HealthService = Depends(get_health_service),
+):
+    """Readiness: SELECT 1 e conexão disponível no pool (503 se não)"""
+    ready, report = health_service.readiness()
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return report
+
+
+@router.get("")
+@router.get("/details")
+def health_details(
+    response: Response,
+    health_service: HealthService = Depends(get_health_service),
+):
+    """Health check completo com PDV (em cache)"""
+    response.headers["Cache-Control"] = f"max-age={settings.HEALTH_DETAILS_TTL_SECONDS}"
+    return health_service.details()
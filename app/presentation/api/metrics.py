@@ -0,0 +1,16 @@
+"""
+Endpoint de métricas no formato do Prometheus
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.infrastructure.metrics.instruments import registry
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Métricas de todos os workers (formato texto 0.0.4)"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
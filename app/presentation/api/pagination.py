@@ -0,0 +1,23 @@
+"""
+Paginação por cursor nas listagens
+
+O corpo continua sendo a lista de sempre; o cursor da próxima página vai no
+cabeçalho ``X-Next-Cursor`` (ausente na última página) e volta em
+``?cursor=``.
+"""
+
+from fastapi import Query, Response
+
+from app.infrastructure.repositories.pagination import Page
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CursorQuery = Query(
+    None, description=f"Cursor da próxima página ({NEXT_CURSOR_HEADER})"
+)
+
+
+def set_next_cursor(response: Response, page: Page) -> Page:
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page
@@ -4,12 +4,39 @@ API v1 - Módulo de rotas da versão 1 da API
 
 from fastapi import APIRouter
 
-from app.presentation.api.v1 import auth, pdv, products, reports, sales, stock
+from app.presentation.api.v1 import (
+    abc,
+    admin,
+    affinities,
+    analytics,
+    auth,
+    events,
+    exports,
+    pdv,
+    products,
+    report_jobs,
+    reports,
+    sales,
+    stock,
+    trending,
+)
 
 api_router = APIRouter()
 api_router.include_router(auth.router)
 api_router.include_router(products.router)
 api_router.include_router(sales.router)
+api_router.include_router(report_jobs.router, prefix="/reports/jobs", tags=["reports"])
+api_router.include_router(abc.router, prefix="/reports/abc", tags=["reports"])
+api_router.include_router(trending.router, prefix="/reports/trending", tags=["reports"])
+api_router.include_router(
+    affinities.router, prefix="/reports/affinities", tags=["reports"]
+)
 api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
+api_router.include_router(
+    analytics.router, prefix="/reports/analytics", tags=["reports"]
+)
+api_router.include_router(exports.router, prefix="/exports", tags=["Exportações"])
 api_router.include_router(pdv.router, prefix="/pdv", tags=["PDV"])
+api_router.include_router(events.router, prefix="/events", tags=["Eventos"])
 api_router.include_router(stock.router, prefix="/stock", tags=["Estoque"])
+api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
@@ -0,0 +1,50 @@
+"""
+Endpoints da curva ABC (Pareto) do catálogo
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.application.services.abc_service import AbcService
+from app.core.deps import get_db
+from app.presentation.api.dependencies import (
+    get_current_active_user,
+    require_supervisor,
+)
+from app.presentation.schemas.auth import UserResponse
+from app.presentation.schemas.report import AbcAnalysisResponse, AbcRefreshResponse
+
+router = APIRouter()
+
+
+def get_abc_service(db: Session = Depends(get_db)) -> AbcService:
+    return AbcService(db)
+
+
+@router.get("", response_model=AbcAnalysisResponse)
+def get_abc_analysis(
+    days: Optional[int] = Query(None, ge=1, le=730, description="Janela em dias"),
+    abc_class: Optional[str] = Query(None, pattern="^[ABC]$"),
+    limit: Optional[int] = Query(None, ge=1, le=50000),
+    abc_service: AbcService = Depends(get_abc_service),
+    _: UserResponse = Depends(get_current_active_user),
+):
+    """Curva ABC por receita (classe por margem incluída em cada item)"""
+    analysis = abc_service.analyze(days)
+    items = analysis["items"]
+    if abc_class:
+        items = [item for item in items if item["abc_class"] == abc_class]
+    analysis["items"] = items[:limit] if limit else items
+    return analysis
+
+
+@router.post("/refresh", response_model=AbcRefreshResponse)
+def refresh_abc_classification(
+    days: Optional[int] = Query(None, ge=1, le=730, description="Janela em dias"),
+    abc_service: AbcService = Depends(get_abc_service),
+    _: UserResponse = Depends(require_supervisor),
+):
+    """Recalcular e gravar a classificação nos produtos (Supervisor+)"""
+    return abc_service.refresh(days)
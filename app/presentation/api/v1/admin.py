@@ -0,0 +1,173 @@
+"""
+Endpoints de diagnóstico para administradores
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
+
+from app.application.services.diagnostics_service import DiagnosticsService
+from app.presentation.api.dependencies import require_admin
+from app.presentation.schemas.admin import (
+    MemoryDiffResponse,
+    MemorySnapshotResponse,
+    MemoryStatus,
+    RequestProfile,
+    SlowQuery,
+    TraceDetail,
+    TraceSummary,
+)
+from app.presentation.schemas.auth import UserResponse
+
+router = APIRouter()
+
+
+def get_diagnostics_service() -> DiagnosticsService:
+    return DiagnosticsService()
+
+
+@router.get("/profiles", response_model=List[RequestProfile])
+def list_profiles(
+    limit: int = Query(50, ge=1, le=500),
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Perfis de requisições (envie ``X-Profile: 1`` para gerar um)"""
+    return diagnostics_service.list_profiles(limit)
+
+
+@router.get("/profiles/{profile_id}")
+def download_profile(
+    profile_id: str,
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Pilhas em formato folded (flamegraph.pl, speedscope)"""
+    try:
+        path = diagnostics_service.profile_path(profile_id)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return FileResponse(
+        path, media_type="text/plain", filename=f"profile-{profile_id}.folded"
+    )
+
+
+# ==================== MEMÓRIA (por worker) ====================
+
+
+@router.get("/memory", response_model=MemoryStatus)
+def get_memory_status(
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """RSS, tracemalloc e tamanho de carrinhos, caches e buffers em memória"""
+    return diagnostics_service.memory_status()
+
+
+@router.post("/memory/tracemalloc/start", response_model=MemoryStatus)
+def start_tracemalloc(
+    frames: int = Query(1, ge=1, le=50),
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Liga o tracemalloc (``frames`` > 1 permite agrupar por traceback)"""
+    try:
+        return diagnostics_service.start_tracing(frames)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/memory/tracemalloc/stop", response_model=MemoryStatus)
+def stop_tracemalloc(
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Desliga o tracemalloc e descarta os snapshots"""
+    try:
+        return diagnostics_service.stop_tracing()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/memory/snapshots", response_model=MemorySnapshotResponse)
+def take_memory_snapshot(
+    group_by: str = Query("lineno", pattern="^(lineno|filename|traceback)$"),
+    limit: int = Query(25, ge=1, le=500),
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Tira um snapshot e devolve as maiores alocações vivas"""
+    try:
+        return diagnostics_service.take_snapshot(group_by, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/memory/diff", response_model=MemoryDiffResponse)
+def diff_memory_snapshots(
+    base_id: int = Query(..., ge=1),
+    target_id: Optional[int] = Query(None, ge=1),
+    group_by: str = Query("lineno", pattern="^(lineno|filename|traceback)$"),
+    limit: int = Query(25, ge=1, le=500),
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Crescimento de ``base_id`` até ``target_id`` (ou até agora)"""
+    try:
+        return diagnostics_service.diff_snapshots(base_id, target_id, group_by, limit)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+# ==================== TRACES (por worker) ====================
+
+
+@router.get("/traces", response_model=List[TraceSummary])
+def list_traces(
+    limit: int = Query(50, ge=1, le=500),
+    min_duration_ms: float = Query(0.0, ge=0),
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Requisições amostradas mais recentes (TRACING_SAMPLE_RATE)"""
+    return diagnostics_service.list_traces(limit, min_duration_ms)
+
+
+@router.get("/traces/{trace_id}", response_model=Union[TraceDetail, Dict[str, Any]])
+def get_trace(
+    trace_id: str,
+    format: str = Query("native", pattern="^(native|otlp)$"),
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Spans de um trace (``format=otlp``: JSON do OpenTelemetry)"""
+    try:
+        return diagnostics_service.get_trace(trace_id, otlp=format == "otlp")
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+# ==================== CONSULTAS LENTAS (por worker) ====================
+
+
+@router.get("/slow-queries", response_model=List[SlowQuery])
+def list_slow_queries(
+    order_by: str = Query("total_ms", pattern="^(total_ms|max_ms|avg_ms|count)$"),
+    limit: int = Query(50, ge=1, le=500),
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Comandos acima de SLOW_QUERY_THRESHOLD_MS, com plano de execução"""
+    return diagnostics_service.list_slow_queries(order_by, limit)
+
+
+@router.delete("/slow-queries")
+def clear_slow_queries(
+    diagnostics_service: DiagnosticsService = Depends(get_diagnostics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Limpa o log (ex.: depois de criar um índice)"""
+    return {"removed": diagnostics_service.clear_slow_queries()}
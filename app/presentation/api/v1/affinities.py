@@ -0,0 +1,65 @@
+"""
+Endpoints de afinidade entre produtos (comprados juntos)
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.application.services.affinity_service import AffinityService
+from app.application.services.report_job_service import ReportJobService
+from app.core.deps import get_db
+from app.presentation.api.dependencies import (
+    get_current_active_user,
+    require_supervisor,
+)
+from app.presentation.schemas.auth import UserResponse
+from app.presentation.schemas.report import AffinityRunRequest, ProductPairAffinity
+from app.presentation.schemas.report_job import ReportJobCreate, ReportJobResponse
+
+router = APIRouter()
+
+
+def get_affinity_service(db: Session = Depends(get_db)) -> AffinityService:
+    return AffinityService(db)
+
+
+def get_report_job_service() -> ReportJobService:
+    return ReportJobService()
+
+
+@router.get("", response_model=List[ProductPairAffinity])
+def get_top_pairs(
+    min_lift: float = Query(1.2, ge=0),
+    limit: int = Query(50, ge=1, le=1000),
+    affinity_service: AffinityService = Depends(get_affinity_service),
+    _: UserResponse = Depends(get_current_active_user),
+):
+    """Pares mais comprados juntos (base para promoções combinadas)"""
+    return affinity_service.get_top_pairs(min_lift, limit)
+
+
+@router.post(
+    "/refresh", response_model=ReportJobResponse, status_code=status.HTTP_202_ACCEPTED
+)
+def refresh_affinities(
+    request: AffinityRunRequest,
+    job_service: ReportJobService = Depends(get_report_job_service),
+    _: UserResponse = Depends(require_supervisor),
+):
+    """
+    Recalcular a tabela de afinidades (Supervisor+)
+
+    Roda como job ``basket_affinity`` no pool de processos; acompanhe em
+    ``/reports/jobs/{id}`` (o resultado é o resumo da mineração).
+    """
+    try:
+        return job_service.submit(
+            ReportJobCreate(
+                job_type="basket_affinity",
+                params=request.model_dump(exclude_none=True),
+            )
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,84 @@
+"""
+Endpoints de análises ad-hoc de vendas (armazenamento colunar em memória)
+"""
+
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.application.services.analytics_service import AnalyticsService
+from app.infrastructure.database.models.sale import PaymentMethod, SaleStatus
+from app.presentation.api.dependencies import get_current_active_user, require_admin
+from app.presentation.schemas.analytics import (
+    AnalyticsFilters,
+    AnalyticsResponse,
+    AnalyticsStoreStats,
+)
+from app.presentation.schemas.auth import UserResponse
+
+router = APIRouter()
+
+
+def get_analytics_service() -> AnalyticsService:
+    return AnalyticsService()
+
+
+@router.get("/sales", response_model=AnalyticsResponse)
+def query_sales(
+    start_date: Optional[date] = Query(None, description="Data inicial (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Data final (YYYY-MM-DD)"),
+    category_id: List[int] = Query([], description="Filtrar por categorias"),
+    product_id: List[int] = Query([], description="Filtrar por produtos"),
+    cashier_id: List[int] = Query([], description="Filtrar por operadores"),
+    payment_method: List[PaymentMethod] = Query([]),
+    sale_status: List[SaleStatus] = Query([SaleStatus.COMPLETED]),
+    group_by: List[str] = Query(
+        ["day"],
+        description="day, week, month, hour, weekday, product, category, "
+        "cashier, payment_method, status",
+    ),
+    metrics: List[str] = Query(
+        ["revenue", "quantity", "transactions"],
+        description="revenue, quantity, profit, discount, items, "
+        "transactions, average_ticket",
+    ),
+    order_by: Optional[str] = Query(None, description="Métrica para ordenação"),
+    descending: bool = Query(True),
+    limit: Optional[int] = Query(None, ge=1, le=10000, description="Top-k"),
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+    _: UserResponse = Depends(get_current_active_user),
+):
+    """
+    Relatório ad-hoc de vendas
+
+    Filtra, agrupa e ordena itens de venda em memória. Ex.: top 10 produtos
+    por receita no trimestre: `group_by=product&metrics=revenue&order_by=revenue&limit=10`
+    """
+    filters = AnalyticsFilters(
+        start_date=start_date,
+        end_date=end_date,
+        category_ids=category_id,
+        product_ids=product_id,
+        cashier_ids=cashier_id,
+        payment_methods=payment_method,
+        statuses=sale_status,
+        group_by=group_by,
+        metrics=metrics,
+        order_by=order_by,
+        descending=descending,
+        limit=limit,
+    )
+    try:
+        return analytics_service.query_sales(filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/refresh", response_model=AnalyticsStoreStats)
+def refresh_store(
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+    _: UserResponse = Depends(require_admin),
+):
+    """Força a atualização incremental do armazenamento (Admin apenas)"""
+    return analytics_service.refresh()
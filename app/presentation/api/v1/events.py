@@ -0,0 +1,58 @@
+"""
+Endpoints de eventos em tempo real (Server-Sent Events)
+"""
+
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.application.services.event_service import EVENT_TYPES, EventService
+from app.presentation.api.dependencies import get_streaming_user, require_supervisor
+from app.presentation.schemas.auth import UserResponse
+
+router = APIRouter()
+
+
+def get_event_service() -> EventService:
+    return EventService()
+
+
+@router.get("/stream")
+async def stream_events(
+    types: List[str] = Query([], description="sale, kpis, low_stock (vazio = todos)"),
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+    event_service: EventService = Depends(get_event_service),
+    _: UserResponse = Depends(get_streaming_user),
+):
+    """
+    Vendas, KPIs do dia e produtos que cruzaram o estoque mínimo
+
+    A autenticação não segura sessão do banco: a conexão fica aberta
+    enquanto a tela estiver aberta. Só chegam os eventos do worker que
+    atende a conexão; com ``WEB_CONCURRENCY > 1`` a tela perde as vendas
+    dos outros workers.
+    """
+    unknown = set(types) - set(EVENT_TYPES)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Tipos de evento inválidos: {', '.join(sorted(unknown))}",
+        )
+    event_types = frozenset(types) or None
+    return StreamingResponse(
+        event_service.broker.stream(
+            event_types, last_event_id, event_service.initial_state(event_types)
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/stats")
+def get_event_stats(
+    event_service: EventService = Depends(get_event_service),
+    _: UserResponse = Depends(require_supervisor),
+) -> Dict[str, int]:
+    """Assinantes conectados e mensagens descartadas (Supervisor+)"""
+    return event_service.stats()
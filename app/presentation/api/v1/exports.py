@@ -0,0 +1,122 @@
+"""
+Endpoints de exportação de relatórios (CSV, XLSX e PDF) em fluxo
+"""
+
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.application.services.export_service import ExportService
+from app.infrastructure.database.models.sale import PaymentMethod, SaleStatus
+from app.infrastructure.database.models.stock import MovementType
+from app.presentation.api.dependencies import require_streaming_supervisor
+from app.presentation.schemas.auth import UserResponse
+
+router = APIRouter()
+
+FORMAT_QUERY = Query("csv", pattern="^(csv|xlsx|pdf)$", description="csv, xlsx ou pdf")
+
+
+def get_export_service() -> ExportService:
+    return ExportService()
+
+
+def _streaming_response(
+    export_service: ExportService, dataset: str, file_format: str, **filters
+) -> StreamingResponse:
+    try:
+        filename, media_type, content = export_service.export(
+            dataset, file_format, **filters
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/sales")
+def export_sales(
+    format: str = FORMAT_QUERY,
+    start_date: Optional[date] = Query(None, description="Data inicial (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Data final (YYYY-MM-DD)"),
+    sale_status: Optional[SaleStatus] = Query(None),
+    payment_method: Optional[PaymentMethod] = Query(None),
+    user_id: Optional[int] = Query(None),
+    export_service: ExportService = Depends(get_export_service),
+    _: UserResponse = Depends(require_streaming_supervisor),
+):
+    """Exportar vendas (Supervisor+)"""
+    return _streaming_response(
+        export_service,
+        "sales",
+        format,
+        start_date=start_date,
+        end_date=end_date,
+        status=sale_status,
+        payment_method=payment_method,
+        user_id=user_id,
+    )
+
+
+@router.get("/sale-items")
+def export_sale_items(
+    format: str = FORMAT_QUERY,
+    start_date: Optional[date] = Query(None, description="Data inicial (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Data final (YYYY-MM-DD)"),
+    sale_status: Optional[SaleStatus] = Query(None),
+    product_id: Optional[int] = Query(None),
+    category_id: Optional[int] = Query(None),
+    export_service: ExportService = Depends(get_export_service),
+    _: UserResponse = Depends(require_streaming_supervisor),
+):
+    """Exportar itens de venda (Supervisor+)"""
+    return _streaming_response(
+        export_service,
+        "sale-items",
+        format,
+        start_date=start_date,
+        end_date=end_date,
+        status=sale_status,
+        product_id=product_id,
+        category_id=category_id,
+    )
+
+
+@router.get("/stock-movements")
+def export_stock_movements(
+    format: str = FORMAT_QUERY,
+    start_date: Optional[date] = Query(None, description="Data inicial (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Data final (YYYY-MM-DD)"),
+    product_id: Optional[int] = Query(None),
+    movement_type: Optional[MovementType] = Query(None),
+    export_service: ExportService = Depends(get_export_service),
+    _: UserResponse = Depends(require_streaming_supervisor),
+):
+    """Exportar movimentações de estoque (Supervisor+)"""
+    return _streaming_response(
+        export_service,
+        "stock-movements",
+        format,
+        start_date=start_date,
+        end_date=end_date,
+        product_id=product_id,
+        movement_type=movement_type,
+    )
+
+
+@router.get("/stock-report")
+def export_stock_report(
+    format: str = FORMAT_QUERY,
+    category_id: Optional[int] = Query(None),
+    export_service: ExportService = Depends(get_export_service),
+    _: UserResponse = Depends(require_streaming_supervisor),
+):
+    """Exportar posição de estoque (Supervisor+)"""
+    return _streaming_response(
+        export_service, "stock-report", format, category_id=category_id
+    )
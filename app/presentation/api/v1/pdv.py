@@ -7,6 +7,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
+from app.application.services.affinity_service import AffinityService
 from app.application.services.sale_service import SaleService
 from app.core.deps import get_current_user
 from app.infrastructure.database.connection import get_db
@@ -16,6 +17,7 @@ from app.presentation.schemas.sale import (
     CartOperation,
     PaymentRequest,
     PaymentResponse,
+    ProductRecommendation,
 )
 
 router = APIRouter(tags=["PDV - Ponto de Venda"])
@@ -54,6 +56,18 @@ async def get_current_cart(
     return sale_service.get_current_cart()
 
 
+@router.get("/recommendations", response_model=List[ProductRecommendation])
+async def get_cart_recommendations(
+    limit: int = Query(5, ge=1, le=20),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Produtos frequentemente comprados junto com os itens do carrinho"""
+    cart = SaleService(db, user_id=current_user.id).get_current_cart()
+    product_ids = [item.product_id for item in cart.items]
+    return AffinityService(db).get_recommendations(product_ids, limit)
+
+
 @router.post("/cart/update", response_model=Cart)
 async def update_cart(
     operation: CartOperation,
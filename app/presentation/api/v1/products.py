@@ -4,12 +4,13 @@ Endpoints de produtos
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.application.services.product_service import ProductService
 from app.infrastructure.database.connection import get_db
 from app.presentation.api.dependencies import get_current_active_user, require_admin
+from app.presentation.api.pagination import CursorQuery, set_next_cursor
 from app.presentation.schemas.auth import UserResponse
 from app.presentation.schemas.product import (
     BarcodeSearch,
@@ -152,27 +153,35 @@ async def create_product(
 
 @router.get("/", response_model=List[ProductSummary])
 async def list_products(
+    response: Response,
     skip: int = Query(0, ge=0, description="Pular registros"),
     limit: int = Query(100, ge=1, le=1000, description="Limite de registros"),
     active_only: bool = Query(True, description="Apenas produtos ativos"),
+    cursor: Optional[str] = CursorQuery,
     product_service: ProductService = Depends(get_product_service),
     _: UserResponse = Depends(get_current_active_user),
 ):
     """
-    Lista produtos (resumo)
+    Lista produtos (resumo), em ordem de id
     """
-    return product_service.list_products(
-        skip=skip, limit=limit, active_only=active_only
-    )
+    try:
+        products = product_service.list_products(
+            skip=skip, limit=limit, active_only=active_only, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return set_next_cursor(response, products)
 
 
 @router.get("/search", response_model=List[ProductSummary])
 async def search_products(
+    response: Response,
     q: Optional[str] = Query(None, description="Buscar por nome, código ou descrição"),
     category_id: Optional[int] = Query(None, description="Filtrar por categoria"),
     low_stock: bool = Query(False, description="Apenas produtos com estoque baixo"),
     skip: int = Query(0, ge=0, description="Pular registros"),
     limit: int = Query(100, ge=1, le=1000, description="Limite de registros"),
+    cursor: Optional[str] = CursorQuery,
     product_service: ProductService = Depends(get_product_service),
     _: UserResponse = Depends(get_current_active_user),
 ):
@@ -182,14 +191,20 @@ async def search_products(
     - **q**: Texto para buscar (nome, código, descrição)
     - **category_id**: Filtrar por categoria
     - **low_stock**: Apenas produtos com estoque baixo
+    - **cursor**: Próxima página (cabeçalho X-Next-Cursor da anterior)
     """
-    return product_service.search_products(
-        query=q,
-        category_id=category_id,
-        low_stock_only=low_stock,
-        skip=skip,
-        limit=limit,
-    )
+    try:
+        products = product_service.search_products(
+            query=q,
+            category_id=category_id,
+            low_stock_only=low_stock,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return set_next_cursor(response, products)
 
 
 @router.post("/barcode-search", response_model=ProductResponse)
@@ -0,0 +1,64 @@
+"""
+Endpoints de jobs de relatórios em segundo plano
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+
+from app.application.services.report_job_service import ReportJobService
+from app.presentation.api.dependencies import require_supervisor
+from app.presentation.schemas.auth import UserResponse
+from app.presentation.schemas.report_job import ReportJobCreate, ReportJobResponse
+
+router = APIRouter()
+
+
+def get_report_job_service() -> ReportJobService:
+    return ReportJobService()
+
+
+@router.post("", response_model=ReportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_report_job(
+    request: ReportJobCreate,
+    job_service: ReportJobService = Depends(get_report_job_service),
+    _: UserResponse = Depends(require_supervisor),
+):
+    """Enfileirar relatório pesado (Supervisor+)"""
+    try:
+        return job_service.submit(request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/{job_id}", response_model=ReportJobResponse)
+def get_report_job(
+    job_id: str,
+    job_service: ReportJobService = Depends(get_report_job_service),
+    _: UserResponse = Depends(require_supervisor),
+):
+    """Status e progresso de um job"""
+    job = job_service.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job não encontrado ou expirado",
+        )
+    return job
+
+
+@router.get("/{job_id}/download")
+def download_report_job(
+    job_id: str,
+    job_service: ReportJobService = Depends(get_report_job_service),
+    _: UserResponse = Depends(require_supervisor),
+):
+    """Baixar o resultado (JSON) de um job concluído"""
+    try:
+        path = job_service.result_path(job_id)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return FileResponse(
+        path, media_type="application/json", filename=f"report_{job_id}.json"
+    )
@@ -1,14 +1,30 @@
+from datetime import datetime
+from typing import Any, Optional
+
+import structlog
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.application.services.trending_service import TrendingService
 from app.core.deps import get_current_user, get_db
+from app.infrastructure.analytics.live_kpis import live_kpis
+from app.infrastructure.repositories.velocity_repository import VelocityRepository
 
-print("DEBUG: reports.py - Arquivo simplificado de relatórios carregado")
+logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
 
+def _isoformat(value: Any) -> Optional[str]:
+    """Datas do SQL direto: ``datetime`` no PostgreSQL, texto no SQLite"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.isoformat()
+
+
 @router.get("/dashboard")
 async def get_dashboard(
     db: Session = Depends(get_db), current_user=Depends(get_current_user)
@@ -16,58 +32,23 @@ async def get_dashboard(
     """
     Dashboard simplificado usando SQL direto
     """
-    print(
-        f"DEBUG: /dashboard - Iniciando para usuário {current_user.username if hasattr(current_user, 'username') else 'desconhecido'}"
-    )
-
     try:
-        # Total de vendas DE HOJE
-        print("DEBUG: Executando query - vendas de hoje")
-        print(
-            "DEBUG: Query: SELECT COUNT(*) FROM sales WHERE status = 'COMPLETED' AND DATE(created_at) = CURRENT_DATE"
-        )
-        today_sales_result = db.execute(
-            text(
-                "SELECT COUNT(*) FROM sales WHERE status = 'COMPLETED' AND DATE(created_at) = CURRENT_DATE"
-            )
-        )
-        today_sales = today_sales_result.scalar() or 0
-        print(f"DEBUG: Vendas de hoje RESULTADO: {today_sales}")
-
-        # Receita DE HOJE
-        print("DEBUG: Executando query - receita de hoje")
-        print(
-            "DEBUG: Query: SELECT COALESCE(SUM(final_amount), 0) FROM sales WHERE status = 'COMPLETED' AND DATE(created_at) = CURRENT_DATE"
-        )
-        today_revenue_result = db.execute(
-            text(
-                "SELECT COALESCE(SUM(final_amount), 0) FROM sales WHERE status = 'COMPLETED' AND DATE(created_at) = CURRENT_DATE"
-            )
-        )
-        today_revenue = float(today_revenue_result.scalar() or 0.0)
-        print(f"DEBUG: Receita de hoje RESULTADO: {today_revenue}")
+        # Vendas e receita DE HOJE (contadores por minuto em memória)
+        today_kpis = live_kpis.today_kpis()
+        today_sales = today_kpis["today_transactions"]
+        today_revenue = today_kpis["today_sales"]
 
         # Total de produtos
-        print("DEBUG: Executando query - total de produtos")
-        print("DEBUG: Query: SELECT COUNT(*) FROM products")
         total_products_result = db.execute(text("SELECT COUNT(*) FROM products"))
         total_products = total_products_result.scalar() or 0
-        print(f"DEBUG: Total de produtos RESULTADO: {total_products}")
 
         # Alertas de estoque baixo (produtos com quantidade < 10)
-        print("DEBUG: Executando query - alertas de estoque")
-        print("DEBUG: Query: SELECT COUNT(*) FROM products WHERE stock_quantity < 10")
         low_stock_result = db.execute(
             text("SELECT COUNT(*) FROM products WHERE stock_quantity < 10")
         )
         low_stock_alerts = low_stock_result.scalar() or 0
-        print(f"DEBUG: Alertas de estoque baixo RESULTADO: {low_stock_alerts}")
 
         # Vendas recentes DE HOJE (últimas 5)
-        print("DEBUG: Executando query - vendas recentes de hoje")
-        print(
-            "DEBUG: Query: SELECT id, final_amount, created_at FROM sales WHERE status = 'COMPLETED' AND DATE(created_at) = CURRENT_DATE ORDER BY created_at DESC LIMIT 5"
-        )
         recent_sales_result = db.execute(
             text(
                 """
@@ -85,50 +66,15 @@ async def get_dashboard(
                 {
                     "id": row[0],
                     "total": float(row[1]),
-                    "created_at": row[2].isoformat() if row[2] else None,
+                    "created_at": _isoformat(row[2]),
                 }
             )
-        print(f"DEBUG: Vendas recentes encontradas RESULTADO: {len(recent_sales)}")
-
-        # Produtos mais vendidos (TOP 5 de todos os tempos)
-        print("DEBUG: Executando query - top produtos mais vendidos")
-        top_products_result = db.execute(
-            text(
-                """
-                SELECT
-                    p.name,
-                    p.price,
-                    COALESCE(SUM(si.quantity), 0) as total_sold,
-                    COUNT(DISTINCT s.id) as times_sold
-                FROM products p
-                LEFT JOIN sale_items si ON p.id = si.product_id
-                LEFT JOIN sales s ON si.sale_id = s.id AND s.status = 'COMPLETED'
-                WHERE p.is_active = true
-                GROUP BY p.id, p.name, p.price
-                HAVING SUM(si.quantity) > 0
-                ORDER BY total_sold DESC, times_sold DESC
-                LIMIT 5
-            """
-            )
-        )
 
-        top_products = []
-        for row in top_products_result:
-            top_products.append(
-                {
-                    "name": row[0],
-                    "price": float(row[1]) if row[1] else 0.0,
-                    "quantity_sold": int(row[2]) if row[2] else 0,
-                    "times_sold": int(row[3]) if row[3] else 0,
-                }
-            )
-        print(f"DEBUG: Top produtos encontrados RESULTADO: {len(top_products)}")
+        # Produtos mais vendidos HOJE (contadores em memória, sem reagregar)
+        top_products = TrendingService(db).get_top_today(limit=5)
 
         # Se não houver vendas, mostrar produtos mais populares (maior estoque inicial)
         if len(top_products) == 0:
-            print(
-                "DEBUG: Nenhuma venda encontrada, buscando produtos populares por estoque"
-            )
             popular_products_result = db.execute(
                 text(
                     """
@@ -150,9 +96,6 @@ async def get_dashboard(
                         "times_sold": int(row[4]),
                     }
                 )
-            print(
-                f"DEBUG: Produtos populares por estoque RESULTADO: {len(top_products)}"
-            )
 
         dashboard_data = {
             "today_sales": today_revenue,  # 🔥 CORRIGIDO: VALOR em reais das vendas de hoje
@@ -172,14 +115,16 @@ async def get_dashboard(
             },
         }
 
-        print(f"DEBUG: /dashboard - Dados finais RESULTADO: {dashboard_data}")
+        logger.debug(
+            "dashboard_built",
+            recent_sales=len(recent_sales),
+            top_products=len(top_products),
+            low_stock_alerts=low_stock_alerts,
+        )
         return dashboard_data
 
-    except Exception as e:
-        print(f"DEBUG: /dashboard - Erro: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("dashboard_failed")
 
         return {
             "today_sales": 0.0,  # 🔥 CORRIGIDO: valor em reais, não quantidade
@@ -205,8 +150,6 @@ async def get_kpis(
     """
     KPIs usando SQL direto
     """
-    print("DEBUG: /kpis - Iniciando")
-
     try:
         total_sales_result = db.execute(
             text("SELECT COUNT(*) FROM sales WHERE status = 'COMPLETED'")
@@ -228,18 +171,21 @@ async def get_kpis(
         )
         low_stock_alerts = low_stock_result.scalar() or 0
 
+        today_kpis = live_kpis.today_kpis()
         kpis = {
             "total_sales": total_sales,
             "total_revenue": total_revenue,
             "total_products": total_products,
             "low_stock_alerts": low_stock_alerts,
+            "today_sales": today_kpis["today_transactions"],
+            "today_revenue": today_kpis["today_sales"],
+            "average_ticket": today_kpis["average_ticket"],
         }
 
-        print(f"DEBUG: /kpis - Retornando: {kpis}")
         return kpis
 
-    except Exception as e:
-        print(f"DEBUG: /kpis - Erro: {e}")
+    except Exception:
+        logger.exception("kpis_failed")
         return {
             "total_sales": 0,
             "total_revenue": 0.0,
@@ -255,8 +201,6 @@ async def get_sales_report(
     """
     Relatório de vendas simplificado
     """
-    print("DEBUG: /sales - Iniciando")
-
     try:
         sales_result = db.execute(
             text(
@@ -276,16 +220,15 @@ async def get_sales_report(
                 {
                     "id": row[0],
                     "total": float(row[1]),
-                    "created_at": row[2].isoformat() if row[2] else None,
+                    "created_at": _isoformat(row[2]),
                     "status": row[3],
                 }
             )
 
-        print(f"DEBUG: /sales - Encontradas {len(sales)} vendas")
         return {"sales": sales}
 
-    except Exception as e:
-        print(f"DEBUG: /sales - Erro: {e}")
+    except Exception:
+        logger.exception("sales_report_failed")
         return {"sales": []}
 
 
@@ -296,8 +239,6 @@ async def get_stock_alerts(
     """
     Alertas de estoque com detalhes dos produtos
     """
-    print("DEBUG: /stock-alerts - Iniciando")
-
     try:
         # 🔍 MELHORAR: Query mais detalhada com informações úteis
         alerts_result = db.execute(
@@ -313,11 +254,19 @@ async def get_stock_alerts(
                     WHEN stock_quantity <= 0 THEN 'CRÍTICO'
                     WHEN stock_quantity <= min_stock_level * 0.5 THEN 'URGENTE'
                     ELSE 'ATENÇÃO'
-                END as urgency_level
+                END as urgency_level,
+                id,
+                abc_class
             FROM products
             WHERE stock_quantity <= min_stock_level
             AND is_active = true
             ORDER BY
+                CASE abc_class
+                    WHEN 'A' THEN 1
+                    WHEN 'B' THEN 2
+                    WHEN 'C' THEN 3
+                    ELSE 4
+                END,
                 CASE
                     WHEN stock_quantity <= 0 THEN 1
                     WHEN stock_quantity <= min_stock_level * 0.5 THEN 2
@@ -328,9 +277,15 @@ async def get_stock_alerts(
             )
         )
 
+        rows = alerts_result.fetchall()
+        days_to_stockout = VelocityRepository(db).get_days_to_stockout_map(
+            [row[6] for row in rows], [float(row[1]) for row in rows]
+        )
+
         alerts = []
-        for row in alerts_result:
+        for row in rows:
             alert = {
+                "product_id": row[6],
                 "product_name": row[0],
                 "current_stock": float(row[1]),
                 "min_stock_level": float(row[2]),
@@ -339,11 +294,11 @@ async def get_stock_alerts(
                 "urgency_level": row[5],
                 "action_needed": f"Comprar {int(row[4])} unidades",
                 "estimated_cost": float(row[3]) * float(row[4]),
+                "days_to_stockout": days_to_stockout[row[6]],
+                "abc_class": row[7],
             }
             alerts.append(alert)
 
-        print(f"DEBUG: Encontrados {len(alerts)} alertas de estoque")
-
         # 📊 Estatísticas dos alertas
         total_alerts = len(alerts)
         critical_alerts = len([a for a in alerts if a["urgency_level"] == "CRÍTICO"])
@@ -361,7 +316,7 @@ async def get_stock_alerts(
         }
 
     except Exception as e:
-        print(f"DEBUG: Erro em /stock-alerts: {e}")
+        logger.exception("stock_alerts_failed")
         return {
             "alerts": [],
             "summary": {
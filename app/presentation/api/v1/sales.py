@@ -5,7 +5,7 @@ Endpoints de gestão de vendas
 from datetime import date
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.application.services.sale_service import SaleService
@@ -14,6 +14,7 @@ from app.presentation.api.dependencies import (
     get_current_active_user,
     require_supervisor,
 )
+from app.presentation.api.pagination import CursorQuery, set_next_cursor
 from app.presentation.schemas.auth import UserResponse
 from app.presentation.schemas.sale import SaleResponse, SaleSummary
 
@@ -26,23 +27,30 @@ def get_sale_service(db: Session = Depends(get_db)) -> SaleService:
 
 @router.get("/", response_model=List[SaleSummary])
 async def list_sales(
+    response: Response,
     start_date: Optional[date] = Query(None, description="Data inicial (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="Data final (YYYY-MM-DD)"),
     user_id: Optional[int] = Query(None, description="ID do usuário/operador"),
     status: Optional[str] = Query(None, description="Status da venda"),
     skip: int = Query(0, ge=0, description="Pular registros"),
     limit: int = Query(100, ge=1, le=1000, description="Limite de registros"),
+    cursor: Optional[str] = CursorQuery,
     sale_service: SaleService = Depends(get_sale_service),
     _: UserResponse = Depends(get_current_active_user),
 ):
-    return sale_service.list_sales(
-        start_date=start_date,
-        end_date=end_date,
-        user_id=user_id,
-        status=status,
-        skip=skip,
-        limit=limit,
-    )
+    try:
+        sales = sale_service.list_sales(
+            start_date=start_date,
+            end_date=end_date,
+            user_id=user_id,
+            status=status,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return set_next_cursor(response, sales)
 
 
 @router.get("/{sale_id}", response_model=SaleResponse)
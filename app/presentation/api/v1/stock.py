@@ -1,14 +1,20 @@
 from datetime import date, datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
+from app.application.services.forecast_service import ForecastService
+from app.application.services.reorder_service import ReorderService
 from app.application.services.stock_service import StockService
 from app.core.deps import get_current_user, get_db
 from app.infrastructure.database.models.stock import MovementType
 from app.infrastructure.database.models.user import User
+from app.presentation.api.pagination import CursorQuery, set_next_cursor
 from app.presentation.schemas.stock import (
+    DraftOrdersResponse,
+    ProductForecastResponse,
+    ReorderSuggestionResponse,
     StockAdjustmentCreate,
     StockAlertResponse,
     StockEntryCreate,
@@ -51,16 +57,18 @@ def create_stock_movement(
 
 @router.get("/movements", response_model=List[StockMovementResponse])
 def get_stock_movements(
+    response: Response,
     product_id: Optional[int] = Query(None),
     movement_type: Optional[MovementType] = Query(None),
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = CursorQuery,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Listar movimentações de estoque"""
+    """Listar movimentações de estoque (mais recentes primeiro)"""
     stock_service = StockService(db)
 
     start_datetime = (
@@ -68,14 +76,19 @@ def get_stock_movements(
     )
     end_datetime = datetime.combine(end_date, datetime.max.time()) if end_date else None
 
-    return stock_service.get_stock_movements(
-        product_id=product_id,
-        movement_type=movement_type,
-        start_date=start_datetime,
-        end_date=end_datetime,
-        skip=skip,
-        limit=limit,
-    )
+    try:
+        movements = stock_service.get_stock_movements(
+            product_id=product_id,
+            movement_type=movement_type,
+            start_date=start_datetime,
+            end_date=end_datetime,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return set_next_cursor(response, movements)
 
 
 # ==================== ENTRADA DE ESTOQUE ====================
@@ -142,6 +155,35 @@ def get_stock_alerts(
     return stock_service.get_low_stock_alerts()
 
 
+# ==================== REPOSIÇÃO AUTOMÁTICA ====================
+
+
+@router.get("/reorder/suggestions", response_model=List[ReorderSuggestionResponse])
+def get_reorder_suggestions(
+    supplier_id: Optional[int] = Query(None, gt=0),
+    limit: Optional[int] = Query(None, ge=1, le=50000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Sugestões de compra para todo o catálogo (mais urgentes primeiro)"""
+    reorder_service = ReorderService(db)
+    suggestions = reorder_service.compute_suggestions(supplier_id=supplier_id)
+    return suggestions[:limit] if limit else suggestions
+
+
+@router.post("/reorder/draft-orders", response_model=DraftOrdersResponse)
+def create_reorder_draft_orders(
+    supplier_id: Optional[int] = Query(None, gt=0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Gerar pedidos de compra em rascunho (um por fornecedor)"""
+    reorder_service = ReorderService(db)
+    return reorder_service.create_draft_orders(
+        user_id=current_user.id, supplier_id=supplier_id
+    )
+
+
 # ==================== RELATÓRIOS DE ESTOQUE ====================
 
 
@@ -207,25 +249,45 @@ def get_products_low_stock(
 @router.get("/products/{product_id}/movements")
 def get_product_movements(
     product_id: int,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = CursorQuery,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Histórico de movimentações de um produto específico"""
     stock_service = StockService(db)
 
-    movements = stock_service.get_stock_movements(
-        product_id=product_id, skip=skip, limit=limit
-    )
+    try:
+        movements = stock_service.get_stock_movements(
+            product_id=product_id, skip=skip, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor(response, movements)
 
     return {
         "product_id": product_id,
         "movements": movements,
         "total_movements": len(movements),
+        "next_cursor": movements.next_cursor,
     }
 
 
+@router.get(
+    "/products/{product_id}/forecast", response_model=List[ProductForecastResponse]
+)
+def get_product_forecast(
+    product_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Previsão diária de demanda do produto (gerada pelo job noturno)"""
+    forecast_service = ForecastService(db)
+    return forecast_service.get_product_forecast(product_id)
+
+
 # ==================== DASHBOARD DE ESTOQUE ====================
 
 
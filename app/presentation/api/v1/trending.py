@@ -0,0 +1,29 @@
+"""
+Endpoints de produtos em alta (tempo real)
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.application.services.trending_service import TrendingService
+from app.core.deps import get_db
+from app.presentation.api.dependencies import get_current_active_user
+from app.presentation.schemas.auth import UserResponse
+from app.presentation.schemas.report import TrendingResponse
+
+router = APIRouter()
+
+
+def get_trending_service(db: Session = Depends(get_db)) -> TrendingService:
+    return TrendingService(db)
+
+
+@router.get("", response_model=TrendingResponse)
+def get_trending_products(
+    window: str = Query("1h", pattern="^(15m|1h|today)$"),
+    limit: int = Query(10, ge=1, le=100),
+    trending_service: TrendingService = Depends(get_trending_service),
+    _: UserResponse = Depends(get_current_active_user),
+):
+    """O que está vendendo agora (atualizado a cada venda)"""
+    return trending_service.get_trending(window, limit)
@@ -0,0 +1,120 @@
+"""
+Schemas de diagnóstico (administração)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class RequestProfile(BaseModel):
+    """Perfil de uma requisição (pilhas em formato folded)"""
+
+    id: str
+    method: str
+    path: str
+    route: Optional[str] = None
+    status_code: int
+    duration_ms: float
+    samples: int
+    interval_ms: int
+    username: str
+    created_at: datetime
+    download_url: str
+
+
+class MemorySnapshotInfo(BaseModel):
+    id: int
+    taken_at: datetime
+
+
+class MemoryStatus(BaseModel):
+    """tracemalloc e estruturas em memória de um worker"""
+
+    pid: int
+    rss_bytes: Optional[int] = None
+    tracing: bool
+    traceback_frames: Optional[int] = None
+    traced_bytes: int
+    traced_peak_bytes: int
+    tracemalloc_overhead_bytes: int
+    snapshots: List[MemorySnapshotInfo]
+    structures: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+class MemoryStat(BaseModel):
+    """Alocações vivas agrupadas por arquivo:linha (ou traceback)"""
+
+    location: str
+    size_bytes: int
+    count: int
+    size_diff_bytes: Optional[int] = None
+    count_diff: Optional[int] = None
+
+
+class MemorySnapshotResponse(BaseModel):
+    id: int
+    taken_at: datetime
+    traced_bytes: int
+    group_by: str
+    top: List[MemoryStat]
+
+
+class MemoryDiffResponse(BaseModel):
+    """Crescimento entre dois snapshots (maior crescimento primeiro)"""
+
+    base_id: int
+    target_id: int
+    group_by: str
+    size_diff_bytes: int
+    top: List[MemoryStat]
+
+
+class TraceSummary(BaseModel):
+    """Trace de uma requisição (sem os spans)"""
+
+    trace_id: str
+    name: str
+    started_at_ns: int
+    duration_ms: float
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    span_count: int
+    dropped_spans: int
+
+
+class TraceSpan(BaseModel):
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    name: str
+    kind: str
+    start_ns: int
+    end_ns: int
+    duration_ms: float
+    attributes: Dict[str, Any]
+    error: Optional[str] = None
+
+
+class TraceDetail(TraceSummary):
+    spans: List[TraceSpan]
+
+
+class SlowQuery(BaseModel):
+    """Consultas lentas com a mesma impressão digital"""
+
+    id: str
+    fingerprint: str
+    count: int
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+    last_ms: float
+    first_seen: datetime
+    last_seen: datetime
+    statement: str
+    parameters: Optional[Any] = None
+    caller: List[str]
+    plan: Optional[List[str]] = None
+    plan_error: Optional[str] = None
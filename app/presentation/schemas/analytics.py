@@ -0,0 +1,51 @@
+"""
+Schemas para análises ad-hoc de vendas
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.infrastructure.database.models.sale import PaymentMethod, SaleStatus
+
+
+class AnalyticsFilters(BaseModel):
+    """Filtros, agrupamentos e métricas da consulta analítica"""
+
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    category_ids: List[int] = []
+    product_ids: List[int] = []
+    cashier_ids: List[int] = []
+    payment_methods: List[PaymentMethod] = []
+    statuses: List[SaleStatus] = [SaleStatus.COMPLETED]
+    group_by: List[str] = ["day"]
+    metrics: List[str] = ["revenue", "quantity", "transactions"]
+    order_by: Optional[str] = None
+    descending: bool = True
+    limit: Optional[int] = Field(None, ge=1, le=10000)
+
+
+class AnalyticsStoreStats(BaseModel):
+    """Estado do armazenamento em memória"""
+
+    items: int
+    capacity: int
+    memory_bytes: int
+    last_item_id: int
+    last_sale_id: int
+    products: int
+    seconds_since_refresh: Optional[float] = None
+
+
+class AnalyticsResponse(BaseModel):
+    """Resultado da consulta analítica"""
+
+    group_by: List[str]
+    metrics: List[str]
+    rows: List[Dict[str, Any]]
+    total_rows: int
+    elapsed_ms: float
+    generated_at: datetime
+    store: AnalyticsStoreStats
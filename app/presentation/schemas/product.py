@@ -156,6 +156,7 @@ class ProductResponse(ProductBase):
     profit_margin: Optional[float] = Field(None, description="Margem de lucro (%)")
     stock_status: str = Field("", description="Status do estoque")
     has_promotion: bool = Field(False, description="Tem promoção ativa")
+    abc_class: Optional[str] = Field(None, description="Classe ABC por receita")
 
     class Config:
         from_attributes = True
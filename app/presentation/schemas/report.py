@@ -1,7 +1,7 @@
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class DashboardKPIs(BaseModel):
@@ -51,6 +51,7 @@ class StockAlert(BaseModel):
     min_stock: float
     stock_status: str  # "critical", "low", "ok"
     days_to_stockout: Optional[int]
+    abc_class: Optional[str] = None
 
 
 class SalesGoal(BaseModel):
@@ -129,3 +130,102 @@ class SalesReportResponse(BaseModel):
     data_points: List[DailySales]
     top_products: List[TopProduct]
     category_breakdown: List[CategoryPerformance]
+
+
+class AbcItem(BaseModel):
+    """Produto na curva ABC"""
+
+    product_id: int
+    product_name: str
+    revenue: float
+    margin: float
+    revenue_share: float
+    abc_class: str
+    abc_margin_class: str
+
+
+class AbcClassSummary(BaseModel):
+    """Totais de uma classe ABC"""
+
+    products: int
+    revenue: float
+    revenue_share: float
+
+
+class AbcAnalysisResponse(BaseModel):
+    """Curva ABC do período"""
+
+    period_start: datetime
+    period_end: datetime
+    window_days: int
+    thresholds: Dict[str, float]
+    summary: Dict[str, AbcClassSummary]
+    items: List[AbcItem]
+
+
+class AbcRefreshResponse(BaseModel):
+    """Resultado da atualização da classificação gravada"""
+
+    window_days: int
+    products_evaluated: int
+    products_updated: int
+    distribution: Dict[str, int]
+    refreshed_at: datetime
+
+
+class AbcRunRequest(BaseModel):
+    """Parâmetros da reclassificação ABC"""
+
+    days: Optional[int] = Field(None, ge=1, le=730)
+
+
+class AffinityRunRequest(BaseModel):
+    """Parâmetros da mineração de pares comprados juntos"""
+
+    window_days: Optional[int] = Field(None, ge=1, le=730)
+    shards: Optional[int] = Field(None, ge=1, le=64)
+
+
+class AffinityRunResponse(BaseModel):
+    """Resultado da mineração de pares"""
+
+    window_days: int
+    baskets: int
+    frequent_products: int
+    pairs_counted: int
+    rows: int
+    shards: int
+    count_error_bound: int
+    elapsed_seconds: float
+
+
+class ProductPairAffinity(BaseModel):
+    """Par de produtos comprados juntos"""
+
+    product_id: int
+    product_name: str
+    related_product_id: int
+    related_product_name: str
+    pair_count: int
+    support: float
+    confidence: float
+    lift: float
+
+
+class TrendingProduct(BaseModel):
+    """Produto em alta na janela"""
+
+    product_id: int
+    product_name: str
+    price: float
+    quantity: float
+    max_error: float  # Superestimativa máxima da quantidade (Space-Saving)
+    times_sold: int
+
+
+class TrendingResponse(BaseModel):
+    """Produtos em alta (15m, 1h ou today)"""
+
+    window: str
+    generated_at: datetime
+    items: List[TrendingProduct]
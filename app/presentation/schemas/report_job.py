@@ -0,0 +1,34 @@
+"""
+Schemas para jobs de relatórios em segundo plano
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+
+class ReportJobCreate(BaseModel):
+    """Solicitação de um job de relatório"""
+
+    # sales_report, stock_report, demand_forecast, abc_classification,
+    # basket_affinity
+    job_type: str
+    params: Dict[str, Any] = {}
+
+
+class ReportJobResponse(BaseModel):
+    """Status de um job de relatório"""
+
+    id: str
+    job_type: str
+    params: Dict[str, Any]
+    status: str  # "queued", "running", "completed", "failed"
+    progress: float
+    message: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    expires_at: datetime
+    download_url: Optional[str] = None
@@ -138,3 +138,15 @@ class PaymentResponse(BaseModel):
     change_amount: float
     payment_method: PaymentMethod
     receipt_data: dict
+
+
+class ProductRecommendation(BaseModel):
+    """Sugestão de produto comprado junto com o carrinho"""
+
+    product_id: int
+    product_name: str
+    barcode: str
+    price: float
+    confidence: float
+    lift: float
+    pair_count: int
@@ -2,7 +2,7 @@
 Schemas para sistema de estoque
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 from typing import List, Optional
@@ -154,7 +154,7 @@ class PurchaseOrderCreate(PurchaseOrderBase):
 
 class PurchaseOrderUpdate(BaseModel):
     status: Optional[str] = Field(
-        None, pattern="^(pending|confirmed|delivered|cancelled)$"
+        None, pattern="^(draft|pending|confirmed|delivered|cancelled)$"
     )
     notes: Optional[str] = None
     expected_delivery: Optional[datetime] = None
@@ -221,6 +221,56 @@ class StockAlertResponse(BaseModel):
     reorder_point: Optional[int] = None
     alert_level: AlertLevelEnum
     days_without_stock: Optional[int] = None
+    abc_class: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+# =================== REORDER SCHEMAS ===================
+class ReorderSuggestionResponse(BaseModel):
+    product_id: int
+    product_name: Optional[str] = None
+    supplier_id: int
+    current_stock: float
+    open_order_quantity: float
+    reorder_point: float
+    target_stock: float
+    daily_velocity: float
+    days_of_coverage: Optional[float] = None
+    quantity_to_order: int
+    unit_cost: float
+    estimated_cost: float
+
+
+class DraftOrderSummary(BaseModel):
+    id: int
+    order_number: str
+    supplier_id: int
+    items: int
+    total_amount: float
+
+
+class DraftOrdersResponse(BaseModel):
+    orders_created: int
+    items_created: int
+    total_amount: float
+    orders: List[DraftOrderSummary]
+
+
+# =================== FORECAST SCHEMAS ===================
+class ForecastRunRequest(BaseModel):
+    horizon_days: Optional[int] = Field(None, ge=1, le=90)
+    history_days: Optional[int] = Field(None, ge=28, le=1095)
+
+
+class ProductForecastResponse(BaseModel):
+    forecast_date: date
+    predicted_quantity: float
+    lower_bound: float
+    upper_bound: float
+    model: str
+    generated_at: datetime
 
     class Config:
         from_attributes = True
@@ -0,0 +1,3 @@
+"""
+Benchmarks dos caminhos críticos com baseline e limites de regressão
+"""
@@ -0,0 +1,171 @@
+"""
+Casos de benchmark dos caminhos críticos (via API, como o PDV e o painel)
+"""
+
+import random
+from datetime import timedelta
+from typing import Dict, List
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models.product import Product
+from app.infrastructure.database.models.sale import Sale
+
+from .harness import Case
+
+API = "/api/v1"
+
+
+def _check(response, expected: int = 200):
+    """Benchmark de resposta com erro não vale: interrompe a execução"""
+    if response.status_code != expected:
+        raise RuntimeError(
+            f"{response.request.method} {response.request.url.path}: "
+            f"{response.status_code} {response.text[:200]}"
+        )
+    return response
+
+
+def build_cases(
+    client: TestClient,
+    db: Session,
+    username: str,
+    password: str,
+    seed: int,
+    days: int,
+) -> List[Case]:
+    rng = random.Random(seed)
+    token = _check(
+        client.post(
+            f"{API}/auth/login", json={"username": username, "password": password}
+        )
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Produtos por unidade com estoque folgado (pagamentos baixam o estoque)
+    products = db.execute(
+        select(Product.id, Product.barcode)
+        .where(Product.requires_weighing.is_(False), Product.stock_quantity >= 500)
+        .order_by(Product.id)
+        .limit(500)
+    ).all()
+    if not products:
+        raise RuntimeError("Dataset sem produtos com estoque para o PDV")
+    barcodes = [row.barcode for row in products]
+    cart_product: Dict[str, int] = {}
+
+    def clear_cart():
+        _check(
+            client.post(
+                f"{API}/pdv/cart/update", json={"operation": "clear"}, headers=headers
+            )
+        )
+
+    def scan(barcode: str):
+        return _check(
+            client.post(
+                f"{API}/pdv/add-product",
+                json={"barcode": barcode, "quantity": 1},
+                headers=headers,
+            )
+        )
+
+    def barcode_scan():
+        scan(rng.choice(barcodes))
+
+    def barcode_setup():
+        # Carrinho de tamanho realista: esvazia a cada ~20 leituras
+        if rng.random() < 0.05:
+            clear_cart()
+
+    def cart_setup():
+        if "id" not in cart_product:
+            clear_cart()
+            index = rng.randrange(len(products))
+            scan(products[index].barcode)
+            cart_product["id"] = products[index].id
+
+    def cart_update():
+        _check(
+            client.post(
+                f"{API}/pdv/cart/update",
+                json={
+                    "operation": "update",
+                    "product_id": cart_product["id"],
+                    "quantity": rng.randint(1, 5),
+                },
+                headers=headers,
+            )
+        )
+
+    def payment_setup():
+        cart_product.clear()
+        clear_cart()
+        for barcode in rng.sample(barcodes, 3):
+            scan(barcode)
+
+    def payment():
+        _check(
+            client.post(
+                f"{API}/pdv/payment",
+                json={"payment_method": "pix", "amount_received": 100000},
+                headers=headers,
+            )
+        )
+
+    # Janelas a partir do fim do dataset, não do relógio
+    last_day = db.execute(select(func.max(Sale.created_at))).scalar_one().date()
+
+    def sales_listing():
+        start = last_day - timedelta(days=rng.randrange(max(days - 7, 1)))
+        _check(
+            client.get(
+                f"{API}/sales/",
+                params={
+                    "start_date": start.isoformat(),
+                    "end_date": (start + timedelta(days=7)).isoformat(),
+                    "limit": 100,
+                },
+                headers=headers,
+            )
+        )
+
+    def dashboard():
+        data = _check(client.get(f"{API}/reports/dashboard", headers=headers)).json()
+        # Em erro o endpoint responde 200 com zeros: isso não é o painel
+        if not data["products_sold"]:
+            raise RuntimeError("/reports/dashboard respondeu o fallback de erro")
+
+    def stock_report():
+        _check(client.get(f"{API}/stock/report", headers=headers))
+
+    search_terms = ["Integral", "Premium", "Produto 1", "Light", "Zero", "2000"]
+
+    def product_search():
+        _check(
+            client.get(
+                f"{API}/products/search",
+                params={"q": rng.choice(search_terms), "limit": 50},
+                headers=headers,
+            )
+        )
+
+    def login():
+        _check(
+            client.post(
+                f"{API}/auth/login", json={"username": username, "password": password}
+            )
+        )
+
+    return [
+        Case("barcode_scan", barcode_scan, barcode_setup, "Leitura no PDV"),
+        Case("cart_update", cart_update, cart_setup, "Alterar quantidade"),
+        Case("payment", payment, payment_setup, "Checkout de 3 itens"),
+        Case("sales_listing", sales_listing, description="Vendas de uma semana"),
+        Case("dashboard", dashboard, description="Painel de relatórios"),
+        Case("stock_report", stock_report, description="Relatório de estoque"),
+        Case("product_search", product_search, description="Busca por texto"),
+        Case("login", login, description="Login (bcrypt)"),
+    ]
@@ -0,0 +1,114 @@
+"""
+Medição dos benchmarks: latência por operação e consultas SQL
+
+Cada caso roda ``warmup`` vezes sem medir e depois ``iterations`` vezes;
+``setup`` (opcional) prepara cada iteração fora do tempo medido. O número de
+consultas vem de um listener ``before_cursor_execute`` no engine da
+aplicação, que conta tudo que for executado durante a chamada.
+"""
+
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """Conta os comandos SQL executados no engine"""
+
+    def __init__(self, engine: Engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+class Case:
+    """Um benchmark: operação medida e preparo opcional de cada iteração"""
+
+    def __init__(
+        self,
+        name: str,
+        operation: Callable[[], Any],
+        setup: Optional[Callable[[], Any]] = None,
+        description: str = "",
+    ):
+        self.name = name
+        self.operation = operation
+        self.setup = setup
+        self.description = description
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    position = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[position]
+
+
+def run_case(
+    case: Case, counter: QueryCounter, iterations: int, warmup: int
+) -> Dict[str, Any]:
+    """Distribuição de latência (ms) e consultas por operação"""
+    for _ in range(warmup):
+        if case.setup:
+            case.setup()
+        case.operation()
+
+    latencies: List[float] = []
+    queries: List[int] = []
+    for _ in range(iterations):
+        if case.setup:
+            case.setup()
+        before = counter.count
+        started = time.perf_counter()
+        case.operation()
+        latencies.append((time.perf_counter() - started) * 1000)
+        queries.append(counter.count - before)
+
+    return {
+        "iterations": iterations,
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "min_ms": round(min(latencies), 3),
+        "p50_ms": round(percentile(latencies, 0.5), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(max(latencies), 3),
+        "queries": statistics.median_low(queries),
+        "max_queries": max(queries),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baselines: Dict[str, Dict[str, Any]],
+    tolerance: float,
+    query_tolerance: int,
+) -> List[str]:
+    """
+    Regressões em relação à baseline
+
+    Latência: p50 e p95 acima de ``baseline * (1 + tolerance)``. Consultas:
+    mediana acima de ``baseline + query_tolerance`` (o número de consultas
+    não depende da máquina, então a tolerância padrão é zero).
+    """
+    failures = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            limit = baseline[metric] * (1 + tolerance)
+            if result[metric] > limit:
+                failures.append(
+                    f"{name}: {metric} {result[metric]:.2f} > {limit:.2f} "
+                    f"(baseline {baseline[metric]:.2f})"
+                )
+        if result["queries"] > baseline["queries"] + query_tolerance:
+            failures.append(
+                f"{name}: {result['queries']} consultas por operação "
+                f"(baseline {baseline['queries']})"
+            )
+    return failures
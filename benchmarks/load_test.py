@@ -0,0 +1,495 @@
+"""
+Teste de carga com vários caixas e usuários de retaguarda simultâneos
+
+Cada caixa (lane) faz login, passa cestas no PDV, paga e, às vezes, tem a
+venda cancelada por um supervisor; os usuários de retaguarda alternam
+painel, relatórios e estoque. Tudo com ``httpx.AsyncClient`` em um único
+event loop.
+
+Uso:
+    # Sobe a aplicação localmente (uvicorn) sobre o dataset dos benchmarks
+    python -m benchmarks.load_test --cashiers 1,2,4,8,16 --backoffice 2
+
+    # Contra uma instância já em execução
+    python -m benchmarks.load_test --base-url http://localhost:8000 \\
+        --cashier-users caixa1,caixa2 --supervisor-user supervisor31
+
+``--cashiers`` aceita uma lista: cada valor é um estágio de ``--duration``
+segundos, e o resumo final mostra em que número de caixas a latência do
+checkout degrada. Esperas por bloqueio do banco vêm de
+``db_lock_errors_total`` (``/metrics``) e, no PostgreSQL com
+``--database-url``, de amostras de ``pg_locks`` não concedidos.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks.harness import percentile
+from benchmarks.run import END_DATE, configure_environment, prepare_database
+
+API = "/api/v1"
+CHECKOUT = "POST /pdv/payment"
+BACKOFFICE_REQUESTS = [
+    ("GET /reports/dashboard", "/reports/dashboard", None),
+    ("GET /stock/dashboard", "/stock/dashboard", None),
+    ("GET /stock/report", "/stock/report", None),
+    ("GET /reports/kpis", "/reports/kpis", None),
+    ("GET /sales/", "/sales/", {"limit": 100}),
+]
+
+
+class EndpointStats:
+    """Latências e erros por endpoint (rota, não URL)"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, endpoint: str, elapsed: float, ok: bool) -> None:
+        self.latencies.setdefault(endpoint, []).append(elapsed * 1000)
+        if not ok:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def summary(self, duration: float) -> Dict[str, Dict[str, float]]:
+        result = {}
+        for endpoint, samples in sorted(self.latencies.items()):
+            errors = self.errors.get(endpoint, 0)
+            result[endpoint] = {
+                "requests": len(samples),
+                "throughput_rps": round(len(samples) / duration, 2),
+                "error_rate": round(errors / len(samples), 4),
+                "p50_ms": round(percentile(samples, 0.5), 2),
+                "p95_ms": round(percentile(samples, 0.95), 2),
+                "p99_ms": round(percentile(samples, 0.99), 2),
+            }
+        return result
+
+
+class LoadTest:
+    """Um estágio: N caixas e M usuários de retaguarda por ``duration``"""
+
+    def __init__(
+        self,
+        args: argparse.Namespace,
+        cashier_users: List[str],
+        supervisor_user: Optional[str],
+        barcodes: List[str],
+    ):
+        self.args = args
+        self.cashier_users = cashier_users
+        self.supervisor_user = supervisor_user
+        self.barcodes = barcodes
+        self.stats = EndpointStats()
+        self.sales = 0
+        self.cancelled = 0
+        self._supervisor_headers: Optional[dict] = None
+
+    async def _request(
+        self, client: httpx.AsyncClient, endpoint: str, method: str, path: str, **kw
+    ) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, f"{API}{path}", **kw)
+        except httpx.HTTPError:
+            self.stats.record(endpoint, time.perf_counter() - started, False)
+            return None
+        self.stats.record(
+            endpoint, time.perf_counter() - started, response.status_code < 400
+        )
+        return response
+
+    async def _login(self, client: httpx.AsyncClient, username: str) -> dict:
+        response = await self._request(
+            client,
+            "POST /auth/login",
+            "POST",
+            "/auth/login",
+            json={"username": username, "password": self.args.password},
+        )
+        if response is None or response.status_code != 200:
+            raise RuntimeError(f"Login de {username} falhou")
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    async def _think(self, rng: random.Random, mean: float) -> None:
+        if mean > 0:
+            await asyncio.sleep(rng.expovariate(1 / mean))
+
+    async def cashier(self, client: httpx.AsyncClient, lane: int, stop_at: float):
+        rng = random.Random(self.args.seed * 1000 + lane)
+        username = self.cashier_users[lane % len(self.cashier_users)]
+        headers = await self._login(client, username)
+        await self._request(
+            client,
+            "POST /pdv/cart/update",
+            "POST",
+            "/pdv/cart/update",
+            json={"operation": "clear"},
+            headers=headers,
+        )
+        while time.monotonic() < stop_at:
+            for _ in range(min(int(rng.expovariate(1 / self.args.basket)) + 1, 40)):
+                await self._request(
+                    client,
+                    "POST /pdv/add-product",
+                    "POST",
+                    "/pdv/add-product",
+                    json={"barcode": rng.choice(self.barcodes), "quantity": 1},
+                    headers=headers,
+                )
+                await self._think(rng, self.args.scan_think)
+            response = await self._request(
+                client,
+                CHECKOUT,
+                "POST",
+                "/pdv/payment",
+                json={"payment_method": "pix", "amount_received": 100000},
+                headers=headers,
+            )
+            if response is not None and response.status_code == 200:
+                self.sales += 1
+                if self.supervisor_user and rng.random() < self.args.cancel_rate:
+                    await self._cancel(client, response.json()["sale_id"])
+            else:
+                # Venda não fechou: começa a próxima cesta do zero
+                await self._request(
+                    client,
+                    "POST /pdv/cart/update",
+                    "POST",
+                    "/pdv/cart/update",
+                    json={"operation": "clear"},
+                    headers=headers,
+                )
+            await self._think(rng, self.args.customer_think)
+
+    async def _cancel(self, client: httpx.AsyncClient, sale_id: int) -> None:
+        if self._supervisor_headers is None:
+            self._supervisor_headers = await self._login(client, self.supervisor_user)
+        response = await self._request(
+            client,
+            "POST /sales/{id}/cancel",
+            "POST",
+            f"/sales/{sale_id}/cancel",
+            headers=self._supervisor_headers,
+        )
+        if response is not None and response.status_code == 200:
+            self.cancelled += 1
+
+    async def backoffice(self, client: httpx.AsyncClient, user: int, stop_at: float):
+        rng = random.Random(self.args.seed * 1000 + 500 + user)
+        username = (
+            self.supervisor_user or self.cashier_users[user % len(self.cashier_users)]
+        )
+        headers = await self._login(client, username)
+        while time.monotonic() < stop_at:
+            endpoint, path, params = rng.choice(BACKOFFICE_REQUESTS)
+            await self._request(
+                client, endpoint, "GET", path, params=params, headers=headers
+            )
+            await self._think(rng, self.args.report_think)
+
+    async def run(self, cashiers: int) -> Dict:
+        args = self.args
+        lock_errors = await _lock_errors(args.base_url)
+        limits = httpx.Limits(max_connections=cashiers + args.backoffice + 5)
+        async with httpx.AsyncClient(
+            base_url=args.base_url, timeout=args.timeout, limits=limits
+        ) as client:
+            started = time.monotonic()
+            stop_at = started + args.duration
+            sampler = asyncio.create_task(_sample_pg_locks(args.database_url, stop_at))
+            await asyncio.gather(
+                *(self.cashier(client, lane, stop_at) for lane in range(cashiers)),
+                *(
+                    self.backoffice(client, user, stop_at)
+                    for user in range(args.backoffice)
+                ),
+            )
+            duration = time.monotonic() - started
+            pg_locks = await sampler
+
+        endpoints = self.stats.summary(duration)
+        requests = sum(item["requests"] for item in endpoints.values())
+        errors = sum(self.stats.errors.values())
+        return {
+            "cashiers": cashiers,
+            "backoffice": args.backoffice,
+            "duration_seconds": round(duration, 1),
+            "requests": requests,
+            "throughput_rps": round(requests / duration, 2),
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "sales": self.sales,
+            "sales_per_minute": round(self.sales * 60 / duration, 1),
+            "cancelled": self.cancelled,
+            "db_lock_errors": await _lock_errors(args.base_url) - lock_errors,
+            "pg_lock_waits": pg_locks,
+            "endpoints": endpoints,
+        }
+
+
+async def _lock_errors(base_url: str) -> float:
+    """Total de db_lock_errors_total no /metrics (0 se indisponível)"""
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=10) as client:
+            response = await client.get("/metrics")
+    except httpx.HTTPError:
+        return 0.0
+    total = 0.0
+    for line in response.text.splitlines():
+        if line.startswith("db_lock_errors_total"):
+            total += float(line.rsplit(" ", 1)[1])
+    return total
+
+
+async def _sample_pg_locks(database_url: Optional[str], stop_at: float):
+    """Backends esperando bloqueio (pg_locks não concedidos), a cada 0,5 s"""
+    if not database_url or not database_url.startswith("postgresql"):
+        return None
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(database_url, pool_size=1)
+
+    def sample() -> int:
+        with engine.connect() as conn:
+            return conn.execute(
+                text("SELECT count(*) FROM pg_locks WHERE NOT granted")
+            ).scalar()
+
+    samples = []
+    try:
+        while time.monotonic() < stop_at:
+            samples.append(await asyncio.to_thread(sample))
+            await asyncio.sleep(0.5)
+    finally:
+        engine.dispose()
+    return {
+        "samples": len(samples),
+        "max_waiting": max(samples, default=0),
+        "mean_waiting": round(sum(samples) / len(samples), 2) if samples else 0.0,
+    }
+
+
+async def _fetch_barcodes(args: argparse.Namespace, username: str) -> List[str]:
+    """Até 200 produtos por unidade com estoque para toda a carga"""
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60) as client:
+        token = (
+            await client.post(
+                f"{API}/auth/login",
+                json={"username": username, "password": args.password},
+            )
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        response = await client.get(
+            f"{API}/products/", params={"limit": 1000}, headers=headers
+        )
+        candidates = [
+            product["id"]
+            for product in response.json()
+            if product["stock_quantity"] >= 100
+        ][:200]
+        # O resumo não diz se o produto é pesado; o detalhe diz
+        details = await asyncio.gather(
+            *(
+                client.get(f"{API}/products/{product_id}", headers=headers)
+                for product_id in candidates
+            )
+        )
+    return [
+        detail.json()["barcode"]
+        for detail in details
+        if detail.status_code == 200 and not detail.json()["requires_weighing"]
+    ]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_app(args: argparse.Namespace, work_dir: Path) -> subprocess.Popen:
+    """uvicorn local sobre uma cópia do dataset dos benchmarks"""
+    database = work_dir / "load_test.db"
+    configure_environment(work_dir, database)
+    prepare_database(args, database)
+
+    port = _free_port()
+    args.base_url = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--workers",
+            "1",
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        env=dict(os.environ),
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{args.base_url}/health/ready").status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        if process.poll() is not None:
+            break
+        time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError("A aplicação não ficou pronta")
+
+
+def _local_users(database: Path):
+    """Caixas e um supervisor do dataset sintético"""
+    from sqlalchemy import create_engine, select
+
+    from app.infrastructure.database.models.user import User, UserRole
+
+    engine = create_engine(f"sqlite:///{database}")
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(
+                select(User.username, User.role).order_by(User.id)
+            ).all()
+    finally:
+        engine.dispose()
+    cashiers = [row.username for row in rows if row.role == UserRole.CASHIER]
+    supervisors = [row.username for row in rows if row.role == UserRole.SUPERVISOR]
+    return cashiers, supervisors[0] if supervisors else None
+
+
+def _print_stage(result: Dict) -> None:
+    print(
+        f"\n== {result['cashiers']} caixas, {result['backoffice']} retaguarda: "
+        f"{result['throughput_rps']} req/s, {result['sales_per_minute']} vendas/min, "
+        f"erros {result['error_rate']:.2%}, bloqueios {result['db_lock_errors']:.0f}"
+    )
+    print(
+        f"{'endpoint':<28}{'req':>7}{'rps':>8}{'err':>8}{'p50':>9}{'p95':>9}{'p99':>9}"
+    )
+    for endpoint, item in result["endpoints"].items():
+        print(
+            f"{endpoint:<28}{item['requests']:>7}{item['throughput_rps']:>8.1f}"
+            f"{item['error_rate']:>8.2%}{item['p50_ms']:>9.1f}"
+            f"{item['p95_ms']:>9.1f}{item['p99_ms']:>9.1f}"
+        )
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Teste de carga do PDV")
+    parser.add_argument(
+        "--cashiers", default="4", help="Caixas simultâneos; lista = estágios"
+    )
+    parser.add_argument("--backoffice", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=60, help="Segundos/estágio")
+    parser.add_argument("--basket", type=float, default=8, help="Itens médios")
+    parser.add_argument("--scan-think", type=float, default=0.3, help="s entre itens")
+    parser.add_argument("--customer-think", type=float, default=2.0)
+    parser.add_argument("--report-think", type=float, default=3.0)
+    parser.add_argument("--cancel-rate", type=float, default=0.02)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--password", default="synthetic123")
+    parser.add_argument("--base-url", help="Instância existente (senão sobe local)")
+    parser.add_argument(
+        "--cashier-users", default="", help="Usuários separados por vírgula"
+    )
+    parser.add_argument("--supervisor-user", help="Usuário que cancela vendas")
+    parser.add_argument("--database-url", help="PostgreSQL para amostrar pg_locks")
+    parser.add_argument(
+        "--degradation",
+        type=float,
+        default=2.0,
+        help="p95 do checkout acima de N x o do 1º estágio = degradado",
+    )
+    parser.add_argument("--output", type=Path, help="Grava os resultados em JSON")
+    # Dataset do modo local (mesmos parâmetros dos benchmarks)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--products", type=int, default=20_000)
+    parser.add_argument("--customers", type=int, default=5_000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--sales-per-day", type=int, default=800)
+    parser.add_argument("--end-date", default=END_DATE)
+    parser.add_argument("--dataset-dir", type=Path, default=Path("./data/benchmarks"))
+    return parser.parse_args()
+
+
+def run_load_test() -> int:
+    args = _parse_args()
+    stages = [int(value) for value in args.cashiers.split(",")]
+    work_dir = Path(tempfile.mkdtemp(prefix="load-test-"))
+    process = None
+    try:
+        if args.base_url:
+            cashier_users = [name for name in args.cashier_users.split(",") if name]
+            supervisor_user = args.supervisor_user
+        else:
+            process = _start_app(args, work_dir)
+            cashier_users, supervisor_user = _local_users(work_dir / "load_test.db")
+        if not cashier_users:
+            print("❌ Informe --cashier-users")
+            return 2
+        if max(stages) > len(cashier_users):
+            # Mesmo usuário = mesmo carrinho no servidor
+            print(f"❌ Só há {len(cashier_users)} caixas para {max(stages)} lanes")
+            return 2
+        if supervisor_user is None:
+            if process is not None:
+                # O dataset local sempre tem supervisores: algo está errado
+                print("❌ Dataset local sem supervisor para os cancelamentos")
+                return 2
+            print("⚠️  Sem supervisor: cancelamentos desativados")
+
+        barcodes = asyncio.run(_fetch_barcodes(args, cashier_users[0]))
+        if not barcodes:
+            print("❌ Nenhum produto com estoque suficiente")
+            return 2
+
+        results = []
+        for cashiers in stages:
+            test = LoadTest(args, cashier_users, supervisor_user, barcodes)
+            result = asyncio.run(test.run(cashiers))
+            _print_stage(result)
+            results.append(result)
+
+        print("\n== Checkout por número de caixas")
+        reference = results[0]["endpoints"].get(CHECKOUT, {}).get("p95_ms")
+        for result in results:
+            checkout = result["endpoints"].get(CHECKOUT)
+            if checkout is None:
+                continue
+            degraded = reference and checkout["p95_ms"] > reference * args.degradation
+            print(
+                f"  {result['cashiers']:>3} caixas: p95 {checkout['p95_ms']:.1f} ms, "
+                f"{result['sales_per_minute']} vendas/min"
+                + ("  ⚠️  degradado" if degraded else "")
+            )
+        if args.output:
+            args.output.write_text(json.dumps(results, indent=2) + "\n")
+        return 0
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(run_load_test())
@@ -0,0 +1,228 @@
+"""
+Executa os benchmarks e compara com a baseline versionada
+
+Uso:
+    python -m benchmarks.run                      # mede e compara
+    python -m benchmarks.run --only payment,login
+    python -m benchmarks.run --update-baseline    # grava baselines.json
+
+O dataset vem do gerador sintético (``scripts/generate_synthetic_data.py``)
+e fica em cache por parâmetros em ``--dataset-dir``; cada execução trabalha
+numa cópia, porque os pagamentos alteram o banco. Sai com código 1 quando
+algum benchmark regride além da tolerância.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baselines.json"
+DATASET_KEYS = ("seed", "products", "customers", "days", "sales_per_day", "end_date")
+# Fim fixo do período simulado: o dataset em cache não envelhece
+END_DATE = "2026-10-18"
+# Supervisores cancelam vendas no teste de carga; entram na chave do cache
+# para que datasets antigos (sem supervisores) sejam gerados de novo
+SUPERVISORS = 2
+PASSWORD = "synthetic123"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos críticos")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--products", type=int, default=20_000)
+    parser.add_argument("--customers", type=int, default=5_000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--sales-per-day", type=int, default=800)
+    parser.add_argument("--end-date", default=END_DATE, help="Último dia do dataset")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--only", default="", help="Casos separados por vírgula")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Aumento de latência aceito (0.5 = 50%%)",
+    )
+    parser.add_argument(
+        "--query-tolerance",
+        type=int,
+        default=0,
+        help="Consultas a mais por operação aceitas",
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output", type=Path, help="Grava os resultados em JSON")
+    parser.add_argument("--dataset-dir", type=Path, default=Path("./data/benchmarks"))
+    return parser.parse_args()
+
+
+def _dataset(args: argparse.Namespace) -> dict:
+    return {key: getattr(args, key) for key in DATASET_KEYS}
+
+
+def prepare_database(args: argparse.Namespace, database: Path) -> None:
+    """Cópia de trabalho do dataset (gerado uma vez por conjunto de parâmetros)"""
+    key = json.dumps({**_dataset(args), "supervisors": SUPERVISORS}, sort_keys=True)
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    cached = args.dataset_dir / f"dataset-{digest}.db"
+    if not cached.exists():
+        from sqlalchemy import create_engine
+
+        from app.infrastructure.database.models import Base
+        from scripts.generate_synthetic_data import SyntheticDataGenerator, build_parser
+
+        args.dataset_dir.mkdir(parents=True, exist_ok=True)
+        building = cached.with_suffix(".tmp")
+        building.unlink(missing_ok=True)
+        options = build_parser().parse_args(
+            [
+                f"--seed={args.seed}",
+                f"--products={args.products}",
+                f"--customers={args.customers}",
+                f"--days={args.days}",
+                f"--sales-per-day={args.sales_per_day}",
+                f"--end-date={args.end_date}",
+                f"--supervisors={SUPERVISORS}",
+            ]
+        )
+        print(f"🔄 Gerando dataset {digest} ({key})...")
+        engine = create_engine(f"sqlite:///{building}")
+        try:
+            Base.metadata.create_all(bind=engine)
+            SyntheticDataGenerator(engine, options).run()
+        finally:
+            engine.dispose()
+        os.replace(building, cached)
+
+    shutil.copyfile(cached, database)
+
+
+def configure_environment(work_dir: Path, database: Path) -> None:
+    """Antes de importar a aplicação: banco de trabalho e sem instrumentação"""
+    os.environ.update(
+        {
+            "DATABASE_URL": f"sqlite:///{database}",
+            "DEBUG": "false",
+            "LOG_LEVEL": "WARNING",
+            "PROFILING_ENABLED": "false",
+            "TRACING_ENABLED": "false",
+            "SLOW_QUERY_ENABLED": "false",
+            "BACKUP_ENABLED": "false",
+            "METRICS_DIR": "",
+            "LIVE_KPIS_SNAPSHOT_PATH": str(work_dir / "live_kpis.npz"),
+        }
+    )
+
+
+def _print_results(results: dict, baselines: dict) -> None:
+    header = (
+        f"{'benchmark':<16}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'queries':>9}{'base p95':>10}{'base q':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        baseline = baselines.get(name, {})
+        print(
+            f"{name:<16}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['queries']:>9}"
+            f"{baseline.get('p95_ms', float('nan')):>10.2f}"
+            f"{baseline.get('queries', '-'):>8}"
+        )
+
+
+def run_benchmarks() -> int:
+    args = _parse_args()
+    # Importável como ``python -m benchmarks.run`` ou pelo caminho do arquivo
+    sys.path.insert(0, str(BENCHMARKS_DIR.parent))
+    work_dir = Path(tempfile.mkdtemp(prefix="benchmarks-"))
+    try:
+        # O ambiente vem antes de qualquer import da aplicação (settings)
+        database = work_dir / "benchmark.db"
+        configure_environment(work_dir, database)
+        prepare_database(args, database)
+
+        from fastapi.testclient import TestClient
+
+        from app.infrastructure.database.connection import SessionLocal, engine
+        from app.infrastructure.database.models.user import User
+        from app.main import app
+        from benchmarks.cases import build_cases
+        from benchmarks.harness import QueryCounter, compare, run_case
+
+        baseline_file = (
+            json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        )
+        baselines = baseline_file.get("benchmarks", {})
+        if not args.update_baseline and baseline_file.get("dataset") not in (
+            None,
+            _dataset(args),
+        ):
+            print(
+                "❌ Dataset diferente do da baseline "
+                f"{baseline_file['dataset']}; use os mesmos parâmetros "
+                "ou --update-baseline"
+            )
+            return 2
+
+        only = {name for name in args.only.split(",") if name}
+        db = SessionLocal()
+        with TestClient(app) as client:
+            username = db.query(User.username).order_by(User.id).first()[0]
+            cases = build_cases(client, db, username, PASSWORD, args.seed, args.days)
+            counter = QueryCounter(engine)
+            results = {}
+            for case in cases:
+                if only and case.name not in only:
+                    continue
+                started = time.perf_counter()
+                results[case.name] = run_case(
+                    case, counter, args.iterations, args.warmup
+                )
+                print(f"✓ {case.name} ({time.perf_counter() - started:.1f}s)")
+        db.close()
+
+        _print_results(results, baselines)
+        report = {
+            "dataset": _dataset(args),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+            },
+            "generated_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "benchmarks": results,
+        }
+        if args.output:
+            args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+        if args.update_baseline:
+            # Casos não executados mantêm a baseline anterior
+            report["benchmarks"] = {**baselines, **results}
+            args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+            print(f"✅ Baseline gravada em {args.baseline}")
+            return 0
+
+        failures = compare(results, baselines, args.tolerance, args.query_tolerance)
+        if failures:
+            print("❌ Regressões:")
+            for failure in failures:
+                print(f"  {failure}")
+            return 1
+        print("✅ Nenhuma regressão")
+        return 0
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(run_benchmarks())
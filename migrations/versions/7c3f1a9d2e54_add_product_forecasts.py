@@ -0,0 +1,67 @@
+"""add_product_forecasts
+
+Revision ID: 7c3f1a9d2e54
+Revises: 0b032b7864b1
+Create Date: 2026-10-19 02:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3f1a9d2e54"
+down_revision: Union[str, None] = "0b032b7864b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "product_forecasts",
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("forecast_date", sa.Date(), nullable=False),
+        sa.Column("predicted_quantity", sa.Float(), nullable=False),
+        sa.Column("lower_bound", sa.Float(), nullable=False),
+        sa.Column("upper_bound", sa.Float(), nullable=False),
+        sa.Column("model", sa.String(length=50), nullable=False),
+        sa.Column("generated_at", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["product_id"],
+            ["products.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "product_id", "forecast_date", name="uq_product_forecasts_product_date"
+        ),
+    )
+    op.create_index(
+        op.f("ix_product_forecasts_id"), "product_forecasts", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_product_forecasts_product_id"),
+        "product_forecasts",
+        ["product_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_product_forecasts_forecast_date"),
+        "product_forecasts",
+        ["forecast_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_product_forecasts_forecast_date"), table_name="product_forecasts"
+    )
+    op.drop_index(
+        op.f("ix_product_forecasts_product_id"), table_name="product_forecasts"
+    )
+    op.drop_index(op.f("ix_product_forecasts_id"), table_name="product_forecasts")
+    op.drop_table("product_forecasts")
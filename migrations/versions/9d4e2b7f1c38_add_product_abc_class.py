@@ -0,0 +1,37 @@
+"""add_product_abc_class
+
+Revision ID: 9d4e2b7f1c38
+Revises: 7c3f1a9d2e54
+Create Date: 2026-10-19 02:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4e2b7f1c38"
+down_revision: Union[str, None] = "7c3f1a9d2e54"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "products", sa.Column("abc_class", sa.String(length=1), nullable=True)
+    )
+    op.add_column(
+        "products", sa.Column("abc_margin_class", sa.String(length=1), nullable=True)
+    )
+    op.add_column("products", sa.Column("abc_updated_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        op.f("ix_products_abc_class"), "products", ["abc_class"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_products_abc_class"), table_name="products")
+    op.drop_column("products", "abc_updated_at")
+    op.drop_column("products", "abc_margin_class")
+    op.drop_column("products", "abc_class")
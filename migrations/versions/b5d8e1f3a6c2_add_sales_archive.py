@@ -0,0 +1,130 @@
+"""add_sales_archive
+
+Revision ID: b5d8e1f3a6c2
+Revises: e4a7c2d9b813
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d8e1f3a6c2"
+down_revision: Union[str, None] = "e4a7c2d9b813"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _enum(*values: str, name: str) -> sa.Enum:
+    # Tipos já criados pelas tabelas vivas (Postgres)
+    return sa.Enum(*values, name=name).with_variant(
+        postgresql.ENUM(*values, name=name, create_type=False), "postgresql"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sales_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("customer_id", sa.Integer(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("subtotal_amount", sa.Float(), nullable=False),
+        sa.Column("discount_amount", sa.Float(), nullable=False),
+        sa.Column("bulk_discount_amount", sa.Float(), nullable=False),
+        sa.Column("final_amount", sa.Float(), nullable=False),
+        sa.Column(
+            "payment_method",
+            _enum("CASH", "DEBIT_CARD", "CREDIT_CARD", "PIX", name="paymentmethod"),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            _enum("PENDING", "COMPLETED", "CANCELLED", name="salestatus"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_sales_archive_created_at"),
+        "sales_archive",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_table(
+        "sale_items_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("sale_id", sa.Integer(), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("quantity", sa.Float(), nullable=False),
+        sa.Column("weight", sa.Float(), nullable=True),
+        sa.Column("unit_price", sa.Float(), nullable=False),
+        sa.Column("original_total_price", sa.Float(), nullable=False),
+        sa.Column("discount_applied", sa.Float(), nullable=False),
+        sa.Column("bulk_discount_applied", sa.Float(), nullable=False),
+        sa.Column("final_total_price", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_sale_items_archive_sale_id"),
+        "sale_items_archive",
+        ["sale_id"],
+        unique=False,
+    )
+    op.create_table(
+        "stock_movements_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "movement_type",
+            _enum(
+                "ENTRADA",
+                "SAIDA",
+                "AJUSTE",
+                "PERDA",
+                "DEVOLUCAO",
+                "TRANSFERENCIA",
+                name="movementtype",
+            ),
+            nullable=False,
+        ),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("previous_quantity", sa.Integer(), nullable=False),
+        sa.Column("new_quantity", sa.Integer(), nullable=False),
+        sa.Column("unit_cost", sa.Numeric(precision=10, scale=2), nullable=True),
+        sa.Column("total_cost", sa.Numeric(precision=10, scale=2), nullable=True),
+        sa.Column("reason", sa.String(length=255), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("sale_id", sa.Integer(), nullable=True),
+        sa.Column("supplier_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_stock_movements_archive_created_at"),
+        "stock_movements_archive",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_stock_movements_archive_created_at"),
+        table_name="stock_movements_archive",
+    )
+    op.drop_table("stock_movements_archive")
+    op.drop_index(
+        op.f("ix_sale_items_archive_sale_id"), table_name="sale_items_archive"
+    )
+    op.drop_table("sale_items_archive")
+    op.drop_index(op.f("ix_sales_archive_created_at"), table_name="sales_archive")
+    op.drop_table("sales_archive")
@@ -0,0 +1,50 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: c7e2a4f9d135
+Revises: b5d8e1f3a6c2
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2a4f9d135"
+down_revision: Union[str, None] = "b5d8e1f3a6c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = (
+    ("ix_sales_created_at_id", "sales"),
+    ("ix_stock_movements_created_at_id", "stock_movements"),
+    ("ix_purchase_orders_created_at_id", "purchase_orders"),
+    ("ix_sales_archive_created_at_id", "sales_archive"),
+)
+
+
+def _existing_indexes():
+    # As tabelas de estoque vêm dos scripts/create_stock_*, não das migrations
+    inspector = sa.inspect(op.get_bind())
+    for name, table in INDEXES:
+        if inspector.has_table(table):
+            yield name, table
+
+
+def upgrade() -> None:
+    for name, table in list(_existing_indexes()):
+        op.create_index(name, table, ["created_at", "id"], unique=False)
+    # O índice composto também atende os filtros só por created_at
+    op.drop_index("ix_sales_archive_created_at", table_name="sales_archive")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_sales_archive_created_at", "sales_archive", ["created_at"], unique=False
+    )
+    inspector = sa.inspect(op.get_bind())
+    for name, table in list(_existing_indexes()):
+        if name in {index["name"] for index in inspector.get_indexes(table)}:
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,62 @@
+"""add_product_affinities
+
+Revision ID: e4a7c2d9b813
+Revises: 9d4e2b7f1c38
+Create Date: 2026-10-19 04:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a7c2d9b813"
+down_revision: Union[str, None] = "9d4e2b7f1c38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "product_affinities",
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("related_product_id", sa.Integer(), nullable=False),
+        sa.Column("pair_count", sa.Integer(), nullable=False),
+        sa.Column("support", sa.Float(), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=False),
+        sa.Column("lift", sa.Float(), nullable=False),
+        sa.Column("generated_at", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["product_id"],
+            ["products.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["related_product_id"],
+            ["products.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "product_id", "related_product_id", name="uq_product_affinities_pair"
+        ),
+    )
+    op.create_index(
+        op.f("ix_product_affinities_id"), "product_affinities", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_product_affinities_product_id"),
+        "product_affinities",
+        ["product_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_product_affinities_product_id"), table_name="product_affinities"
+    )
+    op.drop_index(op.f("ix_product_affinities_id"), table_name="product_affinities")
+    op.drop_table("product_affinities")
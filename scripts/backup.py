@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Backup online do banco
+
+Uso:
+    python scripts/backup.py              # novo snapshot + rotação
+    python scripts/backup.py --list
+    python scripts/backup.py --verify     # confere todos os snapshots
+
+Com BACKUP_ENABLED a API roda este script sozinha a cada
+BACKUP_INTERVAL_HOURS (com prioridade baixa). Restauração: SQLite,
+``gunzip -c backup-<data>.db.gz > supermarket.db`` com a API parada;
+Postgres, ``pg_restore --clean -d <banco> backup-<data>.dump``.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.infrastructure.backup.snapshot import BackupManager
+
+
+def backup():
+    """Gerar, listar ou verificar snapshots"""
+    parser = argparse.ArgumentParser(description="Backup online do banco")
+    parser.add_argument("--list", action="store_true", help="Snapshots existentes")
+    parser.add_argument("--verify", action="store_true", help="Confere checksums")
+    parser.add_argument("--dir", help="Diretório (padrão: BACKUP_DIR)")
+    parser.add_argument("--keep", type=int, help="Quantos manter (BACKUP_KEEP)")
+    parser.add_argument(
+        "--max-mb-per-second",
+        type=float,
+        help="Limite de leitura (BACKUP_MAX_MB_PER_SECOND, 0 = sem limite)",
+    )
+    args = parser.parse_args()
+    manager = BackupManager(
+        directory=args.dir, keep=args.keep, max_mb_per_second=args.max_mb_per_second
+    )
+
+    if args.list:
+        for path in manager.list():
+            print(f"  {path.name}  {path.stat().st_size / 1024 / 1024:.1f} MB")
+        return 0
+    if args.verify:
+        failures = 0
+        for path in manager.list():
+            valid = manager.verify(path)
+            failures += not valid
+            print(f"  {'✅' if valid else '❌'} {path.name}")
+        return 1 if failures else 0
+
+    print("🔄 Gerando backup...")
+    summary = manager.create()
+    print(
+        f"✅ {summary['file']} ({summary['size_bytes'] / 1024 / 1024:.1f} MB) "
+        f"em {summary['elapsed_seconds']}s"
+    )
+    if summary["removed"]:
+        print(f"🗑️  Removidos: {', '.join(summary['removed'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(backup())
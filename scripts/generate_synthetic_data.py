@@ -0,0 +1,716 @@
+#!/usr/bin/env python3
+"""
+Gerador de dados sintéticos em volume para testes de escala
+
+Determinístico (mesma ``--seed`` e mesmos parâmetros geram os mesmos
+dados; o período termina em ``--end-date``, fixo por padrão, e não no dia
+da execução) e em lote: as linhas são montadas em memória por dia simulado e
+gravadas com ``executemany`` do SQLAlchemy Core ou, no PostgreSQL, com
+``COPY ... FROM STDIN``.
+
+O que é gerado:
+
+- categorias, fornecedores, operadores de caixa, supervisores, clientes e
+  o catálogo de produtos (preço log-normal, ~10% vendidos por peso);
+- vendas dia a dia com sazonalidade por dia da semana e por hora, leve
+  crescimento ao longo do período, popularidade dos produtos em lei de Zipf
+  e tamanho de cesta geométrico;
+- simulação de estoque: vendas concluídas baixam o estoque, produtos abaixo
+  do ponto de reposição geram pedido de compra ao fim do dia (um por
+  fornecedor), entregue na manhã seguinte como movimentação de ENTRADA;
+  perdas e ajustes de inventário aparecem esporadicamente.
+
+Os IDs continuam a partir do maior ID existente em cada tabela, então o
+gerador pode rodar sobre um banco que já tem dados.
+
+Uso:
+    python -m scripts.generate_synthetic_data --products 100000 --days 730 \\
+        --sales-per-day 3000 --seed 42 --end-date 2026-10-18
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from sqlalchemy import bindparam, create_engine, func, insert, select, text, update
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.customer import Customer
+from app.infrastructure.database.models.product import Category, Product
+from app.infrastructure.database.models.sale import (
+    PaymentMethod,
+    Sale,
+    SaleItem,
+    SaleStatus,
+)
+from app.infrastructure.database.models.stock import (
+    MovementType,
+    PurchaseOrder,
+    PurchaseOrderItem,
+    StockMovement,
+    Supplier,
+)
+from app.infrastructure.database.models.user import User, UserRole
+
+# Fim fixo do período: com date.today() os pesos por dia da semana (e todos
+# os sorteios seguintes) mudariam conforme o dia em que o gerador roda
+DEFAULT_END_DATE = date(2026, 10, 18)
+# Participação de cada hora do dia nas vendas (loja aberta das 7h às 22h)
+HOURLY_WEIGHTS = np.array(
+    [0, 0, 0, 0, 0, 0, 0, 2, 4, 5, 6, 8, 10, 9, 6, 5, 6, 8, 10, 9, 6, 3, 0, 0],
+    dtype=np.float64,
+)
+# Segunda a domingo (date.weekday())
+WEEKDAY_WEIGHTS = np.array([0.85, 0.8, 0.85, 0.95, 1.15, 1.4, 1.0])
+PAYMENT_METHODS = [
+    PaymentMethod.CASH,
+    PaymentMethod.DEBIT_CARD,
+    PaymentMethod.CREDIT_CARD,
+    PaymentMethod.PIX,
+]
+PAYMENT_WEIGHTS = np.array([0.15, 0.3, 0.25, 0.3])
+STATUS_WEIGHTS = np.array([0.97, 0.02, 0.01])  # Concluída, cancelada, pendente
+CATEGORY_NAMES = [
+    "Bebidas",
+    "Mercearia",
+    "Hortifruti",
+    "Padaria",
+    "Açougue",
+    "Frios e Laticínios",
+    "Limpeza",
+    "Higiene",
+    "Congelados",
+    "Pet",
+]
+ADJECTIVES = ["Tradicional", "Integral", "Light", "Premium", "Econômico", "Zero"]
+
+
+class BulkWriter:
+    """Acumula linhas por tabela e grava em lotes (executemany ou COPY)"""
+
+    def __init__(self, engine: Engine, tables: list, batch_size: int, use_copy: bool):
+        self.engine = engine
+        self.tables = tables  # Ordem das chaves estrangeiras
+        self.batch_size = batch_size
+        self.use_copy = use_copy
+        self.buffers: Dict[str, List[dict]] = {table.name: [] for table in tables}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, table, rows: List[dict]) -> None:
+        buffer = self.buffers[table.name]
+        buffer.extend(rows)
+        if len(buffer) >= self.batch_size:
+            # Tudo, na ordem: filhos nunca chegam antes dos pais
+            self.flush_all()
+
+    def flush(self, table) -> None:
+        rows = self.buffers.get(table.name)
+        if not rows:
+            return
+        with self.engine.begin() as conn:
+            if self.use_copy:
+                self._copy(conn, table, rows)
+            else:
+                for offset in range(0, len(rows), self.batch_size):
+                    conn.execute(insert(table), rows[offset : offset + self.batch_size])
+        self.counts[table.name] = self.counts.get(table.name, 0) + len(rows)
+        self.buffers[table.name] = []
+
+    def flush_all(self) -> None:
+        for table in self.tables:
+            self.flush(table)
+
+    @staticmethod
+    def _copy(conn, table, rows: List[dict]) -> None:
+        columns = list(rows[0])
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([_copy_value(row[column]) for column in columns])
+        buffer.seek(0)
+        cursor = conn.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) "
+                "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+
+def _copy_value(value):
+    """Valor no formato do COPY (enums do SQLAlchemy gravam o nome)"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (PaymentMethod, SaleStatus, MovementType, UserRole)):
+        return value.name
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return value
+
+
+def _next_id(engine: Engine, table) -> int:
+    with engine.connect() as conn:
+        return (conn.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+
+class SyntheticDataGenerator:
+    """Gera catálogo, vendas, movimentações e pedidos de compra"""
+
+    def __init__(self, engine: Engine, args: argparse.Namespace):
+        self.engine = engine
+        self.args = args
+        self.rng = np.random.default_rng(args.seed)
+        self.tables = [
+            model.__table__
+            for model in (
+                Category,
+                Supplier,
+                User,
+                Customer,
+                Product,
+                Sale,
+                SaleItem,
+                PurchaseOrder,
+                PurchaseOrderItem,
+                StockMovement,
+            )
+        ]
+        self.writer = BulkWriter(
+            engine,
+            self.tables,
+            args.batch_size,
+            use_copy=engine.dialect.name == "postgresql" and not args.no_copy,
+        )
+        # Pedido da véspera: (índices dos produtos, quantidades)
+        self._pending: Optional[np.ndarray] = None
+        self._pending_quantity: Optional[np.ndarray] = None
+        self.next_ids = {table.name: _next_id(engine, table) for table in self.tables}
+
+    def _ids(self, table, count: int) -> np.ndarray:
+        start = self.next_ids[table.name]
+        self.next_ids[table.name] = start + count
+        return np.arange(start, start + count, dtype=np.int64)
+
+    # ==================== CADASTROS ====================
+
+    def generate_master_data(self, start: datetime) -> None:
+        args = self.args
+        created = start - timedelta(days=30)
+        common = {"created_at": created, "updated_at": created}
+
+        self.category_ids = self._ids(Category.__table__, args.categories)
+        self.writer.add(
+            Category.__table__,
+            [
+                {
+                    "id": int(category_id),
+                    "name": f"{CATEGORY_NAMES[index % len(CATEGORY_NAMES)]} "
+                    f"{index // len(CATEGORY_NAMES) + 1}",
+                    "description": "Categoria sintética",
+                    "is_active": True,
+                    **common,
+                }
+                for index, category_id in enumerate(self.category_ids)
+            ],
+        )
+
+        self.supplier_ids = self._ids(Supplier.__table__, args.suppliers)
+        self.writer.add(
+            Supplier.__table__,
+            [
+                {
+                    "id": int(supplier_id),
+                    "name": f"Fornecedor {supplier_id}",
+                    "company_name": f"Fornecedor {supplier_id} Ltda",
+                    "document": f"SYN{supplier_id:011d}",
+                    "email": f"fornecedor{supplier_id}@example.com",
+                    "is_active": True,
+                    **common,
+                }
+                for supplier_id in self.supplier_ids
+            ],
+        )
+
+        # Mesma senha (synthetic123) para todos: o hash bcrypt é caro
+        password = get_password_hash("synthetic123")
+        self.user_ids = self._ids(User.__table__, args.cashiers)
+        self.writer.add(
+            User.__table__,
+            [
+                {
+                    "id": int(user_id),
+                    "username": f"caixa{user_id}",
+                    "email": f"caixa{user_id}@example.com",
+                    "full_name": f"Operador {user_id}",
+                    "hashed_password": password,
+                    "role": UserRole.CASHIER,
+                    "is_active": True,
+                    **common,
+                }
+                for user_id in self.user_ids
+            ],
+        )
+        # Supervisores (cancelamentos); não registram vendas
+        supervisor_ids = self._ids(User.__table__, args.supervisors)
+        self.writer.add(
+            User.__table__,
+            [
+                {
+                    "id": int(user_id),
+                    "username": f"supervisor{user_id}",
+                    "email": f"supervisor{user_id}@example.com",
+                    "full_name": f"Supervisor {user_id}",
+                    "hashed_password": password,
+                    "role": UserRole.SUPERVISOR,
+                    "is_active": True,
+                    **common,
+                }
+                for user_id in supervisor_ids
+            ],
+        )
+
+        self.customer_ids = self._ids(Customer.__table__, args.customers)
+        self.writer.add(
+            Customer.__table__,
+            [
+                {
+                    "id": int(customer_id),
+                    "name": f"Cliente {customer_id}",
+                    "email": f"cliente{customer_id}@example.com",
+                    "cpf": f"{customer_id:011d}",
+                    "loyalty_points": 0.0,
+                    **common,
+                }
+                for customer_id in self.customer_ids
+            ],
+        )
+
+        self._generate_products(common)
+        self.writer.flush_all()
+
+    def _generate_products(self, common: dict) -> None:
+        args, rng = self.args, self.rng
+        count = args.products
+        self.product_ids = self._ids(Product.__table__, count)
+        self.price = np.round(rng.lognormal(mean=2.3, sigma=0.8, size=count), 2)
+        self.price = np.maximum(self.price, 0.5)
+        self.cost = np.round(self.price * rng.uniform(0.55, 0.8, count), 2)
+        self.by_weight = rng.random(count) < 0.1
+        self.product_supplier = rng.choice(self.supplier_ids, count)
+        category = rng.choice(self.category_ids, count)
+
+        # Popularidade em lei de Zipf sobre uma ordem aleatória do catálogo
+        ranks = rng.permutation(count) + 1
+        popularity = 1.0 / ranks**args.zipf
+        self.popularity = popularity / popularity.sum()
+
+        # Estoque inicial: ~3 semanas da demanda esperada
+        daily_items = args.sales_per_day * (1 + 1 / args.basket_p) / 2
+        expected = self.popularity * daily_items
+        self.reorder_point = np.ceil(expected * 7 + 5)
+        self.max_stock = np.ceil(expected * 21 + 20)
+        self.stock = self.max_stock.copy()
+
+        self.writer.add(
+            Product.__table__,
+            [
+                {
+                    "id": int(self.product_ids[index]),
+                    "name": f"Produto {self.product_ids[index]} "
+                    f"{ADJECTIVES[index % len(ADJECTIVES)]}",
+                    "barcode": f"2{self.product_ids[index]:012d}",
+                    "category_id": int(category[index]),
+                    "supplier_id": int(self.product_supplier[index]),
+                    "price": float(self.price[index]),
+                    "cost_price": float(self.cost[index]),
+                    "stock_quantity": float(self.stock[index]),
+                    "min_stock_level": float(self.reorder_point[index]),
+                    "reorder_point": int(self.reorder_point[index]),
+                    "max_stock": int(self.max_stock[index]),
+                    "unit_type": "peso" if self.by_weight[index] else "unidade",
+                    "requires_weighing": bool(self.by_weight[index]),
+                    "tare_weight": 0.0,
+                    "bulk_discount_enabled": False,
+                    "bulk_min_quantity": 10.0,
+                    "bulk_discount_percentage": 5.0,
+                    "is_active": True,
+                    **common,
+                }
+                for index in range(count)
+            ],
+        )
+
+    # ==================== VENDAS ====================
+
+    def generate_day(self, day: date, day_index: int) -> int:
+        """Vendas, recebimentos e ajustes de um dia; devolve o nº de vendas"""
+        args, rng = self.args, self.rng
+        midnight = datetime.combine(day, datetime.min.time())
+        growth = 1 + args.growth * day_index / max(args.days - 1, 1)
+        expected = args.sales_per_day * WEEKDAY_WEIGHTS[day.weekday()] * growth
+        n_sales = int(rng.poisson(expected))
+
+        self._receive_orders(midnight + timedelta(hours=7))
+        if n_sales:
+            self._generate_sales(midnight, n_sales)
+        self._generate_shrinkage(midnight + timedelta(hours=22))
+        self._place_orders(midnight + timedelta(hours=22, minutes=30))
+        return n_sales
+
+    def _generate_sales(self, midnight: datetime, n_sales: int) -> None:
+        rng = self.rng
+        sale_ids = self._ids(Sale.__table__, n_sales)
+        hours = rng.choice(24, n_sales, p=HOURLY_WEIGHTS / HOURLY_WEIGHTS.sum())
+        seconds = np.sort(hours * 3600 + rng.integers(0, 3600, n_sales))
+        basket = np.minimum(rng.geometric(self.args.basket_p, n_sales), 60)
+
+        n_items = int(basket.sum())
+        item_sale = np.repeat(np.arange(n_sales), basket)
+        product_index = rng.choice(len(self.product_ids), n_items, p=self.popularity)
+        weighed = self.by_weight[product_index]
+        quantity = np.where(
+            weighed,
+            np.round(rng.lognormal(-0.5, 0.6, n_items), 3),
+            1 + rng.poisson(0.3, n_items),
+        ).astype(np.float64)
+        unit_price = self.price[product_index]
+        line_total = np.round(quantity * unit_price, 2)
+        subtotal = np.bincount(item_sale, weights=line_total, minlength=n_sales)
+
+        status = rng.choice(3, n_sales, p=STATUS_WEIGHTS)
+        payment = rng.choice(len(PAYMENT_METHODS), n_sales, p=PAYMENT_WEIGHTS)
+        has_customer = rng.random(n_sales) < 0.35
+        customer = rng.choice(self.customer_ids, n_sales)
+        cashier = rng.choice(self.user_ids, n_sales)
+        # Desconto manual em ~5% das vendas
+        discount = np.where(
+            rng.random(n_sales) < 0.05, np.round(subtotal * 0.05, 2), 0.0
+        )
+        statuses = [SaleStatus.COMPLETED, SaleStatus.CANCELLED, SaleStatus.PENDING]
+
+        created = [midnight + timedelta(seconds=int(value)) for value in seconds]
+        self.writer.add(
+            Sale.__table__,
+            [
+                {
+                    "id": int(sale_ids[index]),
+                    "customer_id": int(customer[index])
+                    if has_customer[index]
+                    else None,
+                    "user_id": int(cashier[index]),
+                    "subtotal_amount": round(float(subtotal[index]), 2),
+                    "discount_amount": float(discount[index]),
+                    "bulk_discount_amount": 0.0,
+                    "final_amount": round(float(subtotal[index] - discount[index]), 2),
+                    "payment_method": PAYMENT_METHODS[payment[index]],
+                    "status": statuses[status[index]],
+                    "created_at": created[index],
+                    "updated_at": created[index],
+                }
+                for index in range(n_sales)
+            ],
+        )
+
+        item_ids = self._ids(SaleItem.__table__, n_items)
+        products = self.product_ids[product_index]
+        self.writer.add(
+            SaleItem.__table__,
+            [
+                {
+                    "id": int(item_ids[index]),
+                    "sale_id": int(sale_ids[item_sale[index]]),
+                    "product_id": int(products[index]),
+                    "quantity": float(quantity[index]),
+                    "weight": float(quantity[index]) if weighed[index] else None,
+                    "unit_price": float(unit_price[index]),
+                    "original_total_price": float(line_total[index]),
+                    "discount_applied": 0.0,
+                    "bulk_discount_applied": 0.0,
+                    "final_total_price": float(line_total[index]),
+                    "created_at": created[item_sale[index]],
+                    "updated_at": created[item_sale[index]],
+                }
+                for index in range(n_items)
+            ],
+        )
+
+        # Só vendas concluídas baixam o estoque (como no checkout)
+        completed = status[item_sale] == 0
+        self.stock -= np.bincount(
+            product_index[completed],
+            weights=quantity[completed],
+            minlength=len(self.product_ids),
+        )
+
+    # ==================== ESTOQUE ====================
+
+    def _movement_rows(
+        self,
+        at: datetime,
+        index: np.ndarray,
+        delta: np.ndarray,
+        movement_type: MovementType,
+        reason: str,
+        supplier: Optional[np.ndarray] = None,
+    ) -> List[dict]:
+        previous = self.stock[index].copy()
+        self.stock[index] = np.maximum(previous + delta, 0)
+        movement_ids = self._ids(StockMovement.__table__, len(index))
+        user = self.rng.choice(self.user_ids, len(index))
+        rows = []
+        for position, product in enumerate(index):
+            unit_cost = float(self.cost[product])
+            quantity = int(round(abs(delta[position])))
+            rows.append(
+                {
+                    "id": int(movement_ids[position]),
+                    "product_id": int(self.product_ids[product]),
+                    "movement_type": movement_type,
+                    "quantity": quantity,
+                    "previous_quantity": int(round(previous[position])),
+                    "new_quantity": int(round(self.stock[product])),
+                    "unit_cost": unit_cost,
+                    "total_cost": round(unit_cost * quantity, 2),
+                    "reason": reason,
+                    "user_id": int(user[position]),
+                    "supplier_id": None
+                    if supplier is None
+                    else int(supplier[position]),
+                    "created_at": at,
+                    "updated_at": at,
+                }
+            )
+        return rows
+
+    def _place_orders(self, at: datetime) -> None:
+        """Pedido de compra por fornecedor para os itens abaixo do ponto"""
+        low = np.flatnonzero(self.stock <= self.reorder_point)
+        self._pending = low
+        if len(low) == 0:
+            return
+        quantity = np.ceil(self.max_stock[low] - np.maximum(self.stock[low], 0))
+        suppliers, supplier_slot = np.unique(
+            self.product_supplier[low], return_inverse=True
+        )
+        totals = np.bincount(
+            supplier_slot, weights=quantity * self.cost[low], minlength=len(suppliers)
+        )
+        order_ids = self._ids(PurchaseOrder.__table__, len(suppliers))
+        delivery = at + timedelta(hours=8, minutes=30)
+        user = self.rng.choice(self.user_ids, len(suppliers))
+        self.writer.add(
+            PurchaseOrder.__table__,
+            [
+                {
+                    "id": int(order_id),
+                    "supplier_id": int(suppliers[slot]),
+                    "order_number": f"SYN-{order_id:09d}",
+                    "status": "delivered",
+                    "total_amount": round(float(totals[slot]), 2),
+                    "user_id": int(user[slot]),
+                    "order_date": at,
+                    "expected_delivery": delivery,
+                    "delivery_date": delivery,
+                    "created_at": at,
+                    "updated_at": delivery,
+                }
+                for slot, order_id in enumerate(order_ids)
+            ],
+        )
+        item_ids = self._ids(PurchaseOrderItem.__table__, len(low))
+        self.writer.add(
+            PurchaseOrderItem.__table__,
+            [
+                {
+                    "id": int(item_ids[position]),
+                    "purchase_order_id": int(order_ids[supplier_slot[position]]),
+                    "product_id": int(self.product_ids[product]),
+                    "quantity_ordered": int(quantity[position]),
+                    "quantity_received": int(quantity[position]),
+                    "unit_cost": float(self.cost[product]),
+                    "total_cost": round(
+                        float(quantity[position] * self.cost[product]), 2
+                    ),
+                    "created_at": at,
+                    "updated_at": delivery,
+                }
+                for position, product in enumerate(low)
+            ],
+        )
+        self._pending_quantity = quantity
+
+    def _receive_orders(self, at: datetime) -> None:
+        """Entrega na manhã seguinte dos pedidos da véspera"""
+        pending = self._pending
+        if pending is None or len(pending) == 0:
+            return
+        self.writer.add(
+            StockMovement.__table__,
+            self._movement_rows(
+                at,
+                pending,
+                self._pending_quantity,
+                MovementType.ENTRADA,
+                "Recebimento de pedido de compra",
+                supplier=self.product_supplier[pending],
+            ),
+        )
+        self._pending = None
+
+    def _generate_shrinkage(self, at: datetime) -> None:
+        """Perdas (quebra, validade) e ajustes de inventário esporádicos"""
+        rng = self.rng
+        count = len(self.product_ids)
+        losses = np.flatnonzero(rng.random(count) < self.args.loss_rate)
+        losses = losses[self.stock[losses] >= 1]
+        if len(losses):
+            delta = -np.ceil(self.stock[losses] * rng.uniform(0.01, 0.05, len(losses)))
+            self.writer.add(
+                StockMovement.__table__,
+                self._movement_rows(
+                    at, losses, delta, MovementType.PERDA, "Avaria/validade"
+                ),
+            )
+        adjustments = np.flatnonzero(rng.random(count) < self.args.loss_rate / 2)
+        if len(adjustments):
+            delta = rng.integers(-3, 4, len(adjustments)).astype(np.float64)
+            self.writer.add(
+                StockMovement.__table__,
+                self._movement_rows(
+                    at + timedelta(minutes=15),
+                    adjustments,
+                    delta,
+                    MovementType.AJUSTE,
+                    "Inventário",
+                ),
+            )
+
+    # ==================== EXECUÇÃO ====================
+
+    def run(self) -> Dict[str, int]:
+        args = self.args
+        end = args.end_date
+        first_day = end - timedelta(days=args.days - 1)
+        started = time.perf_counter()
+
+        self.generate_master_data(datetime.combine(first_day, datetime.min.time()))
+        print(f"✓ Cadastros: {args.products} produtos, {args.customers} clientes")
+
+        total_sales = 0
+        for day_index in range(args.days):
+            day = first_day + timedelta(days=day_index)
+            total_sales += self.generate_day(day, day_index)
+            if (day_index + 1) % 30 == 0 or day_index == args.days - 1:
+                elapsed = time.perf_counter() - started
+                print(
+                    f"  {day.isoformat()}: {total_sales} vendas "
+                    f"({total_sales / elapsed:,.0f}/s)"
+                )
+        self.writer.flush_all()
+        self._finish()
+        return dict(self.writer.counts)
+
+    def _finish(self) -> None:
+        """Estoque final nos produtos e sequências do PostgreSQL"""
+        product_table = Product.__table__
+        statement = (
+            update(product_table)
+            .where(product_table.c.id == bindparam("b_id"))
+            .values(stock_quantity=bindparam("b_stock"))
+        )
+        rows = [
+            {"b_id": int(product_id), "b_stock": round(float(stock), 3)}
+            for product_id, stock in zip(self.product_ids, self.stock)
+        ]
+        with self.engine.begin() as conn:
+            for offset in range(0, len(rows), self.args.batch_size):
+                conn.execute(statement, rows[offset : offset + self.args.batch_size])
+            if self.engine.dialect.name == "postgresql":
+                # IDs explícitos não avançam as sequências
+                for table in self.tables:
+                    conn.execute(
+                        text(
+                            f"SELECT setval(pg_get_serial_sequence('{table.name}', "
+                            f"'id'), (SELECT MAX(id) FROM {table.name}))"
+                        )
+                    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parâmetros do gerador (também usados pelos benchmarks)"""
+    parser = argparse.ArgumentParser(description="Dados sintéticos em volume")
+    parser.add_argument("--seed", type=int, default=42, help="Semente aleatória")
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--suppliers", type=int, default=500)
+    parser.add_argument("--customers", type=int, default=50_000)
+    parser.add_argument("--cashiers", type=int, default=30)
+    parser.add_argument("--supervisors", type=int, default=2)
+    parser.add_argument("--days", type=int, default=730, help="Dias de histórico")
+    parser.add_argument(
+        "--end-date",
+        type=date.fromisoformat,
+        default=DEFAULT_END_DATE,
+        help="Último dia simulado (AAAA-MM-DD)",
+    )
+    parser.add_argument(
+        "--sales-per-day", type=int, default=3000, help="Média de vendas por dia"
+    )
+    parser.add_argument(
+        "--growth", type=float, default=0.2, help="Crescimento no período (0.2=20%%)"
+    )
+    parser.add_argument(
+        "--basket-p", type=float, default=0.25, help="Parâmetro da cesta geométrica"
+    )
+    parser.add_argument("--zipf", type=float, default=1.05, help="Expoente de Zipf")
+    parser.add_argument(
+        "--loss-rate", type=float, default=0.002, help="Chance diária de perda"
+    )
+    parser.add_argument("--batch-size", type=int, default=20_000)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument(
+        "--create-tables", action="store_true", help="Criar as tabelas ausentes"
+    )
+    parser.add_argument(
+        "--no-copy", action="store_true", help="Usar executemany no PostgreSQL"
+    )
+    return parser
+
+
+def generate_synthetic_data():
+    """Popular o banco com dados sintéticos em volume"""
+    args = build_parser().parse_args()
+
+    engine = create_engine(args.database_url)
+    if args.create_tables:
+        Base.metadata.create_all(bind=engine)
+
+    print(
+        f"🔄 Gerando {args.days} dias de vendas para {args.products} produtos "
+        f"(seed {args.seed})..."
+    )
+    started = time.perf_counter()
+    try:
+        counts = SyntheticDataGenerator(engine, args).run()
+    finally:
+        engine.dispose()
+    for table, count in counts.items():
+        print(f"  {table}: {count:,} linhas")
+    print(f"✅ {sum(counts.values()):,} linhas em {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    generate_synthetic_data()
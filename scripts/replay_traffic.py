@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Replay de tráfego capturado (CAPTURE_ENABLED) contra outra versão
+
+Fluxo para validar uma versão com o tráfego de um sábado real:
+
+1. Em produção, com CAPTURE_ENABLED=true, os arquivos vão para CAPTURE_DIR.
+2. Restaure o snapshot do banco feito no início da captura e suba a versão
+   nova apontando para ele.
+3. ``python -m scripts.replay_traffic data/capture --base-url http://...
+   --login cashier=caixa1,caixa2:senha --login supervisor=sup1:senha``
+
+Cada usuário capturado (pseudônimo) vira uma conta de teste do mesmo perfil
+(``--login``, em rodízio) e suas requisições saem em ordem, no mesmo ritmo
+da captura dividido por ``--speed`` (0 = sem esperas). Logins capturados
+não são reenviados: cada conta faz login uma vez. IDs criados durante o
+replay (ex.: ``sale_id`` de um pagamento) substituem os originais nos
+caminhos seguintes (``/sales/{sale_id}/cancel``), só nos parâmetros de rota
+com o mesmo nome; um ``id`` vale para a coleção que o criou
+(``POST /products/`` -> ``/products/{product_id}``).
+
+O relatório compara, por rota, p50/p95 da captura e do replay, status
+diferentes e respostas com estrutura diferente; sai com código 1 se o p95
+de alguma rota piorar mais que ``--max-slowdown`` ou se a taxa de
+divergências passar de ``--max-mismatch-rate``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from app.infrastructure.capture.recorder import summarize_response
+
+LOGIN_PATH = "/api/v1/auth/login"
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)]
+
+
+def load_capture(paths: List[Path]) -> List[dict]:
+    """Registros de todos os arquivos (e diretórios), em ordem de tempo"""
+    files = []
+    for path in paths:
+        files.extend(sorted(path.glob("capture-*.jsonl")) if path.is_dir() else [path])
+    records = []
+    for file in files:
+        with file.open(encoding="utf-8") as lines:
+            records.extend(json.loads(line) for line in lines if line.strip())
+    records.sort(key=lambda record: record["ts"])
+    return records
+
+
+def parse_logins(values: List[str]) -> Dict[str, List[tuple]]:
+    """'cashier=caixa1,caixa2:senha' -> {'cashier': [(caixa1, senha), ...]}"""
+    accounts: Dict[str, List[tuple]] = {}
+    for value in values:
+        role, _, rest = value.partition("=")
+        usernames, _, password = rest.rpartition(":")
+        accounts.setdefault(role.strip(), []).extend(
+            (username.strip(), password) for username in usernames.split(",")
+        )
+    return accounts
+
+
+class Replayer:
+    """Reenvia as sessões capturadas e coleta a comparação por rota"""
+
+    def __init__(self, args: argparse.Namespace, accounts: Dict[str, List[tuple]]):
+        self.args = args
+        self.accounts = accounts
+        # (parâmetro ou coleção, ID capturado) -> ID criado no replay
+        self.id_map: Dict[Tuple[str, int], int] = {}
+        self.results: List[dict] = []
+        self.skipped: Dict[str, int] = {}
+        self._tokens: Dict[str, str] = {}
+        self._token_locks: Dict[str, asyncio.Lock] = {}
+
+    def _skip(self, reason: str) -> None:
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+
+    async def _headers(self, client: httpx.AsyncClient, account: tuple) -> dict:
+        username, password = account
+        lock = self._token_locks.setdefault(username, asyncio.Lock())
+        async with lock:
+            if username not in self._tokens:
+                response = await client.post(
+                    LOGIN_PATH, json={"username": username, "password": password}
+                )
+                response.raise_for_status()
+                self._tokens[username] = response.json()["access_token"]
+        return {"Authorization": f"Bearer {self._tokens[username]}"}
+
+    @staticmethod
+    def _id_key(field: str, record: dict, value: int) -> Tuple[str, int]:
+        """``sale_id`` vale para {sale_id}; ``id``, para a coleção da rota"""
+        if field != "id":
+            return field, value
+        return (record.get("route") or record["path"]).rstrip("/"), value
+
+    def _rewrite_path(self, record: dict) -> str:
+        """Troca IDs criados na captura pelos criados no replay"""
+        path, route = record["path"], record.get("route") or ""
+        segments, template = path.split("/"), route.split("/")
+        if len(segments) != len(template):
+            return path
+        for index, part in enumerate(template):
+            if part.startswith("{") and segments[index].isdigit():
+                original = int(segments[index])
+                name = part[1:-1].split(":")[0]
+                collection = "/".join(template[:index])
+                replayed = self.id_map.get((name, original))
+                if replayed is None:
+                    replayed = self.id_map.get((collection, original), original)
+                segments[index] = str(replayed)
+        return "/".join(segments)
+
+    async def _session(
+        self,
+        client: httpx.AsyncClient,
+        records: List[dict],
+        account: Optional[tuple],
+        started: float,
+        first_ts: float,
+    ) -> None:
+        headers = await self._headers(client, account) if account else {}
+        for record in records:
+            if self.args.speed > 0:
+                due = started + (record["ts"] - first_ts) / self.args.speed
+                delay = due - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await self._send(client, record, headers)
+
+    async def _send(self, client: httpx.AsyncClient, record: dict, headers: dict):
+        route = f"{record['method']} {record.get('route') or record['path']}"
+        path = self._rewrite_path(record)
+        if record.get("query"):
+            path = f"{path}?{record['query']}"
+        request_started = time.perf_counter()
+        try:
+            response = await client.request(
+                record["method"],
+                path,
+                json=record["body"] if record.get("body") is not None else None,
+                headers=headers,
+            )
+        except httpx.HTTPError as e:
+            self.results.append(
+                {
+                    "route": route,
+                    "original_ms": record["duration_ms"],
+                    "replay_ms": None,
+                    "status_match": False,
+                    "shape_match": False,
+                    "body_match": False,
+                    "error": type(e).__name__,
+                }
+            )
+            return
+        elapsed = (time.perf_counter() - request_started) * 1000
+
+        original = record.get("response") or {}
+        replayed = (
+            summarize_response(response.content)
+            if response.headers.get("content-type", "").startswith("application/json")
+            else {}
+        )
+        for key, value in (original.get("ids") or {}).items():
+            new_value = (replayed.get("ids") or {}).get(key)
+            if new_value is not None:
+                self.id_map[self._id_key(key, record, value)] = new_value
+        self.results.append(
+            {
+                "route": route,
+                "original_ms": record["duration_ms"],
+                "replay_ms": elapsed,
+                "status_match": response.status_code == record["status"],
+                "shape_match": original.get("shape") == replayed.get("shape"),
+                "body_match": original.get("sha1") == replayed.get("sha1"),
+            }
+        )
+
+    async def run(self, records: List[dict]) -> None:
+        sessions: Dict[Optional[str], List[dict]] = {}
+        for record in records:
+            if record["path"] == LOGIN_PATH:
+                self._skip("login")
+                continue
+            if record.get("body_truncated"):
+                self._skip("body_truncated")
+                continue
+            sessions.setdefault(record.get("user"), []).append(record)
+
+        # Pseudônimo -> conta de teste do mesmo perfil (em rodízio)
+        assigned: Dict[Optional[str], Optional[tuple]] = {}
+        next_account: Dict[str, int] = {}
+        for user, user_records in sessions.items():
+            role = user_records[0].get("role")
+            if user is None:
+                assigned[user] = None
+                continue
+            candidates = self.accounts.get(role)
+            if not candidates:
+                self._skip(f"sem conta para o perfil {role}")
+                continue
+            index = next_account.get(role, 0)
+            next_account[role] = index + 1
+            if index >= len(candidates):
+                print(f"⚠️  Contas de {role} compartilhadas (carrinhos se misturam)")
+            assigned[user] = candidates[index % len(candidates)]
+
+        first_ts = records[0]["ts"] if records else 0.0
+        limits = httpx.Limits(max_connections=max(len(assigned), 1) + 5)
+        async with httpx.AsyncClient(
+            base_url=self.args.base_url, timeout=self.args.timeout, limits=limits
+        ) as client:
+            started = time.monotonic()
+            await asyncio.gather(
+                *(
+                    self._session(client, sessions[user], account, started, first_ts)
+                    for user, account in assigned.items()
+                )
+            )
+
+    def report(self) -> dict:
+        routes: Dict[str, List[dict]] = {}
+        for result in self.results:
+            routes.setdefault(result["route"], []).append(result)
+        summary = {}
+        for route, items in sorted(routes.items()):
+            original = [item["original_ms"] for item in items]
+            replay = [
+                item["replay_ms"] for item in items if item["replay_ms"] is not None
+            ]
+            summary[route] = {
+                "requests": len(items),
+                "original_p50_ms": round(_percentile(original, 0.5), 2),
+                "original_p95_ms": round(_percentile(original, 0.95), 2),
+                "replay_p50_ms": round(_percentile(replay, 0.5), 2) if replay else None,
+                "replay_p95_ms": round(_percentile(replay, 0.95), 2)
+                if replay
+                else None,
+                "status_mismatches": sum(not item["status_match"] for item in items),
+                "shape_mismatches": sum(not item["shape_match"] for item in items),
+                "identical_bodies": sum(item["body_match"] for item in items),
+                "errors": sum(1 for item in items if item.get("error")),
+            }
+        return {"routes": summary, "skipped": self.skipped}
+
+
+def _print_report(report: dict) -> None:
+    print(
+        f"{'rota':<44}{'req':>6}{'p50 orig':>10}{'p50 novo':>10}"
+        f"{'p95 orig':>10}{'p95 novo':>10}{'status≠':>9}{'estrut≠':>9}"
+    )
+    for route, item in report["routes"].items():
+        print(
+            f"{route[:43]:<44}{item['requests']:>6}"
+            f"{item['original_p50_ms']:>10.1f}{item['replay_p50_ms'] or 0:>10.1f}"
+            f"{item['original_p95_ms']:>10.1f}{item['replay_p95_ms'] or 0:>10.1f}"
+            f"{item['status_mismatches']:>9}{item['shape_mismatches']:>9}"
+        )
+    if report["skipped"]:
+        print(f"Ignoradas: {report['skipped']}")
+
+
+def _regressions(report: dict, args: argparse.Namespace) -> List[str]:
+    failures = []
+    total = mismatches = 0
+    for route, item in report["routes"].items():
+        total += item["requests"]
+        mismatches += item["status_mismatches"] + item["errors"]
+        if item["requests"] < args.min_samples or not item["replay_p95_ms"]:
+            continue
+        limit = item["original_p95_ms"] * args.max_slowdown
+        if item["replay_p95_ms"] > limit:
+            failures.append(
+                f"{route}: p95 {item['replay_p95_ms']:.1f} ms > {limit:.1f} ms"
+            )
+    if total and mismatches / total > args.max_mismatch_rate:
+        failures.append(
+            f"{mismatches}/{total} respostas com status diferente ou erro "
+            f"(limite {args.max_mismatch_rate:.1%})"
+        )
+    return failures
+
+
+def replay_traffic():
+    """Reproduz a captura e compara latências e respostas"""
+    parser = argparse.ArgumentParser(description="Replay de tráfego capturado")
+    parser.add_argument("paths", nargs="+", type=Path, help="Arquivos ou diretórios")
+    parser.add_argument("--base-url", required=True)
+    parser.add_argument(
+        "--login",
+        action="append",
+        default=[],
+        help="perfil=usuario1,usuario2:senha (repetível)",
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="1 = ritmo original, 0 = sem esperas"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--max-slowdown", type=float, default=1.5)
+    parser.add_argument("--max-mismatch-rate", type=float, default=0.01)
+    parser.add_argument(
+        "--min-samples", type=int, default=20, help="Mínimo por rota para comparar p95"
+    )
+    parser.add_argument("--output", type=Path, help="Grava o relatório em JSON")
+    args = parser.parse_args()
+
+    records = load_capture(args.paths)
+    if not records:
+        print("❌ Nenhum registro de captura encontrado")
+        return 2
+    span = records[-1]["ts"] - records[0]["ts"]
+    print(
+        f"🔄 Reproduzindo {len(records)} requisições ({span / 60:.1f} min capturados, "
+        f"velocidade {args.speed or 'máxima'})..."
+    )
+    replayer = Replayer(args, parse_logins(args.login))
+    asyncio.run(replayer.run(records))
+    report = replayer.report()
+    _print_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    failures = _regressions(report, args)
+    if failures:
+        print("❌ Regressões:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print("✅ Replay sem regressões")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(replay_traffic())
@@ -0,0 +1,68 @@
+"""
+Rolagem mensal do arquivo de vendas e movimentações
+
+Move para ``sales_archive``, ``sale_items_archive`` e
+``stock_movements_archive`` todo mês anterior ao corte
+(ARCHIVE_AFTER_MONTHS), um mês por transação. Pode ser repetido: meses já
+arquivados não têm mais linhas vivas.
+
+Uso (cron, ex.: dia 1 às 03:00):
+    python -m scripts.roll_partitions [--dry-run]
+    python -m scripts.roll_partitions --list
+    python -m scripts.roll_partitions --restore 2024-03
+"""
+import argparse
+from datetime import datetime
+
+from app.application.services.archive_service import ArchiveService
+from app.infrastructure.database.connection import SessionLocal
+
+
+def _print_counts(entry: dict) -> None:
+    print(
+        f"  {entry['month']}: {entry['sales']} vendas, {entry['sale_items']} itens, "
+        f"{entry['stock_movements']} movimentações"
+    )
+
+
+def roll_partitions():
+    """Arquivar meses fechados (ou restaurar um mês)"""
+    parser = argparse.ArgumentParser(description="Arquivo mensal de vendas")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Só mostra o que seria movido"
+    )
+    parser.add_argument("--list", action="store_true", help="Meses arquivados")
+    parser.add_argument("--restore", metavar="AAAA-MM", help="Devolve um mês")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        service = ArchiveService(db)
+        if args.list:
+            for entry in service.archived_months():
+                print(
+                    f"  {entry['month']}: {entry['sales']} vendas, "
+                    f"{entry['movements']} movimentações"
+                )
+            return
+        if args.restore:
+            month = datetime.strptime(args.restore, "%Y-%m").date()
+            print(f"🔄 Restaurando {args.restore}...")
+            _print_counts(service.restore(month))
+            return
+
+        summary = service.roll(dry_run=args.dry_run)
+        action = "Seriam arquivados" if args.dry_run else "Arquivados"
+        print(f"📦 Corte: {summary['cutoff']:%Y-%m} (meses anteriores vão ao arquivo)")
+        if not summary["months"]:
+            print("✅ Nenhum mês pendente")
+            return
+        print(f"✅ {action} {len(summary['months'])} meses:")
+        for entry in summary["months"]:
+            _print_counts(entry)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    roll_partitions()
@@ -0,0 +1,43 @@
+"""
+Job noturno de previsão de demanda por produto
+
+Uso (cron, ex.: 02:00): python -m scripts.run_demand_forecast --horizon 14
+"""
+import argparse
+
+from app.application.services.forecast_service import ForecastService
+from app.infrastructure.database.connection import SessionLocal
+from app.infrastructure.jobs.executor import shutdown_process_pool
+
+
+def run_demand_forecast():
+    """Gerar previsões para todo o catálogo"""
+    parser = argparse.ArgumentParser(description="Previsão de demanda (Holt-Winters)")
+    parser.add_argument("--horizon", type=int, default=None, help="Dias previstos")
+    parser.add_argument("--history", type=int, default=None, help="Dias de histórico")
+    parser.add_argument("--shards", type=int, default=None, help="Faixas de produtos")
+    parser.add_argument(
+        "--sequential", action="store_true", help="Não usar o pool de processos"
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print("🔄 Calculando previsões de demanda...")
+        summary = ForecastService(db).run_forecast(
+            horizon_days=args.horizon,
+            history_days=args.history,
+            shards=args.shards,
+            parallel=not args.sequential,
+        )
+        print(
+            f"✅ {summary['products']} produtos, {summary['rows']} previsões "
+            f"({summary['shards']} faixas) em {summary['elapsed_seconds']}s"
+        )
+    finally:
+        db.close()
+        shutdown_process_pool(wait=True)
+
+
+if __name__ == "__main__":
+    run_demand_forecast()
@@ -0,0 +1,30 @@
+"""
+Fixtures compartilhadas: banco SQLite em memória com todas as tabelas
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.infrastructure.database.models import Base
+
+
+@pytest.fixture
+def engine():
+    # StaticPool: uma única conexão, visível também no threadpool do TestClient
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
@@ -0,0 +1,76 @@
+"""
+Holt-Winters semanal vetorizado
+"""
+
+import numpy as np
+
+from app.infrastructure.forecasting.holt_winters import SEASON_LENGTH, forecast
+
+WEEK = np.array([8.0, 6.0, 7.0, 9.0, 14.0, 20.0, 12.0])
+
+
+def _weekly(weeks: int, noise: float = 0.0, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    series = np.tile(WEEK, weeks)
+    return series + rng.normal(0.0, noise, series.shape) if noise else series
+
+
+def test_recovers_exact_weekly_pattern():
+    result = forecast(_weekly(12)[None, :], horizon=14)
+
+    np.testing.assert_allclose(result.mean[0], np.tile(WEEK, 2), atol=0.5)
+
+
+def test_continues_season_from_last_observed_day():
+    # Histórico termina no 3º dia da semana: a previsão começa no 4º
+    history = _weekly(16)[: 16 * SEASON_LENGTH - 4]
+
+    result = forecast(history[None, :], horizon=SEASON_LENGTH)
+
+    np.testing.assert_allclose(result.mean[0], np.roll(WEEK, 4), atol=0.5)
+
+
+def test_interval_brackets_mean_and_widens_with_horizon():
+    result = forecast(_weekly(16, noise=1.5)[None, :], horizon=21)
+
+    assert np.all(result.lower <= result.mean)
+    assert np.all(result.mean <= result.upper)
+    width = result.upper - result.mean
+    assert np.all(np.diff(width[0]) >= -1e-9)
+    assert width[0, 0] > 0
+
+
+def test_products_are_independent():
+    rows = np.vstack([_weekly(8, noise=1.0, seed=1), _weekly(8, noise=3.0, seed=2)])
+
+    together = forecast(rows, horizon=7)
+    alone = forecast(rows[1:], horizon=7)
+
+    np.testing.assert_allclose(together.mean[1], alone.mean[0])
+    np.testing.assert_allclose(together.upper[1], alone.upper[0])
+
+
+def test_product_without_sales_forecasts_zero():
+    result = forecast(np.zeros((1, 56)), horizon=7)
+
+    np.testing.assert_array_equal(result.mean, 0.0)
+    np.testing.assert_array_equal(result.lower, 0.0)
+    np.testing.assert_array_equal(result.upper, 0.0)
+
+
+def test_late_launch_ignores_days_before_first_sale():
+    # 6 semanas sem o produto e 4 vendendo ~10/dia
+    history = np.concatenate([np.zeros(6 * SEASON_LENGTH), np.full(28, 10.0)])
+
+    result = forecast(history[None, :], horizon=7)
+
+    np.testing.assert_allclose(result.mean[0], 10.0, atol=0.5)
+
+
+def test_forecast_is_never_negative():
+    declining = np.linspace(30.0, 0.0, 8 * SEASON_LENGTH)
+
+    result = forecast(declining[None, :], horizon=28)
+
+    assert np.all(result.mean >= 0)
+    assert np.all(result.lower >= 0)
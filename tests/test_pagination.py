@@ -0,0 +1,212 @@
+"""
+Paginação por cursor (keyset): páginas sem repetição nem lacuna
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, text
+
+from app.infrastructure.database.connection import get_db
+from app.infrastructure.database.models import ArchivedSale, Sale, User
+from app.infrastructure.database.models.sale import PaymentMethod, SaleStatus
+from app.infrastructure.database.models.user import UserRole
+from app.infrastructure.repositories.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+)
+from app.infrastructure.repositories.sale_repository import SaleRepository
+from app.presentation.api.dependencies import get_current_active_user
+from app.presentation.api.v1 import sales
+
+NOW = datetime(2026, 10, 18, 12, 0)
+
+
+def _sale_rows(count, start, first_id, seed):
+    """Vendas com 4 por instante, inseridas fora da ordem de created_at"""
+    rows = [
+        {
+            "id": first_id + index,
+            "created_at": start + timedelta(minutes=minute),
+            "updated_at": start,
+            "user_id": 1,
+            "final_amount": 10.0,
+            "payment_method": PaymentMethod.CASH,
+            "status": SaleStatus.COMPLETED,
+        }
+        for index, minute in enumerate(
+            random.Random(seed).sample([i // 4 for i in range(count)], count)
+        )
+    ]
+    return rows
+
+
+def _expected(db, table):
+    """Ordem da listagem: texto gravado de created_at e id, decrescentes"""
+    rows = db.execute(text(f"SELECT created_at, id FROM {table}")).all()
+    return [row.id for row in sorted(rows, reverse=True)]
+
+
+def _drain(fetch, limit):
+    """Segue os cursores até a última página"""
+    ids, cursor, pages = [], None, 0
+    while True:
+        page = fetch(cursor, limit)
+        assert len(page) <= limit
+        ids.extend(item.id for item in page)
+        pages += 1
+        cursor = page.next_cursor
+        if cursor is None:
+            return ids, pages
+        assert pages < 200, "cursor não avança"
+
+
+@pytest.fixture
+def live_sales(db):
+    db.add(
+        User(
+            id=1,
+            username="caixa",
+            email="caixa@example.com",
+            full_name="Caixa",
+            hashed_password="x",
+            role=UserRole.CASHIER,
+        )
+    )
+    db.execute(insert(Sale), _sale_rows(53, NOW - timedelta(days=1), 1, seed=1))
+    # Formato do CURRENT_TIMESTAMP do SQLite (sem microssegundos) na mesma coluna
+    db.execute(
+        text("UPDATE sales SET created_at = substr(created_at, 1, 19) WHERE id % 3 = 0")
+    )
+    db.commit()
+    return _expected(db, "sales")
+
+
+@pytest.mark.parametrize("limit", [1, 4, 5, 7, 53, 100])
+def test_keyset_page_walks_duplicate_timestamps_without_gaps(db, live_sales, limit):
+    query = db.query(Sale)
+
+    ids, pages = _drain(
+        lambda cursor, size: keyset_page(
+            query, (Sale.created_at, Sale.id), cursor, size
+        ),
+        limit,
+    )
+
+    assert ids == live_sales
+    assert pages == max(-(-len(live_sales) // limit), 1)
+
+
+def test_keyset_page_ascending(db, live_sales):
+    query = db.query(Sale)
+
+    ids, _ = _drain(
+        lambda cursor, size: keyset_page(
+            query, (Sale.created_at, Sale.id), cursor, size, descending=False
+        ),
+        6,
+    )
+
+    assert ids == live_sales[::-1]
+
+
+def test_sales_listing_continues_into_archive(db, live_sales):
+    db.execute(
+        insert(ArchivedSale),
+        _sale_rows(30, NOW - timedelta(days=800), 1001, seed=2),
+    )
+    db.commit()
+    repository = SaleRepository(db)
+
+    ids, _ = _drain(
+        lambda cursor, size: repository.get_sales_by_filters(limit=size, cursor=cursor),
+        7,
+    )
+
+    # Toda venda arquivada é mais antiga: vivas primeiro, depois o arquivo
+    assert ids == live_sales + _expected(db, "sales_archive")
+    assert len(set(ids)) == len(ids)
+
+
+def test_sales_listing_archive_starts_on_page_boundary(db, live_sales):
+    db.execute(
+        insert(ArchivedSale),
+        _sale_rows(8, NOW - timedelta(days=800), 1001, seed=3),
+    )
+    db.commit()
+    repository = SaleRepository(db)
+
+    # 53 vivas em páginas de 53: a próxima página é só do arquivo
+    first = repository.get_sales_by_filters(limit=53)
+    assert [sale.id for sale in first] == live_sales
+    assert first.next_cursor is not None
+
+    second = repository.get_sales_by_filters(limit=53, cursor=first.next_cursor)
+    assert [sale.id for sale in second] == _expected(db, "sales_archive")
+    assert second.next_cursor is None
+
+
+def test_empty_table_has_no_cursor(db):
+    page = keyset_page(db.query(Sale), (Sale.created_at, Sale.id), None, 10)
+
+    assert list(page) == []
+    assert page.next_cursor is None
+    assert page.last_cursor is None
+
+
+def test_cursor_round_trip():
+    values = ["2026-10-18 12:00:00.000000", 42]
+
+    assert decode_cursor(encode_cursor(values), 2) == values
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        "%%%",
+        encode_cursor([1]),
+        encode_cursor([1, 2, 3]),
+        "eyJhIjoxfQ",  # {"a":1}: JSON válido, mas não é lista
+    ],
+)
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2)
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(sales.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_active_user] = lambda: None
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor([1])])
+def test_sales_endpoint_rejects_bad_cursor(client, live_sales, cursor):
+    response = client.get("/sales/", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cursor inválido"
+
+
+def test_sales_endpoint_follows_next_cursor_header(client, live_sales):
+    ids, cursor = [], None
+    while True:
+        params = {"limit": 10, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/sales/", params=params)
+        assert response.status_code == 200
+        ids.extend(sale["id"] for sale in response.json())
+        assert len(ids) <= len(live_sales), "página repetida"
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert ids == live_sales
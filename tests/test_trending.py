@@ -0,0 +1,67 @@
+"""
+Resumo Space-Saving dos produtos em alta
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from app.infrastructure.analytics.trending import SpaceSaving
+
+
+def _stream(seed: int, length: int = 5000, products: int = 300):
+    """Vendas com popularidade em lei de Zipf"""
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, products + 1)]
+    return rng.choices(range(1, products + 1), weights=weights, k=length)
+
+
+@pytest.mark.parametrize("capacity", [10, 50, 200])
+def test_counts_within_error_bounds(capacity):
+    stream = _stream(seed=capacity)
+    truth = Counter(stream)
+    summary = SpaceSaving(capacity)
+
+    for product_id in stream:
+        summary.add(product_id, 1.0)
+
+    assert len(summary.counters) <= capacity
+    assert sum(counter[0] for counter in summary.counters.values()) == len(stream)
+    for product_id, (count, error, _) in summary.counters.items():
+        assert count - error <= truth[product_id] <= count
+
+
+@pytest.mark.parametrize("capacity", [10, 50])
+def test_heavy_hitters_are_never_evicted(capacity):
+    stream = _stream(seed=7)
+    summary = SpaceSaving(capacity)
+
+    for product_id in stream:
+        summary.add(product_id, 1.0)
+
+    threshold = len(stream) / capacity
+    heavy = {product for product, count in Counter(stream).items() if count > threshold}
+    assert heavy
+    assert heavy <= set(summary.counters)
+
+
+def test_exact_while_below_capacity():
+    summary = SpaceSaving(10)
+
+    for product_id, quantity in [(1, 2.0), (2, 0.5), (1, 1.0), (3, 4.0)]:
+        summary.add(product_id, quantity)
+
+    assert summary.counters == {1: [3.0, 0.0, 2], 2: [0.5, 0.0, 1], 3: [4.0, 0.0, 1]}
+
+
+def test_remove_discounts_and_ignores_unknown_products():
+    summary = SpaceSaving(2)
+    summary.add(1, 3.0)
+    summary.add(1, 2.0)
+
+    summary.remove(1, 2.0)
+    summary.remove(1, 10.0)
+    summary.remove(99, 1.0)
+
+    assert summary.counters == {1: [0.0, 0.0, 0]}
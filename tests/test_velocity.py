@@ -0,0 +1,29 @@
+"""
+Dias até a ruptura de estoque
+"""
+
+import numpy as np
+
+from app.infrastructure.repositories.velocity_repository import days_to_stockout
+
+
+def test_floor_of_stock_over_velocity():
+    stock = np.array([10.0, 7.0, 1.0, 0.5])
+    velocity = np.array([2.0, 3.0, 4.0, 0.25])
+
+    assert days_to_stockout(stock, velocity) == [5, 2, 0, 2]
+
+
+def test_without_sales_there_is_no_forecast():
+    assert days_to_stockout(np.array([5.0]), np.array([0.0])) == [None]
+
+
+def test_empty_or_negative_stock_is_already_out():
+    stock = np.array([0.0, -3.0, 0.0, -1.5])
+    velocity = np.array([2.0, 1.0, 0.0, 0.0])
+
+    assert days_to_stockout(stock, velocity) == [0, 0, 0, 0]
+
+
+def test_empty_input():
+    assert days_to_stockout(np.array([]), np.array([])) == []